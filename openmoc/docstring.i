@@ -991,6 +991,25 @@ Returns
 The CMFD cell ID. Return -1 if cell is not found.  
 ";
 
+%feature("docstring") Cmfd::getFSRCmfdCells "
+getFSRCmfdCells(int *fsr_cmfd_cells, int num_FSRs)  
+
+Fills an array with the CMFD cell ID that each FSR lies in.  
+
+This class method is intended to be called by the OpenMOC Python \"plotter\" module as  
+a utility to find the CMFD cells of all FSRs in a single call rather than calling  
+Cmfd::convertFSRIdToCmfdCell(...) for each FSR. This method may be called from Python  
+as follows:  
+
+Parameters
+----------
+* fsr_cmfd_cells :  
+    an array of CMFD cell IDs indexed by FSR ID, with -1 for FSRs which do not lie in a  
+    CMFD cell  
+* num_FSRs :  
+    the number of FSRs  
+";
+
 %feature("docstring") Cmfd::setCellFSRs "
 setCellFSRs(std::vector< std::vector< int > > *cell_fsrs)  
 
@@ -1003,21 +1022,20 @@ Parameters
 ";
 
 %feature("docstring") Cmfd::tallyCurrent "
-tallyCurrent(segment *curr_segment, FP_PRECISION *track_flux, int azim_index, bool fwd)  
+tallyCurrent(int surface, FP_PRECISION *track_flux, int azim_index)  
 
-Tallies the current contribution from this segment across the the appropriate CMFD mesh
+Tallies the current contribution from a segment across the the appropriate CMFD mesh
 cell surface.  
 
 Parameters
 ----------
-* curr_segment :  
-    The current Track segment  
+* surface :  
+    The CMFD surface crossed at the end of the segment in the direction of integration
+    (-1 if no surface is crossed)  
 * track_flux :  
     The outgoing angular flux for this segment  
 * azim_index :  
     Azimuthal angle index of the current Track  
-* fwd :  
-    Boolean indicating direction of integration along segment  
 ";
 
 %feature("docstring") Cmfd::setCentroidUpdateOn "
@@ -2239,7 +2257,7 @@ Parameters
 ";
 
 %feature("docstring") Geometry::getFSRsToKeys "
-getFSRsToKeys() -> std::vector< std::string > &  
+getFSRsToKeys() -> std::vector< fsr_key > &  
 
 Returns the vector that maps FSR IDs to FSR key hashes.  
 
@@ -2290,7 +2308,7 @@ the FSR's centroid
 ";
 
 %feature("docstring") Geometry::getFSRKeysMap "
-getFSRKeysMap() -> ParallelHashMap< std::string, fsr_data * > &  
+getFSRKeysMap() -> ParallelHashMap< fsr_key, fsr_data * > &  
 
 Returns a pointer to the map that maps FSR keys to FSR IDs.  
 
@@ -2361,15 +2379,16 @@ the number of Cells
 ";
 
 %feature("docstring") Geometry::getFSRKey "
-getFSRKey(LocalCoords *coords) -> std::string  
+getFSRKey(LocalCoords *coords) -> fsr_key  
 
-Generate a string FSR \"key\" that identifies an FSR by its unique hierarchical
+Generate an integer FSR \"key\" that identifies an FSR by its unique hierarchical
 lattice/universe/cell structure.  
 
 Since not all FSRs will reside on the absolute lowest universe level and Cells might
 overlap other cells, it is important to have a method for uniquely identifying FSRs. This
-method creates a unique FSR key by constructing a structured string that describes the
-hierarchy of lattices/universes/cells.  
+method creates a unique FSR key by packing the CMFD cell, lattice, universe and cell IDs
+and lattice cell indices of the hierarchy into a compact vector of integers which is cheap
+to hash.  
 
 Parameters
 ----------
@@ -2381,6 +2400,27 @@ Returns
 the FSR key  
 ";
 
+%feature("docstring") Geometry::getFSRKeyString "
+getFSRKeyString(int fsr_id) -> std::string  
+
+Return a string rendering of the FSR key for a given FSR ID.  
+
+This is intended for debugging and for users wishing to inspect the
+lattice/universe/cell hierarchy of an FSR from Python:  
+
+
+          key = geometry.getFSRKeyString(fsr_id)  
+
+Parameters
+----------
+* fsr_id :  
+    the FSR ID  
+
+Returns
+-------
+the FSR key as a string  
+";
+
 %feature("docstring") Geometry::subdivideCells "
 subdivideCells()  
 
@@ -2570,6 +2610,20 @@ Returns
 number of FSRs  
 ";
 
+%feature("docstring") Geometry::getFSRLayoutId "
+getFSRLayoutId() -> int  
+
+Returns a unique ID for the current layout of the FSRs.  
+
+A new ID, unique among all Geometries, is assigned each time the FSRs are initialized  
+for Track generation. Data cached by FSR ID, such as by the OpenMOC Python \"process\"  
+module, is valid as long as this ID is unchanged.  
+
+Returns
+-------
+the FSR layout ID  
+";
+
 %feature("docstring") Geometry::findFSRId "
 findFSRId(LocalCoords *coords) -> int  
 
@@ -2679,6 +2733,76 @@ Returns
 the FSR's characteristic point  
 ";
 
+%feature("docstring") Geometry::getFSRPoints "
+getFSRPoints(double *fsr_points, int num_values)  
+
+Fills an array with the x,y,z coordinates of the characteristic point for each FSR.  
+
+This class method is intended to be called by the OpenMOC Python \"process\" and  
+\"plotter\" modules as a utility to retrieve the points of all FSRs in a single call  
+rather than one FSR at a time. The points are stored in FSR ID order as (x,y,z)  
+triples. This method may be called from Python as follows:  
+
+Parameters
+----------
+* fsr_points :  
+    an array of coordinates for each FSR point  
+* num_values :  
+    the number of values in the array (3 times the number of FSRs)  
+";
+
+%feature("docstring") Geometry::getFSRCentroids "
+getFSRCentroids(double *fsr_centroids, int num_values)  
+
+Fills an array with the x,y,z coordinates of the centroid of each FSR.  
+
+This class method is intended to be called by the OpenMOC Python \"plotter\" and  
+\"process\" modules as a utility to retrieve the centroids of all FSRs in a single call  
+rather than one FSR at a time. The centroids are stored in FSR ID order as (x,y,z)  
+triples. This method may be called from Python as follows:  
+
+Parameters
+----------
+* fsr_centroids :  
+    an array of coordinates for each FSR centroid  
+* num_values :  
+    the number of values in the array (3 times the number of FSRs)  
+";
+
+%feature("docstring") Geometry::getFSRCellIds "
+getFSRCellIds(int *fsr_cell_ids, int num_FSRs)  
+
+Fills an array with the ID of the Cell containing each FSR.  
+
+This class method is intended to be called by the OpenMOC Python \"process\" and  
+\"plotter\" modules as a utility to find the Cells of all FSRs in a single call. This  
+method may be called from Python as follows:  
+
+Parameters
+----------
+* fsr_cell_ids :  
+    an array of Cell IDs indexed by FSR ID  
+* num_FSRs :  
+    the number of FSRs  
+";
+
+%feature("docstring") Geometry::getFSRMaterialIds "
+getFSRMaterialIds(int *fsr_material_ids, int num_FSRs)  
+
+Fills an array with the ID of the Material filling each FSR.  
+
+This class method is intended to be called by the OpenMOC Python \"process\" and  
+\"plotter\" modules as a utility to find the Materials of all FSRs in a single call.  
+This method may be called from Python as follows:  
+
+Parameters
+----------
+* fsr_material_ids :  
+    an array of Material IDs indexed by FSR ID  
+* num_FSRs :  
+    the number of FSRs  
+";
+
 %feature("docstring") Geometry::initializeCmfd "
 initializeCmfd()  
 
@@ -2716,24 +2840,27 @@ Returns
 the number of Materials  
 ";
 
-%feature("docstring") Geometry::setFSRCentroid "
-setFSRCentroid(int fsr, Point *centroid)  
+%feature("docstring") Geometry::setFSRCentroids "
+setFSRCentroids(double *centroids, int num_FSRs)  
 
-Sets the centroid for an FSR.  
+Sets the centroid of each FSR.  
 
-The _FSR_keys_map stores a hash of a std::string representing the Lattice/Cell/Universe
+The _FSR_keys_map stores an integer fsr_key representing the Lattice/Cell/Universe
 hierarchy for a unique region and the associated FSR data. _centroid is a point that
 represents the numerical centroid of an FSR computed using all segments contained in the
-FSR. This method is used by the TrackGenerator to set the centroid after segments have
-been created. It is important to note that this method is a helper function for the
-TrackGenerator and should not be explicitly called by the user.  
+FSR. The centroids are stored in one contiguous array of Points owned by the Geometry,
+which is reused each time the centroids are set for the same number of FSRs, and the
+_centroid of each FSR points into this array. This method is used by the TrackGenerator
+to set the centroids after segments have been created. It is important to note that this
+method is a helper function for the TrackGenerator and should not be explicitly called by
+the user.  
 
 Parameters
 ----------
-* fsr :  
-    a FSR ID  
-* centroid :  
-    a Point representing the FSR centroid  
+* centroids :  
+    an array of (x,y,z) coordinates for each FSR centroid  
+* num_FSRs :  
+    the number of FSRs  
 ";
 
 %feature("docstring") Geometry::~Geometry "
@@ -6420,6 +6547,23 @@ Returns
 the flat source region volume  
 ";
 
+%feature("docstring") Solver::getFSRVolumes "
+getFSRVolumes(double *fsr_volumes, int num_FSRs)  
+
+Fills an array with the volume of each FSR.  
+
+This class method is intended to be called by the OpenMOC Python \"process\" module  
+as a utility to retrieve the volumes of all FSRs in a single call. This method may be  
+called from Python as follows:  
+
+Parameters
+----------
+* fsr_volumes :  
+    an array of volumes indexed by FSR ID  
+* num_FSRs :  
+    the number of FSRs  
+";
+
 %feature("docstring") Solver::initializeFixedSources "
 initializeFixedSources()  
 
@@ -6438,6 +6582,76 @@ Returns
 the converged eigenvalue $ k_{eff} $  
 ";
 
+%feature("docstring") Solver::getReferenceNumIterations "
+getReferenceNumIterations() -> int  
+
+Returns the number of source iterations needed to converge the eigenvalue without  
+acceleration.  
+
+Returns
+-------
+the reference number of source iterations (0 if not set)  
+";
+
+%feature("docstring") Solver::getArrayGeneration "
+getArrayGeneration() -> int  
+
+Returns the number of times the FSR flux and source arrays have been allocated.  
+
+The array views returned to Python record this number and may no longer be used  
+once it changes.  
+
+Returns
+-------
+the number of FSR flux and source array allocations  
+";
+
+%feature("docstring") Solver::getNumSweepsSaved "
+getNumSweepsSaved() -> int  
+
+Returns the number of transport sweeps saved by the acceleration in the last  
+eigenvalue calculation.  
+
+The sweeps saved are the difference between the reference number of source  
+iterations set by setReferenceNumIterations(...) and the number of iterations needed  
+by the last eigenvalue calculation. The result is negative if the acceleration  
+needed more sweeps and is zero if no acceleration was used or if no reference has  
+been set.  
+
+Returns
+-------
+the number of transport sweeps saved  
+";
+
+%feature("docstring") Solver::setReferenceNumIterations "
+setReferenceNumIterations(int num_iterations)  
+
+Sets the number of source iterations needed to converge the eigenvalue without  
+acceleration.  
+
+The sweeps saved by the acceleration are reported against this reference, e.g.,  
+the number of iterations of an unaccelerated calculation of the same problem at the  
+same threshold, which may be run once for a series of similar accelerated  
+calculations:  
+
+
+          solver.computeEigenvalue()
+          solver.setReferenceNumIterations(solver.getNumIterations())
+          solver.setAccelerationType(openmoc.ANDERSON)
+          solver.computeEigenvalue()
+          print(solver.getNumSweepsSaved())  
+
+The sweeps saved cannot be estimated reliably from the iterates of the accelerated  
+calculation itself, since the convergence of its first unaccelerated iterations is  
+dominated by the higher harmonics rather than by the dominance ratio. A reference of  
+0 (the default) disables the report.  
+
+Parameters
+----------
+* num_iterations :  
+    the reference number of source iterations  
+";
+
 %feature("docstring") Solver::useExponentialIntrinsic "
 useExponentialIntrinsic()  
 
@@ -8906,6 +9120,15 @@ initializeFSRs()
 Initializes the FSR volumes and Materials array.  
 ";
 
+%feature("docstring") VectorizedSolver::initializeCmfd "
+initializeCmfd()  
+
+Initializes CMFD acceleration if it is attached to the Geometry.  
+
+CMFD is not yet supported since its energy groups are mapped from the unpadded MOC energy
+groups, and since the TRACK_VECTORIZED sweep does not tally the CMFD surface currents.  
+";
+
 %feature("docstring") VectorizedSolver::computeKeff "
 computeKeff()  
 
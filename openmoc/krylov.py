@@ -1,4 +1,6 @@
+import os
 import sys
+from numbers import Integral
 
 import numpy as np
 
@@ -68,14 +70,35 @@ class IRAMSolver(object):
         self._F_op = None
         self._a_count = None
         self._m_count = None
+        self._f_count = None
+        self._warm_start = None
+        self._inner_guess = None
+        self._inner_rhs_norm = None
+        self._basis = None
+        self._checkpoint_file = None
+        self._checkpoint_interval = None
         self._eigenvalues = None
         self._eigenvectors = None
 
     def computeEigenmodes(self, solver_mode=openmoc.FORWARD, num_modes=5,
                           inner_method='gmres', outer_tol=1e-5,
-                          inner_tol=1e-6, interval=10):
+                          inner_tol=1e-6, interval=10, v0=None,
+                          warm_start=True, checkpoint_file=None,
+                          checkpoint_interval=10):
         """Compute all eigenmodes in the problem using the scipy.linalg package.
 
+        The outer eigenvalue solve may be warm started from the eigenvectors
+        of a previous run or from a flux distribution, such as the scalar
+        fluxes of a restored simulation state. Each inner Ax=b solve may
+        also be started from the previous inner solution.
+
+        If a checkpoint file is given, the most recent Krylov vectors, the
+        previous inner solution and the operator counters are periodically
+        written to it in HDF5 format. If the file exists when this routine
+        is called (e.g., from a run which was killed), the solve resumes with
+        a starting vector built from the checkpointed Krylov vectors. The
+        checkpoint file is removed once the eigenmodes have converged.
+
         Parameters
         ----------
         solver_mode : {openmoc.FORWARD, openmoc.ADJOINT}
@@ -90,8 +113,27 @@ class IRAMSolver(object):
             The tolerance on the inner Ax=b solve (default is 1E-5)
         interval : Integral
             The inner iteration interval for logging messages (default is 10)
+        v0 : numpy.ndarray or None
+            The starting vector for the outer eigenvalue solve, indexed by FSR
+            and energy group in any shape. If None (default), the sum of the
+            eigenvectors from a previous call is used if available.
+        warm_start : bool
+            Whether to start each inner solve from the previous inner
+            solution rather than a zero vector (default is True)
+        checkpoint_file : str or None
+            The HDF5 file to checkpoint to and resume from (default is None)
+        checkpoint_interval : Integral
+            The number of outer operator applications between checkpoints
+            (default is 10)
         """
 
+        cv.check_type('warm_start', warm_start, bool)
+        if checkpoint_file is not None:
+            cv.check_type('checkpoint_file', checkpoint_file, str)
+            cv.check_type('checkpoint_interval', checkpoint_interval, Integral)
+            cv.check_greater_than('checkpoint_interval',
+                                  checkpoint_interval, 0)
+
         # Ensure that vacuum boundary conditions are used
         geometry = self._moc_solver.getGeometry()
         if (geometry.getMinXBoundaryType() != openmoc.VACUUM or
@@ -111,20 +153,54 @@ class IRAMSolver(object):
         self._inner_tol = inner_tol
         self._interval = interval
 
-        # Initialize inner/outer iteration counters to zero
+        self._warm_start = warm_start
+        self._checkpoint_file = checkpoint_file
+        self._checkpoint_interval = checkpoint_interval
+
+        # Initialize inner/outer iteration counters and warm start data
         self._m_count = 0
         self._a_count = 0
-
-        # Initialize MOC solver
-        self._moc_solver.initializePolarQuadrature()
-        self._moc_solver.initializeExpEvaluator()
+        self._f_count = 0
+        self._inner_guess = None
+        self._inner_rhs_norm = None
+        self._basis = []
+
+        # Build the starting vector for the outer eigenvalue solve
+        if v0 is not None:
+            v0 = np.ravel(np.real(v0)).astype(self._precision)
+            if v0.size != self._op_size:
+                py_printf('ERROR', 'Unable to warm start the IRAMSolver ' +
+                          'with a %d element vector for an operator of ' +
+                          'size %d', v0.size, self._op_size)
+        elif self._eigenvectors is not None and \
+             self._eigenvectors.shape[0] == self._op_size:
+            v0 = np.sum(np.real(self._eigenvectors), axis=1)
+            v0 = v0.astype(self._precision)
+
+        # Resume from the checkpoint of a previous run if one exists
+        if checkpoint_file is not None and os.path.exists(checkpoint_file):
+            restart_v0 = self._load_checkpoint()
+            if restart_v0 is not None:
+                v0 = restart_v0
+
+        # Initialize MOC solver in the order used by Solver.computeEigenvalue
+        self._moc_solver.initializeFSRs()
         self._moc_solver.initializeMaterials(solver_mode)
+        self._moc_solver.countFissionableFSRs()
+        self._moc_solver.initializeExpEvaluator()
         self._moc_solver.initializeFluxArrays()
         self._moc_solver.initializeSourceArrays()
-        self._moc_solver.initializeFSRs()
-        self._moc_solver.countFissionableFSRs()
         self._moc_solver.zeroTrackFluxes()
 
+        # Apply the operators in place on a view of the Solver's scalar flux
+        # rather than copying the flux in and out of the Solver each sweep
+        if self._with_cuda:
+            self._flux_view = None
+        else:
+            flux_view = self._moc_solver.getScalarFluxView(writable=True)
+            num_groups = geometry.getNumEnergyGroups()
+            self._flux_view = flux_view[:, :num_groups]
+
         # Initialize SciPy operators
         op_shape = (self._op_size, self._op_size)
         self._A_op = linalg.LinearOperator(op_shape, self._A,
@@ -138,9 +214,13 @@ class IRAMSolver(object):
         timer = openmoc.Timer()
         timer.startTimer()
         vals, vecs = linalg.eigs(self._F_op, k=self._num_modes,
-                                 tol=self._outer_tol)
+                                 tol=self._outer_tol, v0=v0)
         timer.stopTimer()
 
+        # Remove the checkpoint since the eigenmodes have converged
+        if checkpoint_file is not None and os.path.exists(checkpoint_file):
+            os.remove(checkpoint_file)
+
         # Print a timer report
         tot_time = timer.getTime()
         time_per_mode = tot_time / self._num_modes
@@ -177,13 +257,19 @@ class IRAMSolver(object):
 
         # Remove imaginary components from NumPy array
         flux = np.real(flux).astype(self._precision)
-        flux_old = np.copy(flux)
 
         # Apply operator to flux
         self._a_count += 1
-        self._moc_solver.setFluxes(flux)
-        self._moc_solver.scatterTransportSweep()
-        flux = self._moc_solver.getFluxes(self._op_size)
+        if self._flux_view is None:
+            flux_old = np.copy(flux)
+            self._moc_solver.setFluxes(flux)
+            self._moc_solver.scatterTransportSweep()
+            flux = self._moc_solver.getFluxes(self._op_size)
+        else:
+            flux_old = flux
+            self._flux_view[...] = flux.reshape(self._flux_view.shape)
+            self._moc_solver.scatterTransportSweep()
+            flux = self._flux_view.ravel()
 
         # Print report to screen to update user on progress
         if self._a_count % self._interval == 0:
@@ -218,9 +304,14 @@ class IRAMSolver(object):
 
         # Apply operator to flux
         self._m_count += 1
-        self._moc_solver.setFluxes(flux)
-        self._moc_solver.fissionTransportSweep()
-        flux = self._moc_solver.getFluxes(self._op_size)
+        if self._flux_view is None:
+            self._moc_solver.setFluxes(flux)
+            self._moc_solver.fissionTransportSweep()
+            flux = self._moc_solver.getFluxes(self._op_size)
+        else:
+            self._flux_view[...] = flux.reshape(self._flux_view.shape)
+            self._moc_solver.fissionTransportSweep()
+            flux = np.array(self._flux_view).ravel()
 
         py_printf('NORMAL', "Performed M operator sweep number %d", self._m_count)
 
@@ -250,20 +341,107 @@ class IRAMSolver(object):
         # Apply operator to flux - get updated flux from fission source
         flux = self._M_op * flux
 
+        # Start from the previous inner solution scaled to the new source
+        x0 = None
+        rhs_norm = np.linalg.norm(flux)
+        if self._warm_start and self._inner_guess is not None and \
+           self._inner_rhs_norm > 0.:
+            x0 = self._inner_guess * (rhs_norm / self._inner_rhs_norm)
+
         # Solve AX=B fixed scatter source problem using Krylov subspace method
         if self._inner_method == 'gmres':
-            flux, x = linalg.gmres(self._A_op, flux, tol=self._inner_tol)
+            flux, x = linalg.gmres(self._A_op, flux, x0=x0, tol=self._inner_tol)
         elif self._inner_method == 'lgmres':
-            flux, x = linalg.lgmres(self._A_op, flux, tol=self._inner_tol)
+            flux, x = linalg.lgmres(self._A_op, flux, x0=x0, tol=self._inner_tol)
         elif self._inner_method == 'bicgstab':
-            flux, x = linalg.bicgstab(self._A_op, flux, tol=self._inner_tol)
+            flux, x = linalg.bicgstab(self._A_op, flux, x0=x0, tol=self._inner_tol)
         elif self._inner_method == 'cgs':
-            flux, x = linalg.cgs(self._A_op, flux, tol=self._inner_tol)
+            flux, x = linalg.cgs(self._A_op, flux, x0=x0, tol=self._inner_tol)
         else:
             py_printf('ERROR', 'Unable to use %s to solve Ax=b', self._inner_method)
 
         # Check that solve completed without error before returning new flux
         if x != 0:
             py_printf('ERROR', 'Unable to solve Ax=b with %s', self._inner_method)
-        else:
-            return flux
\ No newline at end of file
+
+        self._f_count += 1
+        self._inner_guess = np.real(flux).astype(self._precision)
+        self._inner_rhs_norm = rhs_norm
+
+        # Keep the most recent Krylov vectors to restart from a checkpoint
+        if self._checkpoint_file is not None:
+            self._basis.append(self._inner_guess)
+            del self._basis[:-(2 * self._num_modes + 1)]
+            if self._f_count % self._checkpoint_interval == 0:
+                self._save_checkpoint()
+
+        return flux
+
+    def _save_checkpoint(self):
+        """Private routine to checkpoint the Krylov vectors and counters.
+
+        The checkpoint is written to a temporary file which then replaces the
+        previous checkpoint such that a job killed while writing does not
+        corrupt it.
+
+        """
+
+        import h5py
+
+        tmp_file = self._checkpoint_file + '.tmp'
+        f = h5py.File(tmp_file, 'w')
+        f.attrs['op size'] = self._op_size
+        f.attrs['num modes'] = self._num_modes
+        f.attrs['A count'] = self._a_count
+        f.attrs['M count'] = self._m_count
+        f.attrs['F count'] = self._f_count
+        f.attrs['inner rhs norm'] = self._inner_rhs_norm
+        f.create_dataset('basis', data=np.array(self._basis))
+        f.create_dataset('inner guess', data=self._inner_guess)
+        f.close()
+        os.rename(tmp_file, self._checkpoint_file)
+
+        py_printf('INFO', 'Checkpointed IRAMSolver after %d outer ' +
+                  'iterations to %s', self._f_count, self._checkpoint_file)
+
+    def _load_checkpoint(self):
+        """Private routine to resume from the checkpoint of a previous run.
+
+        SciPy does not expose the internal state of the ARPACK iterations, so
+        the outer solve is restarted with the sum of the orthonormalized
+        checkpointed Krylov vectors as its starting vector. This vector spans
+        the dominant eigenmodes approximated before the previous run stopped.
+
+        Returns
+        -------
+        v0 : numpy.ndarray or None
+            The starting vector for the outer eigenvalue solve, or None if
+            the checkpoint is not compatible with this problem
+
+        """
+
+        import h5py
+
+        f = h5py.File(self._checkpoint_file, 'r')
+        if f.attrs['op size'] != self._op_size:
+            py_printf('WARNING', 'Unable to resume from checkpoint %s for ' +
+                      'an operator of size %d rather than %d',
+                      self._checkpoint_file, f.attrs['op size'], self._op_size)
+            f.close()
+            return None
+
+        self._a_count = int(f.attrs['A count'])
+        self._m_count = int(f.attrs['M count'])
+        self._f_count = int(f.attrs['F count'])
+        self._inner_rhs_norm = float(f.attrs['inner rhs norm'])
+        self._inner_guess = f['inner guess'][...].astype(self._precision)
+        basis = f['basis'][...]
+        f.close()
+
+        self._basis = [vector.astype(self._precision) for vector in basis]
+
+        py_printf('NORMAL', 'Resuming IRAMSolver from checkpoint %s after ' +
+                  '%d outer iterations', self._checkpoint_file, self._f_count)
+
+        q, r = np.linalg.qr(np.transpose(basis))
+        return np.sum(q, axis=1).astype(self._precision)
\ No newline at end of file
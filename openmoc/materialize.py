@@ -513,34 +513,26 @@ def compute_sph_factors(mgxs_lib, max_sph_iters=30, sph_tol=1E-5,
     num_groups = geometry.getNumEnergyGroups()
     num_fsrs = geometry.getNumFSRs()
 
-    # Map FSRs to domains (and vice versa) to compute domain-averaged fluxes
-    fsrs_to_domains = np.zeros(num_fsrs)
-    domains_to_fsrs = collections.defaultdict(list)
-    sph_to_fsr_indices = []
-
-    for fsr in range(num_fsrs):
-        cell = geometry.findCellContainingFSR(fsr)
-
-        if mgxs_lib.domain_type == 'material':
-            domain = cell.getFillMaterial()
-        else:
-            domain = cell
-
-        fsrs_to_domains[fsr] = domain.getId()
-        domains_to_fsrs[domain.getId()].append(fsr)
-
-        if domain.isFissionable():
-            sph_to_fsr_indices.append(fsr)
-
-    # Get all OpenMOC domains
+    # Get all OpenMOC domains and the domain ID for each FSR
     if mgxs_lib.domain_type == 'material':
         openmoc_domains = geometry.getAllMaterials()
+        fsrs_to_domains = geometry.getFSRMaterialIds(num_fsrs)
     elif mgxs_lib.domain_type == 'cell':
         openmoc_domains = geometry.getAllMaterialCells()
+        fsrs_to_domains = geometry.getFSRCellIds(num_fsrs)
     else:
         py_printf('ERROR', 'SPH factors cannot be applied for an OpenMC MGXS '
                   'library of domain type %s', mgxs_lib.domain_type)
 
+    # Map domains to FSRs to compute domain-averaged fluxes
+    domains_to_fsrs = _get_domains_to_fsrs(fsrs_to_domains)
+
+    # Find the FSRs in fissionable domains
+    fissionable_ids = [domain_id for domain_id in openmoc_domains
+                       if openmoc_domains[domain_id].isFissionable()]
+    sph_to_fsr_indices = \
+        np.nonzero(np.in1d(fsrs_to_domains, fissionable_ids))[0]
+
     # Build a list of indices into the SPH array for fissionable domains
     sph_to_domain_indices = []
     for i, openmc_domain in enumerate(mgxs_lib.domains):
@@ -660,14 +652,12 @@ def _load_openmc_src(mgxs_lib, solver):
     keff = mgxs_lib.keff
 
     # Create mapping of FSRs-to-domains to optimize fixed source setup
-    domains_to_fsrs = collections.defaultdict(list)
-    for fsr_id in range(geometry.getNumFSRs()):
-        cell = geometry.findCellContainingFSR(fsr_id)
-        if mgxs_lib.domain_type == 'material':
-            domain = cell.getFillMaterial()
-        else:
-            domain = cell
-        domains_to_fsrs[domain.getId()].append(fsr_id)
+    num_fsrs = geometry.getNumFSRs()
+    if mgxs_lib.domain_type == 'material':
+        fsrs_to_domains = geometry.getFSRMaterialIds(num_fsrs)
+    else:
+        fsrs_to_domains = geometry.getFSRCellIds(num_fsrs)
+    domains_to_fsrs = _get_domains_to_fsrs(fsrs_to_domains)
 
     # Compute fixed sources for all domains in the MGXS library
     for i, openmc_domain in enumerate(mgxs_lib.domains):
@@ -738,6 +728,34 @@ def _load_openmc_src(mgxs_lib, solver):
     return openmc_fluxes
 
 
+def _get_domains_to_fsrs(fsrs_to_domains):
+    """Map each domain to the FSRs it contains.
+
+    This is a helper routine for the compute_sph_factors(...) routine.
+
+    Parameters
+    ----------
+    fsrs_to_domains : numpy.ndarray of Integral
+        The material or cell ID for each FSR indexed by FSR ID
+
+    Returns
+    -------
+    domains_to_fsrs : collections.defaultdict
+        A dictionary of lists of FSR IDs indexed by domain ID
+
+    """
+
+    # Group the FSR IDs by domain ID with a stable sort
+    fsrs = np.argsort(fsrs_to_domains, kind='mergesort')
+    domain_ids, starts = np.unique(fsrs_to_domains[fsrs], return_index=True)
+
+    domains_to_fsrs = collections.defaultdict(list)
+    for domain_id, domain_fsrs in zip(domain_ids, np.split(fsrs, starts[1:])):
+        domains_to_fsrs[int(domain_id)] = domain_fsrs.tolist()
+
+    return domains_to_fsrs
+
+
 def _apply_sph_factors(mgxs_lib, geometry, sph):
     """Apply SPH factors to an OpenMC MGXS library.
 
@@ -51,6 +51,17 @@
  * openmoc.process */
 %apply (double* ARGOUT_ARRAY1, int DIM1) {(double* fission_rates, int num_FSRs)}
 
+/* The typemaps used to match the method signatures for the Geometry's and
+ * Solver's bulk FSR getter methods for the data processing and plotting
+ * routines in openmoc.process, openmoc.plotter and openmoc.materialize */
+%apply (double* ARGOUT_ARRAY1, int DIM1) {(double* fsr_points, int num_values)}
+%apply (double* ARGOUT_ARRAY1, int DIM1) {(double* fsr_centroids, int num_values)}
+%apply (int* ARGOUT_ARRAY1, int DIM1) {(int* fsr_cmfd_cells, int num_FSRs)}
+%apply (int* ARGOUT_ARRAY1, int DIM1) {(int* fsr_cell_ids, int num_FSRs)}
+%apply (int* ARGOUT_ARRAY1, int DIM1) {(int* fsr_material_ids, int num_FSRs)}
+%apply (double* ARGOUT_ARRAY1, int DIM1) {(double* fsr_volumes, int num_FSRs)}
+%apply (double* ARGOUT_ARRAY1, int DIM1) {(double* fsr_sources, int num_values)}
+
 /* The typemap used to match the method signature for the Universe's
  * getCellIds method for the data processing routines in openmoc.process */
 %apply (int* ARGOUT_ARRAY1, int DIM1) {(int* cell_ids, int num_cells)}
@@ -70,3 +81,115 @@
 
 /* The typemap used to match the method signature for Solver::setFluxes */
 %apply (FP_PRECISION* INPLACE_ARRAY1, int DIM1) {(FP_PRECISION* in_fluxes, int num_fluxes)}
+
+/* The typemap used to match the method signatures for the Solver's array
+ * view getter methods. These return 2D NumPy arrays indexed by FSR and energy
+ * group which alias the Solver's flux and source arrays without a copy. */
+%apply (FP_PRECISION** ARGOUTVIEW_ARRAY2, int* DIM1, int* DIM2) {(FP_PRECISION** view_array, int* num_FSRs, int* num_groups)}
+
+/* The raw view getters are wrapped by the Python methods below, which keep
+ * the Solver alive for the lifetime of each view, make views read-only
+ * unless a writable view is requested and refuse to use views after the
+ * Solver reallocates its arrays */
+%rename(_getScalarFluxView) Solver::getScalarFluxView;
+%rename(_getOldScalarFluxView) Solver::getOldScalarFluxView;
+%rename(_getReducedSourceView) Solver::getReducedSourceView;
+%rename(_getFixedSourceView) Solver::getFixedSourceView;
+
+%pythoncode %{
+import numpy as _numpy
+
+class _SolverArrayView(_numpy.ndarray):
+    """A NumPy array aliasing one of a Solver's arrays which holds a
+    reference to the Solver such that its memory is not freed while the
+    view is in use. The view records the Solver's array generation and
+    raises a RuntimeError if used after the Solver reallocates its arrays,
+    which frees the memory aliased by the view. Arrays computed from views
+    are ordinary NumPy arrays."""
+
+    def __array_finalize__(self, obj):
+        self._solver = getattr(obj, '_solver', None)
+        self._generation = getattr(obj, '_generation', None)
+
+    def _check_valid(self):
+        if self._solver is not None and \
+           self._generation != self._solver.getArrayGeneration():
+            raise RuntimeError('Unable to use a view of a Solver array '
+                               'which the Solver has since reallocated')
+
+    def __getitem__(self, key):
+        self._check_valid()
+        return super(_SolverArrayView, self).__getitem__(key)
+
+    def __setitem__(self, key, value):
+        self._check_valid()
+        super(_SolverArrayView, self).__setitem__(key, value)
+
+    def __repr__(self):
+        self._check_valid()
+        return repr(self.view(_numpy.ndarray))
+
+    def __str__(self):
+        self._check_valid()
+        return str(self.view(_numpy.ndarray))
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        inputs = tuple(_solver_view_base(x) for x in inputs)
+        outputs = kwargs.get('out', ())
+        if outputs:
+            kwargs['out'] = tuple(_solver_view_base(x) for x in outputs)
+
+        result = getattr(ufunc, method)(*inputs, **kwargs)
+
+        # Return the views written in place rather than their base arrays
+        if outputs:
+            return outputs[0] if len(outputs) == 1 else outputs
+        return result
+
+    def __array_function__(self, func, types, args, kwargs):
+        self._check_valid()
+        return super(_SolverArrayView, self).__array_function__(
+            func, types, args, kwargs)
+
+def _solver_view_base(array):
+    if isinstance(array, _SolverArrayView):
+        array._check_valid()
+        return array.view(_numpy.ndarray)
+    return array
+
+def _solver_view(solver, array, writable):
+    view = array.view(_SolverArrayView)
+    view._solver = solver
+    view._generation = solver.getArrayGeneration()
+    view.flags.writeable = writable
+    return view
+%}
+
+%extend Solver {
+  %pythoncode %{
+    def getScalarFluxView(self, writable=False):
+        """Return a view of the FSR scalar fluxes indexed by FSR and group.
+
+        The view aliases the Solver's scalar flux array and is invalidated
+        when the Solver reallocates its flux arrays, such as at the start of
+        each computeEigenvalue(...), computeFlux(...) or computeSource(...)
+        call, after which using it raises a RuntimeError. The view is
+        read-only unless writable is True."""
+        return _solver_view(self, self._getScalarFluxView(), writable)
+
+    def getOldScalarFluxView(self, writable=False):
+        """Return a view of the previous iteration's FSR scalar fluxes
+        indexed by FSR and group. See getScalarFluxView(...)."""
+        return _solver_view(self, self._getOldScalarFluxView(), writable)
+
+    def getReducedSourceView(self, writable=False):
+        """Return a view of the FSR reduced sources indexed by FSR and
+        group. See getScalarFluxView(...)."""
+        return _solver_view(self, self._getReducedSourceView(), writable)
+
+    def getFixedSourceView(self, writable=False):
+        """Return a view of the FSR fixed sources indexed by FSR and
+        group. See getScalarFluxView(...)."""
+        return _solver_view(self, self._getFixedSourceView(), writable)
+  %}
+}
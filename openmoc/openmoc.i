@@ -25,6 +25,7 @@
   #include "../src/Solver.h"
   #include "../src/CPUSolver.h"
   #include "../src/boundary_type.h"
+  #include "../src/segmentation_type.h"
   #include "../src/Surface.h"
   #include "../src/Timer.h"
   #include "../src/Track.h"
@@ -66,7 +67,7 @@
 %warnfilter(511) std::vector;
 
 /* Methods for SWIG to ignore in generating Python API */
-%ignore setFSRCentroid(int fsr, Point* centroid);
+%ignore setFSRCentroids(double* centroids, int num_FSRs);
 %ignore setFSRKeysMap(std::unordered_map<std::size_t, fsr_data>* FSR_keys_map);
 %ignore setFSRsToKeys(std::vector<std::size_t>* FSRs_to_keys);
 %ignore setFSRsToMaterialIDs(std::vector<int>* FSRs_to_material_IDs);
@@ -81,6 +82,7 @@
 %ignore Matrix::getIA();
 %ignore Matrix::getJA();
 %ignore Matrix::getDiag();
+%ignore Matrix::setSparsityPattern(int* cell_neighbors, int num_neighbors);
 
 %exception {
   try {
@@ -120,6 +122,7 @@ namespace std {
 %include ../src/Solver.h
 %include ../src/CPUSolver.h
 %include ../src/boundary_type.h
+%include ../src/segmentation_type.h
 %include ../src/Surface.h
 %include ../src/Timer.h
 %include ../src/Track.h
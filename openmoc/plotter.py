@@ -1,7 +1,9 @@
 import os
 import sys
+import time
+import multiprocessing
 from numbers import Integral, Real
-from collections import Iterable
+from collections import Iterable, OrderedDict
 
 import numpy as np
 import numpy.random
@@ -56,6 +58,25 @@ subdirectory = "/plots/"
 
 TINY_MOVE = openmoc.TINY_MOVE
 
+# The maximum number of rasterized domain ID grids to cache for reuse
+raster_cache_size = 16
+
+# A cache of the domain IDs on the plotting grids of the most recent plots,
+# keyed by the geometry, plotting window, gridsize, z-coordinate and domain
+_raster_cache = OrderedDict()
+
+# The plots and rendering settings exported by the worker processes. These
+# are inherited by the workers when they are forked such that the surfaces
+# need not be pickled.
+_export_plots = None
+_export_settings = None
+
+# The data, grid and settings of the tiled plot rendered by the worker
+# processes, which are inherited by the workers when they are forked. The
+# Geometry is only queried by the parent process, since OpenMP may not be
+# used by a process forked after OpenMP threads were started.
+_tiled_plot = None
+
 if sys.version_info[0] >= 3:
     basestring = str
 
@@ -485,10 +506,8 @@ def plot_flat_source_regions(geometry, gridsize=250, xlim=None, ylim=None,
     if centroids:
 
         # Populate a NumPy array with the FSR centroid coordinates
-        centroids = np.zeros((num_fsrs, 2), dtype=np.float)
-        for fsr_id in range(num_fsrs):
-            point = geometry.getFSRCentroid(fsr_id)
-            centroids[fsr_id,:] = [point.getX(), point.getY()]
+        centroids = geometry.getFSRCentroids(num_fsrs * 3)
+        centroids = centroids.reshape(num_fsrs, 3)[:, :2]
 
         # Plot centroids on figure using matplotlib
         if library == 'pil':
@@ -583,9 +602,7 @@ def plot_cmfd_cells(geometry, cmfd, gridsize=250, xlim=None, ylim=None,
 
     # Create a NumPy array to map FSRs to CMFD cells
     num_fsrs = geometry.getNumFSRs()
-    fsrs_to_cmfd_cells = np.zeros(num_fsrs, dtype=np.int64)
-    for fsr_id in range(num_fsrs):
-        fsrs_to_cmfd_cells[fsr_id] = cmfd.convertFSRIdToCmfdCell(fsr_id)
+    fsrs_to_cmfd_cells = cmfd.getFSRCmfdCells(num_fsrs).astype(np.int64)
 
     # Assign random color scheme to CMFD cells
     num_cmfd_cells = cmfd.getNumCells()
@@ -617,7 +634,7 @@ def plot_cmfd_cells(geometry, cmfd, gridsize=250, xlim=None, ylim=None,
 
 def plot_spatial_fluxes(solver, energy_groups=[1], norm=False, gridsize=250,
                         xlim=None, ylim=None, get_figure=False,
-                        library='matplotlib'):
+                        library='matplotlib', num_workers=1):
     """Plot a color-coded 2D surface plot of the FSR scalar fluxes for one or
     more energy groups.
 
@@ -641,6 +658,9 @@ def plot_spatial_fluxes(solver, energy_groups=[1], norm=False, gridsize=250,
         Whether to return the Matplotlib figure (only if library='matplotlib')
     library : {'matplotlib', 'pil'}
         The plotting library to use
+    num_workers : Integral, optional
+        The number of processes used to render and save the plots (1 by
+        default). This is ignored if get_figure is True.
 
     Returns
     -------
@@ -653,6 +673,12 @@ def plot_spatial_fluxes(solver, energy_groups=[1], norm=False, gridsize=250,
 
         >>> openmoc.plotter.plot_spatial_fluxes(solver, energy_groups=[1,7])
 
+    The PIL library and a pool of processes may be used to quickly export
+    the plots for many energy groups:
+
+        >>> openmoc.plotter.plot_spatial_fluxes(solver, range(1, 71),
+        ...                                     library='pil', num_workers=8)
+
     """
 
     global solver_types
@@ -675,25 +701,20 @@ def plot_spatial_fluxes(solver, energy_groups=[1], norm=False, gridsize=250,
     plot_params.cmap = plt.get_cmap('jet')
     plot_params.norm = norm
 
+    plot_params.title = 'z = {0}'.format(zcoord)
+
     # Get array of FSR energy-dependent fluxes
     fluxes = get_scalar_fluxes(solver)
 
-    # Initialize an empty list of Matplotlib figures if requestd by the user
-    figures = []
-
-    # Loop over all energy group and create a plot
-    for index, group in enumerate(energy_groups):
-        plot_params.suptitle = 'FSR Scalar Flux (Group {0})'.format(group)
-        plot_params.title = 'z = {0}'.format(zcoord)
-        plot_params.filename = 'fsr-flux-group-{0}-z-{1}'.format(group, zcoord)
-        fig = plot_spatial_data(fluxes[:,index], plot_params, get_figure)
-
-        if get_figure:
-            figures.append(fig[0])
+    # Plot the fluxes in each energy group on the same spatial grid
+    global subdirectory
+    directory = openmoc.get_output_directory() + subdirectory
+    plots = _get_flux_plots(fluxes, energy_groups, plot_params, directory)
+    coords = _get_pixel_coords(plot_params)
 
     # Return figures if requested by the user
-    if get_figure:
-        return figures
+    return _export_spatial_plots(plots, plot_params, coords['bounds'],
+                                 get_figure, num_workers)
 
 
 def plot_energy_fluxes(solver, fsrs, group_bounds=None, norm=True,
@@ -915,7 +936,8 @@ def plot_fission_rates(solver, norm=False, transparent_zeros=True, gridsize=250,
 
 def plot_eigenmode_fluxes(iramsolver, eigenmodes=[], energy_groups=[1],
                           norm=False, gridsize=250, xlim=None, ylim=None,
-                          get_figure=False, library='matplotlib'):
+                          get_figure=False, library='matplotlib',
+                          num_workers=1):
     """Plot the color-coded 2D surface plot of FSR scalar fluxes for one or
     more eigenmodes from an IRAMSolver.
 
@@ -939,11 +961,16 @@ def plot_eigenmode_fluxes(iramsolver, eigenmodes=[], energy_groups=[1],
         Whether to return the Matplotlib figure (only if library='matplotlib')
     library : {'matplotlib', 'pil'}
         The plotting library to use
+    num_workers : Integral, optional
+        The number of processes used to render and save the plots for all
+        eigenmodes and energy groups (1 by default). This is ignored if
+        get_figure is True.
 
     Returns
     -------
     fig : list of matplotlib.Figure or None
-        The Matplotlib figures are returned if get_figure is True
+        The Matplotlib figures for each eigenmode and energy group are
+        returned if get_figure is True
 
     Examples
     --------
@@ -958,59 +985,56 @@ def plot_eigenmode_fluxes(iramsolver, eigenmodes=[], energy_groups=[1],
 
     py_printf('NORMAL', 'Plotting the eigenmode fluxes...')
 
-    global subdirectory
-    directory = openmoc.get_output_directory() + subdirectory
-
-    # Make directory if it does not exist
-    try:
-        os.makedirs(directory)
-    except OSError:
-        pass
+    cv.check_type('energy_groups', energy_groups, Iterable, Integral)
 
-    # Extract the MOC Solver from the IRAMSolver
-    moc_solver = iramsolver._moc_solver
+    # Initialize plotting parameters
+    geometry = iramsolver._moc_solver.getGeometry()
+    num_fsrs = geometry.getNumFSRs()
+    num_groups = geometry.getNumEnergyGroups()
+    zcoord = geometry.getFSRPoint(0).getZ()
+    plot_params = PlotParams()
+    plot_params.geometry = geometry
+    plot_params.zcoord = zcoord
+    plot_params.gridsize = gridsize
+    plot_params.library = library
+    plot_params.xlim = xlim
+    plot_params.ylim = ylim
+    plot_params.colorbar = True
+    plot_params.cmap = plt.get_cmap('jet')
+    plot_params.norm = norm
+    plot_params.title = 'z = {0}'.format(zcoord)
 
-    # Initialize a list of figures to return to user if requested
-    figures = []
+    # Gather the plots for all eigenmodes to render them together
+    plots = []
 
     # Loop over each eigenmode
     for mode in eigenmodes:
 
         # Extract the eigenvector for this eigenmode from the IRAMSolver
-        eigenvec = iramsolver._eigenvectors[:,mode-1]
-
-        # Convert it into a form that SWIG will be happy with
-        eigenvec = np.squeeze(np.ascontiguousarray(eigenvec))
-        eigenvec = np.real(eigenvec).astype(iramsolver._precision)
+        fluxes = np.real(iramsolver._eigenvectors[:,mode-1])
+        fluxes = np.reshape(fluxes, (num_fsrs, num_groups))
 
         # Ensure the primary eigenvector is positive
         if mode == 1:
-            eigenvec = np.abs(eigenvec)
-
-        # Insert eigenvector into MOC Solver object
-        moc_solver.setFluxes(eigenvec)
+            fluxes = np.abs(fluxes)
 
         # Set subdirectory folder for this eigenmode
         num_digits = len(str(max(eigenmodes)))
-        subdirectory = \
+        directory = openmoc.get_output_directory() + \
             '/plots/eig-{0}-flux/'.format(str(mode).zfill(num_digits))
 
         # Plot this eigenmode's spatial fluxes
-        fig = plot_spatial_fluxes(moc_solver, energy_groups, norm, gridsize,
-                                  xlim, ylim, get_figure, library)
-
-        if get_figure:
-            figures.append(fig[0])
-
-    # Reset global subdirectory
-    subdirectory = '/plots/'
+        plots.extend(_get_flux_plots(fluxes, energy_groups, plot_params,
+                                     directory))
 
     # Return Matplotlib figures if requested by user
-    if get_figure:
-        return figures
+    coords = _get_pixel_coords(plot_params)
+    return _export_spatial_plots(plots, plot_params, coords['bounds'],
+                                 get_figure, num_workers)
 
 
-def plot_spatial_data(domains_to_data, plot_params, get_figure=False):
+def plot_spatial_data(domains_to_data, plot_params, get_figure=False,
+                      num_workers=1):
     """Plots a color-coded 2D surface plot of arbitrary data mapped to each
     spatial domain in the geometry.
 
@@ -1029,6 +1053,9 @@ def plot_spatial_data(domains_to_data, plot_params, get_figure=False):
         The plotting parameters
     get_figure : bool, optional
         Whether to return the Matplotlib figures (False by default)
+    num_workers : Integral, optional
+        The number of processes used to render and save the plots (1 by
+        default). This is ignored if get_figure is True.
 
     Returns
     -------
@@ -1046,6 +1073,8 @@ def plot_spatial_data(domains_to_data, plot_params, get_figure=False):
     """
 
     cv.check_type('plot_params', plot_params, PlotParams)
+    cv.check_type('num_workers', num_workers, Integral)
+    cv.check_greater_than('num_workers', num_workers, 0)
 
     # Determine the number of domains
     if plot_params.domain_type == 'material':
@@ -1070,28 +1099,15 @@ def plot_spatial_data(domains_to_data, plot_params, get_figure=False):
         py_printf('ERROR', 'Unable to plot spatial data since ' +
                   'domains_to_data is not a dict, array or DataFrame')
 
-    global subdirectory, matplotlib_rcparams
+    global subdirectory
     directory = openmoc.get_output_directory() + subdirectory
 
-    # Make directory if it does not exist
-    try:
-        os.makedirs(directory)
-    except OSError:
-        pass
-
-    # Retrieve the pixel coordinates
-    coords = _get_pixel_coords(plot_params)
-
-    # Query the geometry for the data on the spatial grid
-    domains = plot_params.geometry.getSpatialDataOnGrid(
-        coords['x'], coords['y'], zcoord=plot_params.zcoord,
-        domain_type=plot_params.domain_type)
-    domains = np.reshape(domains, tuple(([plot_params.gridsize]*2)))
-    domains[domains == np.nan] = -1
+    # Retrieve the pixel coordinates and the domain IDs on the spatial grid
+    coords, domains = _get_domains_on_grid(plot_params)
 
     # Make domains-to-data array 2D to mirror a Pandas DataFrame
-    if isinstance(domains_to_data, np.ndarray):
-        domains_to_data.shape += (1,)
+    if isinstance(domains_to_data, np.ndarray) and domains_to_data.ndim == 1:
+        domains_to_data = domains_to_data.reshape(-1, 1)
 
     # Determine the number of plots to generate
     if pandas_df or isinstance(domains_to_data, np.ndarray):
@@ -1099,8 +1115,8 @@ def plot_spatial_data(domains_to_data, plot_params, get_figure=False):
     else:
         num_plots = int(len(domains_to_data) / num_domains)
 
-    # Initialize a list of Matplotlib figures to return to user if requested
-    figures = []
+    # Build the surface, filename and suptitle of each plot
+    plots = []
 
     # Loop over all columns in NumPy array or Pandas DataFrame input
     for i in range(num_plots):
@@ -1108,33 +1124,18 @@ def plot_spatial_data(domains_to_data, plot_params, get_figure=False):
         # Use domain IDs to appropriately index into FSR data
         # If domains-to-data was input as a Pandas DataFrame
         if pandas_df:
-            surface = domains_to_data.ix[:,i].values
-            surface = surface.take(domains.flatten())
+            surface = _get_surface(domains_to_data.ix[:,i].values, domains,
+                                   plot_params)
         # If domains-to-data was input as a NumPy array
         elif isinstance(domains_to_data, np.ndarray):
-            surface = domains_to_data.take(domains.flatten())
+            surface = _get_surface(domains_to_data[:,i], domains, plot_params)
         # If domains-to-data was input as a Python dictionary
         else:
-            surface = np.zeros(domains.shape, dtype=np.int)
+            surface = np.zeros(domains.shape, dtype=np.float)
             for domain_id in domains_to_data:
                 indices = np.where(domains == domain_id)
                 surface[indices] = domains_to_data[domain_id]
-
-        # Reshape data to 2D array for Matplotlib image plot
-        surface.shape = (plot_params.gridsize, plot_params.gridsize)
-
-        # Normalize data to maximum if requested
-        if plot_params.norm:
-            surface /= np.max(surface)
-
-        # Set zero data entries to NaN so Matplotlib will make them transparent
-        if plot_params.transparent_zeros:
-            indices = np.where(surface == 0.0)
-            surface[indices] = np.nan
-
-        # Color "bad" numbers (ie, NaN, INF) with transparent pixels
-        if plot_params.cmap:
-            plot_params.cmap.set_bad(alpha=0.0)
+            surface = _get_surface(surface, None, plot_params)
 
         # Create plot filename
         plot_filename = directory + plot_params.filename
@@ -1146,63 +1147,193 @@ def plot_spatial_data(domains_to_data, plot_params, get_figure=False):
         # Append file extension (e.g., '.png', '.ppm') to filename
         plot_filename += plot_params.extension
 
-        # Use Python Imaging Library (PIL) to plot 2D color map of domain data
-        if plot_params.library == 'pil':
-            img = _get_pil_image(np.flipud(surface), plot_params)
+        # If input was Pandas DataFrame, append column name to suptitle
+        suptitle = plot_params.suptitle
+        if suptitle and pandas_df:
+            suptitle += ' ({0})'.format(domains_to_data.columns[i])
 
-            if get_figure:
-                figures.append(img)
-            else:
-                img.save(plot_filename)
+        plots.append((surface, plot_filename, suptitle))
 
-        # Use Matplotlib to plot 2D color map of domain data
-        else:
+    # Render and save the plots or return them to the user
+    return _export_spatial_plots(plots, plot_params, coords['bounds'],
+                                 get_figure, num_workers)
 
-            # Ensure that normal settings are used even if called from ipython
-            curr_rc = dict(matplotlib.rcParams)
-            matplotlib.rcParams.update(matplotlib_rcparams)
-
-            fig = plt.figure()
-            fig.patch.set_facecolor('none')
-            plt.imshow(np.flipud(surface), extent=coords['bounds'],
-                       interpolation=plot_params.interpolation,
-                       vmin=plot_params.vmin, vmax=plot_params.vmax,
-                       cmap=plot_params.cmap)
-
-            if plot_params.colorbar:
-                plt.colorbar()
-            if plot_params.title:
-                plt.title(plot_params.title)
-
-            if plot_params.suptitle:
-                # If input was Pandas DataFrame, append column name to suptitle
-                if pandas_df:
-                    suptitle = plot_params.suptitle
-                    suptitle += ' ({0})'.format(domains_to_data.columns[i])
-                else:
-                    suptitle = plot_params.suptitle
 
-                plt.suptitle(suptitle)
+def plot_tiled_spatial_data(domains_to_data, plot_params, tile_size=1024,
+                            pyramid=False, num_workers=1):
+    """Plots a color-coded 2D surface plot of arbitrary data mapped to each
+    spatial domain in the geometry as a grid of image tiles.
 
-            # If the user requested the Matplotlib figure handles for further
-            # specialization, append the handle to this figure to a list
-            if get_figure:
-                figures.append(fig)
+    This routine renders very large plots, such as full-core FSR layouts at
+    pin resolution, without holding the whole image in memory. The plotting
+    window of plot_params.gridsize pixels along each axis is split into
+    square tiles which are queried, colored with the Python Imaging Library
+    (PIL) and saved to disk as they finish. The tiles of each zoom level are
+    saved as '<row>-<column><extension>' in a '<level>' subdirectory of a
+    directory named by plot_params.filename, with the full resolution tiles
+    at level 0.
 
-            # Otherwise, save this Matplotlib figure
-            else:
-                fig.savefig(plot_filename, bbox_inches='tight')
-                plt.close()
+    If a zoom pyramid is requested, each tile at level n+1 is downsampled
+    from the 2x2 tiles beneath it at level n until the whole window fits in
+    a single tile.
 
-            # Restore settings if called from ipython
-            matplotlib.rcParams.update(curr_rc)
+    NOTE: Worker processes are forked and therefore require a POSIX platform.
+    The Geometry is queried with OpenMP by the calling process for a batch of
+    tiles at a time, while the workers color and save the previous batch.
 
-    # Return Matplotlib figures if requested by user
-    if get_figure:
-        return figures
+    Parameters
+    ----------
+    domains_to_data : dict or numpy.ndarray
+        A mapping between spatial domain IDs and numerical data to plot. In
+        the case of 'material' and 'cell' domain types, domains_to_data must
+        be a Python dictionary with keys representing material/cell IDs and
+        values of the data to plot. In the case of the 'fsr' domain type,
+        domains_to_data may be a dictionary or NumPy array indexed by FSR ID.
+    plot_params : openmoc.plotter.PlotParams
+        The plotting parameters
+    tile_size : Integral, optional
+        The number of pixels along each axis of a tile (1024 by default)
+    pyramid : bool, optional
+        Whether to build a zoom pyramid of downsampled tiles (False by default)
+    num_workers : Integral, optional
+        The number of worker processes used to color and save the tiles (1
+        by default)
 
-    # Delete the memory allocated for the domains std::vector
-    del domains
+    Returns
+    -------
+    directory : str
+        The directory with the subdirectory of tiles for each zoom level
+
+    Examples
+    --------
+    A user may invoke this function from an Python file as follows:
+        >>> plot_params = PlotParams()
+        >>> plot_params.geometry = geometry
+        >>> plot_params.domain_type = 'fsr'
+        >>> plot_params.filename = 'fsr-tiles'
+        >>> plot_params.gridsize = 20000
+        >>> openmoc.plotter.plot_tiled_spatial_data(
+        ...     fission_rates, plot_params, pyramid=True, num_workers=4)
+
+    """
+
+    global subdirectory, _tiled_plot
+
+    cv.check_type('plot_params', plot_params, PlotParams)
+    cv.check_type('domains_to_data', domains_to_data, (np.ndarray, dict))
+    cv.check_type('tile_size', tile_size, Integral)
+    cv.check_greater_than('tile_size', tile_size, 0)
+    cv.check_type('pyramid', pyramid, bool)
+    cv.check_type('num_workers', num_workers, Integral)
+    cv.check_greater_than('num_workers', num_workers, 0)
+
+    if plot_params.filename is None:
+        py_printf('ERROR', 'Unable to plot tiled spatial data without a ' +
+                  'filename for the directory of tiles')
+
+    # Map the data to an array if it is indexed by FSR ID
+    if isinstance(domains_to_data, np.ndarray):
+        data = np.asarray(np.ravel(domains_to_data), dtype=np.float)
+        values = data
+    else:
+        data = domains_to_data
+        values = np.asarray(list(domains_to_data.values()), dtype=np.float)
+
+    # Normalize the data to the maximum over all domains rather than tiles
+    if plot_params.vmax is not None:
+        vmax = plot_params.vmax
+    elif plot_params.norm:
+        vmax = 1.
+    else:
+        vmax = np.nanmax(values)
+    scale = 1. / np.nanmax(values) if plot_params.norm else 1.
+
+    # Color "bad" numbers (ie, NaN, INF) with transparent pixels
+    if plot_params.cmap:
+        plot_params.cmap.set_bad(alpha=0.0)
+
+    directory = openmoc.get_output_directory() + subdirectory + \
+        plot_params.filename + '/'
+
+    # Split the pixels of the plotting window into tiles, with the rows of
+    # pixels ordered from the top to the bottom of the window
+    coords = _get_pixel_coords(plot_params)
+    num_tiles = -(-plot_params.gridsize // tile_size)
+
+    _tiled_plot = {'data': data,
+                   'x': coords['x'],
+                   'y': coords['y'][::-1],
+                   'geometry': plot_params.geometry,
+                   'zcoord': plot_params.zcoord,
+                   'domain_type': plot_params.domain_type,
+                   'scale': scale,
+                   'vmax': vmax,
+                   'transparent_zeros': plot_params.transparent_zeros,
+                   'cmap': plot_params.cmap,
+                   'tile_size': tile_size,
+                   'num_tiles': num_tiles,
+                   'directory': directory,
+                   'extension': plot_params.extension}
+
+    py_printf('NORMAL', 'Plotting %d x %d tiles of %d x %d pixels...',
+              num_tiles, num_tiles, tile_size, tile_size)
+
+    timer = time.time()
+    level = 0
+    tiles = [(row, col) for row in range(num_tiles)
+             for col in range(num_tiles)]
+
+    # The worker processes only color and save the tiles
+    num_workers = min(num_workers, len(tiles))
+    pool = _fork_pool(num_workers) if num_workers > 1 else None
+
+    try:
+        # Render the full resolution tiles, then downsample the tiles of
+        # each zoom level from those beneath it
+        while True:
+            try:
+                os.makedirs(directory + str(level))
+            except OSError:
+                pass
+
+            if pool is None:
+                for tile in tiles:
+                    _render_tile(level, tile)
+
+            # Query a batch of tiles in this process while the workers color
+            # and save the previous batch
+            else:
+                pending = None
+                for i in range(0, len(tiles), num_workers):
+                    batch = [(level, tile, _query_tile(tile) if level == 0
+                              else None)
+                             for tile in tiles[i:i+num_workers]]
+                    if pending is not None:
+                        pending.get()
+                    pending = pool.map_async(_render_tile_star, batch)
+                pending.get()
+
+            if not pyramid or num_tiles == 1:
+                break
+
+            level += 1
+            num_tiles = -(-num_tiles // 2)
+            _tiled_plot['num_tiles'] = num_tiles
+            tiles = [(row, col) for row in range(num_tiles)
+                     for col in range(num_tiles)]
+
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+        _tiled_plot = None
+
+    timer = time.time() - timer
+    py_printf('INFO', 'Rendered %d zoom level(s) with %d process(es) in ' +
+              '%.3f sec (%.2E pixels/sec)', level + 1, num_workers, timer,
+              plot_params.gridsize ** 2 / max(timer, 1e-12))
+
+    return directory
 
 
 def plot_quadrature(solver, get_figure=False):
@@ -1621,6 +1752,434 @@ def _get_pixel_coords(plot_params):
     return coords
 
 
+def clear_raster_cache():
+    """Clear the cache of domain IDs rasterized on plotting grids.
+
+    The domain IDs on the plotting grid of each plot are cached such that
+    later plots of the same Geometry, window and domain type need not query
+    the Geometry again. The cache must be cleared if the Geometry is modified
+    after plotting without changing its number of FSRs.
+
+    """
+
+    _raster_cache.clear()
+
+
+def _get_domains_on_grid(plot_params):
+    """A helper method to rasterize the domain IDs on a plotting window.
+
+    This routine queries the Geometry for the material, cell or FSR ID at
+    each pixel in the plotting window. The domain IDs are cached such that
+    later plots with the same Geometry, window, gridsize, z-coordinate and
+    domain type reuse them.
+
+    Parameters
+    ----------
+    plot_params : openmoc.plotter.PlotParams
+        A PlotParams object initialized with a geometry
+
+    Returns
+    -------
+    coords : dict
+        A dictionary with the plotting window map and bounding box
+    domains : numpy.ndarray
+        A read-only 2D array of the domain IDs at each pixel
+
+    """
+
+    global raster_cache_size
+
+    coords = _get_pixel_coords(plot_params)
+    geometry = plot_params.geometry
+    key = (int(geometry.this), geometry.getNumFSRs(), tuple(coords['bounds']),
+           plot_params.gridsize, plot_params.zcoord, plot_params.domain_type)
+
+    if key in _raster_cache:
+        _raster_cache[key] = _raster_cache.pop(key)
+        return coords, _raster_cache[key][1]
+
+    # Query the geometry for the data on the spatial grid
+    domains = geometry.getSpatialDataOnGrid(
+        coords['x'], coords['y'], zcoord=plot_params.zcoord,
+        domain_type=plot_params.domain_type)
+    domains = np.reshape(np.asarray(domains, dtype=np.int64),
+                         tuple(([plot_params.gridsize]*2)))
+    domains.flags.writeable = False
+
+    # Store a reference to the Geometry with its domain IDs such that its
+    # address is not reused by another Geometry while it is in the cache
+    _raster_cache[key] = (geometry, domains)
+    while len(_raster_cache) > raster_cache_size:
+        _raster_cache.popitem(last=False)
+
+    return coords, domains
+
+
+def _get_surface(data, domains, plot_params):
+    """A helper method to map data for each domain onto the plotting grid.
+
+    Parameters
+    ----------
+    data : numpy.ndarray
+        The data for each domain, or the data on the plotting grid if
+        domains is None
+    domains : numpy.ndarray or None
+        The 2D array of domain IDs on the plotting grid
+    plot_params : openmoc.plotter.PlotParams
+        The plotting parameters
+
+    Returns
+    -------
+    surface : numpy.ndarray
+        The 2D array of data on the plotting grid
+
+    """
+
+    if domains is None:
+        surface = np.array(data, dtype=np.float)
+    else:
+        surface = np.asarray(data, dtype=np.float).take(domains)
+
+    # Reshape data to 2D array for Matplotlib image plot
+    surface.shape = (plot_params.gridsize, plot_params.gridsize)
+
+    # Normalize data to maximum if requested
+    if plot_params.norm:
+        surface /= np.max(surface)
+
+    # Set zero data entries to NaN so Matplotlib will make them transparent
+    if plot_params.transparent_zeros:
+        indices = np.where(surface == 0.0)
+        surface[indices] = np.nan
+
+    return surface
+
+
+def _get_flux_plots(fluxes, energy_groups, plot_params, directory):
+    """A helper method to build the plots of the fluxes in energy groups.
+
+    Parameters
+    ----------
+    fluxes : numpy.ndarray
+        The scalar fluxes indexed by FSR and energy group
+    energy_groups : Iterable of Integral
+        The energy groups to plot (starting at 1 for the highest energy)
+    plot_params : openmoc.plotter.PlotParams
+        The plotting parameters
+    directory : str
+        The directory to save the plots in
+
+    Returns
+    -------
+    plots : list of tuple
+        The 2D surface, filename and suptitle of each plot
+
+    """
+
+    coords, domains = _get_domains_on_grid(plot_params)
+    zcoord = plot_params.zcoord
+
+    plots = []
+    for group in energy_groups:
+        surface = _get_surface(fluxes[:,group-1], domains, plot_params)
+        filename = directory + 'fsr-flux-group-{0}-z-{1}'.format(group, zcoord)
+        suptitle = 'FSR Scalar Flux (Group {0})'.format(group)
+        plots.append((surface, filename + plot_params.extension, suptitle))
+
+    return plots
+
+
+def _export_spatial_plots(plots, plot_params, bounds, get_figure=False,
+                          num_workers=1):
+    """A helper method to render and save or return 2D surface plots.
+
+    The plots are rendered and saved in turn by this process unless a pool
+    of worker processes is requested. The worker processes are forked and
+    therefore require a POSIX platform.
+
+    Parameters
+    ----------
+    plots : list of tuple
+        The 2D surface, filename and suptitle of each plot
+    plot_params : openmoc.plotter.PlotParams
+        The plotting parameters shared by all plots
+    bounds : list of Real
+        The bounding box of the plotting window
+    get_figure : bool
+        Whether to return the Matplotlib figures / PIL Images rather than
+        saving them (False by default)
+    num_workers : Integral
+        The number of processes used to render and save the plots
+
+    Returns
+    -------
+    figures : list of matplotlib.Figure or PIL.Image or None
+        The figures are returned if get_figure is True
+
+    """
+
+    global _export_plots, _export_settings
+
+    # Color "bad" numbers (ie, NaN, INF) with transparent pixels
+    if plot_params.cmap:
+        plot_params.cmap.set_bad(alpha=0.0)
+
+    settings = {'library': plot_params.library,
+                'bounds': bounds,
+                'interpolation': plot_params.interpolation,
+                'vmin': plot_params.vmin,
+                'vmax': plot_params.vmax,
+                'cmap': plot_params.cmap,
+                'colorbar': plot_params.colorbar,
+                'title': plot_params.title}
+
+    if get_figure:
+        return [_render_spatial_plot(surface, None, suptitle, settings)
+                for surface, filename, suptitle in plots]
+
+    # Make the directories if they do not exist
+    for directory in set(os.path.dirname(plot[1]) for plot in plots):
+        try:
+            os.makedirs(directory)
+        except OSError:
+            pass
+
+    timer = time.time()
+    num_workers = min(num_workers, len(plots))
+
+    # Render and save the plots in this process or in forked worker processes
+    if num_workers <= 1:
+        for surface, filename, suptitle in plots:
+            _render_spatial_plot(surface, filename, suptitle, settings)
+    else:
+        _export_plots = plots
+        _export_settings = settings
+        pool = _fork_pool(num_workers)
+        try:
+            pool.map(_export_spatial_plot, range(len(plots)))
+        finally:
+            pool.close()
+            pool.join()
+            _export_plots = None
+            _export_settings = None
+
+    timer = time.time() - timer
+    py_printf('INFO', 'Exported %d plots with %d process(es) in %.3f sec ' +
+              '(%.2f plots/sec)', len(plots), max(num_workers, 1), timer,
+              len(plots) / max(timer, 1e-12))
+
+
+def _fork_pool(num_workers):
+    """Return a pool of worker processes forked from this process.
+
+    The workers find the plots they render in module globals, which are only
+    inherited by forked workers, so processes are forked even where they are
+    spawned by default.
+
+    Parameters
+    ----------
+    num_workers : Integral
+        The number of worker processes
+
+    Returns
+    -------
+    pool : multiprocessing.Pool
+        The pool of forked worker processes
+
+    """
+
+    if sys.version_info[0] == 2:
+        return multiprocessing.Pool(num_workers)
+
+    if 'fork' not in multiprocessing.get_all_start_methods():
+        py_printf('ERROR', 'Unable to plot with %d worker processes since ' +
+                  'processes cannot be forked on this platform', num_workers)
+
+    return multiprocessing.get_context('fork').Pool(num_workers)
+
+
+def _export_spatial_plot(index):
+    """Render and save a single plot of the global export in a worker.
+
+    Parameters
+    ----------
+    index : Integral
+        The index of the plot to render and save
+
+    """
+
+    surface, filename, suptitle = _export_plots[index]
+    _render_spatial_plot(surface, filename, suptitle, _export_settings)
+
+
+def _render_spatial_plot(surface, filename, suptitle, settings):
+    """A helper method to render a 2D surface plot and save it to a file.
+
+    Parameters
+    ----------
+    surface : numpy.ndarray
+        The 2D array of data on the plotting grid
+    filename : str or None
+        The file to save the plot to, or None to return the figure
+    suptitle : str or None
+        The major title string
+    settings : dict
+        The library, bounding box, interpolation, colormap, colorbar and
+        minor title used to render the plot
+
+    Returns
+    -------
+    fig : matplotlib.Figure or PIL.Image or None
+        The figure is returned if no filename is given
+
+    """
+
+    global matplotlib_rcparams
+
+    # Use Python Imaging Library (PIL) to plot 2D color map of domain data
+    if settings['library'] == 'pil':
+        img = _get_pil_image(np.flipud(surface), settings['cmap'])
+
+        if filename is None:
+            return img
+        else:
+            img.save(filename)
+            return
+
+    # Use Matplotlib to plot 2D color map of domain data
+    # Ensure that normal settings are used even if called from ipython
+    curr_rc = dict(matplotlib.rcParams)
+    matplotlib.rcParams.update(matplotlib_rcparams)
+
+    fig = plt.figure()
+    fig.patch.set_facecolor('none')
+    plt.imshow(np.flipud(surface), extent=settings['bounds'],
+               interpolation=settings['interpolation'],
+               vmin=settings['vmin'], vmax=settings['vmax'],
+               cmap=settings['cmap'])
+
+    if settings['colorbar']:
+        plt.colorbar()
+    if settings['title']:
+        plt.title(settings['title'])
+    if suptitle:
+        plt.suptitle(suptitle)
+
+    # Save this Matplotlib figure unless the figure handle was requested for
+    # further specialization
+    if filename is not None:
+        fig.savefig(filename, bbox_inches='tight')
+        plt.close(fig)
+        fig = None
+
+    # Restore settings if called from ipython
+    matplotlib.rcParams.update(curr_rc)
+
+    return fig
+
+
+def _query_tile(tile):
+    """Query the Geometry for the domain IDs on the pixels of a single tile of
+    the global tiled plot.
+
+    Parameters
+    ----------
+    tile : 2-tuple of Integral
+        The row and column of the tile
+
+    Returns
+    -------
+    domains : numpy.ndarray of Integral
+        The domain IDs on the rows and columns of pixels of the tile
+
+    """
+
+    plot = _tiled_plot
+    row, col = tile
+    size = plot['tile_size']
+
+    xcoords = plot['x'][col*size:(col+1)*size]
+    ycoords = plot['y'][row*size:(row+1)*size]
+    domains = plot['geometry'].getSpatialDataOnGrid(
+        xcoords, ycoords, zcoord=plot['zcoord'],
+        domain_type=plot['domain_type'])
+    return np.reshape(np.asarray(domains, dtype=np.int64),
+                      (len(ycoords), len(xcoords)))
+
+
+def _render_tile(level, tile, domains=None):
+    """Render a single tile of the global tiled plot and save it to disk.
+
+    The full resolution tiles at level 0 are colored from the domain IDs on
+    their pixels, which are queried from the Geometry unless they are given.
+    The tiles at higher zoom levels are downsampled from the 2x2 tiles
+    beneath them, which are read back from disk.
+
+    Parameters
+    ----------
+    level : Integral
+        The zoom level of the tile
+    tile : 2-tuple of Integral
+        The row and column of the tile
+    domains : numpy.ndarray of Integral, optional
+        The domain IDs on the pixels of a tile at level 0
+
+    """
+
+    from PIL import Image
+
+    plot = _tiled_plot
+    row, col = tile
+    size = plot['tile_size']
+    directory = plot['directory']
+    extension = plot['extension']
+
+    # Downsample the 2x2 tiles beneath this one at the previous zoom level
+    if level > 0:
+        subtiles = []
+        for i in range(2):
+            for j in range(2):
+                filename = directory + '{0}/{1}-{2}{3}'.format(
+                    level - 1, 2*row + i, 2*col + j, extension)
+                if os.path.exists(filename):
+                    subtiles.append((i, j, Image.open(filename)))
+
+        width = max(j * size + img.size[0] for i, j, img in subtiles)
+        height = max(i * size + img.size[1] for i, j, img in subtiles)
+        img = Image.new('RGBA', (width, height))
+        for i, j, subtile in subtiles:
+            img.paste(subtile, (j * size, i * size))
+        img = img.resize((max(width // 2, 1), max(height // 2, 1)),
+                         Image.LANCZOS)
+
+    # Map the data onto the domain IDs on this tile's pixels
+    else:
+        if domains is None:
+            domains = _query_tile(tile)
+
+        if isinstance(plot['data'], np.ndarray):
+            surface = plot['data'].take(domains)
+        else:
+            surface = np.zeros(domains.shape, dtype=np.float)
+            for domain_id in plot['data']:
+                surface[domains == domain_id] = plot['data'][domain_id]
+
+        surface *= plot['scale']
+        if plot['transparent_zeros']:
+            surface[surface == 0.0] = np.nan
+
+        img = _get_pil_image(surface, plot['cmap'], plot['vmax'])
+
+    img.save(directory + '{0}/{1}-{2}{3}'.format(level, row, col, extension))
+
+
+def _render_tile_star(args):
+    """Unpack the arguments to render a tile of the global tiled plot in a
+    worker process."""
+
+    return _render_tile(*args)
+
+
 def _colorize(data, num_colors, seed=1):
     """Replace unique data values with a random but reproducible color IDs.
 
@@ -1660,17 +2219,22 @@ def _colorize(data, num_colors, seed=1):
     return ids_to_colors.take(data)
 
 
-def _get_pil_image(array, plot_params):
+def _get_pil_image(array, cmap, vmax=None):
     """Plot 2D NumPy array data using Python Imaging Library (PIL).
 
-    This is a good alternative to matplotlib for high-resolution images.
+    This is a good alternative to matplotlib for high-resolution images. The
+    colormap is applied with a lookup table of its colors, which is much
+    faster than calling the colormap on the array for large images.
 
     Parameters
     ----------
     array : numpy.ndarray
         A NumPy array of data
-    plot_params : openmoc.plotter.PlotParmas
-        A PlotParams object with the matplotlib colormap to use
+    cmap : matplotlib.colormap
+        The matplotlib colormap to use
+    vmax : Real or None
+        The value mapped to the top of the colormap (default is None for the
+        maximum of the array)
 
     Returns
     -------
@@ -1684,7 +2248,25 @@ def _get_pil_image(array, plot_params):
     # Convert array to a normalized array of floating point values
     float_array = np.zeros(array.shape, dtype=np.float)
     float_array[:,:] = array[:,:]
-    float_array[:,:] /= np.max(float_array)
+    if vmax is None:
+        vmax = np.nanmax(float_array)
+    float_array[:,:] /= vmax
+
+    # Build a lookup table of the colormap's colors followed by its colors
+    # for values under and over its range and for "bad" numbers
+    num_colors = cmap.N
+    lut = np.vstack((cmap(np.arange(num_colors)), cmap([-1., 2., np.nan])))
+    lut = np.uint8(lut * 255)
+
+    # Map the normalized values to the colormap's indices as Matplotlib does
+    float_array *= num_colors
+    float_array[float_array == num_colors] = num_colors - 1
+    bad = np.isnan(float_array)
+    float_array[bad] = 0.
+    indices = np.floor(float_array).astype(np.intp)
+    indices[float_array < 0.] = num_colors
+    indices[float_array >= num_colors] = num_colors + 1
+    indices[bad] = num_colors + 2
 
     # Use Python Imaging Library (PIL) to create an image from the array
-    return Image.fromarray(np.uint8(plot_params.cmap(float_array) * 255))
+    return Image.fromarray(lut.take(indices, axis=0))
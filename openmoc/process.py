@@ -80,36 +80,34 @@ def get_scalar_fluxes(solver, fsrs='all', groups='all'):
     else:
         cv.check_type('groups', Iterable, Integral)
 
+    num_fsrs = solver.getGeometry().getNumFSRs()
+    num_groups = solver.getGeometry().getNumEnergyGroups()
+
+    # Read the fluxes from a view of the Solver's scalar flux array, which
+    # may be padded in energy, rather than copying them out of the Solver.
+    # The GPUSolver stores its fluxes on the device and must copy them.
+    if 'GPUSolver' in type(solver).__name__:
+        fluxes = solver.getFluxes(num_fsrs * num_groups)
+        fluxes = np.reshape(fluxes, (num_fsrs, num_groups))
+    else:
+        fluxes = solver.getScalarFluxView()[:, :num_groups]
+
     # Extract all of the FSR scalar fluxes
     if groups == 'all' and fsrs == 'all':
-        num_fsrs = solver.getGeometry().getNumFSRs()
-        num_groups = solver.getGeometry().getNumEnergyGroups()
-        num_fluxes = num_groups * num_fsrs
-        fluxes = solver.getFluxes(num_fluxes)
-        fluxes = np.reshape(fluxes, (num_fsrs, num_groups))
-        return fluxes
+        return np.array(fluxes)
 
-    # Build a list of FSRs to iterate over
+    # Build a list of FSRs to extract
     if fsrs == 'all':
-        num_fsrs = solver.getGeometry().getNumFSRs()
         fsrs = np.arange(num_fsrs)
-    else:
-        num_fsrs = len(fsrs)
 
-    # Build a list of enery groups to iterate over
+    # Build a list of enery groups to extract
     if groups == 'all':
-        num_groups = solver.getGeometry().getNumEnergyGroups()
         groups = np.arange(num_groups) + 1
-    else:
-        num_groups = len(groups)
 
     # Extract some of the FSR scalar fluxes
-    fluxes = np.zeros((num_fsrs, num_groups))
-    for fsr in fsrs:
-        for group in groups:
-            fluxes[fsr, group-1] = solver.getFlux(int(fsr), int(group))
-
-    return fluxes
+    fsrs = np.asarray(fsrs, dtype=int)
+    groups = np.asarray(groups, dtype=int) - 1
+    return np.array(fluxes[np.ix_(fsrs, groups)], dtype=np.float64)
 
 
 def compute_fission_rates(solver, use_hdf5=False):
@@ -154,22 +152,37 @@ def compute_fission_rates(solver, use_hdf5=False):
     geometry = solver.getGeometry()
 
     # Compute the volume-weighted fission rates for each FSR
-    fsr_fission_rates = solver.computeFSRFissionRates(geometry.getNumFSRs())
+    num_fsrs = geometry.getNumFSRs()
+    fsr_fission_rates = solver.computeFSRFissionRates(num_fsrs)
+
+    # Find the FSRs filled by fissionable materials
+    materials = geometry.getAllMaterials()
+    fissionable_ids = [material_id for material_id in materials
+                       if materials[material_id].isFissionable()]
+    fsr_material_ids = geometry.getFSRMaterialIds(num_fsrs)
+    fsr_points = geometry.getFSRPoints(num_fsrs * 3).reshape(num_fsrs, 3)
 
     # Initialize fission rates dictionary
     fission_rates_sum = {}
 
+    # Reuse the same LocalCoords linked list for each FSR
+    root_coords = openmoc.LocalCoords(0., 0., 0.)
+    root_coords.reserveLevels(geometry.getMaxNestingDepth())
+
     # Loop over FSRs and populate fission rates dictionary
-    for fsr in range(geometry.getNumFSRs()):
+    for fsr in range(num_fsrs):
 
-        if geometry.findFSRMaterial(fsr).isFissionable():
+        if fsr_material_ids[fsr] in fissionable_ids:
 
             # Get the linked list of LocalCoords
-            point = geometry.getFSRPoint(fsr)
-            coords = openmoc.LocalCoords(point.getX(), point.getY(), point.getZ())
-            coords.setUniverse(geometry.getRootUniverse())
-            geometry.findCellContainingCoords(coords)
-            coords = coords.getHighestLevel().getNext()
+            x, y, z = fsr_points[fsr]
+            root_coords.prune()
+            root_coords.setX(x)
+            root_coords.setY(y)
+            root_coords.setZ(z)
+            root_coords.setUniverse(geometry.getRootUniverse())
+            geometry.findCellContainingCoords(root_coords)
+            coords = root_coords.getNext()
 
             # initialize dictionary key
             key = 'UNIV = 0 : '
@@ -216,7 +229,8 @@ def store_simulation_state(solver, fluxes=False, sources=False,
                            fission_rates=False, use_hdf5=False,
                            filename='simulation-state',
                            directory = 'simulation-states',
-                           append=True, note=''):
+                           append=True, note='', compression='gzip',
+                           indexed=False):
     """Store all of the data for an OpenMOC simulation to a binary file for
     downstream data processing.
 
@@ -247,6 +261,14 @@ def store_simulation_state(solver, fluxes=False, sources=False,
     output file, or append to an existing file using a timestamp to record
     multiple simulation states to the same file.
 
+    The FSR scalar fluxes and sources are streamed from the Solver into
+    chunked and compressed HDF5 datasets a chunk of FSRs at a time. If an
+    indexed HDF5 file is requested, each simulation state is appended to a
+    'states' group as a numbered group and a row is appended to an 'index'
+    dataset with the timestamp, Solver type, note, eigenvalue, number of
+    iterations and runtime of each state. Thousands of states may then be
+    listed and read selectively, e.g., with SimulationStates(...).
+
     Parameters
     ----------
     solver : openmoc.Solver
@@ -267,6 +289,11 @@ def store_simulation_state(solver, fluxes=False, sources=False,
         Append to existing file or create new one (False by default)
     note : str, optional
         An optional string note to include in state file
+    compression : {'gzip', 'lzf', None}
+        The compression filter for the HDF5 FSR datasets (default is 'gzip')
+    indexed : bool
+        Whether to store the state in an indexed HDF5 file rather than in
+        groups for each day and time (False by default)
 
     Examples
     --------
@@ -291,6 +318,8 @@ def store_simulation_state(solver, fluxes=False, sources=False,
     cv.check_type('directory', directory, basestring)
     cv.check_type('append', append, bool)
     cv.check_type('note', note, basestring)
+    cv.check_value('compression', compression, ('gzip', 'lzf', None))
+    cv.check_type('indexed', indexed, bool)
 
     # Make directory if it does not exist
     if not os.path.exists(directory):
@@ -354,33 +383,42 @@ def store_simulation_state(solver, fluxes=False, sources=False,
     tot_time = solver.getTotalTime()
     keff = solver.getKeff()
 
-    if solver_type is 'GPUSolver':
-        num_threads = solver.getNumThreadsPerBlock()
-        num_blocks = solver.getNumThreadBlocks()
+    # Store the simulation data in a Python dictionary
+    state = {}
+    state['solver type'] = solver_type
+    state['# FSRs'] = num_FSRs
+    state['# materials'] = num_materials
+    state['# energy groups'] = num_groups
+    state['z coord'] = zcoord
+    state['# tracks'] = num_tracks
+    state['# segments'] = num_segments
+    state['track spacing [cm]'] = spacing
+    state['# azimuthal angles'] = num_azim
+    state['# polar angles'] = num_polar
+    state['# iterations'] = num_iters
+    state['convergence threshold'] = thresh
+    state['exponential'] = method
+    state['floating point'] = precision
+    state['CMFD'] = cmfd
+    state['time [sec]'] = tot_time
+    state['keff'] = keff
+
+    if solver_type == 'GPUSolver':
+        state['# threads per block'] = solver.getNumThreadsPerBlock()
+        state['# thread blocks'] = solver.getNumThreadBlocks()
     else:
-        num_threads = solver.getNumThreads()
+        state['# threads'] = solver.getNumThreads()
 
-    # If the user requested to store the FSR fluxes
+    # The FSR data requested by the user, indexed by FSR and energy group
+    fsr_data = []
     if fluxes:
-
-        # Allocate array
-        scalar_fluxes = np.zeros((num_FSRs, num_groups))
-
-        # Get the scalar flux for each FSR and energy group
-        for i in range(num_FSRs):
-            for j in range(num_groups):
-                scalar_fluxes[i,j] = solver.getFlux(i,j+1)
-
-    # If the user requested to store the FSR sources
+        fsr_data.append('FSR scalar fluxes')
     if sources:
+        fsr_data.append('FSR sources')
 
-        # Allocate array
-        sources_array = np.zeros((num_FSRs, num_groups))
-
-        # Get the scalar flux for each FSR and energy group
-        for i in range(num_FSRs):
-            for j in range(num_groups):
-                sources_array[i,j] = solver.getFSRSource(i,j+1)
+    # Create strings for the day and time
+    day_key = '{0:02}-{1:02}-{2:02}'.format(month, day, year)
+    time_key = '{0:02}:{1:02}:{2:02}'.format(hr, mins, sec)
 
     # If using HDF5
     if use_hdf5:
@@ -389,54 +427,42 @@ def store_simulation_state(solver, fluxes=False, sources=False,
         else:
             f = h5py.File(directory + '/' + filename + '.h5', 'w')
 
-        # Create groups for the day in the HDF5 file
-        day_key = '{0:02}-{1:02}-{2:02}'.format(month, day, year)
-        day_group = f.require_group(day_key)
+        # Append a numbered group for this state and a row to the index
+        if indexed:
+            time_group = _append_indexed_state(f, state, day_key, time_key,
+                                               note)
+
+        # Create groups for the day and time in the HDF5 file
+        else:
+            day_group = f.require_group(day_key)
 
-        # Create group for the time - use counter in case two simulations
-        # write simulation state at the exact same hour,minute, and second
-        time_key = '{0:02}:{1:02}:{2:02}'.format(hr, mins, sec)
-        counter = 0
-        while time_key in day_group.keys():
-            time_key = '{0:02}:{1:02}:{2:02}-{3}'.format(hr, mins, sec, counter)
-            counter += 1
+            # Use counter in case two simulations write simulation state at
+            # the exact same hour, minute, and second
+            key = time_key
+            counter = 0
+            while key in day_group.keys():
+                key = '{0}-{1}'.format(time_key, counter)
+                counter += 1
 
-        time_group = day_group.require_group(time_key)
+            time_group = day_group.require_group(key)
 
         # Store a note for this simulation state
-        if not note is '':
+        if note != '':
             time_group.attrs['note'] = note
 
         # Store simulation data to the HDF5 file
-        time_group.create_dataset('solver type', data=solver_type)
-        time_group.create_dataset('# FSRs', data=num_FSRs)
-        time_group.create_dataset('# materials', data=num_materials)
-        time_group.create_dataset('# energy groups', data=num_groups)
-        time_group.create_dataset('z coord', data=zcoord)
-        time_group.create_dataset('# tracks', data=num_tracks)
-        time_group.create_dataset('# segments', data=num_segments)
-        time_group.create_dataset('track spacing [cm]', data=spacing)
-        time_group.create_dataset('# azimuthal angles', data=num_azim)
-        time_group.create_dataset('# polar angles', data=num_polar)
-        time_group.create_dataset('# iterations', data=num_iters)
-        time_group.create_dataset('convergence threshold', data=thresh)
-        time_group.create_dataset('exponential', data=method)
-        time_group.create_dataset('floating point', data=precision)
-        time_group.create_dataset('CMFD', data=cmfd)
-        time_group.create_dataset('time [sec]', data=tot_time)
-        time_group.create_dataset('keff', data=keff)
-
-        if solver_type is 'GPUSolver':
-            time_group.create_dataset('# threads per block', data=num_threads)
-            time_group.create_dataset('# thread blocks', data=num_blocks)
-        else:
-            time_group.create_dataset('# threads', data=num_threads)
-
-        if fluxes:
-            time_group.create_dataset('FSR scalar fluxes', data=scalar_fluxes)
-
-        if sources:
-            time_group.create_dataset('FSR sources', data=sources_array)
+        for key in state:
+            time_group.create_dataset(key, data=state[key])
+
+        # Stream the FSR data into chunked, compressed datasets
+        chunk_FSRs = _get_chunk_num_fsrs(num_FSRs, num_groups)
+        for name in fsr_data:
+            dataset = time_group.create_dataset(
+                name, shape=(num_FSRs, num_groups), dtype=np.float64,
+                chunks=(chunk_FSRs, num_groups), compression=compression)
+            for first, last, data in \
+                _iter_fsr_data(solver, name, num_FSRs, num_groups, chunk_FSRs):
+                dataset[first:last] = data
 
         if fission_rates:
             compute_fission_rates(solver, use_hdf5=True)
@@ -455,51 +481,20 @@ def store_simulation_state(solver, fluxes=False, sources=False,
         else:
             sim_states = {}
 
-        # Create strings for the day and time
-        day = str(month).zfill(2)+'-'+str(day).zfill(2)+'-'+str(year)
-        time = str(hr).zfill(2)+':'+str(mins).zfill(2)+':'+str(sec).zfill(2)
-
         # Create dictionaries for this day and time within the pickled file
-        if not day in sim_states.keys():
-            sim_states[day] = {}
+        if not day_key in sim_states.keys():
+            sim_states[day_key] = {}
 
-        sim_states[day][time] = {}
-        state = sim_states[day][time]
+        sim_states[day_key][time_key] = state
 
         # Store a note for this simulation state
-        if not note is '':
+        if note != '':
             state['note'] = note
 
-        # Store simulation data to a Python dictionary
-        state['solver type'] = solver_type
-        state['# FSRs'] = num_FSRs
-        state['# materials'] = num_materials
-        state['# energy groups'] = num_groups
-        state['z coord'] = zcoord
-        state['# tracks'] = num_tracks
-        state['# segments'] = num_segments
-        state['track spacing [cm]'] = spacing
-        state['# azimuthal angles'] = num_azim
-        state['# polar angles'] = num_polar
-        state['# iterations'] = num_iters
-        state['convergence threshold'] = thresh
-        state['exponential'] = method
-        state['floating point'] = precision
-        state['CMFD'] = cmfd
-        state['time [sec]'] = tot_time
-        state['keff'] = keff
-
-        if solver_type is 'GPUSolver':
-            state['# threads per block'] = num_threads
-            state['# thread blocks'] = num_blocks
-        else:
-            state['# threads'] = num_threads
-
-        if fluxes:
-            state['FSR scalar fluxes'] = scalar_fluxes
-
-        if sources:
-            state['FSR sources'] = sources_array
+        for name in fsr_data:
+            state[name] = np.concatenate(
+                [data for first, last, data in
+                 _iter_fsr_data(solver, name, num_FSRs, num_groups)])
 
         if fission_rates:
             compute_fission_rates(solver, False)
@@ -509,8 +504,162 @@ def store_simulation_state(solver, fluxes=False, sources=False,
         # Pickle the simulation states to a file
         pickle.dump(sim_states, open(filename, 'wb'))
 
-        # Pickle the simulation states to a file
-        pickle.dump(sim_states, open(filename, 'wb'))
+
+def _get_chunk_num_fsrs(num_FSRs, num_groups):
+    """Return the number of FSRs in each chunk of streamed FSR data.
+
+    The chunks are sized to about one megabyte of double precision values.
+
+    Parameters
+    ----------
+    num_FSRs : Integral
+        The number of FSRs
+    num_groups : Integral
+        The number of energy groups
+
+    Returns
+    -------
+    chunk_FSRs : Integral
+        The number of FSRs in each chunk
+
+    """
+
+    return max(min(num_FSRs, 2**17 // num_groups), 1)
+
+
+def _iter_fsr_data(solver, name, num_FSRs, num_groups, chunk_FSRs=None):
+    """Iterate over the FSR scalar fluxes or sources in chunks of FSRs.
+
+    The scalar fluxes are read from a view of the Solver's flux array and the
+    sources are computed a chunk at a time, such that no more than one chunk
+    is copied from the Solver at a time. The GPUSolver stores its fluxes on
+    the device and copies all of them at once.
+
+    Parameters
+    ----------
+    solver : openmoc.Solver
+        The solver used to compute the flux
+    name : {'FSR scalar fluxes', 'FSR sources'}
+        The FSR data to iterate over
+    num_FSRs : Integral
+        The number of FSRs
+    num_groups : Integral
+        The number of energy groups
+    chunk_FSRs : Integral or None
+        The number of FSRs in each chunk (default is None for about one
+        megabyte of values)
+
+    Yields
+    ------
+    first : Integral
+        The ID of the first FSR in the chunk
+    last : Integral
+        One past the ID of the last FSR in the chunk
+    data : numpy.ndarray
+        The data in the chunk indexed by FSR and energy group
+
+    """
+
+    if chunk_FSRs is None:
+        chunk_FSRs = _get_chunk_num_fsrs(num_FSRs, num_groups)
+
+    with_cuda = 'GPUSolver' in type(solver).__name__
+
+    if name == 'FSR scalar fluxes':
+        if with_cuda:
+            fluxes = np.reshape(solver.getFluxes(num_FSRs * num_groups),
+                                (num_FSRs, num_groups))
+        else:
+            fluxes = solver.getScalarFluxView()[:, :num_groups]
+
+    for first in range(0, num_FSRs, chunk_FSRs):
+        last = min(first + chunk_FSRs, num_FSRs)
+
+        if name == 'FSR scalar fluxes':
+            data = np.array(fluxes[first:last], dtype=np.float64)
+        elif with_cuda:
+            data = np.zeros((last - first, num_groups))
+            for i in range(first, last):
+                for j in range(num_groups):
+                    data[i-first,j] = solver.getFSRSource(i,j+1)
+        else:
+            data = solver.getFSRSources(first, (last - first) * num_groups)
+            data = np.reshape(data, (last - first, num_groups))
+
+        yield first, last, data
+
+
+# The fields of each row of the index of an indexed simulation state file
+_index_fields = ('state', 'date', 'time', 'solver type', 'note', 'keff',
+                 '# iterations', 'time [sec]', '# FSRs', '# energy groups')
+
+
+def _get_index_dtype():
+    """Return the NumPy compound data type of a simulation state index row.
+
+    Returns
+    -------
+    dtype : numpy.dtype
+        The data type of the fields in each row of the index
+
+    """
+
+    string = h5py.special_dtype(vlen=str)
+    return np.dtype([('state', string), ('date', string), ('time', string),
+                     ('solver type', string), ('note', string),
+                     ('keff', np.float64), ('# iterations', np.int64),
+                     ('time [sec]', np.float64), ('# FSRs', np.int64),
+                     ('# energy groups', np.int64)])
+
+
+def _append_indexed_state(f, state, day_key, time_key, note):
+    """Append a group for a simulation state to an indexed HDF5 file.
+
+    Parameters
+    ----------
+    f : h5py.File
+        The HDF5 file opened for writing
+    state : dict
+        The scalar simulation state data
+    day_key : str
+        The date the state was stored
+    time_key : str
+        The time of day the state was stored
+    note : str
+        The note for the state
+
+    Returns
+    -------
+    group : h5py.Group
+        The new group for the simulation state
+
+    """
+
+    states = f.require_group('states')
+
+    if 'index' in f:
+        index = f['index']
+    else:
+        index = f.create_dataset('index', shape=(0,), maxshape=(None,),
+                                 chunks=(256,), dtype=_get_index_dtype())
+
+    # Name the state's group by its position in the index
+    num_states = index.shape[0]
+    state_key = '{0:08}'.format(num_states)
+
+    row = np.zeros(1, dtype=index.dtype)
+    row['state'] = state_key
+    row['date'] = day_key
+    row['time'] = time_key
+    row['note'] = note
+    for field in _index_fields[3:]:
+        if field != 'note':
+            row[field] = state[field]
+
+    index.resize((num_states + 1,))
+    index[num_states] = row[0]
+
+    return states.create_group(state_key)
 
 
 def restore_simulation_state(filename='simulation-state.h5',
@@ -563,6 +712,7 @@ def restore_simulation_state(filename='simulation-state.h5',
     See Also
     --------
     store_simulation_state(...)
+    SimulationStates : A lazy reader which loads only the data accessed
 
     """
 
@@ -587,67 +737,36 @@ def restore_simulation_state(filename='simulation-state.h5',
         # Loop over all simulation state timestamps by day
         for day in f.keys():
 
+            # Skip the states of an indexed file, which are restored below
+            if day in ('index', 'states'):
+                continue
+
             # Create sub-dictionary for this day
             states[day] = {}
 
             # Loop over all simulation state timestamps by time of day
             for time in f[day]:
+                states[day][time] = _read_hdf5_state(f[day][time])
+
+        # Restore the states of an indexed file by their timestamps
+        if 'index' in f:
+            for row in f['index'][...]:
+                day = _to_str(row['date'])
+                time = _to_str(row['time'])
+                if day not in states:
+                    states[day] = {}
+
+                # Use counter in case two states have the same timestamp
+                key = time
+                counter = 0
+                while key in states[day]:
+                    key = '{0}-{1}'.format(time, counter)
+                    counter += 1
+
+                group = f['states'][_to_str(row['state'])]
+                states[day][key] = _read_hdf5_state(group)
 
-                # Create sub-dictionary for this simulation state
-                dataset = f[day][time]
-                states[day][time] = {}
-                state = states[day][time]
-
-                # Extract simulation state data
-                solver_type = str(dataset['solver type'])
-                num_FSRs = int(dataset['# FSRs'][...])
-                num_materials = int(dataset['# materials'][...])
-                num_tracks = int(dataset['# tracks'][...])
-                num_segments = int(dataset['# segments'][...])
-                spacing = int(dataset['track spacing [cm]'][...])
-                num_azim = int(dataset['# azimuthal angles'][...])
-                num_polar = int(dataset['# polar angles'][...])
-                num_iters = int(dataset['# iterations'][...])
-                thresh = float(dataset['convergence threshold'][...])
-                method = str(dataset['exponential'][...])
-                precision = str(dataset['floating point'][...])
-                cmfd = str(dataset['CMFD'][...])
-                time = float(dataset['time [sec]'][...])
-                keff =  float(dataset['keff'][...])
-
-                # Store simulation state data in sub-dictionary
-                state['solver type'] = solver_type
-                state['# FSRs'] = num_FSRs
-                state['# materials'] = num_materials
-                state['# tracks'] = num_tracks
-                state['# segments'] = num_segments
-                state['track spacing [cm]'] = spacing
-                state['# azimuthal angles'] = num_azim
-                state['# polar angles'] = num_polar
-                state['# iterations'] = num_iters
-                state['convergence threshold'] = thresh
-                state['exponential'] = method
-                state['floating point'] = precision
-                state['CMFD'] = cmfd
-                state['time [sec]'] = time
-                state['keff'] = keff
-
-                if solver_type is 'GPUSolver':
-                    state['# threads per block'] = \
-                        int(dataset['# threads per block'])
-                    state['# thread blocks'] = int(dataset['# thread blocks'])
-                else:
-                    state['# threads'] = int(dataset['# threads'][...])
-                if 'FSR scalar fluxes' in dataset:
-                    state['FSR scalar fluxes'] = \
-                        dataset['FSR scalar fluxes'][...]
-                if 'FSR sources' in dataset:
-                    state['FSR sources'] = dataset['FSR sources'][...]
-                if 'note' in dataset:
-                    state['note'] = str(dataset['note'])
-                if 'fission-rates' in dataset:
-                    py_printf('WARNING', 'The restore_simulation_state(...)' +
-                              'method does not yet support fission rates')
+        f.close()
 
         return states
 
@@ -664,6 +783,437 @@ def restore_simulation_state(filename='simulation-state.h5',
         return {}
 
 
+def _to_str(value):
+    """Convert a string read from an HDF5 file to a native string.
+
+    Parameters
+    ----------
+    value : str or bytes or numpy.ndarray
+        The string value read from the HDF5 file
+
+    Returns
+    -------
+    value : str
+        The native string
+
+    """
+
+    if isinstance(value, np.ndarray):
+        value = value[()]
+    if isinstance(value, bytes) and not isinstance(value, str):
+        value = value.decode()
+    return str(value)
+
+
+def _read_hdf5_state(group):
+    """Read a simulation state from an HDF5 group into a Python dictionary.
+
+    Parameters
+    ----------
+    group : h5py.Group
+        The HDF5 group of the simulation state
+
+    Returns
+    -------
+    state : dict
+        The dictionary of key/value pairs for simulation state data
+
+    """
+
+    state = {}
+
+    # Extract simulation state data
+    solver_type = str(group['solver type'])
+    num_FSRs = int(group['# FSRs'][...])
+    num_materials = int(group['# materials'][...])
+    num_tracks = int(group['# tracks'][...])
+    num_segments = int(group['# segments'][...])
+    spacing = int(group['track spacing [cm]'][...])
+    num_azim = int(group['# azimuthal angles'][...])
+    num_polar = int(group['# polar angles'][...])
+    num_iters = int(group['# iterations'][...])
+    thresh = float(group['convergence threshold'][...])
+    method = str(group['exponential'][...])
+    precision = str(group['floating point'][...])
+    cmfd = str(group['CMFD'][...])
+    time = float(group['time [sec]'][...])
+    keff =  float(group['keff'][...])
+
+    # Store simulation state data in sub-dictionary
+    state['solver type'] = solver_type
+    state['# FSRs'] = num_FSRs
+    state['# materials'] = num_materials
+    state['# tracks'] = num_tracks
+    state['# segments'] = num_segments
+    state['track spacing [cm]'] = spacing
+    state['# azimuthal angles'] = num_azim
+    state['# polar angles'] = num_polar
+    state['# iterations'] = num_iters
+    state['convergence threshold'] = thresh
+    state['exponential'] = method
+    state['floating point'] = precision
+    state['CMFD'] = cmfd
+    state['time [sec]'] = time
+    state['keff'] = keff
+
+    if solver_type is 'GPUSolver':
+        state['# threads per block'] = \
+            int(group['# threads per block'])
+        state['# thread blocks'] = int(group['# thread blocks'])
+    else:
+        state['# threads'] = int(group['# threads'][...])
+    if 'FSR scalar fluxes' in group:
+        state['FSR scalar fluxes'] = \
+            group['FSR scalar fluxes'][...]
+    if 'FSR sources' in group:
+        state['FSR sources'] = group['FSR sources'][...]
+    if 'note' in group.attrs:
+        state['note'] = _to_str(group.attrs['note'])
+    if 'fission-rates' in group:
+        py_printf('WARNING', 'The restore_simulation_state(...)' +
+                  'method does not yet support fission rates')
+
+    return state
+
+
+class SimulationState(object):
+    """A single simulation state stored by store_simulation_state(...).
+
+    The state's scalar data are read from the file only when they are
+    accessed. The FSR scalar fluxes, FSR sources and fission rates of a
+    state stored in an HDF5 file are returned as h5py datasets which read
+    their values from the file only when sliced, e.g., state['FSR scalar
+    fluxes'][:, 0] reads only the fluxes in the first energy group.
+
+    Attributes
+    ----------
+    date : str
+        The date the state was stored as 'MM-DD-YYYY'
+    time : str
+        The time of day the state was stored as 'HH:MM:SS'
+    timestamp : datetime.datetime
+        The date and time the state was stored
+    solver_type : str
+        The type of Solver used
+    note : str
+        The note stored with the state, or '' if there is none
+    keff : Real
+        The converged eigenvalue
+    num_iterations : Integral
+        The number of source iterations
+    runtime : Real
+        The total runtime [seconds]
+
+    """
+
+    def __init__(self, date, time, source, index_row=None):
+
+        self._date = date
+        self._time = time
+        self._source = source
+        self._index_row = index_row
+
+    def __repr__(self):
+        return 'SimulationState({0} {1}, {2}, keff={3:.6f})'.format(
+            self.date, self.time, self.solver_type, self.keff)
+
+    def __contains__(self, key):
+        return key in self._source
+
+    def __getitem__(self, key):
+        """Return the value of a field of this state.
+
+        Parameters
+        ----------
+        key : str
+            The name of the field, e.g., 'keff' or 'FSR scalar fluxes'
+
+        Returns
+        -------
+        value : object
+            The scalar value of the field, or an h5py dataset for array
+            fields stored in an HDF5 file
+
+        """
+
+        if key == 'note':
+            return self.note
+
+        value = self._source[key]
+
+        # Return HDF5 array datasets unread and read HDF5 scalar datasets
+        if isinstance(value, h5py.Group):
+            return value
+        elif isinstance(value, h5py.Dataset):
+            if value.shape != ():
+                return value
+            value = value[()]
+            if isinstance(value, (bytes, str)):
+                return _to_str(value)
+            return value.item() if hasattr(value, 'item') else value
+        else:
+            return value
+
+    def keys(self):
+        """Return the names of the fields of this state.
+
+        Returns
+        -------
+        keys : list of str
+            The names of the fields of this state
+
+        """
+
+        keys = list(self._source.keys())
+        if self.note != '' and 'note' not in keys:
+            keys.append('note')
+        return keys
+
+    def _get_field(self, key):
+        """Private routine to return a scalar field from the index if the
+        state is in an indexed file or from the state otherwise."""
+
+        if self._index_row is not None:
+            value = self._index_row[key]
+            return _to_str(value) if key in ('solver type', 'note') \
+                else value.item()
+        return self[key]
+
+    @property
+    def date(self):
+        return self._date
+
+    @property
+    def time(self):
+        return self._time
+
+    @property
+    def timestamp(self):
+        return datetime.datetime.strptime(
+            self.date + ' ' + self.time.split('-')[0], '%m-%d-%Y %H:%M:%S')
+
+    @property
+    def solver_type(self):
+        return self._get_field('solver type')
+
+    @property
+    def note(self):
+        if self._index_row is not None:
+            return self._get_field('note')
+        elif isinstance(self._source, h5py.Group):
+            if 'note' in self._source.attrs:
+                return _to_str(self._source.attrs['note'])
+            return ''
+        return self._source.get('note', '')
+
+    @property
+    def keff(self):
+        return self._get_field('keff')
+
+    @property
+    def num_iterations(self):
+        return self._get_field('# iterations')
+
+    @property
+    def runtime(self):
+        return self._get_field('time [sec]')
+
+
+class SimulationStates(object):
+    """A lazy reader of the simulation states stored in a file by
+    store_simulation_state(...).
+
+    Unlike restore_simulation_state(...), this reader does not load the
+    stored arrays. It lists the stored states, from the index of an indexed
+    HDF5 file if there is one, and reads each field of a state only when it
+    is accessed. The states may be filtered by date, Solver type or note. A
+    pickled file cannot be read lazily and is loaded in whole.
+
+    The HDF5 file is kept open while the reader is in use and should be
+    closed with close(...) or by using the reader as a context manager.
+
+    Examples
+    --------
+    The eigenvalues of all states stored with a CPUSolver in June 2016 may be
+    read from a file without reading any fluxes as follows:
+
+        >>> with SimulationStates('simulation-state.h5') as states:
+        ...     june = states.filter(start=datetime.date(2016, 6, 1),
+        ...                          end=datetime.date(2016, 7, 1),
+        ...                          solver_type='CPUSolver')
+        ...     keffs = [state.keff for state in june]
+
+    See Also
+    --------
+    store_simulation_state(...)
+
+    """
+
+    def __init__(self, filename='simulation-state.h5',
+                 directory='simulation-states'):
+        """Open a simulation state file and list the states in it.
+
+        Parameters
+        ----------
+        filename : str
+            The simulation state filename string
+        directory : str
+            The directory where to find the simulation state file
+
+        """
+
+        cv.check_type('filename', filename, basestring)
+        cv.check_type('directory', directory, basestring)
+
+        filename = directory + '/' + filename
+        if not os.path.isfile(filename):
+            py_printf('ERROR', 'Unable to read simulation states since ' +
+                      '"%s" is not an existing simulation state file', filename)
+
+        self._file = None
+        self._states = []
+
+        # If using HDF5
+        if '.h5' in filename or '.hdf5' in filename:
+            self._file = h5py.File(filename, 'r')
+
+            # List the states stored for each day and time
+            for day in sorted(self._file.keys()):
+                if day in ('index', 'states'):
+                    continue
+                for time in sorted(self._file[day]):
+                    self._states.append(
+                        SimulationState(day, time, self._file[day][time]))
+
+            # List the states of an indexed file from its index
+            if 'index' in self._file:
+                groups = self._file['states']
+                for row in self._file['index'][...]:
+                    group = groups[_to_str(row['state'])]
+                    self._states.append(SimulationState(
+                        _to_str(row['date']), _to_str(row['time']), group, row))
+
+        # If using a Python pickled file
+        elif '.pkl' in filename:
+            sim_states = pickle.load(open(filename, 'rb'))
+            for day in sorted(sim_states):
+                for time in sorted(sim_states[day]):
+                    self._states.append(
+                        SimulationState(day, time, sim_states[day][time]))
+
+        # If file does not have a recognizable extension
+        else:
+            py_printf('ERROR', 'Unable to read the simulation states file ' +
+                      '%s since it does not have a supported file extension. ' +
+                      'Only *.h5, *.hdf5, and *.pkl files are supported',
+                      filename)
+
+        # Order the states by the time they were stored
+        self._states.sort(key=lambda state: state.timestamp)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __len__(self):
+        return len(self._states)
+
+    def __iter__(self):
+        return iter(self._states)
+
+    def __getitem__(self, index):
+        return self._states[index]
+
+    def close(self):
+        """Close the simulation state file."""
+
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def filter(self, start=None, end=None, solver_type=None, note=None):
+        """Return the states stored in a time window, with a Solver type
+        and/or with a note.
+
+        Parameters
+        ----------
+        start : datetime.date or datetime.datetime or None
+            The earliest time a state was stored (default is None)
+        end : datetime.date or datetime.datetime or None
+            The time before which a state was stored (default is None)
+        solver_type : str or None
+            The type of Solver used, e.g., 'CPUSolver' (default is None)
+        note : str or None
+            A string which the state's note must contain (default is None)
+
+        Returns
+        -------
+        states : list of SimulationState
+            The states matching all of the given filters
+
+        """
+
+        if start is not None:
+            cv.check_type('start', start, datetime.date)
+            if not isinstance(start, datetime.datetime):
+                start = datetime.datetime.combine(start, datetime.time())
+        if end is not None:
+            cv.check_type('end', end, datetime.date)
+            if not isinstance(end, datetime.datetime):
+                end = datetime.datetime.combine(end, datetime.time())
+        if solver_type is not None:
+            cv.check_type('solver_type', solver_type, basestring)
+        if note is not None:
+            cv.check_type('note', note, basestring)
+
+        states = []
+        for state in self._states:
+            if start is not None and state.timestamp < start:
+                continue
+            if end is not None and state.timestamp >= end:
+                continue
+            if solver_type is not None and state.solver_type != solver_type:
+                continue
+            if note is not None and note not in state.note:
+                continue
+            states.append(state)
+
+        return states
+
+    def get_field(self, key, states=None):
+        """Return an array of a scalar field of each state.
+
+        Parameters
+        ----------
+        key : str
+            The name of the scalar field, e.g., 'keff' or '# iterations'
+        states : Iterable of SimulationState or None
+            The states to read the field from (default is None for all states)
+
+        Returns
+        -------
+        values : numpy.ndarray
+            The value of the field for each state
+
+        """
+
+        cv.check_type('key', key, basestring)
+
+        if states is None:
+            states = self._states
+
+        fields = {'keff': 'keff', '# iterations': 'num_iterations',
+                  'time [sec]': 'runtime', 'solver type': 'solver_type',
+                  'note': 'note'}
+
+        if key in fields:
+            return np.array([getattr(state, fields[key]) for state in states])
+        else:
+            return np.array([state[key] for state in states])
+
+
 def parse_convergence_data(filename, directory=''):
     """Parse an OpenMOC log file to obtain a simulation's convergence data.
 
@@ -760,6 +1310,12 @@ class Mesh(object):
         self._upper_right = None
         self._width = None
 
+        # Cached FSR-to-mesh-cell mapping and FSR cell IDs for a layout of
+        # the FSRs in a geometry
+        self._fsr_layout_id = None
+        self._fsr_mesh_cells = None
+        self._fsr_cell_ids = None
+
     @property
     def dimension(self):
         return self._dimension
@@ -789,24 +1345,28 @@ class Mesh(object):
         cv.check_type('mesh dimension', dimension, Iterable, Integral)
         cv.check_length('mesh dimension', dimension, 2, 3)
         self._dimension = dimension
+        self._fsr_mesh_cells = None
 
     @lower_left.setter
     def lower_left(self, lower_left):
         cv.check_type('mesh lower_left', lower_left, Iterable, Real)
         cv.check_length('mesh lower_left', lower_left, 2, 3)
         self._lower_left = lower_left
+        self._fsr_mesh_cells = None
 
     @upper_right.setter
     def upper_right(self, upper_right):
         cv.check_type('mesh upper_right', upper_right, Iterable, Real)
         cv.check_length('mesh upper_right', upper_right, 2, 3)
         self._upper_right = upper_right
+        self._fsr_mesh_cells = None
 
     @width.setter
     def width(self, width):
         cv.check_type('mesh width', width, Iterable, Real)
         cv.check_length('mesh width', width, 2, 3)
         self._width = width
+        self._fsr_mesh_cells = None
 
     def get_mesh_cell_indices(self, point):
         """Get the mesh cell indices for a point within the geometry.
@@ -866,6 +1426,88 @@ class Mesh(object):
         else:
             return mesh_x, mesh_y, mesh_z
 
+    def get_fsr_mesh_cells(self, geometry):
+        """Get the flat mesh cell index containing each FSR.
+
+        The mesh cell indices for the characteristic points of all FSRs are
+        computed with array arithmetic and cached on the mesh, such that
+        subsequent calls for the same FSRs return the cached mapping. The
+        cache is reset if the mesh parameters are changed or if Tracks are
+        generated again for the geometry.
+
+        Parameters
+        ----------
+        geometry : openmoc.Geometry
+            The geometry with FSRs to map to mesh cells
+
+        Returns
+        -------
+        mesh_cells : numpy.ndarray of Integral
+            The index of the mesh cell in the flattened (C-ordered) mesh
+            containing each FSR, indexed by FSR ID. FSRs outside the mesh are
+            assigned an index of -1.
+
+        """
+
+        cv.check_type('geometry', geometry, openmoc.Geometry)
+
+        self._check_fsr_cache(geometry)
+        if self._fsr_mesh_cells is not None:
+            return self._fsr_mesh_cells
+
+        # Retrieve the characteristic points of all FSRs in one call
+        num_fsrs = geometry.getNumFSRs()
+        points = geometry.getFSRPoints(num_fsrs * 3).reshape(num_fsrs, 3)
+        num_dims = len(self.dimension)
+
+        # Translate the points with respect to the center of the mesh
+        lower_left = np.asarray(self.lower_left[:num_dims], dtype=float)
+        upper_right = np.asarray(self.upper_right[:num_dims], dtype=float)
+        dimension = np.asarray(self.dimension, dtype=np.int64)
+        width = np.asarray(self.width[:num_dims], dtype=float)
+        points = points[:, :num_dims] - (upper_right + lower_left) / 2.
+
+        # Compute the mesh cell indices and round them down
+        indices = (points + dimension * width * 0.5) / width
+        indices = np.floor(indices).astype(np.int64)
+
+        # Flatten the indices and flag FSRs outside of the mesh
+        inside = np.all((indices >= 0) & (indices < dimension), axis=1)
+        mesh_cells = np.full(num_fsrs, -1, dtype=np.int64)
+        mesh_cells[inside] = \
+            np.ravel_multi_index(tuple(indices[inside].T), tuple(dimension))
+
+        self._fsr_mesh_cells = mesh_cells
+        return mesh_cells
+
+    def _check_fsr_cache(self, geometry):
+        """Reset the cached FSR data if it was built for other FSRs."""
+
+        layout_id = geometry.getFSRLayoutId()
+        if layout_id != self._fsr_layout_id:
+            self._fsr_layout_id = layout_id
+            self._fsr_mesh_cells = None
+            self._fsr_cell_ids = None
+
+    def _get_fsr_domain_ids(self, geometry, domain_type):
+        """Get the cell or material ID for each FSR.
+
+        The cell IDs are fixed for a layout of the FSRs and are cached. The
+        material IDs are retrieved on each call since the materials filling
+        the cells may be replaced between tallies.
+
+        """
+
+        num_fsrs = geometry.getNumFSRs()
+        if domain_type == 'material':
+            return geometry.getFSRMaterialIds(num_fsrs)
+
+        self._check_fsr_cache(geometry)
+        if self._fsr_cell_ids is None:
+            self._fsr_cell_ids = geometry.getFSRCellIds(num_fsrs)
+
+        return self._fsr_cell_ids
+
     def tally_fission_rates(self, solver, volume='integrated'):
         """Compute the fission rates in each mesh cell.
 
@@ -899,18 +1541,16 @@ class Mesh(object):
         num_fsrs = geometry.getNumFSRs()
 
         # Compute the volume- and energy-integrated fission rates for each FSR
-        fission_rates = solver.computeFSRFissionRates(geometry.getNumFSRs())
+        fission_rates = solver.computeFSRFissionRates(num_fsrs)
 
-        # Initialize a 2D or 3D NumPy array in which to tally
-        tally = np.zeros(tuple(self.dimension), dtype=np.float)
+        # Find the mesh cell containing each FSR
+        mesh_cells = self.get_fsr_mesh_cells(geometry)
+        inside = mesh_cells >= 0
 
         # Tally the fission rates in each FSR to the corresponding mesh cell
-        for fsr in range(num_fsrs):
-            point = geometry.getFSRPoint(fsr)
-            mesh_indices = self.get_mesh_cell_indices(point)
-
-            if np.nan not in mesh_indices:
-                tally[mesh_indices] += fission_rates[fsr]
+        tally = np.bincount(mesh_cells[inside], weights=fission_rates[inside],
+                            minlength=self.num_mesh_cells)
+        tally = tally.reshape(tuple(self.dimension))
 
         # Average the fission rates by mesh cell volume if needed
         if volume == 'averaged':
@@ -971,44 +1611,40 @@ class Mesh(object):
             cv.check_type('domains_to_coeffs',
                           domains_to_coeffs, (dict, np.ndarray))
 
-        # Extract the FSR fluxes from the Solver
+        # Extract the FSR fluxes and volumes from the Solver
         fluxes = get_scalar_fluxes(solver)
+        volumes = solver.getFSRVolumes(num_fsrs)
 
-        # Initialize a 2D or 3D NumPy array in which to tally
-        tally_shape = tuple(self.dimension) + (num_groups,)
-        tally = np.zeros(tally_shape, dtype=np.float)
-
-        # Compute product of fluxes with domains-to-coeffs mapping by group, FSR
-        for fsr in range(num_fsrs):
-            point = geometry.getFSRPoint(fsr)
-            mesh_indices = self.get_mesh_cell_indices(point)
+        # Find the mesh cell containing each FSR
+        mesh_cells = self.get_fsr_mesh_cells(geometry)
+        inside = np.nonzero(mesh_cells >= 0)[0]
 
-            if np.nan in mesh_indices:
-                continue
-
-            volume = solver.getFSRVolume(fsr)
-            fsr_tally = np.zeros(num_groups, dtype=np.float)
-
-            # Determine domain ID (material, cell or FSR) for this FSR
-            if domain_type == 'fsr':
-                domain_id = fsr
-            else:
-                coords = \
-                    openmoc.LocalCoords(point.getX(), point.getY(), point.getZ())
-                coords.setUniverse(geometry.getRootUniverse())
-                cell = geometry.findCellContainingCoords(coords)
-                if domain_type == 'cell':
-                    domain_id = cell.getId()
-                else:
-                    domain_id = cell.getFillMaterial().getId()
-
-            # Tally flux multiplied by coefficients by energy group
-            for group in range(num_groups):
-                fsr_tally[group] = \
-                    fluxes[fsr, group] * domains_to_coeffs[domain_id][group]
+        # Determine domain ID (material, cell or FSR) for each FSR
+        if domain_type == 'fsr':
+            domain_ids = inside
+        else:
+            domain_ids = self._get_fsr_domain_ids(geometry, domain_type)
+            domain_ids = domain_ids[inside]
 
-            # Increment mesh tally with volume-integrated FSR tally
-            tally[mesh_indices] += fsr_tally * volume
+        # Gather the coefficients for each FSR by energy group
+        if isinstance(domains_to_coeffs, np.ndarray):
+            coeffs = domains_to_coeffs[domain_ids, :num_groups]
+        else:
+            unique_ids, inverse = np.unique(domain_ids, return_inverse=True)
+            coeffs = np.array([np.asarray(domains_to_coeffs[domain_id])
+                               [:num_groups] for domain_id in unique_ids])
+            coeffs = coeffs.reshape(len(unique_ids), num_groups)[inverse]
+
+        # Compute volume-integrated product of fluxes with coefficients
+        fsr_tallies = fluxes[inside, :] * coeffs * volumes[inside, np.newaxis]
+
+        # Scatter the FSR tallies to the mesh cells by energy group
+        tally = np.zeros((self.num_mesh_cells, num_groups), dtype=float)
+        for group in range(num_groups):
+            tally[:, group] = np.bincount(mesh_cells[inside],
+                                          weights=fsr_tallies[:, group],
+                                          minlength=self.num_mesh_cells)
+        tally = tally.reshape(tuple(self.dimension) + (num_groups,))
 
         # Integrate the energy groups if needed
         if energy == 'integrated':
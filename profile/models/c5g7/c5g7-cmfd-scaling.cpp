@@ -0,0 +1,92 @@
+#include "../../../src/CPUSolver.h"
+#include "../../../src/log.h"
+#include "c5g7-model.h"
+#include <iostream>
+
+int main() {
+
+  /* Define simulation parameters */
+  #ifdef OPENMP
+  int num_threads = omp_get_num_procs();
+  #else
+  int num_threads = 1;
+  #endif
+  double azim_spacing = 0.1;
+  int num_azim = 4;
+  int num_sweeps = 10;
+
+  /* Set logging information */
+  set_log_level("NORMAL");
+  log_printf(TITLE, "Benchmarking C5G7 transport sweeps with and without CMFD "
+             "current tallies...");
+
+  /* Create CMFD mesh */
+  log_printf(NORMAL, "Creating CMFD mesh...");
+
+  Cmfd cmfd;
+  cmfd.setSORRelaxationFactor(1.5);
+  cmfd.setLatticeStructure(51, 51);
+  std::vector< std::vector<int> > cmfd_group_structure = {{1,2,3}, {4,5,6,7}};
+  cmfd.setGroupStructure(cmfd_group_structure);
+
+  /* Create the geometry */
+  log_printf(NORMAL, "Creating geometry...");
+  Geometry geometry;
+  geometry.setRootUniverse(createC5G7RootUniverse());
+  geometry.setCmfd(&cmfd);
+
+  /* Generate tracks */
+  log_printf(NORMAL, "Initializing the track generator...");
+  TrackGenerator track_generator(&geometry, num_azim, azim_spacing);
+  track_generator.setNumThreads(num_threads);
+  track_generator.generateTracks();
+
+  /* Initialize the solver and CMFD with a short eigenvalue calculation */
+  CPUSolver solver(&track_generator);
+  solver.setNumThreads(num_threads);
+  solver.computeEigenvalue(1);
+
+  /* Time transport sweeps with and without CMFD current tallies for each
+   * thread count, using the same segments with CMFD surfaces */
+  bool flux_update_on[] = {false, true};
+  std::map<bool, std::map<int, double> > sweep_times;
+  std::vector<int> thread_counts;
+
+  for (int n=1; n < num_threads; n *= 2)
+    thread_counts.push_back(n);
+  thread_counts.push_back(num_threads);
+
+  for (int c=0; c < 2; c++) {
+    cmfd.setFluxUpdateOn(flux_update_on[c]);
+
+    for (size_t i=0; i < thread_counts.size(); i++) {
+      solver.setNumThreads(thread_counts[i]);
+
+      /* Warm up the thread-private buffers before timing */
+      solver.transportSweep();
+
+      double start = omp_get_wtime();
+      for (int s=0; s < num_sweeps; s++)
+        solver.transportSweep();
+      double time_per_sweep = (omp_get_wtime() - start) / num_sweeps;
+
+      sweep_times[flux_update_on[c]][thread_counts[i]] = time_per_sweep;
+    }
+  }
+
+  /* Report the time per sweep and parallel efficiency with each thread
+   * count, with and without CMFD */
+  log_printf(TITLE, "TRANSPORT SWEEP SCALING WITH CMFD");
+  log_printf(RESULT, "# threads   no CMFD (sec)   efficiency      CMFD (sec)"
+             "   efficiency");
+  for (size_t i=0; i < thread_counts.size(); i++) {
+    int n = thread_counts[i];
+    double no_cmfd = sweep_times[false][n];
+    double with_cmfd = sweep_times[true][n];
+    log_printf(RESULT, "%9d   %13.4E   %10.3f   %13.4E   %10.3f", n, no_cmfd,
+               sweep_times[false][1] / (n * no_cmfd), with_cmfd,
+               sweep_times[true][1] / (n * with_cmfd));
+  }
+
+  return 0;
+}
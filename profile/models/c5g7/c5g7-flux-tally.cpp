@@ -0,0 +1,85 @@
+#include "../../../src/CPUSolver.h"
+#include "../../../src/log.h"
+#include "c5g7-model.h"
+#include <iostream>
+#include <stdlib.h>
+
+int main(int argc, char* argv[]) {
+
+  /* Define simulation parameters, with an optional maximum thread count */
+  #ifdef OPENMP
+  int num_threads = omp_get_num_procs();
+  #else
+  int num_threads = 1;
+  #endif
+  if (argc > 1)
+    num_threads = atoi(argv[1]);
+  if (num_threads < 1)
+    log_printf(ERROR, "Unable to benchmark with %d threads", num_threads);
+  double azim_spacing = 0.1;
+  int num_azim = 4;
+  int num_sweeps = 10;
+
+  /* Set logging information */
+  set_log_level("NORMAL");
+  log_printf(TITLE, "Benchmarking C5G7 transport sweeps with each flux tally "
+             "type...");
+
+  /* Create the geometry */
+  log_printf(NORMAL, "Creating geometry...");
+  Geometry geometry;
+  geometry.setRootUniverse(createC5G7RootUniverse());
+
+  /* Generate tracks */
+  log_printf(NORMAL, "Initializing the track generator...");
+  TrackGenerator track_generator(&geometry, num_azim, azim_spacing);
+  track_generator.setNumThreads(num_threads);
+  track_generator.generateTracks();
+
+  /* Initialize the solver with a short eigenvalue calculation */
+  CPUSolver solver(&track_generator);
+  solver.setNumThreads(num_threads);
+  solver.computeEigenvalue(1);
+
+  /* Time transport sweeps for each flux tally type and thread count */
+  fluxTallyType tally_types[] = {FSR_LOCKS, THREAD_PRIVATE};
+  std::string tally_names[] = {"FSR_LOCKS", "THREAD_PRIVATE"};
+  std::map<std::string, std::map<int, double> > sweep_times;
+  std::vector<int> thread_counts;
+
+  for (int n=1; n < num_threads; n *= 2)
+    thread_counts.push_back(n);
+  thread_counts.push_back(num_threads);
+
+  for (int t=0; t < 2; t++) {
+    solver.setFluxTallyType(tally_types[t]);
+
+    for (size_t i=0; i < thread_counts.size(); i++) {
+      solver.setNumThreads(thread_counts[i]);
+
+      /* Warm up the thread-private buffers before timing */
+      solver.transportSweep();
+
+      double start = omp_get_wtime();
+      for (int s=0; s < num_sweeps; s++)
+        solver.transportSweep();
+      double time_per_sweep = (omp_get_wtime() - start) / num_sweeps;
+
+      sweep_times[tally_names[t]][thread_counts[i]] = time_per_sweep;
+    }
+  }
+
+  /* Report the time per sweep and speedup over FSR_LOCKS */
+  log_printf(TITLE, "TRANSPORT SWEEP SCALING");
+  log_printf(RESULT, "# threads      FSR_LOCKS (sec)   THREAD_PRIVATE (sec)"
+             "   speedup");
+  for (size_t i=0; i < thread_counts.size(); i++) {
+    int n = thread_counts[i];
+    double locks = sweep_times["FSR_LOCKS"][n];
+    double private_fluxes = sweep_times["THREAD_PRIVATE"][n];
+    log_printf(RESULT, "%9d      %15.4E   %20.4E   %7.3f", n, locks,
+               private_fluxes, locks / private_fluxes);
+  }
+
+  return 0;
+}
@@ -0,0 +1,17 @@
+/**
+ * @file c5g7-model.h
+ * @brief The 2D C5G7 benchmark problem shared by the C5G7 profiling
+ *        drivers.
+ */
+
+#ifndef C5G7_MODEL_H_
+#define C5G7_MODEL_H_
+
+#include "../../../src/Geometry.h"
+
+/** The number of energy groups in the C5G7 cross-sections */
+#define C5G7_NUM_GROUPS 7
+
+Universe* createC5G7RootUniverse();
+
+#endif /* C5G7_MODEL_H_ */
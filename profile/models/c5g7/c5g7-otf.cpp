@@ -0,0 +1,78 @@
+#include "../../../src/CPUSolver.h"
+#include "../../../src/log.h"
+#include "c5g7-model.h"
+#include <iostream>
+
+int main() {
+
+  /* Define simulation parameters */
+  #ifdef OPENMP
+  int num_threads = omp_get_num_procs();
+  #else
+  int num_threads = 1;
+  #endif
+  double azim_spacing = 0.1;
+  int num_azim = 4;
+  int num_sweeps = 10;
+  int num_iterations = 10;
+  double segment_cache_memory = 100.;
+
+  /* Set logging information */
+  set_log_level("NORMAL");
+  log_printf(TITLE, "Benchmarking C5G7 transport sweeps with on-the-fly "
+             "segments...");
+
+  /* Create the geometry */
+  log_printf(NORMAL, "Creating geometry...");
+  Geometry geometry;
+  geometry.setRootUniverse(createC5G7RootUniverse());
+
+  /* Generate tracks */
+  log_printf(NORMAL, "Initializing the track generator...");
+
+  /* Time transport sweeps for explicit and on-the-fly segments */
+  segmentationType formations[] = {EXPLICIT_2D, OTF_2D, OTF_2D};
+  double cache_memory[] = {0., 0., segment_cache_memory};
+  std::string names[] = {"EXPLICIT_2D", "OTF_2D", "OTF_2D (cached)"};
+  double segment_memory[3];
+  double sweep_times[3];
+  double keffs[3];
+
+  for (int f=0; f < 3; f++) {
+    TrackGenerator track_generator(&geometry, num_azim, azim_spacing);
+    track_generator.setNumThreads(num_threads);
+    track_generator.setSegmentFormation(formations[f]);
+    track_generator.setSegmentCacheMemory(cache_memory[f]);
+    track_generator.generateTracks();
+
+    /* Initialize the solver with a short eigenvalue calculation */
+    CPUSolver solver(&track_generator);
+    solver.setNumThreads(num_threads);
+    solver.computeEigenvalue(num_iterations);
+    keffs[f] = solver.getKeff();
+
+    double start = omp_get_wtime();
+    for (int s=0; s < num_sweeps; s++)
+      solver.transportSweep();
+    sweep_times[f] = (omp_get_wtime() - start) / num_sweeps;
+
+    /* Memory for the stored segments and the flattened segment arrays */
+    if (formations[f] == EXPLICIT_2D)
+      segment_memory[f] = (track_generator.getNumSegments() * sizeof(segment)
+          + track_generator.getNumFlatSegments() * (sizeof(FP_PRECISION) +
+          3 * sizeof(int) + sizeof(unsigned short))) / 1.E6;
+    else
+      segment_memory[f] = track_generator.getNumCachedSegments() *
+          (sizeof(int) + sizeof(FP_PRECISION)) / 1.E6;
+  }
+
+  /* Report the segment memory and time per sweep for each formation type */
+  log_printf(TITLE, "SEGMENT FORMATION");
+  log_printf(RESULT, "formation          segments (MB)   time / sweep (sec)"
+             "   keff");
+  for (int f=0; f < 3; f++)
+    log_printf(RESULT, "%-15s    %13.2f   %18.4E   %1.6f", names[f].c_str(),
+               segment_memory[f], sweep_times[f], keffs[f]);
+
+  return 0;
+}
@@ -0,0 +1,49 @@
+#include "../../../src/CPUSolver.h"
+#include "../../../src/log.h"
+#include "c5g7-model.h"
+#include <iostream>
+
+int main() {
+
+  /* Define simulation parameters */
+  #ifdef OPENMP
+  int num_threads = omp_get_num_procs();
+  #else
+  int num_threads = 1;
+  #endif
+  double azim_spacing = 0.05;
+  int num_azim = 16;
+  int num_repeats = 5;
+
+  /* Set logging information */
+  set_log_level("NORMAL");
+  log_printf(TITLE, "Benchmarking ray tracing of the OECD's C5G7 Benchmark "
+             "Problem...");
+
+  /* Create the geometry */
+  log_printf(NORMAL, "Creating geometry...");
+  Geometry geometry;
+  geometry.setRootUniverse(createC5G7RootUniverse());
+
+  /* Ray trace the geometry repeatedly without storing the Tracks */
+  log_printf(NORMAL, "Initializing the track generator...");
+  TrackGenerator track_generator(&geometry, num_azim, azim_spacing);
+  track_generator.setNumThreads(num_threads);
+
+  double min_time = std::numeric_limits<double>::infinity();
+  for (int r=0; r < num_repeats; r++) {
+    double start = omp_get_wtime();
+    track_generator.generateTracks(false);
+    min_time = std::min(min_time, omp_get_wtime() - start);
+  }
+  track_generator.printTimerReport();
+
+  /* Report the segments traced per second for the fastest repetition */
+  int num_segments = track_generator.getNumSegments();
+  log_printf(TITLE, "C5G7 RAY TRACING");
+  log_printf(RESULT, "# threads   # segments   time (sec)   segments / sec");
+  log_printf(RESULT, "%9d   %10d   %10.4E   %14.4E", num_threads,
+             num_segments, min_time, num_segments / min_time);
+
+  return 0;
+}
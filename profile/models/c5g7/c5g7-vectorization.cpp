@@ -0,0 +1,64 @@
+#include "../../../src/VectorizedSolver.h"
+#include "../../../src/log.h"
+#include "c5g7-model.h"
+#include <iostream>
+
+int main() {
+
+  /* Define simulation parameters */
+  #ifdef OPENMP
+  int num_threads = omp_get_num_procs();
+  #else
+  int num_threads = 1;
+  #endif
+  double azim_spacing = 0.1;
+  int num_azim = 4;
+  int num_sweeps = 10;
+
+  /* Set logging information */
+  set_log_level("NORMAL");
+  log_printf(TITLE, "Benchmarking C5G7 transport sweeps with each "
+             "vectorization type...");
+
+  /* Create the geometry */
+  log_printf(NORMAL, "Creating geometry...");
+  Geometry geometry;
+  geometry.setRootUniverse(createC5G7RootUniverse());
+
+  /* Generate tracks */
+  log_printf(NORMAL, "Initializing the track generator...");
+  TrackGenerator track_generator(&geometry, num_azim, azim_spacing);
+  track_generator.setNumThreads(num_threads);
+  track_generator.generateTracks();
+
+  /* Initialize the solver with a short eigenvalue calculation */
+  VectorizedSolver solver(&track_generator);
+  solver.setNumThreads(num_threads);
+  solver.computeEigenvalue(1);
+
+  /* Time transport sweeps for each vectorization type */
+  vectorizationType vectorization_types[] = {GROUP_VECTORIZED,
+                                             TRACK_VECTORIZED};
+  double sweep_times[2];
+
+  for (int t=0; t < 2; t++) {
+    solver.setVectorizationType(vectorization_types[t]);
+
+    /* Warm up the Track batch buffers before timing */
+    solver.transportSweep();
+
+    double start = omp_get_wtime();
+    for (int s=0; s < num_sweeps; s++)
+      solver.transportSweep();
+    sweep_times[t] = (omp_get_wtime() - start) / num_sweeps;
+  }
+
+  /* Report the time per sweep and speedup over GROUP_VECTORIZED */
+  log_printf(TITLE, "TRANSPORT SWEEP VECTORIZATION");
+  log_printf(RESULT, "# groups   GROUP_VECTORIZED (sec)   TRACK_VECTORIZED "
+             "(sec)   speedup");
+  log_printf(RESULT, "%8d   %22.4E   %22.4E   %7.3f", C5G7_NUM_GROUPS,
+             sweep_times[0], sweep_times[1], sweep_times[0] / sweep_times[1]);
+
+  return 0;
+}
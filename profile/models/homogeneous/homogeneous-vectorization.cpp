@@ -0,0 +1,113 @@
+#include "../../../src/VectorizedSolver.h"
+#include "../../../src/log.h"
+#include <array>
+#include <iostream>
+
+int main() {
+
+  /* Define simulation parameters */
+  #ifdef OPENMP
+  int num_threads = omp_get_num_procs();
+  #else
+  int num_threads = 1;
+  #endif
+  double azim_spacing = 0.1;
+  int num_azim = 4;
+  int num_sweeps = 10;
+
+  /* Set logging information */
+  set_log_level("NORMAL");
+  log_printf(TITLE, "Benchmarking homogeneous infinite medium transport "
+             "sweeps with each vectorization type...");
+
+  /* Time transport sweeps for an increasing number of energy groups */
+  int group_counts[] = {1, 2, 4, 8, 16};
+  int num_group_counts = 5;
+  vectorizationType vectorization_types[] = {GROUP_VECTORIZED,
+                                             TRACK_VECTORIZED};
+  double sweep_times[5][2];
+
+  for (int n=0; n < num_group_counts; n++) {
+
+    int num_groups = group_counts[n];
+
+    /* Create a material with the same one group data in each group */
+    log_printf(NORMAL, "Creating a %d group material...", num_groups);
+    Material* infinite_medium = new Material();
+    infinite_medium->setNumEnergyGroups(num_groups);
+
+    std::vector<double> sigmaF(num_groups, 0.0414198575);
+    std::vector<double> nuSigmaF(num_groups, 0.0994076580);
+    std::vector<double> sigmaS(num_groups*num_groups, 0.0);
+    std::vector<double> chi(num_groups, 1.0 / num_groups);
+    std::vector<double> sigmaT(num_groups, 0.452648699);
+    for (int g=0; g < num_groups; g++)
+      sigmaS[g*num_groups+g] = 0.383259177;
+
+    infinite_medium->setSigmaF(&sigmaF[0], num_groups);
+    infinite_medium->setNuSigmaF(&nuSigmaF[0], num_groups);
+    infinite_medium->setSigmaS(&sigmaS[0], num_groups*num_groups);
+    infinite_medium->setChi(&chi[0], num_groups);
+    infinite_medium->setSigmaT(&sigmaT[0], num_groups);
+
+    /* Create surfaces */
+    double L = 200.0;
+    XPlane left(-L/2);
+    XPlane right(L/2);
+    YPlane top(L/2);
+    YPlane bottom(-L/2);
+
+    left.setBoundaryType(REFLECTIVE);
+    right.setBoundaryType(REFLECTIVE);
+    top.setBoundaryType(REFLECTIVE);
+    bottom.setBoundaryType(REFLECTIVE);
+
+    /* Create cells and universes */
+    Cell* cell = new Cell();
+    cell->setFill(infinite_medium);
+    cell->addSurface(+1, &left);
+    cell->addSurface(-1, &right);
+    cell->addSurface(+1, &bottom);
+    cell->addSurface(-1, &top);
+
+    Universe* root_universe = new Universe();
+    root_universe->addCell(cell);
+
+    /* Create the geometry */
+    Geometry geometry;
+    geometry.setRootUniverse(root_universe);
+
+    /* Generate tracks */
+    TrackGenerator track_generator(&geometry, num_azim, azim_spacing);
+    track_generator.setNumThreads(num_threads);
+    track_generator.generateTracks(false);
+
+    /* Initialize the solver with a short eigenvalue calculation */
+    VectorizedSolver solver(&track_generator);
+    solver.setNumThreads(num_threads);
+    solver.computeEigenvalue(1);
+
+    for (int t=0; t < 2; t++) {
+      solver.setVectorizationType(vectorization_types[t]);
+
+      /* Warm up the Track batch buffers before timing */
+      solver.transportSweep();
+
+      double start = omp_get_wtime();
+      for (int s=0; s < num_sweeps; s++)
+        solver.transportSweep();
+      sweep_times[n][t] = (omp_get_wtime() - start) / num_sweeps;
+    }
+  }
+
+  /* Report the time per sweep and speedup over GROUP_VECTORIZED */
+  log_printf(TITLE, "TRANSPORT SWEEP VECTORIZATION");
+  log_printf(RESULT, "# groups   GROUP_VECTORIZED (sec)   TRACK_VECTORIZED "
+             "(sec)   speedup");
+  for (int n=0; n < num_group_counts; n++)
+    log_printf(RESULT, "%8d   %22.4E   %22.4E   %7.3f", group_counts[n],
+               sweep_times[n][0], sweep_times[n][1],
+               sweep_times[n][0] / sweep_times[n][1]);
+
+  return 0;
+}
@@ -0,0 +1,140 @@
+#include "../../../src/CPUSolver.h"
+#include "../../../src/log.h"
+#include <array>
+#include <iostream>
+
+int main() {
+
+  /* Define simulation parameters */
+  #ifdef OPENMP
+  int num_threads = omp_get_num_procs();
+  #else
+  int num_threads = 1;
+  #endif
+  double azim_spacing = 0.001;
+  int num_azim = 16;
+  int num_repeats = 5;
+
+  /* Set logging information */
+  set_log_level("NORMAL");
+  log_printf(TITLE, "Benchmarking ray tracing of nested 2 x 2 lattices...");
+
+  /* Define one group materials since only the geometry is ray traced */
+  log_printf(NORMAL, "Creating materials...");
+  double sigma_t[1] = {0.452648699};
+  double sigma_s[1] = {0.383259177};
+  double nu_sigma_f[1] = {0.0994076580};
+  double sigma_f[1] = {0.0414198575};
+  double chi[1] = {1.0};
+  double zeros[1] = {0.0};
+
+  Material* uo2 = new Material(1, "UO2");
+  uo2->setNumEnergyGroups(1);
+  uo2->setSigmaT(sigma_t, 1);
+  uo2->setSigmaS(sigma_s, 1);
+  uo2->setNuSigmaF(nu_sigma_f, 1);
+  uo2->setSigmaF(sigma_f, 1);
+  uo2->setChi(chi, 1);
+
+  Material* water = new Material(2, "Water");
+  water->setNumEnergyGroups(1);
+  water->setSigmaT(sigma_t, 1);
+  water->setSigmaS(sigma_s, 1);
+  water->setNuSigmaF(zeros, 1);
+  water->setSigmaF(zeros, 1);
+  water->setChi(zeros, 1);
+
+  /* Create surfaces */
+  log_printf(NORMAL, "Creating surfaces...");
+  XPlane left(-2.0);
+  XPlane right(2.0);
+  YPlane top(-2.0);
+  YPlane bottom(2.0);
+  left.setBoundaryType(REFLECTIVE);
+  right.setBoundaryType(REFLECTIVE);
+  top.setBoundaryType(REFLECTIVE);
+  bottom.setBoundaryType(REFLECTIVE);
+
+  ZCylinder large_zcylinder(0.0, 0.0, 0.4);
+  ZCylinder medium_zcylinder(0.0, 0.0, 0.3);
+  ZCylinder small_zcylinder(0.0, 0.0, 0.2);
+
+  /* Create cells and universes */
+  log_printf(NORMAL, "Creating cells...");
+
+  ZCylinder* zcylinders[3] = {&large_zcylinder, &medium_zcylinder,
+                              &small_zcylinder};
+  Universe* pins[3];
+
+  for (int i=0; i < 3; i++) {
+    Cell* fuel = new Cell();
+    fuel->setNumRings(3);
+    fuel->setNumSectors(8);
+    fuel->setFill(uo2);
+    fuel->addSurface(-1, zcylinders[i]);
+
+    Cell* moderator = new Cell();
+    moderator->setNumSectors(8);
+    moderator->setFill(water);
+    moderator->addSurface(+1, zcylinders[i]);
+
+    pins[i] = new Universe();
+    pins[i]->addCell(fuel);
+    pins[i]->addCell(moderator);
+  }
+
+  Cell* lattice_cell = new Cell();
+  Universe* assembly = new Universe();
+  assembly->addCell(lattice_cell);
+
+  Cell* root_cell = new Cell();
+  root_cell->addSurface(+1, &left);
+  root_cell->addSurface(-1, &right);
+  root_cell->addSurface(+1, &top);
+  root_cell->addSurface(-1, &bottom);
+
+  Universe* root_universe = new Universe();
+  root_universe->addCell(root_cell);
+
+  /* Create nested 2 x 2 lattices */
+  log_printf(NORMAL, "Creating nested 2 x 2 lattices...");
+
+  Lattice* lattice = new Lattice();
+  lattice->setWidth(1.0, 1.0);
+  Universe* pin_matrix[2*2] = {pins[0], pins[1], pins[0], pins[2]};
+  lattice->setUniverses(1, 2, 2, pin_matrix);
+  lattice_cell->setFill(lattice);
+
+  Lattice* core = new Lattice();
+  core->setWidth(2.0, 2.0);
+  Universe* assembly_matrix[2*2] = {assembly, assembly, assembly, assembly};
+  core->setUniverses(1, 2, 2, assembly_matrix);
+  root_cell->setFill(core);
+
+  /* Create the geometry */
+  log_printf(NORMAL, "Creating geometry...");
+  Geometry geometry;
+  geometry.setRootUniverse(root_universe);
+
+  /* Ray trace the geometry repeatedly without storing the Tracks */
+  log_printf(NORMAL, "Initializing the track generator...");
+  TrackGenerator track_generator(&geometry, num_azim, azim_spacing);
+  track_generator.setNumThreads(num_threads);
+
+  double min_time = std::numeric_limits<double>::infinity();
+  for (int r=0; r < num_repeats; r++) {
+    double start = omp_get_wtime();
+    track_generator.generateTracks(false);
+    min_time = std::min(min_time, omp_get_wtime() - start);
+  }
+  track_generator.printTimerReport();
+
+  /* Report the segments traced per second for the fastest repetition */
+  int num_segments = track_generator.getNumSegments();
+  log_printf(TITLE, "NESTED LATTICE RAY TRACING");
+  log_printf(RESULT, "# threads   # segments   time (sec)   segments / sec");
+  log_printf(RESULT, "%9d   %10d   %10.4E   %14.4E", num_threads,
+             num_segments, min_time, num_segments / min_time);
+
+  return 0;
+}
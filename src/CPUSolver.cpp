@@ -14,6 +14,30 @@ CPUSolver::CPUSolver(TrackGenerator* track_generator)
 
   setNumThreads(1);
   _FSR_locks = NULL;
+  _flux_tally_type = FSR_LOCKS;
+  _num_thread_fluxes = 0;
+  _thread_scalar_flux = NULL;
+  _num_segment_materials = 0;
+  _segment_sigma_t = NULL;
+  _exp_cache_memory = 0.;
+  _exp_cache = NULL;
+}
+
+
+/**
+ * @brief Destructor deletes the thread-private scalar flux arrays, the
+ *        segment total cross-section table and the exponential cache.
+ */
+CPUSolver::~CPUSolver() {
+
+  if (_thread_scalar_flux != NULL)
+    delete [] _thread_scalar_flux;
+
+  if (_segment_sigma_t != NULL)
+    delete [] _segment_sigma_t;
+
+  if (_exp_cache != NULL)
+    delete [] _exp_cache;
 }
 
 
@@ -26,6 +50,34 @@ int CPUSolver::getNumThreads() {
 }
 
 
+/**
+ * @brief Returns the method used to tally FSR scalar fluxes.
+ * @return the flux tally type (FSR_LOCKS or THREAD_PRIVATE)
+ */
+fluxTallyType CPUSolver::getFluxTallyType() {
+  return _flux_tally_type;
+}
+
+
+/**
+ * @brief Returns the maximum memory allowed for the exponential cache.
+ * @return the exponential cache memory budget (MB)
+ */
+double CPUSolver::getExponentialCacheMemory() {
+  return _exp_cache_memory;
+}
+
+
+/**
+ * @brief Returns whether the exponentials for each segment are precomputed
+ *        and stored in the exponential cache.
+ * @return true if the exponential cache is in use; false otherwise
+ */
+bool CPUSolver::isUsingExponentialCache() {
+  return (_exp_cache != NULL);
+}
+
+
 /**
  * @brief Fills an array with the scalar fluxes.
  * @details This class method is a helper routine called by the OpenMOC
@@ -84,6 +136,59 @@ void CPUSolver::setNumThreads(int num_threads) {
 }
 
 
+/**
+ * @brief Sets the method used to tally FSR scalar fluxes during each
+ *        transport sweep.
+ * @details By default, each thread adds its segment contributions directly
+ *          into the shared FSR scalar flux array while holding a lock for
+ *          the FSR (FSR_LOCKS). Alternatively, each thread may tally into
+ *          its own copy of the scalar flux array, which are summed into the
+ *          shared array at the end of the sweep (THREAD_PRIVATE). The latter
+ *          avoids all locking in the sweep at the cost of one scalar flux
+ *          array per thread and typically scales better with many threads.
+ *          This routine may be called from Python as follows:
+ *
+ * @code
+ *          solver.setFluxTallyType(openmoc.THREAD_PRIVATE)
+ * @endcode
+ *
+ * @param tally_type the flux tally type (FSR_LOCKS or THREAD_PRIVATE)
+ */
+void CPUSolver::setFluxTallyType(fluxTallyType tally_type) {
+  _flux_tally_type = tally_type;
+}
+
+
+/**
+ * @brief Sets the maximum memory for a cache of precomputed exponentials.
+ * @details The segment lengths and total cross-sections do not change
+ *          between source iterations. If the exponential cache is enabled,
+ *          the exponential \f$ 1 - exp(-\tau/sin(\theta_p)) \f$ is computed
+ *          once for each segment, energy group and polar angle at the start
+ *          of each eigenvalue, source or flux calculation and stored in
+ *          single precision for reuse in every transport sweep. The cache is
+ *          only built if its size fits within the given memory budget;
+ *          otherwise the exponentials are evaluated on the fly as usual.
+ *          The cache is disabled by default. This routine may be called
+ *          from Python as follows:
+ *
+ * @code
+ *          # Allow up to 2 GB for the exponential cache
+ *          solver.setExponentialCacheMemory(2000.)
+ * @endcode
+ *
+ * @param max_memory the maximum memory for the cache (MB), or 0 to disable
+ */
+void CPUSolver::setExponentialCacheMemory(double max_memory) {
+
+  if (max_memory < 0)
+    log_printf(ERROR, "Cannot set the exponential cache memory to %f MB "
+               "because it must be non-negative", max_memory);
+
+  _exp_cache_memory = max_memory;
+}
+
+
 /**
  * @brief Set the flux array for use in transport sweep source calculations.
  * @detail This is a helper method for the checkpoint restart capabilities,
@@ -114,6 +219,7 @@ void CPUSolver::setFluxes(FP_PRECISION* in_fluxes, int num_fluxes) {
   /* Set the scalar flux array pointer to the array passed in from NumPy */
   _scalar_flux = in_fluxes;
   _user_fluxes = true;
+  _array_generation++;
 }
 
 
@@ -128,6 +234,19 @@ void CPUSolver::initializeFSRs() {
 }
 
 
+/**
+ * @brief Initializes the ExpEvaluator and the exponential cache.
+ * @details The exponential cache is built after the ExpEvaluator since the
+ *          ExpEvaluator may split Track segments to bound their optical
+ *          lengths.
+ */
+void CPUSolver::initializeExpEvaluator() {
+
+  Solver::initializeExpEvaluator();
+  initializeExponentialCache();
+}
+
+
 /**
  * @brief Allocates memory for Track boundary angular and FSR scalar fluxes.
  * @details Deletes memory for old flux arrays if they were allocated
@@ -162,6 +281,63 @@ void CPUSolver::initializeFluxArrays() {
   catch(std::exception &e) {
     log_printf(ERROR, "Could not allocate memory for the fluxes");
   }
+
+  _array_generation++;
+
+  /* Allocate thread-private scalar fluxes if requested by the user */
+  if (_flux_tally_type == THREAD_PRIVATE)
+    initializeThreadFluxes();
+}
+
+
+/**
+ * @brief Allocates memory for the thread-private FSR scalar fluxes.
+ * @details One array of scalar fluxes for all FSRs and energy groups is
+ *          allocated for each OpenMP thread and initialized to zero. This
+ *          is used by the THREAD_PRIVATE flux tally type.
+ */
+void CPUSolver::initializeThreadFluxes() {
+
+  if (_thread_scalar_flux != NULL)
+    delete [] _thread_scalar_flux;
+
+  _num_thread_fluxes = omp_get_max_threads();
+  long size = (long)_num_thread_fluxes * _num_FSRs * _num_groups;
+
+  log_printf(INFO, "Allocating %d thread-private scalar flux arrays "
+             "(%.2f MB)", _num_thread_fluxes,
+             size * sizeof(FP_PRECISION) / 1.E6);
+
+  try {
+    _thread_scalar_flux = new FP_PRECISION[size];
+  }
+  catch(std::exception &e) {
+    log_printf(ERROR, "Could not allocate memory for the thread-private "
+               "fluxes");
+  }
+
+#pragma omp parallel for schedule(static)
+  for (long i=0; i < size; i++)
+    _thread_scalar_flux[i] = 0.;
+}
+
+
+/**
+ * @brief Sums the thread-private scalar fluxes into the FSR scalar fluxes.
+ * @details The thread-private scalar fluxes are reset to zero as they are
+ *          reduced so that they are ready for the next transport sweep.
+ */
+void CPUSolver::reduceThreadFluxes() {
+
+#pragma omp parallel for schedule(guided)
+  for (int r=0; r < _num_FSRs; r++) {
+    for (int t=0; t < _num_thread_fluxes; t++) {
+      for (int e=0; e < _num_groups; e++) {
+        _scalar_flux(r,e) += _thread_scalar_flux(t,r,e);
+        _thread_scalar_flux(t,r,e) = 0.;
+      }
+    }
+  }
 }
 
 
@@ -189,6 +365,8 @@ void CPUSolver::initializeSourceArrays() {
     log_printf(ERROR, "Could not allocate memory for FSR sources");
   }
 
+  _array_generation++;
+
   /* Initialize fixed sources to zero */
   memset(_fixed_sources, 0.0, sizeof(FP_PRECISION) * size);
 
@@ -662,6 +840,101 @@ void CPUSolver::computeKeff() {
 }
 
 
+/**
+ * @brief Loads the flattened segment arrays and the segment total
+ *        cross-sections for the transport sweep.
+ * @details The TrackGenerator's contiguous segment arrays are rebuilt if the
+ *          segments or their Materials have changed. The total cross-sections
+ *          for each compact segment Material index are copied into a
+ *          contiguous table so that the sweep does not dereference a
+ *          Material pointer for each segment.
+ */
+void CPUSolver::initializeSegmentArrays() {
+
+  if (!_track_generator->containsSegmentArrays())
+    _track_generator->initializeSegmentArrays();
+
+  int num_materials = _track_generator->getNumSegmentMaterials();
+  Material** materials = _track_generator->getSegmentMaterials();
+
+  if (_segment_sigma_t == NULL || _num_segment_materials != num_materials) {
+    if (_segment_sigma_t != NULL)
+      delete [] _segment_sigma_t;
+    _segment_sigma_t = new FP_PRECISION[num_materials * _num_groups];
+    _num_segment_materials = num_materials;
+  }
+
+  for (int m=0; m < num_materials; m++) {
+    FP_PRECISION* sigma_t = materials[m]->getSigmaT();
+    for (int e=0; e < _num_groups; e++)
+      _segment_sigma_t[m * _num_groups + e] = sigma_t[e];
+  }
+}
+
+
+/**
+ * @brief Precomputes the exponentials for each segment, energy group and
+ *        polar angle if they fit within the exponential cache memory budget.
+ * @details Any previous cache is deleted. If the cache is disabled or its
+ *          estimated size exceeds the memory budget set with
+ *          CPUSolver::setExponentialCacheMemory(), no cache is built and the
+ *          exponentials are evaluated on the fly in each transport sweep.
+ *          The cache is not supported when segments are formed on the fly.
+ */
+void CPUSolver::initializeExponentialCache() {
+
+  if (_exp_cache != NULL)
+    delete [] _exp_cache;
+  _exp_cache = NULL;
+
+  if (_exp_cache_memory <= 0.)
+    return;
+
+  if (_track_generator->getSegmentFormation() == OTF_2D) {
+    log_printf(WARNING, "Exponentials will be evaluated on the fly since "
+               "segments are formed on the fly");
+    return;
+  }
+
+  /* Load the flattened segment arrays and segment cross-sections */
+  initializeSegmentArrays();
+
+  long num_segments = _track_generator->getNumFlatSegments();
+  long size = num_segments * _num_groups * _num_polar_2;
+  double mem = size * sizeof(float) / 1.E6;
+
+  if (mem > _exp_cache_memory) {
+    log_printf(WARNING, "The exponential cache requires %.2f MB which "
+               "exceeds the %.2f MB budget so exponentials will be evaluated "
+               "on the fly", mem, _exp_cache_memory);
+    return;
+  }
+
+  log_printf(NORMAL, "Precomputing exponentials for %ld segments (%.2f MB)",
+             num_segments, mem);
+
+  try {
+    _exp_cache = new float[size];
+  }
+  catch (std::exception &e) {
+    log_printf(ERROR, "Could not allocate memory for the exponential cache");
+  }
+
+  FP_PRECISION* lengths = _track_generator->getSegmentLengths();
+  unsigned short* material_ids = _track_generator->getSegmentMaterialIds();
+
+#pragma omp parallel for schedule(static)
+  for (long s=0; s < num_segments; s++) {
+    FP_PRECISION* sigma_t = &_segment_sigma_t[material_ids[s] * _num_groups];
+    for (int e=0; e < _num_groups; e++) {
+      for (int p=0; p < _num_polar_2; p++)
+        _exp_cache(s,e,p) =
+            _exp_evaluator->computeExponential(sigma_t[e] * lengths[s], p);
+    }
+  }
+}
+
+
 /**
  * @brief This method performs one transport sweep of all azimuthal angles,
  *        Tracks, Track segments, polar angles and energy groups.
@@ -682,11 +955,28 @@ void CPUSolver::transportSweep() {
   /* Copy starting flux to current flux */
   copyBoundaryFluxes();
 
+  /* Allocate thread-private fluxes if none exist for each thread */
+  if (_flux_tally_type == THREAD_PRIVATE &&
+      (_thread_scalar_flux == NULL ||
+       _num_thread_fluxes < omp_get_max_threads()))
+    initializeThreadFluxes();
+
+  /* Load the flattened segment arrays and segment cross-sections */
+  initializeSegmentArrays();
+
   /* Tracks are traversed and the MOC equations from this CPUSolver are applied
      to all Tracks and corresponding segments */
   TransportSweep sweep_tracks(_track_generator);
   sweep_tracks.setCPUSolver(this);
   sweep_tracks.execute();
+
+  /* Sum the thread-private fluxes into the FSR scalar fluxes */
+  if (_flux_tally_type == THREAD_PRIVATE)
+    reduceThreadFluxes();
+
+  /* Sum the thread-private CMFD surface currents */
+  if (_cmfd != NULL && _cmfd->isFluxUpdateOn())
+    _cmfd->reduceCurrents();
 }
 
 
@@ -694,20 +984,23 @@ void CPUSolver::transportSweep() {
  * @brief Computes the contribution to the FSR scalar flux from a Track segment.
  * @details This method integrates the angular flux for a Track segment across
  *          energy groups and polar angles, and tallies it into the FSR
- *          scalar flux, and updates the Track's angular flux.
- * @param curr_segment a pointer to the Track segment of interest
+ *          scalar flux, and updates the Track's angular flux. If the
+ *          exponential cache is in use, the precomputed exponentials for the
+ *          segment are used.
+ * @param segment_id the index of the segment in the flattened segment arrays
+ * @param length the length of the segment (cm)
+ * @param material_id the compact Material index of the segment
+ * @param fsr_id the ID of the FSR in which the segment resides
  * @param azim_index a pointer to the azimuthal angle index for this segment
  * @param track_flux a pointer to the Track's angular flux
  * @param fsr_flux a pointer to the temporary FSR flux buffer
- * @param fwd
  */
-void CPUSolver::tallyScalarFlux(segment* curr_segment, int azim_index,
+void CPUSolver::tallyScalarFlux(long segment_id, FP_PRECISION length,
+                                int material_id, int fsr_id, int azim_index,
                                 FP_PRECISION* track_flux,
                                 FP_PRECISION* fsr_flux) {
 
-  int fsr_id = curr_segment->_region_id;
-  FP_PRECISION length = curr_segment->_length;
-  FP_PRECISION* sigma_t = curr_segment->_material->getSigmaT();
+  FP_PRECISION* sigma_t = &_segment_sigma_t[material_id * _num_groups];
   FP_PRECISION delta_psi, exponential;
 
   /* Set the FSR scalar flux buffer to zero */
@@ -716,37 +1009,50 @@ void CPUSolver::tallyScalarFlux(segment* curr_segment, int azim_index,
   /* Compute change in angular flux along segment in this FSR */
   for (int e=0; e < _num_groups; e++) {
     for (int p=0; p < _num_polar_2; p++) {
-      exponential = _exp_evaluator->computeExponential(sigma_t[e] * length, p);
+      if (_exp_cache != NULL)
+        exponential = _exp_cache(segment_id,e,p);
+      else
+        exponential = _exp_evaluator->computeExponential(sigma_t[e] * length,
+                                                         p);
       delta_psi = (track_flux(p,e)-_reduced_sources(fsr_id,e)) * exponential;
       fsr_flux[e] += delta_psi * _quadrature->getWeightInline(azim_index, p);
       track_flux(p,e) -= delta_psi;
     }
   }
 
-  /* Atomically increment the FSR scalar flux from the temporary array */
-  omp_set_lock(&_FSR_locks[fsr_id]);
-  {
+  /* Increment this thread's private FSR scalar flux without locking */
+  if (_flux_tally_type == THREAD_PRIVATE) {
+    int tid = omp_get_thread_num();
     for (int e=0; e < _num_groups; e++)
-      _scalar_flux(fsr_id,e) += fsr_flux[e];
+      _thread_scalar_flux(tid,fsr_id,e) += fsr_flux[e];
+  }
+
+  /* Atomically increment the FSR scalar flux from the temporary array */
+  else {
+    omp_set_lock(&_FSR_locks[fsr_id]);
+    {
+      for (int e=0; e < _num_groups; e++)
+        _scalar_flux(fsr_id,e) += fsr_flux[e];
+    }
+    omp_unset_lock(&_FSR_locks[fsr_id]);
   }
-  omp_unset_lock(&_FSR_locks[fsr_id]);
 }
 
 
 /**
  * @brief Tallies the current contribution from this segment across the
  *        the appropriate CMFD mesh cell surface.
- * @param curr_segment a pointer to the Track segment of interest
+ * @param surface the CMFD surface crossed at the end of the segment in the
+ *        direction of integration (-1 if no surface is crossed)
  * @param azim_index the azimuthal index for this segmenbt
  * @param track_flux a pointer to the Track's angular flux
- * @param fwd boolean indicating direction of integration along segment
  */
-void CPUSolver::tallyCurrent(segment* curr_segment, int azim_index,
-                             FP_PRECISION* track_flux, bool fwd) {
+void CPUSolver::tallyCurrent(int surface, int azim_index,
+                             FP_PRECISION* track_flux) {
 
   /* Tally surface currents if CMFD is in use */
   if (_cmfd != NULL && _cmfd->isFluxUpdateOn())
-    _cmfd->tallyCurrent(curr_segment, track_flux, azim_index, fwd);
+    _cmfd->tallyCurrent(surface, track_flux, azim_index);
 }
 
 
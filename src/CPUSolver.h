@@ -29,6 +29,31 @@
  *  group for the outgoing reflective track from a given Track */
 #define track_out_flux(p,e) (track_out_flux[(p)*_num_groups + (e)])
 
+/** Indexing macro for the thread-private scalar flux for each thread, FSR
+ *  and energy group */
+#define _thread_scalar_flux(t,r,e) \
+  (_thread_scalar_flux[((long)(t)*_num_FSRs + (r))*_num_groups + (e)])
+
+/** Indexing macro for the cached exponentials for each flattened segment,
+ *  energy group and polar angle */
+#define _exp_cache(s,e,p) \
+  (_exp_cache[((long)(s)*_num_groups + (e))*_num_polar_2 + (p)])
+
+
+/**
+ * @enum fluxTallyType
+ * @brief The method used to tally FSR scalar fluxes in a transport sweep.
+ */
+enum fluxTallyType {
+
+  /** Tally into the shared scalar flux array guarded by one lock per FSR */
+  FSR_LOCKS,
+
+  /** Tally into thread-private scalar flux arrays which are reduced into the
+   *  shared scalar flux array at the end of each transport sweep */
+  THREAD_PRIVATE
+};
+
 
 /**
  * @class CPUSolver CPUSolver.h "src/CPUSolver.h"
@@ -45,28 +70,62 @@ protected:
   /** OpenMP mutual exclusion locks for atomic FSR scalar flux updates */
   omp_lock_t* _FSR_locks;
 
+  /** The method used to tally FSR scalar fluxes in each transport sweep */
+  fluxTallyType _flux_tally_type;
+
+  /** The number of thread-private scalar flux arrays allocated */
+  int _num_thread_fluxes;
+
+  /** Thread-private scalar fluxes for each FSR and energy group used with
+   *  the THREAD_PRIVATE flux tally type */
+  FP_PRECISION* _thread_scalar_flux;
+
+  /** The number of Materials in the segment total cross-section table */
+  int _num_segment_materials;
+
+  /** The total cross-sections for each compact segment Material index and
+   *  energy group, copied from the TrackGenerator's segment Materials */
+  FP_PRECISION* _segment_sigma_t;
+
+  /** The maximum memory (MB) allowed for the cache of precomputed
+   *  exponentials (0 disables the cache) */
+  double _exp_cache_memory;
+
+  /** The precomputed exponentials for each flattened segment, energy group
+   *  and polar angle, or NULL if the exponentials are evaluated on the fly */
+  float* _exp_cache;
+
+  void initializeThreadFluxes();
+  void initializeSegmentArrays();
+  void initializeExponentialCache();
+  void reduceThreadFluxes();
+
 public:
   CPUSolver(TrackGenerator* track_generator=NULL);
+  virtual ~CPUSolver();
 
   /**
    * @brief Computes the contribution to the FSR flux from a Track segment.
-   * @param curr_segment a pointer to the Track segment of interest
+   * @param segment_id the index of the segment in the flattened segment arrays
+   * @param length the length of the segment (cm)
+   * @param material_id the compact Material index of the segment
+   * @param fsr_id the ID of the FSR in which the segment resides
    * @param azim_index a pointer to the azimuthal angle index for this segment
    * @param track_flux a pointer to the Track's angular flux
    * @param fsr_flux a pointer to the temporary FSR scalar flux buffer
    */
-  virtual void tallyScalarFlux(segment* curr_segment, int azim_index,
+  virtual void tallyScalarFlux(long segment_id, FP_PRECISION length,
+                               int material_id, int fsr_id, int azim_index,
                                FP_PRECISION* track_flux, FP_PRECISION* fsr_flux);
 
   /**
    * @brief Computes the contribution to surface current from a segment.
-   * @param curr_segment a pointer to the Track segment of interest
+   * @param surface the CMFD surface crossed in the direction of integration
    * @param azim_index a pointer to the azimuthal angle index for this segment
    * @param track_flux a pointer to the Track's angular flux
-   * @param fwd the direction of integration along the segment
    */
-  virtual void tallyCurrent(segment* curr_segment, int azim_index,
-                            FP_PRECISION* track_flux, bool fwd);
+  virtual void tallyCurrent(int surface, int azim_index,
+                            FP_PRECISION* track_flux);
 
   /**
    * @brief Updates the boundary flux for a Track given boundary conditions.
@@ -79,11 +138,17 @@ public:
                                     bool direction, FP_PRECISION* track_flux);
 
   int getNumThreads();
+  fluxTallyType getFluxTallyType();
+  double getExponentialCacheMemory();
+  bool isUsingExponentialCache();
   virtual void getFluxes(FP_PRECISION* out_fluxes, int num_fluxes);
 
   void setNumThreads(int num_threads);
+  void setFluxTallyType(fluxTallyType tally_type);
+  void setExponentialCacheMemory(double max_memory);
   virtual void setFluxes(FP_PRECISION* in_fluxes, int num_fluxes);
 
+  void initializeExpEvaluator();
   void initializeFluxArrays();
   void initializeSourceArrays();
   void initializeFixedSources();
@@ -27,6 +27,11 @@ Cmfd::Cmfd() {
   _centroid_update_on = true;
   _k_nearest = 3;
   _SOR_factor = 1.0;
+  _linear_solver_type = RED_BLACK_SOR;
+  _wielandt_shift = 0.;
+  _num_eigenvalue_iterations = 0;
+  _num_linear_iterations = 0;
+  _timer = new Timer();
   _num_FSRs = 0;
 
   /* Energy group and polar angle problem parameters */
@@ -46,6 +51,9 @@ Cmfd::Cmfd() {
   _group_indices_map = NULL;
   _user_group_indices = false;
   _surface_currents = NULL;
+  _thread_currents = NULL;
+  _num_thread_currents = 0;
+  _current_weights = NULL;
   _cell_locks = NULL;
   _volumes = NULL;
   _lattice = NULL;
@@ -67,6 +75,9 @@ Cmfd::~Cmfd() {
   if (_cell_locks != NULL)
     delete [] _cell_locks;
 
+  if (_timer != NULL)
+    delete _timer;
+
   if (_boundaries != NULL)
     delete [] _boundaries;
 
@@ -101,6 +112,12 @@ Cmfd::~Cmfd() {
   if (_surface_currents != NULL)
     delete _surface_currents;
 
+  if (_thread_currents != NULL)
+    delete [] _thread_currents;
+
+  if (_current_weights != NULL)
+    delete [] _current_weights;
+
   if (_volumes != NULL)
     delete _volumes;
 
@@ -547,17 +564,30 @@ FP_PRECISION Cmfd::computeKeff(int moc_iteration) {
   }
 
   /* Collapse the cross sections onto the CMFD mesh */
+  _timer->startTimer();
   collapseXS();
 
   /* Construct matrices */
   constructMatrices(moc_iteration);
+  _timer->stopTimer();
+  _timer->recordSplit("CMFD matrix construction");
 
   /* Copy old flux to new flux */
   _old_flux->copyTo(_new_flux);
 
   /* Solve the eigenvalue problem */
+  _timer->startTimer();
   _k_eff = eigenvalueSolve(_A, _M, _new_flux, _source_convergence_threshold,
-                           _SOR_factor);
+                           _SOR_factor, _linear_solver_type, _wielandt_shift,
+                           &_num_eigenvalue_iterations,
+                           &_num_linear_iterations);
+  _timer->stopTimer();
+  _timer->recordSplit("CMFD eigenvalue solve");
+
+  log_printf(DEBUG, "CMFD eigenvalue solve with %d power iterations and %d "
+             "linear solver iterations in %1.4E sec",
+             _num_eigenvalue_iterations, _num_linear_iterations,
+             _timer->getTime());
 
   /* Rescale the old and new flux */
   rescaleFlux();
@@ -595,7 +625,10 @@ void Cmfd::rescaleFlux() {
  * @details This method loops over all mesh cells and energy groups and
  *          accumulates the iteraction and streaming terms into their
  *          approipriate positions in the loss + streaming matrix and
- *          fission gain matrix.
+ *          fission gain matrix. The terms for each cell are only added to
+ *          the rows for that cell, such that each row is updated by a
+ *          single thread in place in the fixed sparsity pattern of each
+ *          matrix.
  */
 void Cmfd::constructMatrices(int moc_iteration) {
 
@@ -814,6 +847,40 @@ void Cmfd::setSORRelaxationFactor(FP_PRECISION SOR_factor) {
 }
 
 
+/**
+ * @brief Set the method used to solve the linear systems within the
+ *        diffusion eigenvalue solve.
+ * @details The default RED_BLACK_SOR method uses the successive
+ *          over-relaxation factor set by setSORRelaxationFactor(...). The
+ *          BICGSTAB method typically converges in fewer iterations on fine
+ *          CMFD meshes and is more robust with a Wielandt shift.
+ * @param solver_type The linear solver type (RED_BLACK_SOR or BICGSTAB)
+ */
+void Cmfd::setLinearSolverType(linearSolverType solver_type) {
+  _linear_solver_type = solver_type;
+}
+
+
+/**
+ * @brief Set the Wielandt shift of the eigenvalue for the diffusion
+ *        eigenvalue solve.
+ * @details If positive, the eigenvalue in the power iteration is shifted to
+ *          the current estimate of the eigenvalue plus this shift. Smaller
+ *          shifts require fewer power iterations but lead to linear systems
+ *          which are more expensive to solve. The default of 0 does not
+ *          shift the eigenvalue.
+ * @param shift The Wielandt shift
+ */
+void Cmfd::setWielandtShift(FP_PRECISION shift) {
+
+  if (shift < 0.0)
+    log_printf(ERROR, "The Wielandt shift must be non-negative. "
+               "Input value: %f", shift);
+
+  _wielandt_shift = shift;
+}
+
+
 /**
  * @brief Get the number of coarse CMFD energy groups.
  * @return The number of CMFD energy groups
@@ -925,10 +992,54 @@ void Cmfd::initializeCurrents() {
   _surface_currents = new Vector(_cell_locks, _num_x, _num_y,
                                  _num_cmfd_groups * NUM_SURFACES);
 
+  /* Delete old thread-private surface currents if they exist */
+  if (_thread_currents != NULL)
+    delete [] _thread_currents;
+
+  _thread_currents = NULL;
+  _num_thread_currents = 0;
+
+  /* Store the quadrature weights used to tally the currents */
+  if (_current_weights != NULL)
+    delete [] _current_weights;
+
+  int num_azim_2 = _quadrature->getNumAzimAngles() / 2;
+  _current_weights = new FP_PRECISION[num_azim_2 * _num_polar_2];
+
+  for (int a=0; a < num_azim_2; a++) {
+    for (int p=0; p < _num_polar_2; p++)
+      _current_weights[a*_num_polar_2 + p] =
+          _quadrature->getWeightInline(a, p);
+  }
+
   return;
 }
 
 
+/**
+ * @brief Allocates the thread-private surface currents for each thread.
+ * @details This requires one additional array of surface currents
+ *          (# CMFD cells \f$ \times \f$ # surfaces \f$ \times \f$
+ *          # CMFD groups) for each thread.
+ */
+void Cmfd::initializeThreadCurrents() {
+
+  if (_thread_currents != NULL)
+    delete [] _thread_currents;
+
+  _num_thread_currents = omp_get_max_threads();
+  long size = (long)_num_thread_currents * _surface_currents->getNumRows();
+
+  try {
+    _thread_currents = new FP_PRECISION[size];
+  }
+  catch (std::exception &e) {
+    log_printf(ERROR, "Could not allocate memory for the thread-private CMFD "
+               "surface currents. Backtrace:%s", e.what());
+  }
+}
+
+
 /**
  * @brief Initializes the vector of vectors that links CMFD cells with FSRs.
  * @details This method is called by the geometry once the CMFD mesh has been
@@ -1365,6 +1476,41 @@ int Cmfd::convertFSRIdToCmfdCell(int fsr_id) {
 }
 
 
+/**
+ * @brief Fills an array with the CMFD cell ID that each FSR lies in.
+ * @details This class method is intended to be called by the OpenMOC
+ *          Python "plotter" module as a utility to find the CMFD cells of
+ *          all FSRs in a single call rather than calling
+ *          Cmfd::convertFSRIdToCmfdCell(...) for each FSR. This method may
+ *          be called from Python as follows:
+ *
+ * @code
+ *          cmfd_cells = cmfd.getFSRCmfdCells(geometry.getNumFSRs())
+ * @endcode
+ *
+ * @param fsr_cmfd_cells an array of CMFD cell IDs indexed by FSR ID, with
+ *        -1 for FSRs which do not lie in a CMFD cell
+ * @param num_FSRs the number of FSRs
+ */
+void Cmfd::getFSRCmfdCells(int* fsr_cmfd_cells, int num_FSRs) {
+
+  for (int r=0; r < num_FSRs; r++)
+    fsr_cmfd_cells[r] = -1;
+
+  std::vector<int>::iterator iter;
+  for (int cell_id=0; cell_id < _num_x * _num_y; cell_id++) {
+
+    for (iter = _cell_fsrs.at(cell_id).begin();
+         iter != _cell_fsrs.at(cell_id).end(); ++iter) {
+      if (*iter < 0 || *iter >= num_FSRs)
+        log_printf(ERROR, "Unable to get the CMFD cells for %d FSRs since "
+                   "CMFD cell %d contains FSR %d", num_FSRs, cell_id, *iter);
+      fsr_cmfd_cells[*iter] = cell_id;
+    }
+  }
+}
+
+
 /**
  * @brief Return a pointer to the vector of vectors that contains
  *        the FSRs that lie in each cell.
@@ -1432,6 +1578,43 @@ bool Cmfd::isCentroidUpdateOn() {
 }
 
 
+/**
+ * @brief Get the method used to solve the linear systems.
+ * @return The linear solver type
+ */
+linearSolverType Cmfd::getLinearSolverType() {
+  return _linear_solver_type;
+}
+
+
+/**
+ * @brief Get the Wielandt shift of the eigenvalue.
+ * @return The Wielandt shift
+ */
+FP_PRECISION Cmfd::getWielandtShift() {
+  return _wielandt_shift;
+}
+
+
+/**
+ * @brief Get the number of power iterations in the last eigenvalue solve.
+ * @return The number of power iterations
+ */
+int Cmfd::getNumEigenvalueIterations() {
+  return _num_eigenvalue_iterations;
+}
+
+
+/**
+ * @brief Get the total number of linear solver iterations in the last
+ *        eigenvalue solve.
+ * @return The number of linear solver iterations
+ */
+int Cmfd::getNumLinearIterations() {
+  return _num_linear_iterations;
+}
+
+
 /**
  * @brief Sets the threshold for CMFD source convergence (>0)
  * @param the threshold for source convergence
@@ -1853,64 +2036,70 @@ void Cmfd::setKNearest(int k_nearest) {
  *        group.
  */
 void Cmfd::zeroCurrents() {
-  _surface_currents->clear();
-}
 
+  _surface_currents->clear();
 
-/**
- * @brief Tallies the current contribution from this segment across the
- *        the appropriate CMFD mesh cell surface.
- * @param curr_segment The current Track segment
- * @param track_flux The outgoing angular flux for this segment
- * @param azim_index Azimuthal angle index of the current Track
- * @param fwd Boolean indicating direction of integration along segment
- */
-void Cmfd::tallyCurrent(segment* curr_segment, FP_PRECISION* track_flux,
-                        int azim_index, bool fwd) {
+  /* Allocate thread-private currents if none exist for each thread */
+  if (_thread_currents == NULL ||
+      _num_thread_currents < omp_get_max_threads())
+    initializeThreadCurrents();
 
-  int surf_id, cell_id;
-  int ncg = _num_cmfd_groups;
-  FP_PRECISION currents[_num_cmfd_groups];
-  memset(currents, 0.0, sizeof(FP_PRECISION) * _num_cmfd_groups);
+  long size = (long)_num_thread_currents * _surface_currents->getNumRows();
 
-  if (fwd) {
-    if (curr_segment->_cmfd_surface_fwd != -1) {
+#pragma omp parallel for schedule(static)
+  for (long i=0; i < size; i++)
+    _thread_currents[i] = 0.0;
+}
 
-      surf_id = curr_segment->_cmfd_surface_fwd % NUM_SURFACES;
-      cell_id = curr_segment->_cmfd_surface_fwd / NUM_SURFACES;
 
-      for (int e=0; e < _num_moc_groups; e++) {
-        int g = getCmfdGroup(e);
+/**
+ * @brief Sum the thread-private surface currents into the surface currents
+ *        for each mesh cell and energy group.
+ * @details This is called once after each transport sweep.
+ */
+void Cmfd::reduceCurrents() {
 
-        for (int p=0; p < _num_polar_2; p++)
-          currents[g] += track_flux(p, e) *
-                         _quadrature->getWeightInline(azim_index, p);
-      }
+  FP_PRECISION* currents = _surface_currents->getArray();
+  int size = _surface_currents->getNumRows();
 
-      /* Increment currents */
-      _surface_currents->incrementValues
-          (cell_id, surf_id*ncg, (surf_id+1)*ncg - 1, currents);
-    }
+#pragma omp parallel for schedule(static)
+  for (int i=0; i < size; i++) {
+    FP_PRECISION current = 0.0;
+    for (int t=0; t < _num_thread_currents; t++)
+      current += _thread_currents[(long)t*size + i];
+    currents[i] += current;
   }
-  else {
-    if (curr_segment->_cmfd_surface_bwd != -1) {
+}
 
-      surf_id = curr_segment->_cmfd_surface_bwd % NUM_SURFACES;
-      cell_id = curr_segment->_cmfd_surface_bwd / NUM_SURFACES;
 
-      for (int e=0; e < _num_moc_groups; e++) {
-
-        int g = getCmfdGroup(e);
+/**
+ * @brief Tallies the current contribution from a segment across the
+ *        the appropriate CMFD mesh cell surface.
+ * @param surface The CMFD surface crossed at the end of the segment in the
+ *        direction of integration (-1 if no surface is crossed)
+ * @param track_flux The outgoing angular flux for this segment
+ * @param azim_index Azimuthal angle index of the current Track
+ */
+void Cmfd::tallyCurrent(int surface, FP_PRECISION* track_flux,
+                        int azim_index) {
 
-        for (int p=0; p < _num_polar_2; p++)
-          currents[g] += track_flux(p, e) *
-                         _quadrature->getWeightInline(azim_index, p);
-      }
+  if (surface == -1)
+    return;
 
-      /* Increment currents */
-      _surface_currents->incrementValues
-          (cell_id, surf_id*ncg, (surf_id+1)*ncg - 1, currents);
-    }
+  /* Find this thread's currents for the surface, ordered by cell, surface
+   * and CMFD group as in the surface currents Vector */
+  int tid = omp_get_thread_num();
+  long size = _surface_currents->getNumRows();
+  FP_PRECISION* currents = &_thread_currents[tid*size +
+                                             surface*_num_cmfd_groups];
+  FP_PRECISION* weights = &_current_weights[azim_index*_num_polar_2];
+
+  /* Increment this thread's currents without locking */
+  for (int e=0; e < _num_moc_groups; e++) {
+    FP_PRECISION current = 0.0;
+    for (int p=0; p < _num_polar_2; p++)
+      current += track_flux(p, e) * weights[p];
+    currents[_group_indices_map[e]] += current;
   }
 }
 
@@ -1963,6 +2152,17 @@ void Cmfd::initialize() {
     _flux_ratio = new Vector(_cell_locks, _num_x, _num_y, _num_cmfd_groups);
     _volumes = new Vector(_cell_locks, _num_x, _num_y, 1);
 
+    /* Fix the sparsity patterns of the matrices from the neighboring cells
+     * such that they are updated in place in each MOC iteration */
+    std::vector<int> cell_neighbors(num_cells * NUM_FACES);
+    for (int i=0; i < num_cells; i++) {
+      for (int s=0; s < NUM_FACES; s++)
+        cell_neighbors[i*NUM_FACES + s] = getCellNext(i, s);
+    }
+
+    _A->setSparsityPattern(&cell_neighbors[0], NUM_FACES);
+    _M->setSparsityPattern(NULL, 0);
+
     /* Set the minimum x and y values of the geometry */
     _x_min = _geometry->getMinX();
     _y_min = _geometry->getMinY();
@@ -19,6 +19,7 @@
 #include "Quadrature.h"
 #include "linalg.h"
 #include "Geometry.h"
+#include "Timer.h"
 #endif
 
 /** Forward declaration of Geometry class */
@@ -79,6 +80,21 @@ private:
   /** Gauss-Seidel SOR relaxation factor */
   FP_PRECISION _SOR_factor;
 
+  /** The method used to solve the linear systems */
+  linearSolverType _linear_solver_type;
+
+  /** The Wielandt shift of the eigenvalue (0 for no shift) */
+  FP_PRECISION _wielandt_shift;
+
+  /** The number of power iterations in the last eigenvalue solve */
+  int _num_eigenvalue_iterations;
+
+  /** The number of linear solver iterations in the last eigenvalue solve */
+  int _num_linear_iterations;
+
+  /** A timer to record the time spent in each CMFD solve */
+  Timer* _timer;
+
   /** cmfd source convergence threshold */
   FP_PRECISION _source_convergence_threshold;
 
@@ -143,6 +159,16 @@ private:
   /** Vector of surface currents for each CMFD cell */
   Vector* _surface_currents;
 
+  /** Thread-private surface currents for each CMFD cell, surface and CMFD
+   *  group, tallied without locks and reduced after each transport sweep */
+  FP_PRECISION* _thread_currents;
+
+  /** The number of threads for which surface currents are allocated */
+  int _num_thread_currents;
+
+  /** The total quadrature weight for each azimuthal and polar angle */
+  FP_PRECISION* _current_weights;
+
   /** Vector of vectors of FSRs containing in each cell */
   std::vector< std::vector<int> > _cell_fsrs;
 
@@ -176,6 +202,7 @@ private:
   void getEdgeSplitSurfaces(int cell, int edge, std::vector<int>* surfaces);
   void initializeMaterials();
   void initializeCurrents();
+  void initializeThreadCurrents();
   void generateKNearestStencils();
 
   /* Private getter functions */
@@ -207,8 +234,8 @@ public:
   int findCmfdSurface(int cell_id, LocalCoords* coords);
   void addFSRToCell(int cell_id, int fsr_id);
   void zeroCurrents();
-  void tallyCurrent(segment* curr_segment, FP_PRECISION* track_flux,
-                    int azim_index, bool fwd);
+  void reduceCurrents();
+  void tallyCurrent(int surface, FP_PRECISION* track_flux, int azim_index);
   void updateBoundaryFlux(Track** tracks, FP_PRECISION* boundary_flux,
                           int num_tracks);
 
@@ -222,12 +249,19 @@ public:
   int getNumX();
   int getNumY();
   int convertFSRIdToCmfdCell(int fsr_id);
+  void getFSRCmfdCells(int* fsr_cmfd_cells, int num_FSRs);
   std::vector< std::vector<int> >* getCellFSRs();
   bool isFluxUpdateOn();
   bool isCentroidUpdateOn();
+  linearSolverType getLinearSolverType();
+  FP_PRECISION getWielandtShift();
+  int getNumEigenvalueIterations();
+  int getNumLinearIterations();
 
   /* Set parameters */
   void setSORRelaxationFactor(FP_PRECISION SOR_factor);
+  void setLinearSolverType(linearSolverType solver_type);
+  void setWielandtShift(FP_PRECISION shift);
   void setGeometry(Geometry* geometry);
   void setWidthX(double width);
   void setWidthY(double width);
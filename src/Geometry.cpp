@@ -1,4 +1,8 @@
 #include "Geometry.h"
+#include "MOCKernel.h"
+
+
+static int auto_FSR_layout_id = 0;
 
 
 /**
@@ -20,6 +24,16 @@ Geometry::Geometry() {
 
   /* Initialize CMFD object to NULL */
   _cmfd = NULL;
+
+  /* The nesting depth is computed once the FSRs are initialized */
+  _max_nesting_depth = 0;
+
+  /* The FSR centroids are allocated once they are computed */
+  _FSR_centroids = NULL;
+  _num_FSR_centroids = 0;
+
+  /* A layout ID is assigned each time the FSRs are initialized */
+  _FSR_layout_id = 0;
 }
 
 
@@ -40,6 +54,9 @@ Geometry::~Geometry() {
     _FSRs_to_keys.clear();
   }
 
+  if (_FSR_centroids != NULL)
+    delete [] _FSR_centroids;
+
   /* Remove all Materials in the Geometry */
   std::map<int, Material*> materials = getAllMaterials();
   std::map<int, Cell*> cells = getAllCells();
@@ -191,6 +208,19 @@ int Geometry::getNumFSRs() {
   return _FSRs_to_keys.size();
 }
 
+
+/**
+ * @brief Returns a unique ID for the current layout of the FSRs.
+ * @details A new ID, unique among all Geometries, is assigned each time the
+ *          FSRs are initialized for Track generation. Data cached by FSR ID,
+ *          such as by the OpenMOC Python "process" module, is valid as long
+ *          as this ID is unchanged.
+ * @return the FSR layout ID
+ */
+int Geometry::getFSRLayoutId() {
+  return _FSR_layout_id;
+}
+
 /**
  * @brief Returns the number of energy groups for each Material's nuclear data.
  * @return the number of energy groups
@@ -366,6 +396,23 @@ std::map<int, Universe*> Geometry::getAllUniverses() {
 }
 
 
+/**
+ * @brief Returns the maximum number of nested Universe levels in the
+ *        Geometry.
+ * @details This is the length of the longest linked list of LocalCoords
+ *          built by Geometry::findCellContainingCoords(...), including the
+ *          LocalCoords at the root Universe level.
+ * @return the maximum nesting depth of the Geometry
+ */
+int Geometry::getMaxNestingDepth() {
+
+  if (_root_universe == NULL)
+    return 0;
+
+  return _root_universe->getMaxNestingDepth();
+}
+
+
 /**
  * @brief Returns the Universe at the root node in the CSG tree.
  * @return the root Universe
@@ -564,19 +611,19 @@ int Geometry::findFSRId(LocalCoords* coords) {
   curr = coords->getLowestLevel();
 
   /* Generate unique FSR key */
-  std::string fsr_key = getFSRKey(coords);
+  fsr_key key = getFSRKey(coords);
 
   /* If FSR has not been encountered, update FSR maps and vectors */
-  if (!_FSR_keys_map.contains(fsr_key)) {
+  if (!_FSR_keys_map.contains(key)) {
 
     /* Try to get a clean copy of the fsr_id, adding the FSR data
        if necessary where -1 indicates the key was already added */
-    fsr_id = _FSR_keys_map.insert_and_get_count(fsr_key, NULL);
+    fsr_id = _FSR_keys_map.insert_and_get_count(key, NULL);
     if (fsr_id == -1)
     {
       fsr_data volatile* fsr;
       do {
-        fsr = _FSR_keys_map.at(fsr_key);
+        fsr = _FSR_keys_map.at(key);
       } while (fsr == NULL);
       fsr_id = fsr->_fsr_id;
     }
@@ -585,7 +632,7 @@ int Geometry::findFSRId(LocalCoords* coords) {
       /* Add FSR information to FSR key map and FSR_to vectors */
       fsr_data* fsr = new fsr_data;
       fsr->_fsr_id = fsr_id;
-      _FSR_keys_map.update(fsr_key, fsr);
+      _FSR_keys_map.update(key, fsr);
       Point* point = new Point();
       point->setCoords(coords->getHighestLevel()->getX(),
                        coords->getHighestLevel()->getY(),
@@ -606,7 +653,7 @@ int Geometry::findFSRId(LocalCoords* coords) {
   else {
     fsr_data volatile* fsr;
     do {
-      fsr = _FSR_keys_map.at(fsr_key);
+      fsr = _FSR_keys_map.at(key);
     } while (fsr == NULL);
 
     fsr_id = fsr->_fsr_id;
@@ -625,15 +672,15 @@ int Geometry::findFSRId(LocalCoords* coords) {
 int Geometry::getFSRId(LocalCoords* coords) {
 
   int fsr_id = 0;
-  std::string fsr_key;
+  fsr_key key;
 
   try {
-    fsr_key = getFSRKey(coords);
-    fsr_id = _FSR_keys_map.at(fsr_key)->_fsr_id;
+    key = getFSRKey(coords);
+    fsr_id = _FSR_keys_map.at(key)->_fsr_id;
   }
   catch(std::exception &e) {
     log_printf(ERROR, "Could not find FSR ID with key: %s. Try creating "
-               "geometry with finer track spacing", fsr_key.c_str());
+               "geometry with finer track spacing", key.toString().c_str());
   }
 
   return fsr_id;
@@ -681,57 +728,179 @@ Point* Geometry::getFSRCentroid(int fsr_id) {
 
 
 /**
- * @brief Generate a string FSR "key" that identifies an FSR by its
+ * @brief Fills an array with the x,y,z coordinates of the characteristic
+ *        point for each FSR.
+ * @details This class method is intended to be called by the OpenMOC
+ *          Python "process" and "plotter" modules as a utility to retrieve
+ *          the points of all FSRs in a single call rather than one FSR at a
+ *          time. The points are stored in FSR ID order as (x,y,z) triples.
+ *          This method may be called from Python as follows:
+ *
+ * @code
+ *          num_FSRs = geometry.getNumFSRs()
+ *          points = geometry.getFSRPoints(num_FSRs * 3).reshape(num_FSRs, 3)
+ * @endcode
+ *
+ * @param fsr_points an array of coordinates for each FSR point
+ * @param num_values the number of values in the array (3 times the number
+ *        of FSRs)
+ */
+void Geometry::getFSRPoints(double* fsr_points, int num_values) {
+
+  int num_FSRs = getNumFSRs();
+
+  if (num_values != 3 * num_FSRs)
+    log_printf(ERROR, "Unable to get the FSR points since the array has %d "
+               "values rather than 3 values for each of the %d FSRs",
+               num_values, num_FSRs);
+
+#pragma omp parallel for schedule(static)
+  for (int r=0; r < num_FSRs; r++) {
+    Point* point = _FSR_keys_map.at(_FSRs_to_keys[r])->_point;
+    fsr_points[3*r] = point->getX();
+    fsr_points[3*r+1] = point->getY();
+    fsr_points[3*r+2] = point->getZ();
+  }
+}
+
+
+/**
+ * @brief Fills an array with the x,y,z coordinates of the centroid of each
+ *        FSR.
+ * @details This class method is intended to be called by the OpenMOC
+ *          Python "plotter" and "process" modules as a utility to retrieve
+ *          the centroids of all FSRs in a single call rather than one FSR at
+ *          a time. The centroids are stored in FSR ID order as (x,y,z)
+ *          triples. This method may be called from Python as follows:
+ *
+ * @code
+ *          num_FSRs = geometry.getNumFSRs()
+ *          centroids = geometry.getFSRCentroids(num_FSRs * 3)
+ *          centroids = centroids.reshape(num_FSRs, 3)
+ * @endcode
+ *
+ * @param fsr_centroids an array of coordinates for each FSR centroid
+ * @param num_values the number of values in the array (3 times the number
+ *        of FSRs)
+ */
+void Geometry::getFSRCentroids(double* fsr_centroids, int num_values) {
+
+  int num_FSRs = getNumFSRs();
+
+  if (num_values != 3 * num_FSRs)
+    log_printf(ERROR, "Unable to get the FSR centroids since the array has "
+               "%d values rather than 3 values for each of the %d FSRs",
+               num_values, num_FSRs);
+
+  for (int r=0; r < num_FSRs; r++) {
+    Point* centroid = _FSR_keys_map.at(_FSRs_to_keys[r])->_centroid;
+
+    if (centroid == NULL)
+      log_printf(ERROR, "Unable to get the FSR centroids since the centroid "
+                 "for FSR %d has not yet been computed", r);
+
+    fsr_centroids[3*r] = centroid->getX();
+    fsr_centroids[3*r+1] = centroid->getY();
+    fsr_centroids[3*r+2] = centroid->getZ();
+  }
+}
+
+
+/**
+ * @brief Fills an array with the ID of the Cell containing each FSR.
+ * @details This class method is intended to be called by the OpenMOC
+ *          Python "process" and "plotter" modules as a utility to find the
+ *          Cells of all FSRs in a single call. This method may be called
+ *          from Python as follows:
+ *
+ * @code
+ *          cell_ids = geometry.getFSRCellIds(geometry.getNumFSRs())
+ * @endcode
+ *
+ * @param fsr_cell_ids an array of Cell IDs indexed by FSR ID
+ * @param num_FSRs the number of FSRs
+ */
+void Geometry::getFSRCellIds(int* fsr_cell_ids, int num_FSRs) {
+
+  if (num_FSRs != getNumFSRs())
+    log_printf(ERROR, "Unable to get the FSR Cell IDs for %d FSRs since "
+               "the Geometry contains %d FSRs", num_FSRs, getNumFSRs());
+
+#pragma omp parallel for schedule(guided)
+  for (int r=0; r < num_FSRs; r++)
+    fsr_cell_ids[r] = findCellContainingFSR(r)->getId();
+}
+
+
+/**
+ * @brief Fills an array with the ID of the Material filling each FSR.
+ * @details This class method is intended to be called by the OpenMOC
+ *          Python "process" and "plotter" modules as a utility to find the
+ *          Materials of all FSRs in a single call. This method may be called
+ *          from Python as follows:
+ *
+ * @code
+ *          material_ids = geometry.getFSRMaterialIds(geometry.getNumFSRs())
+ * @endcode
+ *
+ * @param fsr_material_ids an array of Material IDs indexed by FSR ID
+ * @param num_FSRs the number of FSRs
+ */
+void Geometry::getFSRMaterialIds(int* fsr_material_ids, int num_FSRs) {
+
+  if (num_FSRs != getNumFSRs())
+    log_printf(ERROR, "Unable to get the FSR Material IDs for %d FSRs since "
+               "the Geometry contains %d FSRs", num_FSRs, getNumFSRs());
+
+#pragma omp parallel for schedule(guided)
+  for (int r=0; r < num_FSRs; r++)
+    fsr_material_ids[r] = findFSRMaterial(r)->getId();
+}
+
+
+/**
+ * @brief Generate an integer FSR "key" that identifies an FSR by its
  *        unique hierarchical lattice/universe/cell structure.
  * @details Since not all FSRs will reside on the absolute lowest universe
  *          level and Cells might overlap other cells, it is important to
  *          have a method for uniquely identifying FSRs. This method
- *          creates a unique FSR key by constructing a structured string
- *          that describes the hierarchy of lattices/universes/cells.
+ *          creates a unique FSR key by packing the CMFD cell, lattice,
+ *          universe and cell IDs and lattice cell indices of the hierarchy
+ *          into a compact vector of integers which is cheap to hash.
  * @param coords a LocalCoords object pointer
  * @return the FSR key
  */
-std::string Geometry::getFSRKey(LocalCoords* coords) {
+fsr_key Geometry::getFSRKey(LocalCoords* coords) {
 
-  std::stringstream key;
+  fsr_key key;
+  std::vector<int>& components = key._components;
+  components.reserve(16);
   LocalCoords* curr = coords->getHighestLevel();
-  std::ostringstream curr_level_key;
 
   /* If CMFD is on, get CMFD latice cell and write to key */
   if (_cmfd != NULL) {
-      curr_level_key << _cmfd->getLattice()->getLatX(curr->getPoint());
-      key << "CMFD = (" << curr_level_key.str() << ", ";
-      curr_level_key.str(std::string());
-      curr_level_key << _cmfd->getLattice()->getLatY(curr->getPoint());
-      key << curr_level_key.str() << ") : ";
+    components.push_back(KEY_CMFD);
+    components.push_back(_cmfd->getLattice()->getLatX(curr->getPoint()));
+    components.push_back(_cmfd->getLattice()->getLatY(curr->getPoint()));
   }
 
   /* Descend the linked list hierarchy until the lowest level has
    * been reached */
   while (curr != NULL) {
 
-    /* Clear string stream */
-    curr_level_key.str(std::string());
-
     if (curr->getType() == LAT) {
 
       /* Write lattice ID and lattice cell to key */
-      curr_level_key << curr->getLattice()->getId();
-      key << "LAT = " << curr_level_key.str() << " (";
-      curr_level_key.str(std::string());
-      curr_level_key << curr->getLatticeX();
-      key << curr_level_key.str() << ", ";
-      curr_level_key.str(std::string());
-      curr_level_key << curr->getLatticeY();
-      key << curr_level_key.str() << ", ";
-      curr_level_key.str(std::string());
-      curr_level_key << curr->getLatticeZ();
-      key << curr_level_key.str() << ") : ";
+      components.push_back(KEY_LAT);
+      components.push_back(curr->getLattice()->getId());
+      components.push_back(curr->getLatticeX());
+      components.push_back(curr->getLatticeY());
+      components.push_back(curr->getLatticeZ());
     }
     else {
       /* write universe ID to key */
-      curr_level_key << curr->getUniverse()->getId();
-      key << "UNIV = " << curr_level_key.str() << " : ";
+      components.push_back(KEY_UNIV);
+      components.push_back(curr->getUniverse()->getId());
     }
 
     /* If lowest coords reached break; otherwise get next coords */
@@ -741,14 +910,38 @@ std::string Geometry::getFSRKey(LocalCoords* coords) {
       curr = curr->getNext();
   }
 
-  /* clear string stream */
-  curr_level_key.str(std::string());
-
   /* write cell id to key */
-  curr_level_key << curr->getCell()->getId();
-  key << "CELL = " << curr_level_key.str();
+  components.push_back(KEY_CELL);
+  components.push_back(curr->getCell()->getId());
+
+  return key;
+}
+
+
+/**
+ * @brief Return a string rendering of the FSR key for a given FSR ID.
+ * @details This is intended for debugging and for users wishing to inspect
+ *          the lattice/universe/cell hierarchy of an FSR from Python:
+ *
+ * @code
+ *          key = geometry.getFSRKeyString(fsr_id)
+ * @endcode
+ *
+ * @param fsr_id the FSR ID
+ * @return the FSR key as a string
+ */
+std::string Geometry::getFSRKeyString(int fsr_id) {
+
+  std::string key_string;
+
+  try {
+    key_string = _FSRs_to_keys.at(fsr_id).toString();
+  }
+  catch(std::exception &e) {
+    log_printf(ERROR, "Could not find the key for FSR: %d", fsr_id);
+  }
 
-  return key.str();
+  return key_string;
 }
 
 
@@ -782,16 +975,32 @@ void Geometry::subdivideCells() {
  * @details This method is intended to be called by the user before initiating
  *          source iteration. This method first subdivides all Cells by calling
  *          the Geometry::subdivideCells() method. Then it initializes the CMFD
- *          object.
+ *          object and builds the Cell search grids of each Universe.
  * @brief neighbor_cells whether to use neighbor cell optimizations
  */
 void Geometry::initializeFSRs(bool neighbor_cells) {
+
+  /* Invalidate data cached for the previous FSRs */
+  auto_FSR_layout_id++;
+  _FSR_layout_id = auto_FSR_layout_id;
+
   /* Subdivide Cells into sectors and rings */
   subdivideCells();
 
   /* Build collections of neighbor Cells for optimized ray tracing */
   if (neighbor_cells)
     _root_universe->buildNeighbors();
+
+  /* Find the number of LocalCoords levels to preallocate for ray tracing */
+  _max_nesting_depth = getMaxNestingDepth();
+
+  /* Build the Cell search grids of the subdivided Universes */
+  std::map<int, Universe*> all_universes = getAllUniverses();
+  std::map<int, Universe*>::iterator iter;
+  for (iter = all_universes.begin(); iter != all_universes.end(); ++iter) {
+    if (iter->second->getType() == SIMPLE)
+      iter->second->buildCellGrid();
+  }
 }
 
 
@@ -801,9 +1010,14 @@ void Geometry::initializeFSRs(bool neighbor_cells) {
  * @details This method starts at the beginning of a Track and finds successive
  *          intersection points with FSRs as the Track crosses through the
  *          Geometry and creates segment structs and adds them to the Track.
+ *          If an MOCKernel is provided, the kernel is instead applied to each
+ *          segment and no segments are added to the Track. This is used to
+ *          form segments on the fly.
  * @param track a pointer to a track to segmentize
+ * @param kernel the MOCKernel to apply to each segment, or NULL to add the
+ *        segments to the Track
  */
-void Geometry::segmentize(Track* track) {
+void Geometry::segmentize(Track* track, MOCKernel* kernel) {
 
   /* Track starting Point coordinates and azimuthal angle */
   double x0 = track->getStart()->getX();
@@ -821,6 +1035,8 @@ void Geometry::segmentize(Track* track) {
   /* Use a LocalCoords for the start and end of each segment */
   LocalCoords start(x0, y0, z0);
   LocalCoords end(x0, y0, z0);
+  start.reserveLevels(_max_nesting_depth);
+  end.reserveLevels(_max_nesting_depth);
   start.setUniverse(_root_universe);
   end.setUniverse(_root_universe);
   start.setPhi(phi);
@@ -858,10 +1074,10 @@ void Geometry::segmentize(Track* track) {
     fsr_id = findFSRId(&start);
 
     /* Create a new Track segment */
-    segment* new_segment = new segment;
-    new_segment->_material = material;
-    new_segment->_length = length;
-    new_segment->_region_id = fsr_id;
+    segment new_segment;
+    new_segment._material = material;
+    new_segment._length = length;
+    new_segment._region_id = fsr_id;
 
     log_printf(DEBUG, "segment start x = %f, y = %f; end x = %f, y = %f",
                start.getX(), start.getY(), end.getX(), end.getY());
@@ -877,8 +1093,8 @@ void Geometry::segmentize(Track* track) {
       start.adjustCoords(-TINY_MOVE);
       end.adjustCoords(-TINY_MOVE);
 
-      new_segment->_cmfd_surface_fwd = _cmfd->findCmfdSurface(cmfd_cell, &end);
-      new_segment->_cmfd_surface_bwd =
+      new_segment._cmfd_surface_fwd = _cmfd->findCmfdSurface(cmfd_cell, &end);
+      new_segment._cmfd_surface_bwd =
         _cmfd->findCmfdSurface(cmfd_cell, &start);
 
       /* Re-nudge segments from surface */
@@ -886,16 +1102,98 @@ void Geometry::segmentize(Track* track) {
       end.adjustCoords(TINY_MOVE);
     }
 
-    /* Add the segment to the Track */
-    track->addSegment(new_segment);
+    /* Apply the kernel to the segment or add the segment to the Track */
+    if (kernel != NULL)
+      kernel->execute(length, material, fsr_id, new_segment._cmfd_surface_fwd,
+                      new_segment._cmfd_surface_bwd);
+    else
+      track->addSegment(&new_segment);
   }
 
-  log_printf(DEBUG, "Created %d segments for Track: %s",
-             track->getNumSegments(), track->toString().c_str());
+  if (kernel == NULL)
+    log_printf(DEBUG, "Created %d segments for Track: %s",
+               track->getNumSegments(), track->toString().c_str());
+}
+
+
+/**
+ * @brief Ray traces a chord of a Track across a single cell of the Lattice
+ *        filling the root Universe.
+ * @details The chord starts at a Point on the boundary of the Lattice cell
+ *          and ends where the Track leaves the Lattice cell or the Geometry.
+ *          Unlike Geometry::segmentize(...), this method does not assign
+ *          FSR IDs. Instead, it returns the FSR key and a Point in the
+ *          interior of each segment such that the segments may be reused
+ *          as a template for the same chord across other cells of the
+ *          Lattice filled by the same Universe. This method is used for
+ *          modular ray tracing by the TrackGenerator.
+ * @param x0 the x-coordinate of the start of the chord
+ * @param y0 the y-coordinate of the start of the chord
+ * @param z0 the z-coordinate of the chord
+ * @param phi the azimuthal angle of the Track
+ * @param segments the segments along the chord with lengths and Materials
+ * @param keys the FSR key of each segment
+ * @param midpoints the (x, y) midpoint of each segment
+ */
+void Geometry::segmentizeLatticeCell(double x0, double y0, double z0,
+                                     double phi,
+                                     std::vector<segment>& segments,
+                                     std::vector<fsr_key>& keys,
+                                     std::vector< std::pair<double, double> >&
+                                         midpoints) {
+
+  /* Use a LocalCoords for the start and end of each segment */
+  LocalCoords start(x0, y0, z0);
+  LocalCoords end(x0, y0, z0);
+  start.reserveLevels(_max_nesting_depth);
+  end.reserveLevels(_max_nesting_depth);
+  start.setUniverse(_root_universe);
+  end.setUniverse(_root_universe);
+  start.setPhi(phi);
+  end.setPhi(phi);
+
+  /* Find the Cell containing the chord's starting Point */
+  Cell* curr = findFirstCell(&end);
+  Cell* prev;
+
+  if (curr == NULL || end.getNext() == NULL)
+    log_printf(ERROR, "Could not find a Lattice cell containing the start "
+               "Point x = %f, y = %f of a Track chord", x0, y0);
+
+  /* The Lattice cell containing the chord */
+  int lat_x = end.getNext()->getLatticeX();
+  int lat_y = end.getNext()->getLatticeY();
+
+  while (curr != NULL) {
+
+    end.copyCoords(&start);
+    end.setPhi(phi);
+
+    /* Find the next Cell along the Track's trajectory */
+    prev = curr;
+    curr = findNextCell(&end);
+
+    /* Checks that segment does not have the same start and end Points */
+    if (start.getX() == end.getX() && start.getY() == end.getY())
+      log_printf(ERROR, "Created segment with same start and end "
+                 "point: x = %f, y = %f", start.getX(), start.getY());
+
+    segment new_segment;
+    new_segment._length =
+        FP_PRECISION(end.getPoint()->distanceToPoint(start.getPoint()));
+    new_segment._material = prev->getFillMaterial();
+    new_segment._region_id = -1;
+    segments.push_back(new_segment);
+    keys.push_back(getFSRKey(&start));
+
+    midpoints.push_back(std::make_pair((start.getX() + end.getX()) / 2.,
+                                       (start.getY() + end.getY()) / 2.));
 
-  /* Truncate the linked list for the LocalCoords */
-  start.prune();
-  end.prune();
+    /* Stop once the chord leaves the Lattice cell */
+    if (curr != NULL && (end.getNext()->getLatticeX() != lat_x ||
+                         end.getNext()->getLatticeY() != lat_y))
+      break;
+  }
 }
 
 
@@ -910,17 +1208,17 @@ void Geometry::segmentize(Track* track) {
 void Geometry::initializeFSRVectors() {
 
   /* get keys and values from map */
-  std::string *key_list = _FSR_keys_map.keys();
+  fsr_key *key_list = _FSR_keys_map.keys();
   fsr_data **value_list = _FSR_keys_map.values();
 
   /* allocate vectors */
   int num_FSRs = _FSR_keys_map.size();
-  _FSRs_to_keys = std::vector<std::string>(num_FSRs);
+  _FSRs_to_keys = std::vector<fsr_key>(num_FSRs);
 
   /* fill vectors key and material ID information */
 #pragma omp parallel for
   for (int i=0; i < num_FSRs; i++) {
-    std::string key = key_list[i];
+    fsr_key& key = key_list[i];
     fsr_data* fsr = value_list[i];
     int fsr_id = fsr->_fsr_id;
     _FSRs_to_keys.at(fsr_id) = key;
@@ -1039,84 +1337,55 @@ std::vector<int> Geometry::getSpatialDataOnGrid(std::vector<double> grid_x,
 						double zcoord,
 						const char* domain_type) {
 
-  LocalCoords* point;
-  Cell* cell;
-
   /* Instantiate a vector to hold the domain IDs */
   int num_x = grid_x.size();
   int num_y = grid_y.size();
   std::vector<int> domains(num_x * num_y);
 
-  /* Extract the source region IDs */
-  if (strcmp(domain_type, "fsr") == 0) {
-
-#pragma omp parallel for private(point, cell)
-    for (int i=0; i < num_x; i++) {
-      for (int j=0; j < num_y; j++) {
-
-	/* Find the Cell containing this point */
-	point = new LocalCoords(grid_x[i], grid_y[j], zcoord);
-	point->setUniverse(_root_universe);
-	cell = findCellContainingCoords(point);
+  /* Determine the type of domain of interest */
+  int domain = -1;
+  if (strcmp(domain_type, "fsr") == 0)
+    domain = 0;
+  else if (strcmp(domain_type, "material") == 0)
+    domain = 1;
+  else if (strcmp(domain_type, "cell") == 0)
+    domain = 2;
+  else
+    log_printf(ERROR, "Unable to extract spatial data for "
+	       "unsupported domain type %s", domain_type);
 
-	/* Extract the ID of the domain of interest */
-	domains[i+j*num_x] = getFSRId(point);
+  /* Find the number of LocalCoords levels to preallocate for each thread */
+  int max_nesting_depth = getMaxNestingDepth();
 
-	/* Deallocate memory for LocalCoords */
-	point = point->getHighestLevel();
-	point->prune();
-      }
-    }
-  }
+#pragma omp parallel for
+  for (int i=0; i < num_x; i++) {
 
-  /* Extract the material IDs */
-  else if (strcmp(domain_type, "material") == 0) {
+    /* Reuse the same stack allocated LocalCoords for each grid point */
+    LocalCoords point(0., 0., zcoord);
+    point.reserveLevels(max_nesting_depth);
+    Cell* cell;
 
-#pragma omp parallel for private(point, cell)
-    for (int i=0; i < num_x; i++) {
-      for (int j=0; j < num_y; j++) {
+    for (int j=0; j < num_y; j++) {
 
-	/* Find the Cell containing this point */
-	point = new LocalCoords(grid_x[i], grid_y[j], zcoord);
-	point->setUniverse(_root_universe);
-	cell = findCellContainingCoords(point);
+      /* Find the Cell containing this point */
+      point.setX(grid_x[i]);
+      point.setY(grid_y[j]);
+      point.setUniverse(_root_universe);
+      cell = findCellContainingCoords(&point);
 
-	/* Extract the ID of the domain of interest */
+      /* Extract the ID of the domain of interest */
+      if (domain == 0)
+	domains[i+j*num_x] = getFSRId(&point);
+      else if (domain == 1)
 	domains[i+j*num_x] = cell->getFillMaterial()->getId();
-
-	/* Deallocate memory for LocalCoords */
-	point = point->getHighestLevel();
-	point->prune();
-      }
-    }
-  }
-
-  /* Extract the cell IDs */
-  else if (strcmp(domain_type, "cell") == 0) {
-
-#pragma omp parallel for private(point, cell)
-    for (int i=0; i < num_x; i++) {
-      for (int j=0; j < num_y; j++) {
-
-	/* Find the Cell containing this point */
-	point = new LocalCoords(grid_x[i], grid_y[j], zcoord);
-	point->setUniverse(_root_universe);
-	cell = findCellContainingCoords(point);
-
-	/* Extract the ID of the domain of interest */
+      else
 	domains[i+j*num_x] = cell->getId();
 
-	/* Deallocate memory for LocalCoords */
-	point = point->getHighestLevel();
-	point->prune();
-      }
+      /* Unlink the LocalCoords beneath the root Universe for reuse */
+      point.prune();
     }
   }
 
- else
-   log_printf(ERROR, "Unable to extract spatial data for "
-	      "unsupported domain type %s", domain_type);
-
   /* Return the domain IDs */
   return domains;
 }
@@ -1224,16 +1493,16 @@ void Geometry::initializeCmfd() {
  * @brief Returns a pointer to the map that maps FSR keys to FSR IDs
  * @return pointer to _FSR_keys_map map of FSR keys to FSR IDs
  */
-ParallelHashMap<std::string, fsr_data*>& Geometry::getFSRKeysMap() {
+ParallelHashMap<fsr_key, fsr_data*>& Geometry::getFSRKeysMap() {
   return _FSR_keys_map;
 }
 
 
 /**
- * @brief Returns the vector that maps FSR IDs to FSR key hashes
- * @return _FSR_keys_map map of FSR keys to FSR IDs
+ * @brief Returns the vector that maps FSR IDs to FSR keys
+ * @return _FSRs_to_keys vector of FSR keys indexed by FSR ID
  */
-std::vector<std::string>& Geometry::getFSRsToKeys() {
+std::vector<fsr_key>& Geometry::getFSRsToKeys() {
   return _FSRs_to_keys;
 }
 
@@ -1258,20 +1527,43 @@ bool Geometry::withinBounds(LocalCoords* coords) {
 
 
 /**
- * @brief Sets the centroid for an FSR
- * @details The _FSR_keys_map stores a hash of a std::string representing
+ * @brief Sets the centroid of each FSR
+ * @details The _FSR_keys_map stores an integer fsr_key representing
  *          the Lattice/Cell/Universe hierarchy for a unique region
  *          and the associated FSR data. _centroid is a point that represents
  *          the numerical centroid of an FSR computed using all segments
- *          contained in the FSR. This method is used by the TrackGenerator
- *          to set the centroid after segments have been created. It is
- *          important to note that this method is a helper function for the
- *          TrackGenerator and should not be explicitly called by the user.
- * @param fsr a FSR ID
- * @param centroid a Point representing the FSR centroid
+ *          contained in the FSR. The centroids are stored in one contiguous
+ *          array of Points owned by the Geometry, which is reused each time
+ *          the centroids are set for the same number of FSRs, and the
+ *          _centroid of each FSR points into this array. This method is used
+ *          by the TrackGenerator to set the centroids after segments have
+ *          been created. It is important to note that this method is a helper
+ *          function for the TrackGenerator and should not be explicitly
+ *          called by the user.
+ * @param centroids an array of (x,y,z) coordinates for each FSR centroid
+ * @param num_FSRs the number of FSRs
  */
-void Geometry::setFSRCentroid(int fsr, Point* centroid) {
-  _FSR_keys_map.at(_FSRs_to_keys[fsr])->_centroid = centroid;
+void Geometry::setFSRCentroids(double* centroids, int num_FSRs) {
+
+  if (num_FSRs != getNumFSRs())
+    log_printf(ERROR, "Unable to set the centroids of %d FSRs since the "
+               "Geometry contains %d FSRs", num_FSRs, getNumFSRs());
+
+  /* Allocate a new array of centroids if the number of FSRs changed */
+  if (_num_FSR_centroids != num_FSRs) {
+    if (_FSR_centroids != NULL)
+      delete [] _FSR_centroids;
+
+    _FSR_centroids = new Point[num_FSRs];
+    _num_FSR_centroids = num_FSRs;
+  }
+
+#pragma omp parallel for schedule(static)
+  for (int r=0; r < num_FSRs; r++) {
+    _FSR_centroids[r].setCoords(centroids[3*r], centroids[3*r+1],
+                                centroids[3*r+2]);
+    _FSR_keys_map.at(_FSRs_to_keys[r])->_centroid = &_FSR_centroids[r];
+  }
 }
 
 
@@ -1282,13 +1574,9 @@ void Geometry::setFSRCentroid(int fsr, Point* centroid) {
 Cell* Geometry::findCellContainingFSR(int fsr_id) {
 
   Point* point = _FSR_keys_map.at(_FSRs_to_keys[fsr_id])->_point;
-  LocalCoords* coords = new LocalCoords(point->getX(), point->getY(),
-                                        point->getZ());
-  coords->setUniverse(_root_universe);
-  Cell* cell = findCellContainingCoords(coords);
-
-  coords->prune();
-  delete coords;
+  LocalCoords coords(point->getX(), point->getY(), point->getZ());
+  coords.setUniverse(_root_universe);
+  Cell* cell = findCellContainingCoords(&coords);
 
   return cell;
 }
@@ -20,12 +20,140 @@
 #include <string>
 #include <omp.h>
 #include <functional>
+#include <vector>
 #include "ParallelHashMap.h"
 #endif
 
 /** Forward declaration of Cmfd class */
 class Cmfd;
 
+/** Forward declaration of MOCKernel class */
+class MOCKernel;
+
+
+/**
+ * @enum fsrKeyLevel
+ * @brief The type of hierarchy level encoded in an fsr_key.
+ */
+enum fsrKeyLevel {
+
+  /** A CMFD mesh cell level with (x, y) lattice cell indices */
+  KEY_CMFD,
+
+  /** A Lattice level with the Lattice ID and (x, y, z) lattice cell indices */
+  KEY_LAT,
+
+  /** A Universe level with the Universe ID */
+  KEY_UNIV,
+
+  /** The lowest level material-filled Cell with the Cell ID */
+  KEY_CELL
+};
+
+
+/**
+ * @struct fsr_key
+ * @brief A fsr_key is a compact integer key that uniquely identifies an FSR
+ *        by its hierarchical CMFD/lattice/universe/cell structure.
+ * @details The key is a packed vector of integers. Each level in the
+ *          hierarchy is stored as an fsrKeyLevel tag followed by the integer
+ *          components for that level. The key is hashed and compared
+ *          directly on its integers, while a string rendering may be
+ *          built on demand for debugging with the toString() method.
+ */
+struct fsr_key {
+
+  /** The packed tags and integer components for each hierarchy level */
+  std::vector<int> _components;
+
+  /** Equality operator compares the packed integer components */
+  bool operator==(const fsr_key& other) const {
+    return _components == other._components;
+  }
+
+  /**
+   * @brief Returns the number of components of a hierarchy level, including
+   *        its fsrKeyLevel tag.
+   * @param level the fsrKeyLevel tag of the level
+   * @return the number of components of the level
+   */
+  static int getLevelLength(int level) {
+
+    switch (level) {
+    case KEY_CMFD:
+      return 3;
+    case KEY_LAT:
+      return 5;
+    default:
+      return 2;
+    }
+  }
+
+  /**
+   * @brief Returns the number of components up to the end of the first
+   *        hierarchy level of a type, or of the whole key if it has none.
+   * @param level the fsrKeyLevel tag of the level
+   * @return the number of components up to the end of the level
+   */
+  int findLevelEnd(int level) const {
+
+    int i = 0;
+    int num_components = _components.size();
+
+    while (i < num_components) {
+      int tag = _components[i];
+      i += getLevelLength(tag);
+      if (tag == level)
+        break;
+    }
+
+    return i;
+  }
+
+  /**
+   * @brief Converts the key into a structured string such as
+   *        "CMFD = (0, 1) : LAT = 3 (1, 2, 0) : UNIV = 7 : CELL = 12".
+   * @return the string representation of the key
+   */
+  std::string toString() const {
+
+    std::stringstream string;
+    int i = 0;
+    int num_components = _components.size();
+
+    while (i < num_components) {
+
+      if (i > 0)
+        string << " : ";
+
+      switch (_components[i]) {
+      case KEY_CMFD:
+        string << "CMFD = (" << _components[i+1] << ", "
+               << _components[i+2] << ")";
+        break;
+      case KEY_LAT:
+        string << "LAT = " << _components[i+1] << " (" << _components[i+2]
+               << ", " << _components[i+3] << ", " << _components[i+4] << ")";
+        break;
+      case KEY_UNIV:
+        string << "UNIV = " << _components[i+1];
+        break;
+      default:
+        string << "CELL = " << _components[i+1];
+        break;
+      }
+
+      i += getLevelLength(_components[i]);
+    }
+
+    return string.str();
+  }
+};
+
+
+/* The fsr_key hash is in a separate header so SWIG does not parse it */
+#include "fsr_key_hash.h"
+
 /**
  * @struct fsr_data
  * @brief A fsr_data struct represents an FSR with a unique FSR ID
@@ -47,7 +175,8 @@ struct fsr_data {
   /** Characteristic point in Root Universe that lies in FSR */
   Point* _point;
 
-  /** Global numerical centroid in Root Universe */
+  /** Global numerical centroid in Root Universe, which is owned by the
+   *  Geometry's contiguous array of FSR centroids */
   Point* _centroid;
 
   /** Constructor for FSR data initializes centroids and points to NULL */
@@ -60,9 +189,6 @@ struct fsr_data {
   ~fsr_data() {
     if (_point != NULL)
       delete _point;
-
-    if (_centroid != NULL)
-      delete _centroid;
   }
 };
 
@@ -98,11 +224,20 @@ private:
    *  containing the Geometry. */
   boundaryType _y_max_bc;
 
-  /** An map of FSR key hashes to unique fsr_data structs */
-  ParallelHashMap<std::string, fsr_data*> _FSR_keys_map;
+  /** An map of FSR keys to unique fsr_data structs */
+  ParallelHashMap<fsr_key, fsr_data*> _FSR_keys_map;
+
+  /** An vector of FSR keys indexed by FSR ID */
+  std::vector<fsr_key> _FSRs_to_keys;
 
-  /** An vector of FSR key hashes indexed by FSR ID */
-  std::vector<std::string> _FSRs_to_keys;
+  /** A contiguous array of FSR centroids indexed by FSR ID */
+  Point* _FSR_centroids;
+
+  /** The number of FSR centroids in the centroid array */
+  int _num_FSR_centroids;
+
+  /** A unique ID for the current layout of the FSRs */
+  int _FSR_layout_id;
 
   /* The Universe at the root node in the CSG tree */
   Universe* _root_universe;
@@ -113,6 +248,10 @@ private:
   /* A map of all Material in the Geometry for optimization purposes */
   std::map<int, Material*> _all_materials;
 
+  /** The maximum number of nested Universe levels, used to preallocate
+   *  the LocalCoords for ray tracing */
+  int _max_nesting_depth;
+
   Cell* findFirstCell(LocalCoords* coords);
   Cell* findNextCell(LocalCoords* coords);
 
@@ -137,6 +276,7 @@ public:
   boundaryType getMaxYBoundaryType();
   Universe* getRootUniverse();
   int getNumFSRs();
+  int getFSRLayoutId();
   int getNumEnergyGroups();
   int getNumMaterials();
   int getNumCells();
@@ -145,19 +285,25 @@ public:
   std::map<int, Cell*> getAllCells();
   std::map<int, Cell*> getAllMaterialCells();
   std::map<int, Universe*> getAllUniverses();
+  int getMaxNestingDepth();
   void setRootUniverse(Universe* root_universe);
 
   Cmfd* getCmfd();
-  std::vector<std::string>& getFSRsToKeys();
+  std::vector<fsr_key>& getFSRsToKeys();
   int getFSRId(LocalCoords* coords);
   Point* getFSRPoint(int fsr_id);
   Point* getFSRCentroid(int fsr_id);
-  std::string getFSRKey(LocalCoords* coords);
-  ParallelHashMap<std::string, fsr_data*>& getFSRKeysMap();
+  void getFSRPoints(double* fsr_points, int num_values);
+  void getFSRCentroids(double* fsr_centroids, int num_values);
+  void getFSRCellIds(int* fsr_cell_ids, int num_FSRs);
+  void getFSRMaterialIds(int* fsr_material_ids, int num_FSRs);
+  fsr_key getFSRKey(LocalCoords* coords);
+  std::string getFSRKeyString(int fsr_id);
+  ParallelHashMap<fsr_key, fsr_data*>& getFSRKeysMap();
 
   /* Set parameters */
   void setCmfd(Cmfd* cmfd);
-  void setFSRCentroid(int fsr, Point* centroid);
+  void setFSRCentroids(double* centroids, int num_FSRs);
 
   /* Find methods */
   Cell* findCellContainingCoords(LocalCoords* coords);
@@ -168,7 +314,12 @@ public:
   /* Other worker methods */
   void subdivideCells();
   void initializeFSRs(bool neighbor_cells=false);
-  void segmentize(Track* track);
+  void segmentize(Track* track, MOCKernel* kernel=NULL);
+  void segmentizeLatticeCell(double x0, double y0, double z0, double phi,
+                             std::vector<segment>& segments,
+                             std::vector<fsr_key>& keys,
+                             std::vector< std::pair<double, double> >&
+                                 midpoints);
   void initializeFSRVectors();
   void computeFissionability(Universe* univ=NULL);
   std::vector<int> getSpatialDataOnGrid(std::vector<double> grid_x,
@@ -4,6 +4,7 @@
  * @brief Constructor sets the x and y coordinates.
  * @param x the x-coordinate
  * @param y the y-coordinate
+ * @param z the z-coordinate
  */
 LocalCoords::LocalCoords(double x, double y, double z) {
   _coords.setCoords(x, y, z);
@@ -13,13 +14,40 @@ LocalCoords::LocalCoords(double x, double y, double z) {
   _cell = NULL;
   _next = NULL;
   _prev = NULL;
+  _array = NULL;
+  _position = 0;
+  _array_length = 1;
+  _next_array = NULL;
+  _next_array_length = 0;
+}
+
+
+/**
+ * @brief Destructor deletes the LocalCoords allocated for the lower nested
+ *        Universe levels.
+ */
+LocalCoords::~LocalCoords() {
+  if (_next_array != NULL)
+    delete [] _next_array;
 }
 
 
 /**
- * @brief Destructor.
+ * @brief Allocates an array of LocalCoords owned by this LocalCoords for
+ *        the lower nested Universe levels.
+ * @param length the number of LocalCoords in the array
  */
-LocalCoords::~LocalCoords() { }
+void LocalCoords::allocateNextArray(int length) {
+
+  _next_array = new LocalCoords[length];
+  _next_array_length = length;
+
+  for (int i=0; i < length; i++) {
+    _next_array[i]._array = _next_array;
+    _next_array[i]._position = i;
+    _next_array[i]._array_length = length;
+  }
+}
 
 
 /**
@@ -143,6 +171,50 @@ LocalCoords* LocalCoords::getNext() const {
 }
 
 
+/**
+ * @brief Return a pointer to the LocalCoords at the next lower nested Universe
+ *        level, initialized with the given coordinates.
+ * @details The LocalCoords at the lower levels are taken from the array
+ *          containing this LocalCoords, or from an array owned by this
+ *          LocalCoords once the end of that array is reached, such that no
+ *          memory is allocated when descending through the nested Universe
+ *          hierarchy once the arrays have been allocated. The returned
+ *          LocalCoords is reset and linked to this one; any LocalCoords
+ *          beneath it are pruned.
+ * @param x the x-coordinate of the next LocalCoords
+ * @param y the y-coordinate of the next LocalCoords
+ * @param z the z-coordinate of the next LocalCoords
+ * @return a pointer to the next LocalCoords
+ */
+LocalCoords* LocalCoords::getNextCreate(double x, double y, double z) {
+
+  if (_next == NULL) {
+
+    /* Use the next LocalCoords in this LocalCoords' array if available */
+    if (_array != NULL && _position + 1 < _array_length)
+      _next = &_array[_position + 1];
+
+    /* Otherwise use the first LocalCoords in an array owned by this one */
+    else {
+      if (_next_array == NULL)
+        allocateNextArray(LOCAL_COORDS_LEN);
+      _next = &_next_array[0];
+    }
+  }
+
+  /* Reset the next LocalCoords */
+  _next->_coords.setCoords(x, y, z);
+  _next->_phi = 0.;
+  _next->_universe = NULL;
+  _next->_lattice = NULL;
+  _next->_cell = NULL;
+  _next->_next = NULL;
+  _next->_prev = this;
+
+  return _next;
+}
+
+
 /**
  * @brief Return a pointer to the LocalCoord at the next higher nested Universe
  *        level if one exists.
@@ -284,6 +356,31 @@ void LocalCoords::setPrev(LocalCoords* prev) {
 }
 
 
+/**
+ * @brief Preallocates the LocalCoords for a number of nested Universe levels.
+ * @details The LocalCoords for the levels beneath this one are allocated in a
+ *          single array which is reused each time the Universe hierarchy is
+ *          descended by Universe::findCell(...) and Lattice::findCell(...).
+ *          This should be called with the maximum nesting depth of the
+ *          Geometry (Geometry::getMaxNestingDepth()) for the LocalCoords at
+ *          the highest level, before the linked list is populated.
+ * @param num_levels the number of nested Universe levels including this one
+ */
+void LocalCoords::reserveLevels(int num_levels) {
+
+  int num_next = num_levels - 1;
+  if (num_next <= 0 || num_next <= _next_array_length)
+    return;
+
+  prune();
+
+  if (_next_array != NULL)
+    delete [] _next_array;
+
+  allocateNextArray(num_next);
+}
+
+
 /**
  * @brief Find and return the last LocalCoords in the linked list which
  *        represents the local coordinates on the lowest level of a geometry
@@ -362,21 +459,12 @@ void LocalCoords::updateMostLocal(Point* point) {
 
 
 /**
- * @brief Removes and frees memory for all LocalCoords beyond this one
- *        in the linked list
+ * @brief Removes all LocalCoords beyond this one in the linked list.
+ * @details The LocalCoords beneath this one are not deallocated but are kept
+ *          in their arrays to be reused by LocalCoords::getNextCreate(...).
  */
 void LocalCoords::prune() {
 
-  LocalCoords* curr = getLowestLevel();
-  LocalCoords* next = curr->getPrev();
-
-  /* Iterate over LocalCoords beneath this one in the linked list */
-  while (curr != this) {
-    next = curr->getPrev();
-    delete curr;
-    curr = next;
-  }
-
   /* Set the next LocalCoord in the linked list to null */
   setNext(NULL);
 }
@@ -420,19 +508,9 @@ void LocalCoords::copyCoords(LocalCoords* coords) {
 
     curr1 = curr1->getNext();
 
-    if (curr1 != NULL && curr2->getNext() == NULL) {
-      LocalCoords* new_coords = new LocalCoords(0.0, 0.0, 0.0);
-      curr2->setNext(new_coords);
-      new_coords->setPrev(curr2);
-      curr2 = new_coords;
-    }
-    else if (curr1 != NULL)
-      curr2 = curr2->getNext();
+    if (curr1 != NULL)
+      curr2 = curr2->getNextCreate(0.0, 0.0, 0.0);
   }
-
-  /* Prune any remainder from the old coords linked list */
-  if (curr2 != NULL)
-    curr2->prune();
 }
 
 
@@ -22,6 +22,10 @@ class Universe;
 class Lattice;
 class Cell;
 
+/** The number of LocalCoords allocated at once for the lower nested Universe
+ *  levels when the number of levels has not been reserved */
+#define LOCAL_COORDS_LEN 8
+
 /**
  * @enum coordType
  * @brief The type of Universe level on which the LocalCoords reside
@@ -79,8 +83,31 @@ private:
   /** A pointer to the LocalCoords at the next higher nested Universe level */
   LocalCoords* _prev;
 
+  /** The array of LocalCoords which contains this LocalCoords, or NULL if
+   *  this LocalCoords was allocated by itself */
+  LocalCoords* _array;
+
+  /** The index of this LocalCoords in its array */
+  int _position;
+
+  /** The number of LocalCoords in this LocalCoords' array */
+  int _array_length;
+
+  /** An array of LocalCoords owned by this LocalCoords which are reused for
+   *  the lower nested Universe levels */
+  LocalCoords* _next_array;
+
+  /** The number of LocalCoords in the array owned by this LocalCoords */
+  int _next_array_length;
+
+  void allocateNextArray(int length);
+
+  /* LocalCoords own their arrays and therefore may not be copied */
+  LocalCoords(const LocalCoords&);
+  LocalCoords& operator=(const LocalCoords&);
+
 public:
-  LocalCoords(double x, double y, double z);
+  LocalCoords(double x=0., double y=0., double z=0.);
   virtual ~LocalCoords();
   coordType getType();
   Universe* getUniverse() const;
@@ -95,6 +122,7 @@ public:
   double getPhi() const;
   Point* getPoint();
   LocalCoords* getNext() const;
+  LocalCoords* getNextCreate(double x, double y, double z);
   LocalCoords* getPrev() const;
 
   void setType(coordType type);
@@ -112,6 +140,7 @@ public:
   void setNext(LocalCoords *next);
   void setPrev(LocalCoords* coords);
 
+  void reserveLevels(int num_levels);
   LocalCoords* getLowestLevel();
   LocalCoords* getHighestLevel();
   void adjustCoords(double delta);
@@ -17,25 +17,40 @@ MOCKernel::MOCKernel(TrackGenerator* track_generator) {
 
 /**
  * @brief Constructor for the VolumeKernel assigns default values, calls
- *        the MOCKernel constructor, and pulls references to FSR locks and FSR
- *        volumes from the provided TrackGenerator.
+ *        the MOCKernel constructor, and allocates an array of FSR volumes
+ *        initialized to zero.
  * @param track_generator the TrackGenerator used to pull relevant tracking
  *        data
  */
 VolumeKernel::VolumeKernel(TrackGenerator* track_generator) :
                            MOCKernel(track_generator) {
-  _FSR_locks = track_generator->getFSRLocks();
 
-  if (_FSR_locks == NULL)
-    log_printf(ERROR, "Unable to create a VolumeKernel without first creating "
-               "FSR locks which are normally created during Track generation");
+  int num_FSRs = track_generator->getGeometry()->getNumFSRs();
+  _FSR_volumes = new double[num_FSRs];
+  memset(_FSR_volumes, 0, num_FSRs * sizeof(double));
 
-  _FSR_volumes = track_generator->getFSRVolumes();
   _quadrature = track_generator->getQuadrature();
   _weight = 0;
 }
 
 
+/**
+ * @brief Destructor for the VolumeKernel deletes its array of FSR volumes
+ */
+VolumeKernel::~VolumeKernel() {
+  delete [] _FSR_volumes;
+}
+
+
+/**
+ * @brief Returns the array of FSR volumes tallied by this VolumeKernel
+ * @return an array of FSR volumes indexed by FSR ID
+ */
+double* VolumeKernel::getFSRVolumes() {
+  return _FSR_volumes;
+}
+
+
 /**
  * @brief Constructor for the CounterKernel assigns default values and calls
  *        the MOCKernel constructor
@@ -46,6 +61,16 @@ CounterKernel::CounterKernel(TrackGenerator* track_generator) :
                              MOCKernel(track_generator) {}
 
 
+/**
+ * @brief Constructor for the SegmentationKernel assigns default values and
+ *        calls the MOCKernel constructor
+ * @param track_generator the TrackGenerator used to pull relevant tracking
+ *        data
+ */
+SegmentationKernel::SegmentationKernel(TrackGenerator* track_generator) :
+                                       MOCKernel(track_generator) {}
+
+
 /**
  * @brief Prepares an MOCKernel for a new Track
  * @details Resets the segment count
@@ -106,7 +131,8 @@ void MOCKernel::setMaxOpticalLength(FP_PRECISION max_tau) {
  * @brief Adds segment contribution to the FSR volume
  * @details The VolumeKernel execute function adds the product of the
  *          track length and track weight to the buffer array at index
- *          id, referring to the array of FSR volumes.
+ *          id, referring to the array of FSR volumes. No lock is needed since
+ *          the array is only updated by the thread which owns the kernel.
  * @param length segment length
  * @param mat Material associated with the segment
  * @param id the FSR ID of the FSR associated with the segment
@@ -114,15 +140,9 @@ void MOCKernel::setMaxOpticalLength(FP_PRECISION max_tau) {
 void VolumeKernel::execute(FP_PRECISION length, Material* mat, int id,
                            int cmfd_surface_fwd, int cmfd_surface_bwd) {
 
-  /* Set omp lock for FSRs */
-  omp_set_lock(&_FSR_locks[id]);
-
   /* Add value to buffer */
   _FSR_volumes[id] += _weight * length;
 
-  /* Unset lock */
-  omp_unset_lock(&_FSR_locks[id]);
-
   /* Increment count */
   _count++;
 }
@@ -154,3 +174,63 @@ void CounterKernel::execute(FP_PRECISION length, Material* mat, int id,
   /* Increment count */
   _count += num_cuts;
 }
+
+
+/*
+ * @brief Returns the buffer of segments formed since the last new Track
+ * @details The number of segments in the buffer is given by getCount().
+ *          The buffer is overwritten by the segments of the next Track.
+ * @return a pointer to the first segment in the buffer
+ */
+segment* SegmentationKernel::getSegments() {
+  if (_segments.empty())
+    return NULL;
+
+  return &_segments[0];
+}
+
+
+/*
+ * @brief Stores a segment in the buffer, splitting it if necessary
+ * @details The segment is split into equal length segments if its optical
+ *          path length in any energy group exceeds the max optical path
+ *          length. The CMFD surfaces of the segment are assigned to the
+ *          first and last split segments. The buffer is grown as needed and
+ *          is otherwise reused for each Track.
+ * @param length segment length
+ * @param mat Material associated with the segment
+ * @param id the FSR ID of the FSR associated with the segment
+ * @param cmfd_surface_fwd the CMFD surface crossed by the segment end point
+ * @param cmfd_surface_bwd the CMFD surface crossed by the segment start point
+ */
+void SegmentationKernel::execute(FP_PRECISION length, Material* mat, int id,
+                                 int cmfd_surface_fwd, int cmfd_surface_bwd) {
+
+  /* Determine the number of cuts on the segment */
+  FP_PRECISION* sigma_t = mat->getSigmaT();
+  double max_sigma_t = 0;
+  for (int e=0; e < mat->getNumEnergyGroups(); e++)
+    if (sigma_t[e] > max_sigma_t)
+      max_sigma_t = sigma_t[e];
+
+  int num_cuts = std::max((int) std::ceil(length * max_sigma_t / _max_tau), 1);
+
+  if (_count + num_cuts > (int)_segments.size())
+    _segments.resize(std::max(_count + num_cuts, 2 * (int)_segments.size()));
+
+  /* Store each of the split segments in the buffer */
+  for (int k=0; k < num_cuts; k++) {
+    segment* curr_segment = &_segments[_count+k];
+    curr_segment->_length = length / FP_PRECISION(num_cuts);
+    curr_segment->_material = mat;
+    curr_segment->_region_id = id;
+    curr_segment->_cmfd_surface_fwd = -1;
+    curr_segment->_cmfd_surface_bwd = -1;
+  }
+
+  _segments[_count]._cmfd_surface_bwd = cmfd_surface_bwd;
+  _segments[_count+num_cuts-1]._cmfd_surface_fwd = cmfd_surface_fwd;
+
+  /* Increment count */
+  _count += num_cuts;
+}
@@ -30,9 +30,9 @@ class TrackGenerator;
  *          apply some function to segment data in either a nested loop
  *          structure or from on-the-fly calculations. Kernels specify the
  *          actions applied to the segments, reducing the need for repeated
- *          code. This class is the parent class of CounterKernel and
- *          VolumeKernel. A generic MOCKernel should not be explicity
- *          instantiated. Instead, an inheriting class should
+ *          code. This class is the parent class of CounterKernel,
+ *          VolumeKernel and SegmentationKernel. A generic MOCKernel should
+ *          not be explicity instantiated. Instead, an inheriting class should
  *          be instantiated which implements the "execute" function.
  */
 class MOCKernel {
@@ -89,20 +89,19 @@ public:
  * @class VolumeKernel MOCKernel.h "src/MOCKernel.h"
  * @brief Calculates the volume in FSRs by adding weighted segment lengths
  * @details A VolumeKernel inherets from MOCKernel and is a kernel which
- *          is initialized with a pointer to floating point data and adds
- *          the product of the length and the weight to the floating point data
- *          at an input index. The weight corresponds to the weight of the
- *          track associated with the segments.
+ *          owns an array of FSR volumes and adds the product of the length
+ *          and the weight to the array at an input index. The weight
+ *          corresponds to the weight of the track associated with the
+ *          segments. Each thread should use its own VolumeKernel so that
+ *          volumes are tallied without locks, and the volumes of all threads'
+ *          kernels should be summed once all Tracks are traversed.
  */
 class VolumeKernel: public MOCKernel {
 
 private:
 
-  /** Array of FSR locks */
-  omp_lock_t* _FSR_locks;
-
-  /** Pointer to array of FSR volumes */
-  FP_PRECISION* _FSR_volumes;
+  /** Array of FSR volumes tallied by this kernel */
+  double* _FSR_volumes;
 
   /** The cross-sectional area of the Track used to weight segment length
    *  contributions to the volume */
@@ -114,10 +113,38 @@ private:
 public:
 
   VolumeKernel(TrackGenerator* track_generator);
+  virtual ~VolumeKernel();
+  double* getFSRVolumes();
   void newTrack(Track* track);
   void execute(FP_PRECISION length, Material* mat, int id,
                int cmfd_surface_fwd, int cmfd_surface_bwd);
 };
 
 
+/**
+ * @class SegmentationKernel MOCKernel.h "src/MOCKernel.h"
+ * @brief Forms the segments of a Track in a reusable buffer
+ * @details A SegmentationKernel inherets from MOCKernel and is a kernel which
+ *          stores each segment it is applied to in a buffer owned by the
+ *          kernel, splitting segments whose optical path length exceeds the
+ *          max optical path length. The buffer is reused for each new Track
+ *          such that segments formed on the fly need not be stored for all
+ *          Tracks. Each thread should use its own SegmentationKernel.
+ */
+class SegmentationKernel: public MOCKernel {
+
+private:
+
+  /** The buffer of segments formed since the last call to newTrack() */
+  std::vector<segment> _segments;
+
+public:
+
+  SegmentationKernel(TrackGenerator* track_generator);
+  segment* getSegments();
+  void execute(FP_PRECISION length, Material* mat, int id,
+               int cmfd_surface_fwd, int cmfd_surface_bwd);
+};
+
+
 #endif /* MOCKERNEL_H_ */
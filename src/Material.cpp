@@ -859,8 +859,10 @@ void Material::setChiByGroup(double xs, int group) {
 /**
  * @brief Builds the fission matrix from chi and the fission cross-section.
  * @details The fission matrix is constructed as the outer product of the
- *          chi and fission cross-section vectors. This routine is intended
- *          for internal use and is called by the Solver at runtime.
+ *          chi and fission cross-section vectors. If the Material's data has
+ *          been aligned, the matrix is padded like the other aligned
+ *          cross-sections. This routine is intended for internal use and is
+ *          called by the Solver at runtime.
  */
 void Material::buildFissionMatrix() {
 
@@ -874,6 +876,27 @@ void Material::buildFissionMatrix() {
     log_printf(ERROR, "Unable to build Material %d's fission matrix "
                "since its chi spectrum has not been set", _id);
 
+  /* Rebuild the fission matrix with the padded number of groups if the
+   * cross-section data has been aligned for SIMD vectorization */
+  if (_data_aligned) {
+
+    int num_groups = _num_vector_groups * VEC_LENGTH;
+
+    if (_fiss_matrix != NULL)
+      MM_FREE(_fiss_matrix);
+
+    int size = num_groups * num_groups * sizeof(FP_PRECISION);
+    _fiss_matrix = (FP_PRECISION*)MM_MALLOC(size, VEC_ALIGNMENT);
+
+    /* The dummy groups have zero chi and nu-fission cross-sections */
+    for (int G=0; G < num_groups; G++) {
+      for (int g=0; g < num_groups; g++)
+        _fiss_matrix[G*num_groups+g] = _chi[G] * _nu_sigma_f[g];
+    }
+
+    return;
+  }
+
   /* Deallocate memory for old fission matrix if needed */
   if (_fiss_matrix != NULL)
     delete [] _fiss_matrix;
@@ -11,6 +11,9 @@
  *         the outside. Locks are used to make the matrix thread-safe against
  *         concurrent writes the same value. One lock locks out multiple rows of
  *         the matrix at a time reprsenting multiple groups in the same cell.
+ *         Alternatively, a fixed sparsity pattern may be set with
+ *         setSparsityPattern(...), in which case the values are updated in
+ *         place in the CSR arrays without locks.
  *
  *            [1] "Sparse matrix", Wikipedia,
  *                https://en.wikipedia.org/wiki/Sparse_matrix.
@@ -39,6 +42,7 @@ Matrix::Matrix(omp_lock_t* cell_locks, int num_x, int num_y, int num_groups) {
   _JLU = NULL;
   _DIAG = NULL;
   _modified = true;
+  _fixed_pattern = false;
   _NNZ = 0;
   _NNZLU = 0;
 
@@ -113,12 +117,24 @@ void Matrix::incrementValue(int cell_from, int group_from,
     log_printf(ERROR, "Unable to increment Matrix value for group_to %d"
                " which is not between 0 and %d", group_to, _num_groups-1);
 
+  int row = cell_to*_num_groups + group_to;
+  int col = cell_from*_num_groups + group_from;
+
+  /* Increment the value in place in the fixed sparsity pattern */
+  if (_fixed_pattern) {
+    int index = getIndex(row, col);
+    if (index == -1)
+      log_printf(ERROR, "Unable to increment Matrix value for row %d and "
+                 "column %d which are not in the sparsity pattern", row, col);
+    _A[index] += val;
+    _modified = true;
+    return;
+  }
+
   /* Atomically increment the Matrix value from the
    * temporary array using mutual exclusion locks */
   omp_set_lock(&_cell_locks[cell_to]);
 
-  int row = cell_to*_num_groups + group_to;
-  int col = cell_from*_num_groups + group_from;
   _LIL[row][col] += val;
 
   /* Release Matrix cell mutual exclusion lock */
@@ -158,12 +174,24 @@ void Matrix::setValue(int cell_from, int group_from,
     log_printf(ERROR, "Unable to set Matrix value for group_to %d"
                " which is not between 0 and %d", group_to, _num_groups-1);
 
+  int row = cell_to*_num_groups + group_to;
+  int col = cell_from*_num_groups + group_from;
+
+  /* Set the value in place in the fixed sparsity pattern */
+  if (_fixed_pattern) {
+    int index = getIndex(row, col);
+    if (index == -1)
+      log_printf(ERROR, "Unable to set Matrix value for row %d and column %d "
+                 "which are not in the sparsity pattern", row, col);
+    _A[index] = val;
+    _modified = true;
+    return;
+  }
+
   /* Atomically set the Matrix value from the
    * temporary array using mutual exclusion locks */
   omp_set_lock(&_cell_locks[cell_to]);
 
-  int row = cell_to*_num_groups + group_to;
-  int col = cell_from*_num_groups + group_from;
   _LIL[row][col] = val;
 
   /* Release Matrix cell mutual exclusion lock */
@@ -176,10 +204,17 @@ void Matrix::setValue(int cell_from, int group_from,
 
 /**
  * @brief Clear all values in the matrix list of lists.
+ * @details If the Matrix has a fixed sparsity pattern, the values are set to
+ *          zero and the pattern is retained.
  */
 void Matrix::clear() {
-  for (int i=0; i < _num_rows; i++)
-    _LIL[i].clear();
+
+  if (_fixed_pattern)
+    std::fill_n(_A, _NNZ, 0.0);
+  else {
+    for (int i=0; i < _num_rows; i++)
+      _LIL[i].clear();
+  }
 
   _modified = true;
 }
@@ -191,6 +226,27 @@ void Matrix::clear() {
  */
 void Matrix::convertToCSR() {
 
+  /* Copy the values in the fixed sparsity pattern to the diagonal and
+   * lower + upper arrays */
+  if (_fixed_pattern) {
+
+#pragma omp parallel for
+    for (int row=0; row < _num_rows; row++) {
+      int jlu = _ILU[row];
+      for (int i = _IA[row]; i < _IA[row+1]; i++) {
+        if (_JA[i] == row)
+          _DIAG[row] = _A[i];
+        else {
+          _LU[jlu] = _A[i];
+          jlu++;
+        }
+      }
+    }
+
+    _modified = false;
+    return;
+  }
+
   /* Get number of nonzero values */
   int NNZ = getNNZ();
   int NNZLU = getNNZLU();
@@ -311,6 +367,14 @@ FP_PRECISION Matrix::getValue(int cell_from, int group_from,
                               int cell_to, int group_to) {
   int row = cell_to*_num_groups + group_to;
   int col = cell_from*_num_groups + group_from;
+
+  if (_fixed_pattern) {
+    int index = getIndex(row, col);
+    if (index == -1)
+      return 0.0;
+    return _A[index];
+  }
+
   return _LIL[row][col];
 }
 
@@ -463,6 +527,9 @@ int Matrix::getNumRows() {
  */
 int Matrix::getNNZ() {
 
+  if (_fixed_pattern)
+    return _NNZ;
+
   int NNZ = 0;
   std::map<int, FP_PRECISION>::iterator iter;
   for (int row=0; row < _num_rows; row++) {
@@ -484,6 +551,9 @@ int Matrix::getNNZ() {
  */
 int Matrix::getNNZLU() {
 
+  if (_fixed_pattern)
+    return _NNZLU;
+
   int NNZLU = 0;
   std::map<int, FP_PRECISION>::iterator iter;
   for (int row=0; row < _num_rows; row++) {
@@ -544,6 +614,10 @@ void Matrix::setNumGroups(int num_groups) {
  */
 void Matrix::transpose() {
 
+  if (_fixed_pattern)
+    log_printf(ERROR, "Unable to transpose a Matrix with a fixed sparsity "
+               "pattern");
+
   Matrix temp(_cell_locks, _num_x, _num_y, _num_groups);
   convertToCSR();
   int col, cell_to, cell_from, group_to, group_from;
@@ -590,3 +664,137 @@ void Matrix::transpose() {
 omp_lock_t* Matrix::getCellLocks() {
   return _cell_locks;
 }
+
+
+
+/**
+ * @brief Returns whether the Matrix has a fixed sparsity pattern.
+ * @return whether values are updated in place in a fixed sparsity pattern
+ */
+bool Matrix::hasFixedPattern() {
+  return _fixed_pattern;
+}
+
+
+/**
+ * @brief Find the index of a row and column in the CSR arrays of a Matrix
+ *        with a fixed sparsity pattern.
+ * @param row The row in the matrix.
+ * @param col The column in the matrix.
+ * @return The index in the CSR arrays, or -1 if not in the pattern.
+ */
+int Matrix::getIndex(int row, int col) {
+
+  int* first = &_JA[_IA[row]];
+  int* last = &_JA[_IA[row+1]];
+  int* iter = std::lower_bound(first, last, col);
+
+  if (iter == last || *iter != col)
+    return -1;
+
+  return _IA[row] + (iter - first);
+}
+
+
+/**
+ * @brief Fix the sparsity pattern of the matrix from the coupling between
+ *        cells and groups.
+ * @details Each group in a cell is coupled to all groups in the same cell
+ *          and to the same group in each neighboring cell. The CSR arrays
+ *          for this pattern are allocated once and the values are then
+ *          incremented and set in place without locks or rebuilding the CSR
+ *          arrays. The values are initialized to zero. Since each row is
+ *          stored separately, values may be updated concurrently as long
+ *          as each row is updated by a single thread at a time.
+ * @param cell_neighbors An array of the neighboring cells of each cell, or -1
+ *        for no neighbor, indexed by cell and neighbor
+ * @param num_neighbors The number of neighbors for each cell
+ */
+void Matrix::setSparsityPattern(int* cell_neighbors, int num_neighbors) {
+
+  /* Find the sorted columns in each row */
+  std::vector< std::vector<int> > columns(_num_rows);
+
+#pragma omp parallel for
+  for (int cell=0; cell < _num_x*_num_y; cell++) {
+    for (int e=0; e < _num_groups; e++) {
+
+      std::vector<int>& row_columns = columns[cell*_num_groups + e];
+
+      for (int g=0; g < _num_groups; g++)
+        row_columns.push_back(cell*_num_groups + g);
+
+      for (int n=0; n < num_neighbors; n++) {
+        int neighbor = cell_neighbors[cell*num_neighbors + n];
+        if (neighbor != -1)
+          row_columns.push_back(neighbor*_num_groups + e);
+      }
+
+      std::sort(row_columns.begin(), row_columns.end());
+      row_columns.erase(std::unique(row_columns.begin(), row_columns.end()),
+                        row_columns.end());
+    }
+  }
+
+  /* Deallocate memory for arrays if previously allocated */
+  if (_A != NULL)
+    delete [] _A;
+
+  if (_LU != NULL)
+    delete [] _LU;
+
+  if (_IA != NULL)
+    delete [] _IA;
+
+  if (_ILU != NULL)
+    delete [] _ILU;
+
+  if (_JA != NULL)
+    delete [] _JA;
+
+  if (_JLU != NULL)
+    delete [] _JLU;
+
+  if (_DIAG != NULL)
+    delete [] _DIAG;
+
+  /* Compute the row indices of the CSR arrays */
+  _IA = new int[_num_rows+1];
+  _ILU = new int[_num_rows+1];
+  _IA[0] = 0;
+  _ILU[0] = 0;
+
+  for (int row=0; row < _num_rows; row++) {
+    _IA[row+1] = _IA[row] + columns[row].size();
+    _ILU[row+1] = _ILU[row] + columns[row].size() - 1;
+  }
+
+  _NNZ = _IA[_num_rows];
+  _NNZLU = _ILU[_num_rows];
+
+  /* Allocate memory for the values and column indices */
+  _A = new FP_PRECISION[_NNZ];
+  _LU = new FP_PRECISION[_NNZLU];
+  _JA = new int[_NNZ];
+  _JLU = new int[_NNZLU];
+  _DIAG = new FP_PRECISION[_num_rows];
+
+#pragma omp parallel for
+  for (int row=0; row < _num_rows; row++) {
+    int jlu = _ILU[row];
+    for (size_t i=0; i < columns[row].size(); i++) {
+      _JA[_IA[row] + i] = columns[row][i];
+      if (columns[row][i] != row) {
+        _JLU[jlu] = columns[row][i];
+        jlu++;
+      }
+    }
+  }
+
+  /* Remove any values from the list of lists */
+  for (int i=0; i < _num_rows; i++)
+    _LIL[i].clear();
+
+  _fixed_pattern = true;
+  clear();
+}
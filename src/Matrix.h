@@ -21,6 +21,7 @@
 #include <sstream>
 #include <stdlib.h>
 #include <iomanip>
+#include <algorithm>
 #include "log.h"
 #endif
 
@@ -42,6 +43,11 @@ private:
   FP_PRECISION* _DIAG;
 
   bool _modified;
+
+  /** Whether the CSR sparsity pattern is fixed and values are updated in
+   *  place rather than in the list of lists */
+  bool _fixed_pattern;
+
   int _num_x;
   int _num_y;
   int _num_groups;
@@ -53,6 +59,7 @@ private:
   omp_lock_t* _cell_locks;
 
   void convertToCSR();
+  int getIndex(int row, int col);
   void setNumX(int num_x);
   void setNumY(int num_y);
   void setNumGroups(int num_groups);
@@ -85,10 +92,12 @@ public:
   int getNNZ();
   int getNNZLU();
   omp_lock_t* getCellLocks();
+  bool hasFixedPattern();
 
   /* Setter functions */
   void setValue(int cell_from, int group_from, int cell_to, int group_to,
                 FP_PRECISION val);
+  void setSparsityPattern(int* cell_neighbors, int num_neighbors);
 };
 
 #endif /* MATRIX_H_ */
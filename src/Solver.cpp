@@ -28,6 +28,7 @@ Solver::Solver(TrackGenerator* track_generator) {
   _old_scalar_flux = NULL;
   _fixed_sources = NULL;
   _reduced_sources = NULL;
+  _array_generation = 0;
   _quadrature = NULL;
   _num_polar_2 = 0;
 
@@ -40,6 +41,15 @@ Solver::Solver(TrackGenerator* track_generator) {
   setConvergenceThreshold(1E-5);
   _user_fluxes = false;
 
+  _acceleration_type = NO_ACCELERATION;
+  _anderson_depth = 5;
+  _anderson_count = 0;
+  _anderson_fluxes = NULL;
+  _anderson_residuals = NULL;
+  _anderson_boundary_fluxes = NULL;
+  _anderson_keffs = NULL;
+  _reference_num_iterations = 0;
+
   _timer = new Timer();
 }
 
@@ -79,6 +89,18 @@ Solver::~Solver() {
 
   if (_timer != NULL)
     delete _timer;
+
+  if (_anderson_fluxes != NULL)
+    delete [] _anderson_fluxes;
+
+  if (_anderson_residuals != NULL)
+    delete [] _anderson_residuals;
+
+  if (_anderson_boundary_fluxes != NULL)
+    delete [] _anderson_boundary_fluxes;
+
+  if (_anderson_keffs != NULL)
+    delete [] _anderson_keffs;
 }
 
 
@@ -130,6 +152,35 @@ FP_PRECISION Solver::getFSRVolume(int fsr_id) {
 }
 
 
+/**
+ * @brief Fills an array with the volume of each FSR.
+ * @details This class method is intended to be called by the OpenMOC
+ *          Python "process" module as a utility to retrieve the volumes of
+ *          all FSRs in a single call. This method may be called from Python
+ *          as follows:
+ *
+ * @code
+ *          volumes = solver.getFSRVolumes(geometry.getNumFSRs())
+ * @endcode
+ *
+ * @param fsr_volumes an array of volumes indexed by FSR ID
+ * @param num_FSRs the number of FSRs
+ */
+void Solver::getFSRVolumes(double* fsr_volumes, int num_FSRs) {
+
+  if (num_FSRs != _num_FSRs)
+    log_printf(ERROR, "Unable to get the FSR volumes for %d FSRs since the "
+               "Solver contains %d FSRs", num_FSRs, _num_FSRs);
+
+  if (_FSR_volumes == NULL)
+    log_printf(ERROR, "Unable to get the FSR volumes since they "
+               "have not yet been computed");
+
+  for (int r=0; r < num_FSRs; r++)
+    fsr_volumes[r] = _FSR_volumes[r];
+}
+
+
 /**
  * @brief Returns the number of angles used for the polar quadrature.
  * @return the number of polar angles
@@ -207,6 +258,66 @@ bool Solver::isUsingExponentialInterpolation() {
 }
 
 
+/**
+ * @brief Returns the method used to accelerate eigenvalue calculations.
+ * @return the acceleration type (NO_ACCELERATION or ANDERSON)
+ */
+accelerationType Solver::getAccelerationType() {
+  return _acceleration_type;
+}
+
+
+/**
+ * @brief Returns the number of previous iterates used by Anderson mixing.
+ * @return the Anderson mixing history depth
+ */
+int Solver::getAndersonDepth() {
+  return _anderson_depth;
+}
+
+
+/**
+ * @brief Returns the number of source iterations needed to converge the
+ *        eigenvalue without acceleration.
+ * @return the reference number of source iterations (0 if not set)
+ */
+int Solver::getReferenceNumIterations() {
+  return _reference_num_iterations;
+}
+
+
+/**
+ * @brief Returns the number of times the FSR flux and source arrays have
+ *        been allocated.
+ * @details The array views returned to Python record this number and may
+ *          no longer be used once it changes.
+ * @return the number of FSR flux and source array allocations
+ */
+int Solver::getArrayGeneration() {
+  return _array_generation;
+}
+
+
+/**
+ * @brief Returns the number of transport sweeps saved by the acceleration
+ *        in the last eigenvalue calculation.
+ * @details The sweeps saved are the difference between the reference
+ *          number of source iterations set by setReferenceNumIterations(...)
+ *          and the number of iterations needed by the last eigenvalue
+ *          calculation. The result is negative if the acceleration needed
+ *          more sweeps and is zero if no acceleration was used or if no
+ *          reference has been set.
+ * @return the number of transport sweeps saved
+ */
+int Solver::getNumSweepsSaved() {
+
+  if (_acceleration_type == NO_ACCELERATION || _reference_num_iterations == 0)
+    return 0;
+
+  return _reference_num_iterations - _num_iterations;
+}
+
+
 /**
  * @brief Returns the source for some energy group for a flat source region
  * @details This is a helper routine used by the openmoc.process module.
@@ -268,6 +379,73 @@ FP_PRECISION Solver::getFSRSource(int fsr_id, int group) {
 }
 
 
+/**
+ * @brief Computes the sources in all energy groups for a range of FSRs.
+ * @details This is a helper routine used by the openmoc.process module to
+ *          store the FSR sources in chunks of FSRs without computing each
+ *          source with a separate call to getFSRSource(...). The sources are
+ *          indexed by FSR and energy group. This method may be called from
+ *          Python as follows:
+ *
+ * @code
+ *          num_values = num_chunk_FSRs * num_groups
+ *          sources = solver.getFSRSources(first_fsr, num_values)
+ * @endcode
+ *
+ * @param first_fsr the ID of the first FSR in the range
+ * @param fsr_sources an array of the sources in each FSR and group (output)
+ * @param num_values the number of FSRs in the range times the number of
+ *        energy groups
+ */
+void Solver::getFSRSources(int first_fsr, double* fsr_sources,
+                           int num_values) {
+
+  int num_groups = _geometry->getNumEnergyGroups();
+  int num_FSRs = num_values / num_groups;
+
+  if (first_fsr < 0 || first_fsr + num_FSRs > _num_FSRs)
+    log_printf(ERROR, "Unable to return the sources for FSRs %d to %d "
+               "since the max FSR ID = %d", first_fsr,
+               first_fsr + num_FSRs - 1, _num_FSRs-1);
+
+  else if (num_FSRs * num_groups != num_values)
+    log_printf(ERROR, "Unable to return the sources in an array of %d values "
+               "since there are %d groups", num_values, num_groups);
+
+  else if (_scalar_flux == NULL)
+    log_printf(ERROR, "Unable to return the sources "
+               "since they have not yet been computed");
+
+#pragma omp parallel for schedule(guided)
+  for (int i=0; i < num_FSRs; i++) {
+
+    int r = first_fsr + i;
+
+    /* Get Material and cross-sections */
+    Material* material = _FSR_materials[r];
+    FP_PRECISION* sigma_s = material->getSigmaS();
+    FP_PRECISION* fiss_mat = material->getFissionMatrix();
+
+    for (int G=0; G < num_groups; G++) {
+
+      FP_PRECISION fission_source = 0.0;
+      FP_PRECISION scatter_source = 0.0;
+
+      /* Compute total scattering and fission sources for this FSR */
+      for (int g=0; g < _num_groups; g++) {
+        scatter_source += sigma_s[G*_num_groups+g] * _scalar_flux(r,g);
+        fission_source += fiss_mat[G*_num_groups+g] * _scalar_flux(r,g);
+      }
+
+      /* Compute the total source with the fixed source and normalize it to
+       * solid angle for the isotropic approximation */
+      fsr_sources[i*num_groups+G] = (fission_source / _k_eff + scatter_source
+                                     + _fixed_sources(r,G)) * ONE_OVER_FOUR_PI;
+    }
+  }
+}
+
+
 /**
  * @brief Returns the scalar flux for some FSR and energy group.
  * @param fsr_id the ID for the FSR of interest
@@ -311,6 +489,100 @@ FP_PRECISION* Solver::getBoundaryFlux(int track_id, bool fwd) {
 }
 
 
+/**
+ * @brief Returns the FSR scalar flux array without copying it.
+ * @details This method is intended to be called from Python, where it
+ *          returns a 2D NumPy array indexed by FSR and energy group which
+ *          aliases the Solver's array. The view is writable only if
+ *          requested, as follows:
+ *
+ * @code
+ *          fluxes = solver.getScalarFluxView()
+ *          fluxes = solver.getScalarFluxView(writable=True)
+ * @endcode
+ *
+ *          The view keeps the Solver alive, but is only valid until the
+ *          Solver reallocates its flux arrays at the start of the next
+ *          eigenvalue, flux or source calculation. Using the view after
+ *          the arrays are reallocated raises an exception.
+ * @param view_array a pointer to the array (output)
+ * @param num_FSRs the number of FSRs (output)
+ * @param num_groups the number of energy groups (output)
+ */
+void Solver::getScalarFluxView(FP_PRECISION** view_array, int* num_FSRs,
+                               int* num_groups) {
+
+  if (_scalar_flux == NULL)
+    log_printf(ERROR, "Unable to return a view of the scalar flux "
+               "since it has not yet been allocated");
+
+  *view_array = _scalar_flux;
+  *num_FSRs = _num_FSRs;
+  *num_groups = _num_groups;
+}
+
+
+/**
+ * @brief Returns the FSR scalar flux array from the previous iteration
+ *        without copying it.
+ * @details See getScalarFluxView(...) for the use of the view from Python.
+ * @param view_array a pointer to the array (output)
+ * @param num_FSRs the number of FSRs (output)
+ * @param num_groups the number of energy groups (output)
+ */
+void Solver::getOldScalarFluxView(FP_PRECISION** view_array, int* num_FSRs,
+                                  int* num_groups) {
+
+  if (_old_scalar_flux == NULL)
+    log_printf(ERROR, "Unable to return a view of the old scalar flux "
+               "since it has not yet been allocated");
+
+  *view_array = _old_scalar_flux;
+  *num_FSRs = _num_FSRs;
+  *num_groups = _num_groups;
+}
+
+
+/**
+ * @brief Returns the FSR reduced source array without copying it.
+ * @details See getScalarFluxView(...) for the use of the view from Python.
+ * @param view_array a pointer to the array (output)
+ * @param num_FSRs the number of FSRs (output)
+ * @param num_groups the number of energy groups (output)
+ */
+void Solver::getReducedSourceView(FP_PRECISION** view_array, int* num_FSRs,
+                                  int* num_groups) {
+
+  if (_reduced_sources == NULL)
+    log_printf(ERROR, "Unable to return a view of the reduced sources "
+               "since they have not yet been allocated");
+
+  *view_array = _reduced_sources;
+  *num_FSRs = _num_FSRs;
+  *num_groups = _num_groups;
+}
+
+
+/**
+ * @brief Returns the FSR fixed source array without copying it.
+ * @details See getScalarFluxView(...) for the use of the view from Python.
+ * @param view_array a pointer to the array (output)
+ * @param num_FSRs the number of FSRs (output)
+ * @param num_groups the number of energy groups (output)
+ */
+void Solver::getFixedSourceView(FP_PRECISION** view_array, int* num_FSRs,
+                                int* num_groups) {
+
+  if (_fixed_sources == NULL)
+    log_printf(ERROR, "Unable to return a view of the fixed sources "
+               "since they have not yet been allocated");
+
+  *view_array = _fixed_sources;
+  *num_FSRs = _num_FSRs;
+  *num_groups = _num_groups;
+}
+
+
 /**
  * @brief Sets the Geometry for the Solver.
  * @details This is a private setter method for the Solver and is not
@@ -457,6 +729,79 @@ void Solver::useExponentialIntrinsic() {
 }
 
 
+/**
+ * @brief Sets the method used to accelerate eigenvalue calculations.
+ * @details With ANDERSON acceleration, the scalar flux used to compute the
+ *          source for each iteration is extrapolated from the scalar fluxes
+ *          of the most recent iterations by Anderson mixing. This requires
+ *          no geometric information such as a CMFD mesh and may be used
+ *          from Python as follows:
+ *
+ * @code
+ *          solver.setAccelerationType(openmoc.ANDERSON)
+ *          solver.setAndersonDepth(5)
+ * @endcode
+ *
+ *          The acceleration is not applied when CMFD is used to update the
+ *          flux. The default is NO_ACCELERATION.
+ * @param acceleration_type the acceleration type
+ */
+void Solver::setAccelerationType(accelerationType acceleration_type) {
+  _acceleration_type = acceleration_type;
+}
+
+
+/**
+ * @brief Sets the number of previous iterates used by Anderson mixing.
+ * @details A deeper history often converges in fewer iterations, but
+ *          requires storing two additional scalar flux arrays (# FSRs
+ *          \f$ \times \f$ # groups) for each previous iterate. The default
+ *          depth is 5.
+ * @param depth the Anderson mixing history depth
+ */
+void Solver::setAndersonDepth(int depth) {
+
+  if (depth <= 0)
+    log_printf(ERROR, "Unable to set the Anderson depth to %d since it is "
+               "not a positive integer", depth);
+
+  _anderson_depth = depth;
+}
+
+
+/**
+ * @brief Sets the number of source iterations needed to converge the
+ *        eigenvalue without acceleration.
+ * @details The sweeps saved by the acceleration are reported against this
+ *          reference, e.g., the number of iterations of an unaccelerated
+ *          calculation of the same problem at the same threshold, which
+ *          may be run once for a series of similar accelerated calculations:
+ *
+ * @code
+ *          solver.computeEigenvalue()
+ *          solver.setReferenceNumIterations(solver.getNumIterations())
+ *          solver.setAccelerationType(openmoc.ANDERSON)
+ *          solver.computeEigenvalue()
+ *          print(solver.getNumSweepsSaved())
+ * @endcode
+ *
+ *          The sweeps saved cannot be estimated reliably from the iterates
+ *          of the accelerated calculation itself, since the convergence of
+ *          its first unaccelerated iterations is dominated by the higher
+ *          harmonics rather than by the dominance ratio. A reference of 0
+ *          (the default) disables the report.
+ * @param num_iterations the reference number of source iterations
+ */
+void Solver::setReferenceNumIterations(int num_iterations) {
+
+  if (num_iterations < 0)
+    log_printf(ERROR, "Unable to set the reference number of source "
+               "iterations to %d since it is negative", num_iterations);
+
+  _reference_num_iterations = num_iterations;
+}
+
+
 /**
  * @brief Initializes new ExpEvaluator object to compute exponentials.
  */
@@ -638,6 +983,9 @@ void Solver::initializeCmfd() {
   _cmfd->setNumMOCGroups(_num_groups);
   _cmfd->initializeGroupMap();
 
+  /* The boundary fluxes are updated from the segments of each Track */
+  _track_generator->initializeTrackSegments();
+
   /* Give CMFD number of FSRs and FSR property arrays */
   _cmfd->setNumFSRs(_num_FSRs);
   _cmfd->setFSRVolumes(_FSR_volumes);
@@ -672,6 +1020,221 @@ void Solver::resetMaterials(solverMode mode) {
 }
 
 
+/**
+ * @brief Allocates memory for the scalar flux iterates used to accelerate an
+ *        eigenvalue calculation.
+ */
+void Solver::initializeAcceleration() {
+
+  if (_anderson_fluxes != NULL)
+    delete [] _anderson_fluxes;
+  if (_anderson_residuals != NULL)
+    delete [] _anderson_residuals;
+  if (_anderson_boundary_fluxes != NULL)
+    delete [] _anderson_boundary_fluxes;
+  if (_anderson_keffs != NULL)
+    delete [] _anderson_keffs;
+
+  _anderson_fluxes = NULL;
+  _anderson_residuals = NULL;
+  _anderson_boundary_fluxes = NULL;
+  _anderson_keffs = NULL;
+  _anderson_count = 0;
+
+  if (_acceleration_type != ANDERSON)
+    return;
+
+  if (_cmfd != NULL && _cmfd->isFluxUpdateOn()) {
+    log_printf(WARNING, "Anderson acceleration is not applied when CMFD "
+               "updates the flux");
+    return;
+  }
+
+  long size = (long)(_anderson_depth + 1) * _num_FSRs * _num_groups;
+  long boundary_size = (long)(_anderson_depth + 1) * 2 * _tot_num_tracks *
+      _polar_times_groups;
+  double mem = (2 * size + boundary_size) * sizeof(FP_PRECISION) / 1.E6;
+  log_printf(INFO, "Anderson acceleration with a depth of %d iterates "
+             "(%.2f MB)", _anderson_depth, mem);
+
+  try {
+    _anderson_fluxes = new FP_PRECISION[size];
+    _anderson_residuals = new FP_PRECISION[size];
+    _anderson_boundary_fluxes = new FP_PRECISION[boundary_size];
+    _anderson_keffs = new double[_anderson_depth + 1];
+  }
+  catch (std::exception &e) {
+    log_printf(ERROR, "Unable to allocate memory for Anderson acceleration");
+  }
+}
+
+
+/**
+ * @brief Extrapolates the scalar flux for the next source iteration from
+ *        the most recent iterations with Anderson mixing.
+ * @details This is called after each source iteration of an eigenvalue
+ *          calculation. The scalar flux computed by the iteration is
+ *          normalized to the same total fission source as the scalar flux
+ *          it was computed from and stored with its residual. Once the
+ *          history is full, the next scalar flux is the combination of the
+ *          stored fluxes which minimizes the linearized residual in a least
+ *          squares sense. The starting Track boundary angular fluxes and
+ *          the eigenvalue are extrapolated with the same coefficients so
+ *          that the next iteration is consistent with the scalar flux.
+ *          Negative fluxes are set to zero.
+ * @param k_ratio the ratio of the previous to the current eigenvalue
+ */
+void Solver::accelerateFluxes(FP_PRECISION k_ratio) {
+
+  if (_anderson_fluxes == NULL)
+    return;
+
+  long size = (long)_num_FSRs * _num_groups;
+  long boundary_size = 2 * (long)_tot_num_tracks * _polar_times_groups;
+  int num_slots = _anderson_depth + 1;
+
+  /* Store the normalized scalar flux and residual from this iteration */
+  int slot = _anderson_count % num_slots;
+  FP_PRECISION* flux = &_anderson_fluxes[slot * size];
+  FP_PRECISION* residual = &_anderson_residuals[slot * size];
+  FP_PRECISION* boundary_flux = &_anderson_boundary_fluxes[slot *
+                                                           boundary_size];
+  _anderson_keffs[slot] = _k_eff;
+
+#pragma omp parallel for schedule(guided)
+  for (long i=0; i < size; i++) {
+    flux[i] = _scalar_flux[i] * k_ratio;
+    residual[i] = flux[i] - _old_scalar_flux[i];
+  }
+
+  /* Normalize the boundary angular fluxes like the stored scalar fluxes */
+#pragma omp parallel for schedule(guided)
+  for (long i=0; i < boundary_size; i++) {
+    _boundary_flux[i] *= k_ratio;
+    _start_flux[i] *= k_ratio;
+    boundary_flux[i] = _start_flux[i];
+  }
+
+  _anderson_count++;
+
+  /* Use unaccelerated iterations until the history is full */
+  if (_anderson_count <= _anderson_depth)
+    return;
+
+  /* Find the slots of the stored iterates from oldest to newest */
+  int m = _anderson_depth;
+  std::vector<int> slots(m+1);
+  for (int j=0; j <= m; j++)
+    slots[j] = (_anderson_count - 1 - m + j) % num_slots;
+
+  /* Compute the normal equations for the residual differences */
+  std::vector<double> A(m*m, 0.);
+  std::vector<double> b(m, 0.);
+
+#pragma omp parallel
+  {
+    std::vector<double> A_private(m*m, 0.);
+    std::vector<double> b_private(m, 0.);
+    std::vector<double> delta(m);
+
+#pragma omp for schedule(static)
+    for (long i=0; i < size; i++) {
+      for (int j=0; j < m; j++)
+        delta[j] = _anderson_residuals[slots[j+1]*size + i] -
+            _anderson_residuals[slots[j]*size + i];
+
+      for (int j=0; j < m; j++) {
+        b_private[j] += delta[j] * residual[i];
+        for (int k=0; k <= j; k++)
+          A_private[j*m+k] += delta[j] * delta[k];
+      }
+    }
+
+#pragma omp critical
+    {
+      for (int j=0; j < m; j++) {
+        b[j] += b_private[j];
+        for (int k=0; k <= j; k++)
+          A[j*m+k] += A_private[j*m+k];
+      }
+    }
+  }
+
+  /* Symmetrize and regularize the normal equations */
+  double trace = 0.;
+  for (int j=0; j < m; j++) {
+    trace += A[j*m+j];
+    for (int k=0; k < j; k++)
+      A[k*m+j] = A[j*m+k];
+  }
+  for (int j=0; j < m; j++)
+    A[j*m+j] += 1.E-10 * trace / m;
+
+  /* Solve for the mixing coefficients with Gaussian elimination */
+  std::vector<double> gamma(b);
+  for (int j=0; j < m; j++) {
+
+    int pivot = j;
+    for (int k=j+1; k < m; k++) {
+      if (fabs(A[k*m+j]) > fabs(A[pivot*m+j]))
+        pivot = k;
+    }
+
+    /* Skip the extrapolation if the residuals are linearly dependent */
+    if (A[pivot*m+j] == 0.) {
+      log_printf(DEBUG, "Skipping Anderson mixing for singular residuals");
+      return;
+    }
+
+    for (int k=0; k < m; k++)
+      std::swap(A[j*m+k], A[pivot*m+k]);
+    std::swap(gamma[j], gamma[pivot]);
+
+    for (int k=j+1; k < m; k++) {
+      double factor = A[k*m+j] / A[j*m+j];
+      for (int l=j; l < m; l++)
+        A[k*m+l] -= factor * A[j*m+l];
+      gamma[k] -= factor * gamma[j];
+    }
+  }
+
+  for (int j=m-1; j >= 0; j--) {
+    for (int k=j+1; k < m; k++)
+      gamma[j] -= A[j*m+k] * gamma[k];
+    gamma[j] /= A[j*m+j];
+  }
+
+  /* Extrapolate the scalar flux from the stored iterates */
+#pragma omp parallel for schedule(guided)
+  for (long i=0; i < size; i++) {
+    double new_flux = flux[i];
+    for (int j=0; j < m; j++)
+      new_flux -= gamma[j] * (_anderson_fluxes[slots[j+1]*size + i] -
+                              _anderson_fluxes[slots[j]*size + i]);
+    _scalar_flux[i] = std::max(new_flux, 0.);
+  }
+
+  /* Extrapolate the starting boundary angular fluxes consistently */
+#pragma omp parallel for schedule(guided)
+  for (long i=0; i < boundary_size; i++) {
+    double new_flux = boundary_flux[i];
+    for (int j=0; j < m; j++)
+      new_flux -= gamma[j] *
+          (_anderson_boundary_fluxes[slots[j+1]*boundary_size + i] -
+           _anderson_boundary_fluxes[slots[j]*boundary_size + i]);
+    _start_flux[i] = std::max(new_flux, 0.);
+  }
+
+  /* Extrapolate the eigenvalue consistently with the scalar flux */
+  double k_eff = _anderson_keffs[slot];
+  for (int j=0; j < m; j++)
+    k_eff -= gamma[j] * (_anderson_keffs[slots[j+1]] -
+                         _anderson_keffs[slots[j]]);
+  if (k_eff > 0.)
+    _k_eff = k_eff;
+}
+
+
 /**
  * @brief This method performs one transport sweep using the fission source.
  * @details This is a helper routine used for Krylov subspace methods.
@@ -957,6 +1520,7 @@ void Solver::computeEigenvalue(int max_iters, solverMode mode,
 
   _num_iterations = 0;
   FP_PRECISION residual = 0.;
+  FP_PRECISION k_prev = 1.0;
 
   /* An initial guess for the eigenvalue */
   _k_eff = 1.0;
@@ -969,6 +1533,7 @@ void Solver::computeEigenvalue(int max_iters, solverMode mode,
   initializeFluxArrays();
   initializeSourceArrays();
   initializeCmfd();
+  initializeAcceleration();
 
   /* Set scalar flux to unity for each region */
   flattenFSRFluxes(1.0);
@@ -987,13 +1552,20 @@ void Solver::computeEigenvalue(int max_iters, solverMode mode,
       _k_eff = _cmfd->computeKeff(i);
       _cmfd->updateBoundaryFlux(_tracks, _boundary_flux, _tot_num_tracks);
     }
-    else
+    else {
+      k_prev = _k_eff;
       computeKeff();
+    }
 
     log_printf(NORMAL, "Iteration %d:\tk_eff = %1.6f"
                "\tres = %1.3E", i, _k_eff, residual);
 
     residual = computeResidual(res_type);
+
+    /* Extrapolate the scalar flux for the next iteration */
+    if (_acceleration_type != NO_ACCELERATION)
+      accelerateFluxes(k_prev / _k_eff);
+
     storeFSRFluxes();
     _num_iterations++;
 
@@ -1005,6 +1577,11 @@ void Solver::computeEigenvalue(int max_iters, solverMode mode,
   if (_num_iterations == max_iters-1)
     log_printf(WARNING, "Unable to converge the source distribution");
 
+  /* Report the sweeps saved against the reference if one is set */
+  if (_acceleration_type != NO_ACCELERATION && _reference_num_iterations > 0)
+    log_printf(NORMAL, "Anderson acceleration saved %d of %d transport "
+               "sweeps", getNumSweepsSaved(), _reference_num_iterations);
+
   resetMaterials(mode);
 
   _timer->stopTimer();
@@ -1042,6 +1619,15 @@ void Solver::printTimerReport() {
   msg_string.resize(REPORT_WIDTH, '.');
   log_printf(RESULT, "%s%1.4E sec", msg_string.c_str(), time_per_iter);
 
+  /* Time for CMFD */
+  if (_cmfd != NULL && _cmfd->isFluxUpdateOn()) {
+    double cmfd_time = _timer->getSplit("CMFD matrix construction") +
+        _timer->getSplit("CMFD eigenvalue solve");
+    msg_string = "Total time in CMFD solves";
+    msg_string.resize(REPORT_WIDTH, '.');
+    log_printf(RESULT, "%s%1.4E sec", msg_string.c_str(), cmfd_time);
+  }
+
   /* Time per segment */
   int num_segments = _track_generator->getNumSegments();
   int num_integrations = 2 * _num_polar_2 * _num_groups * num_segments;
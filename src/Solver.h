@@ -86,6 +86,21 @@ enum residualType {
 };
 
 
+/**
+ * @enum accelerationType
+ * @brief The method used to accelerate the source iteration in eigenvalue
+ *        calculations.
+*/
+enum accelerationType {
+
+  /** Unaccelerated power iteration */
+  NO_ACCELERATION,
+
+  /** Anderson mixing of the most recent scalar flux iterates */
+  ANDERSON,
+};
+
+
 /**
  * @class Solver Solver.h "src/Solver.h"
  * @brief This is an abstract base class which different Solver subclasses
@@ -149,6 +164,10 @@ protected:
   /** Optional user-specified fixed sources in each FSR and energy group */
   FP_PRECISION* _fixed_sources;
 
+  /** The number of times the FSR flux and source arrays have been
+   *  allocated, which invalidates the views of the previous arrays */
+  int _array_generation;
+
   /** A mapping of fixed sources keyed by the pair (FSR ID, energy group) */
   std::map< std::pair<int, int>, FP_PRECISION > _fix_src_FSR_map;
 
@@ -182,7 +201,34 @@ protected:
   /** A pointer to a Coarse Mesh Finite Difference (CMFD) acceleration object */
   Cmfd* _cmfd;
 
+  /** The method used to accelerate eigenvalue source iterations */
+  accelerationType _acceleration_type;
+
+  /** The number of previous iterates used by Anderson mixing */
+  int _anderson_depth;
+
+  /** The number of iterates stored since Anderson mixing was initialized */
+  int _anderson_count;
+
+  /** The normalized scalar fluxes computed by the most recent iterations */
+  FP_PRECISION* _anderson_fluxes;
+
+  /** The scalar flux residuals of the most recent iterations */
+  FP_PRECISION* _anderson_residuals;
+
+  /** The normalized Track boundary angular fluxes of the most recent
+   *  iterations */
+  FP_PRECISION* _anderson_boundary_fluxes;
+
+  /** The eigenvalues computed by the most recent iterations */
+  double* _anderson_keffs;
+
+  /** The number of source iterations needed to converge the eigenvalue
+   *  without acceleration against which the sweeps saved are reported */
+  int _reference_num_iterations;
+
   void clearTimerSplits();
+  void initializeAcceleration();
 
 public:
   Solver(TrackGenerator* track_generator=NULL);
@@ -193,6 +239,7 @@ public:
   Geometry* getGeometry();
   TrackGenerator* getTrackGenerator();
   FP_PRECISION getFSRVolume(int fsr_id);
+  void getFSRVolumes(double* fsr_volumes, int num_FSRs);
   int getNumPolarAngles();
   int getNumIterations();
   double getTotalTime();
@@ -201,11 +248,25 @@ public:
   FP_PRECISION getMaxOpticalLength();
   bool isUsingDoublePrecision();
   bool isUsingExponentialInterpolation();
+  accelerationType getAccelerationType();
+  int getAndersonDepth();
+  int getReferenceNumIterations();
+  int getArrayGeneration();
+  int getNumSweepsSaved();
 
   virtual FP_PRECISION getFSRSource(int fsr_id, int group);
+  void getFSRSources(int first_fsr, double* fsr_sources, int num_values);
   virtual FP_PRECISION getFlux(int fsr_id, int group);
   virtual void getFluxes(FP_PRECISION* out_fluxes, int num_fluxes) = 0;
   virtual FP_PRECISION* getBoundaryFlux(int track_id, bool fwd);
+  void getScalarFluxView(FP_PRECISION** view_array, int* num_FSRs,
+                         int* num_groups);
+  void getOldScalarFluxView(FP_PRECISION** view_array, int* num_FSRs,
+                            int* num_groups);
+  void getReducedSourceView(FP_PRECISION** view_array, int* num_FSRs,
+                            int* num_groups);
+  void getFixedSourceView(FP_PRECISION** view_array, int* num_FSRs,
+                          int* num_groups);
 
   virtual void setTrackGenerator(TrackGenerator* track_generator);
   virtual void setConvergenceThreshold(FP_PRECISION threshold);
@@ -218,6 +279,9 @@ public:
   void setExpPrecision(FP_PRECISION precision);
   void useExponentialInterpolation();
   void useExponentialIntrinsic();
+  void setAccelerationType(accelerationType acceleration_type);
+  void setAndersonDepth(int depth);
+  void setReferenceNumIterations(int num_iterations);
 
   virtual void initializeExpEvaluator();
   virtual void initializeMaterials(solverMode mode=FORWARD);
@@ -227,6 +291,7 @@ public:
   virtual void initializeCmfd();
 
   virtual void resetMaterials(solverMode mode=FORWARD);
+  virtual void accelerateFluxes(FP_PRECISION k_ratio);
   virtual void fissionTransportSweep();
   virtual void scatterTransportSweep();
 
@@ -22,10 +22,34 @@ TrackGenerator::TrackGenerator(Geometry* geometry, int num_azim,
   _tracks_filename_suffix = "";
   _z_coord = 0.0;
   _segment_formation = EXPLICIT_2D;
+  _modular_ray_tracing = false;
+  _modular_lattice = NULL;
   _max_optical_length = std::numeric_limits<FP_PRECISION>::max();
   _FSR_volumes = NULL;
   _FSR_locks = NULL;
+  _contains_segment_arrays = false;
+  _contains_track_segments = true;
+  _num_flat_segments = 0;
+  _segment_offsets = NULL;
+  _segment_lengths = NULL;
+  _segment_fsr_ids = NULL;
+  _segment_material_ids = NULL;
+  _segment_cmfd_surfaces_fwd = NULL;
+  _segment_cmfd_surfaces_bwd = NULL;
+  _track_file_map = NULL;
+  _track_file_map_size = 0;
+  _mapped_segment_material_ids = false;
+  _FSR_material_ids = NULL;
+  _num_otf_segments = 0;
+  _FSR_materials = NULL;
+  _segment_cache_memory = 0.;
+  _num_cached_tracks = 0;
+  _segment_cache_offsets = NULL;
+  _segment_cache_fsr_ids = NULL;
+  _segment_cache_lengths = NULL;
   _timer = new Timer();
+  _num_cell_lookups = 0;
+  _num_cell_tests = 0;
 }
 
 
@@ -53,6 +77,9 @@ TrackGenerator::~TrackGenerator() {
   if (_FSR_volumes != NULL)
     delete [] _FSR_volumes;
 
+  clearSegmentArrays();
+  clearSegmentCache();
+
   if (_quadrature != NULL && !_user_quadrature)
     delete _quadrature;
 
@@ -158,6 +185,8 @@ int TrackGenerator::getNumY(int azim) {
 
 /**
  * @brief Return the total number of Track segments across the Geometry.
+ * @details If segments are formed on the fly, this is the number of segments
+ *          formed for all Tracks in each transport sweep.
  * @return the total number of Track segments
  */
 int TrackGenerator::getNumSegments() {
@@ -165,6 +194,12 @@ int TrackGenerator::getNumSegments() {
     log_printf(ERROR, "Unable to return the total number of segments since "
                "Tracks have not yet been generated.");
 
+  if (_segment_formation == OTF_2D)
+    return _num_otf_segments;
+
+  if (!_contains_track_segments)
+    return _num_flat_segments;
+
   int num_segments = 0;
 
   for (int i=0; i < _num_azim_2; i++) {
@@ -238,6 +273,16 @@ double TrackGenerator::getZCoord() {
 }
 
 
+/**
+ * @brief Returns whether Tracks are ray traced modularly across the cells
+ *        of the Lattice filling the root Universe.
+ * @return true if modular ray tracing is used; false otherwise
+ */
+bool TrackGenerator::getModularRayTracing() {
+  return _modular_ray_tracing;
+}
+
+
 /**
  * @brief Returns an array of volumes indexed by FSR.
  * @return a pointer to the array of FSR volumes
@@ -317,6 +362,11 @@ FP_PRECISION TrackGenerator::getFSRVolume(int fsr_id) {
     log_printf(ERROR, "Unable to get the volume for FSR %d since the FSR IDs "
                "lie in the range (0, %d)", fsr_id, _geometry->getNumFSRs());
 
+  /* Segments which are not stored in each Track are only traversed to
+   * compute all volumes */
+  if (_segment_formation == OTF_2D || !_contains_track_segments)
+    return getFSRVolumes()[fsr_id];
+
   segment* curr_segment;
   FP_PRECISION volume = 0;
 
@@ -353,16 +403,23 @@ FP_PRECISION TrackGenerator::getMaxOpticalLength() {
 #pragma omp parallel
   {
     segment* curr_segment;
+    segment* segments;
+    int num_segments;
     FP_PRECISION length;
     Material* material;
     FP_PRECISION* sigma_t;
 
+    /* Form the segments on the fly without splitting them */
+    SegmentationKernel kernel(this);
+    kernel.setMaxOpticalLength(std::numeric_limits<FP_PRECISION>::max());
+
     /* Iterate over all tracks, segments, groups to find max optical length */
     for (int i=0; i < _num_azim_2; i++) {
 #pragma omp for reduction(max:max_optical_length)
       for (int j=0; j < _num_tracks[i]; j++) {
-        for (int s=0; s < _tracks[i][j].getNumSegments(); s++) {
-          curr_segment = _tracks[i][j].getSegment(s);
+        segments = getTrackSegments(&_tracks[i][j], &kernel, &num_segments);
+        for (int s=0; s < num_segments; s++) {
+          curr_segment = &segments[s];
           length = curr_segment->_length;
           material = curr_segment->_material;
           sigma_t = material->getSigmaT();
@@ -428,6 +485,91 @@ void TrackGenerator::setTracksFilenameSuffix(char* suffix) {
 }
 
 
+/**
+ * @brief Sets whether to ray trace Tracks modularly across the cells of the
+ *        Lattice filling the root Universe.
+ * @details With modular ray tracing, the Track spacing is made commensurate
+ *          with the pitch of the Lattice filling the root Universe such that
+ *          the chords of the Tracks across each Lattice cell are the same in
+ *          every cell. The segments along each chord are then ray traced
+ *          only once for each unique Universe, azimuthal angle and chord
+ *          offset and are reused for every Lattice cell filled by the same
+ *          Universe. The segments are still stored for each Track, such
+ *          that modular ray tracing reduces the time to ray trace the Tracks
+ *          but not the memory for their segments. Modular ray tracing
+ *          requires that the root Universe contain a single Cell filled by
+ *          a Lattice spanning the Geometry and that CMFD not be used.
+ *          Otherwise, each Track is ray traced across the whole Geometry.
+ *
+ * @code
+ *          track_generator.setModularRayTracing(True)
+ *          track_generator.generateTracks()
+ * @endcode
+ *
+ * @param modular whether to use modular ray tracing
+ */
+void TrackGenerator::setModularRayTracing(bool modular) {
+  _modular_ray_tracing = modular;
+  resetStatus();
+}
+
+
+/**
+ * @brief Sets the type of segmentation used to form the Track segments.
+ * @details With EXPLICIT_2D segmentation (the default), the segments of
+ *          every Track are stored after ray tracing. With OTF_2D
+ *          segmentation, each Track is ray traced once during Track
+ *          generation to find the FSRs and is then ray traced again on the
+ *          fly each time its segments are needed, such as in each transport
+ *          sweep, without storing the segments. This trades additional ray
+ *          tracing time for the memory of the segments. Track files are not
+ *          used with OTF_2D segmentation. The segments of some Tracks may be
+ *          cached to reduce the ray tracing time with
+ *          TrackGenerator::setSegmentCacheMemory(...).
+ *
+ * @code
+ *          track_generator.setSegmentFormation(openmoc.OTF_2D)
+ *          track_generator.generateTracks()
+ * @endcode
+ *
+ * @param segmentation_type the type of segmentation (EXPLICIT_2D or OTF_2D)
+ */
+void TrackGenerator::setSegmentFormation(segmentationType segmentation_type) {
+
+  if (segmentation_type != EXPLICIT_2D && segmentation_type != OTF_2D)
+    log_printf(ERROR, "Unable to set the segment formation type to %d since "
+               "only EXPLICIT_2D and OTF_2D segmentation are supported",
+               segmentation_type);
+
+  _segment_formation = segmentation_type;
+  resetStatus();
+}
+
+
+/**
+ * @brief Sets the maximum memory (MB) for the cache of segments formed on
+ *        the fly.
+ * @details With OTF_2D segmentation, the FSR ID and length of each segment
+ *          are cached for as many Tracks, in order of UID, as fit within the
+ *          memory budget. The segments of the cached Tracks are then formed
+ *          from the cache rather than by ray tracing. The cache requires
+ *          4 bytes plus the size of the floating point precision for each
+ *          segment. Segments are not cached if CMFD is used since the CMFD
+ *          surfaces crossed by each segment are not cached. The cache is
+ *          disabled by default (a budget of 0 MB).
+ * @param mem the maximum memory in megabytes
+ */
+void TrackGenerator::setSegmentCacheMemory(double mem) {
+
+  if (mem < 0.)
+    log_printf(ERROR, "Unable to set the segment cache memory to %f MB "
+               "since it is negative", mem);
+
+  _segment_cache_memory = mem;
+  resetStatus();
+}
+
+
 /**
  * @brief Set the number of azimuthal angles in \f$ [0, 2\pi] \f$.
  * @param num_azim the number of azimuthal angles in \f$ 2\pi \f$
@@ -506,6 +648,28 @@ bool TrackGenerator::containsTracks() {
 }
 
 
+/**
+ * @brief Returns whether the flattened segment arrays are up to date with the
+ *        Track segments.
+ * @return true if the segment arrays are initialized; false otherwise
+ */
+bool TrackGenerator::containsSegmentArrays() {
+  return _contains_segment_arrays;
+}
+
+
+/**
+ * @brief Returns whether or not the segments are stored in each Track.
+ * @details The segments read from a Track file are only stored in the
+ *          flattened segment arrays mapped from the file until they are
+ *          copied into each Track by initializeTrackSegments().
+ * @return true if the segments are stored in each Track; false otherwise
+ */
+bool TrackGenerator::containsTrackSegments() {
+  return _contains_track_segments;
+}
+
+
 /**
  * @brief Fills an array with the x,y,z coordinates for each Track.
  * @details This class method is intended to be called by the OpenMOC
@@ -582,6 +746,10 @@ void TrackGenerator::retrieveSegmentCoords(double* coords, int length_coords) {
   double x0, x1, y0, y1, z;
   double phi;
   segment* segments;
+  int num_segments;
+
+  /* Buffer for segments formed on the fly */
+  SegmentationKernel kernel(this);
 
   int counter = 0;
 
@@ -595,9 +763,9 @@ void TrackGenerator::retrieveSegmentCoords(double* coords, int length_coords) {
       z = _tracks[i][j].getStart()->getZ();
       phi = _tracks[i][j].getPhi();
 
-      segments = _tracks[i][j].getSegments();
+      segments = getTrackSegments(&_tracks[i][j], &kernel, &num_segments);
 
-      for (int s=0; s < _tracks[i][j].getNumSegments(); s++) {
+      for (int s=0; s < num_segments; s++) {
         curr_segment = &segments[s];
 
         coords[counter] = curr_segment->_region_id;
@@ -679,17 +847,41 @@ void TrackGenerator::generateTracks(bool store, bool neighbor_cells) {
       delete [] _tracks[i];
 
     delete [] _tracks;
+    _contains_tracks = false;
   }
 
+  /* Delete the flattened segment arrays and segment cache for the old
+   * Tracks, whose segments have not been split */
+  clearSegmentArrays();
+  clearSegmentCache();
+  _contains_track_segments = true;
+  _max_optical_length = std::numeric_limits<FP_PRECISION>::max();
+
   /* Initialize the CMFD object */
   if (_geometry->getCmfd() != NULL)
     _geometry->initializeCmfd();
 
-  /* Initialize FSRs with pin cell discretization and neighbor cell lists */
+  /* Initialize FSRs with pin cell discretization, neighbor cell lists and
+   * Cell search grids */
+  _timer->startTimer();
   _geometry->initializeFSRs(neighbor_cells);
+  _timer->stopTimer();
+  _timer->recordSplit("FSR initialization");
+
+  /* Find the Lattice whose cells are ray traced modularly */
+  _modular_lattice = NULL;
+  if (_modular_ray_tracing && _segment_formation == OTF_2D)
+    log_printf(WARNING, "Modular ray tracing is not used since segments are "
+               "formed on the fly");
+  else if (_modular_ray_tracing)
+    _modular_lattice = findModularLattice();
 
   initializeTrackFileDirectory();
 
+  /* Tracks are written to a Track file once their UIDs are assigned */
+  bool dump_tracks = (store && !_use_input_file &&
+                      _segment_formation == EXPLICIT_2D);
+
   /* If not Tracks input file exists, generate Tracks */
   if (_use_input_file == false) {
 
@@ -712,14 +904,14 @@ void TrackGenerator::generateTracks(bool store, bool neighbor_cells) {
                  "and YPlanes to enable the Geometry to determine the total "
                  "x-width and y-width of the model.");
 
-    /* Generate Tracks, perform ray tracing across the geometry, and store
-     * the data to a Track file */
+    /* Generate Tracks and perform ray tracing across the geometry */
     try {
       initializeTracks();
       recalibrateTracksToOrigin();
+      _timer->startTimer();
       segmentize();
-      if (store)
-	dumpTracksToFile();
+      _timer->stopTimer();
+      _timer->recordSplit("Segmentation");
     }
     catch (std::exception &e) {
       log_printf(ERROR, "Unable to allocate memory for Tracks");
@@ -749,6 +941,10 @@ void TrackGenerator::generateTracks(bool store, bool neighbor_cells) {
   initializeFSRLocks();
   initializeVolumes();
 
+  /* Store the ray tracing data to a Track file */
+  if (dump_tracks)
+    dumpTracksToFile();
+
   _timer->stopTimer();
   _timer->recordSplit("Total time");
 
@@ -819,12 +1015,18 @@ void TrackGenerator::initializeTrackFileDirectory() {
                   << _z_coord << "_" << _tracks_filename_suffix;
   }
 
+  if (_modular_lattice != NULL)
+    test_filename << "_modular";
+
   test_filename << ".data";
   _tracks_filename = test_filename.str();
 
   /* Check to see if a Track file exists for this geometry, number of azimuthal
-   * angles, and track spacing, and if so, import the ray tracing data */
-  if ((!stat(_tracks_filename.c_str(), &buffer))) {
+   * angles, and track spacing, and if so, import the ray tracing data. Track
+   * files store explicit segments which are not used if segments are formed
+   * on the fly. */
+  if (_segment_formation == EXPLICIT_2D &&
+      (!stat(_tracks_filename.c_str(), &buffer))) {
     if (readTracksFromFile()) {
       _use_input_file = true;
       _contains_tracks = true;
@@ -842,6 +1044,170 @@ segmentationType TrackGenerator::getSegmentFormation() {
 }
 
 
+/**
+ * @brief Returns the total number of segments in the flattened segment arrays.
+ * @return the number of flattened segments
+ */
+long TrackGenerator::getNumFlatSegments() {
+  return _num_flat_segments;
+}
+
+
+/**
+ * @brief Returns the offsets into the flattened segment arrays for each Track.
+ * @details The segments for the Track with UID i are stored at indices
+ *          offsets[i] through offsets[i+1]-1 of each flattened segment array.
+ * @return an array of segment offsets indexed by Track UID
+ */
+long* TrackGenerator::getSegmentOffsets() {
+  if (!_contains_segment_arrays)
+    log_printf(ERROR, "Unable to return the segment offsets since the "
+               "segment arrays have not been initialized");
+
+  return _segment_offsets;
+}
+
+
+/**
+ * @brief Returns the contiguous array of segment lengths.
+ * @return an array of segment lengths ordered by Track UID
+ */
+FP_PRECISION* TrackGenerator::getSegmentLengths() {
+  if (!_contains_segment_arrays)
+    log_printf(ERROR, "Unable to return the segment lengths since the "
+               "segment arrays have not been initialized");
+
+  return _segment_lengths;
+}
+
+
+/**
+ * @brief Returns the contiguous array of segment FSR IDs.
+ * @return an array of segment FSR IDs ordered by Track UID
+ */
+int* TrackGenerator::getSegmentFSRIds() {
+  if (!_contains_segment_arrays)
+    log_printf(ERROR, "Unable to return the segment FSR IDs since the "
+               "segment arrays have not been initialized");
+
+  return _segment_fsr_ids;
+}
+
+
+/**
+ * @brief Returns the contiguous array of compact segment Material indices.
+ * @details Each index refers to a Material in the array returned by
+ *          TrackGenerator::getSegmentMaterials().
+ * @return an array of segment Material indices ordered by Track UID
+ */
+unsigned short* TrackGenerator::getSegmentMaterialIds() {
+  if (!_contains_segment_arrays)
+    log_printf(ERROR, "Unable to return the segment Material indices since "
+               "the segment arrays have not been initialized");
+
+  return _segment_material_ids;
+}
+
+
+/**
+ * @brief Returns the contiguous array of CMFD surfaces crossed by the end
+ *        point of each segment.
+ * @return an array of forward CMFD surfaces ordered by Track UID
+ */
+int* TrackGenerator::getSegmentCmfdSurfacesFwd() {
+  if (!_contains_segment_arrays)
+    log_printf(ERROR, "Unable to return the segment CMFD surfaces since the "
+               "segment arrays have not been initialized");
+
+  return _segment_cmfd_surfaces_fwd;
+}
+
+
+/**
+ * @brief Returns the contiguous array of CMFD surfaces crossed by the start
+ *        point of each segment.
+ * @return an array of backward CMFD surfaces ordered by Track UID
+ */
+int* TrackGenerator::getSegmentCmfdSurfacesBwd() {
+  if (!_contains_segment_arrays)
+    log_printf(ERROR, "Unable to return the segment CMFD surfaces since the "
+               "segment arrays have not been initialized");
+
+  return _segment_cmfd_surfaces_bwd;
+}
+
+
+/**
+ * @brief Returns the number of Materials referenced by the flattened segments.
+ * @return the number of segment Materials
+ */
+int TrackGenerator::getNumSegmentMaterials() {
+  return _segment_materials.size();
+}
+
+
+/**
+ * @brief Returns the Materials indexed by the compact segment Material indices.
+ * @return an array of Material pointers
+ */
+Material** TrackGenerator::getSegmentMaterials() {
+  if (!_contains_segment_arrays)
+    log_printf(ERROR, "Unable to return the segment Materials since the "
+               "segment arrays have not been initialized");
+
+  return &_segment_materials[0];
+}
+
+
+/**
+ * @brief Returns the compact segment Material index of each FSR.
+ * @details Each index refers to a Material in the array returned by
+ *          TrackGenerator::getSegmentMaterials(). This is used to find the
+ *          Material index of segments formed on the fly.
+ * @return an array of Material indices indexed by FSR ID
+ */
+unsigned short* TrackGenerator::getFSRMaterialIds() {
+  if (!_contains_segment_arrays)
+    log_printf(ERROR, "Unable to return the FSR Material indices since the "
+               "segment arrays have not been initialized");
+
+  return _FSR_material_ids;
+}
+
+
+/**
+ * @brief Returns the maximum memory (MB) for the cache of segments formed on
+ *        the fly.
+ * @return the maximum memory in megabytes
+ */
+double TrackGenerator::getSegmentCacheMemory() {
+  return _segment_cache_memory;
+}
+
+
+/**
+ * @brief Returns the number of Tracks whose segments formed on the fly are
+ *        cached.
+ * @details The segments are cached for the Tracks with the lowest UIDs.
+ * @return the number of cached Tracks
+ */
+int TrackGenerator::getNumCachedTracks() {
+  return _num_cached_tracks;
+}
+
+
+/**
+ * @brief Returns the number of segments formed on the fly which are cached.
+ * @return the number of cached segments
+ */
+long TrackGenerator::getNumCachedSegments() {
+  if (_segment_cache_offsets == NULL)
+    return 0;
+
+  return _segment_cache_offsets[_num_cached_tracks];
+}
+
+
 /**
  * @brief Initializes Track azimuthal angles, start and end Points.
  * @details This method computes the azimuthal angles and effective track
@@ -874,6 +1240,16 @@ void TrackGenerator::initializeTracks() {
     _num_x[i] = (int) (fabs(width_x / _azim_spacing * sin(phi))) + 1;
     _num_y[i] = (int) (fabs(width_y / _azim_spacing * cos(phi))) + 1;
 
+    /* Round up the number of intersections to a multiple of the number of
+     * Lattice cells for the Track spacing to be commensurate with the
+     * Lattice pitch for modular ray tracing */
+    if (_modular_lattice != NULL) {
+      int num_lat_x = _modular_lattice->getNumX();
+      int num_lat_y = _modular_lattice->getNumY();
+      _num_x[i] = ((_num_x[i] + num_lat_x - 1) / num_lat_x) * num_lat_x;
+      _num_y[i] = ((_num_y[i] + num_lat_y - 1) / num_lat_y) * num_lat_y;
+    }
+
     /* Total number of Tracks */
     _num_tracks[i] = _num_x[i] + _num_y[i];
 
@@ -1315,9 +1691,20 @@ void TrackGenerator::segmentize() {
 
   log_printf(NORMAL, "Ray tracing for track segmentation...");
 
+  /* Only count the Cell searches made while ray tracing */
+  Universe::resetCellLookupCounts();
+
+  /* Ray trace the Tracks to find the FSRs without storing the segments */
+  if (!_use_input_file && _segment_formation == OTF_2D)
+    segmentizeOTF();
+
+  /* Reuse the segments traced across repeated Lattice cells */
+  else if (!_use_input_file && _modular_lattice != NULL)
+    segmentizeModular();
+
   /* This section loops over all Track and segmentizes each one if the
    * Tracks were not read in from an input file */
-  if (!_use_input_file) {
+  else if (!_use_input_file) {
 
     /* Loop over all Tracks */
     for (int i=0; i < _num_azim_2; i++) {
@@ -1328,18 +1715,532 @@ void TrackGenerator::segmentize() {
     }
   }
 
+  _num_cell_lookups = Universe::getNumCellLookups();
+  _num_cell_tests = Universe::getNumCellTests();
+
   _geometry->initializeFSRVectors();
 
   _contains_tracks = true;
 
+  /* Find the Material in each FSR to form cached segments on the fly */
+  if (_segment_formation == OTF_2D)
+    initializeSegments();
+
   return;
 }
 
 
 /**
- * @brief Writes all Track and segment data to a "*.tracks" binary file.
+ * @brief Finds the Lattice whose cells are ray traced modularly.
+ * @details Modular ray tracing requires that the root Universe contain a
+ *          single untransformed Cell filled by a Lattice which spans the
+ *          Geometry and that CMFD not be used. If these conditions are not
+ *          met, a warning is reported and NULL is returned.
+ * @return a pointer to the Lattice filling the root Universe or NULL
+ */
+Lattice* TrackGenerator::findModularLattice() {
+
+  if (_geometry->getCmfd() != NULL) {
+    log_printf(WARNING, "Unable to use modular ray tracing with CMFD. Each "
+               "Track will be ray traced across the whole Geometry.");
+    return NULL;
+  }
+
+  std::map<int, Cell*> cells = _geometry->getRootUniverse()->getCells();
+  Cell* cell = cells.size() == 1 ? cells.begin()->second : NULL;
+
+  if (cell == NULL || cell->getType() != FILL || cell->isTranslated() ||
+      cell->isRotated() || cell->getFillUniverse()->getType() != LATTICE) {
+    log_printf(WARNING, "Unable to use modular ray tracing since the root "
+               "Universe does not contain a single Cell filled by a Lattice. "
+               "Each Track will be ray traced across the whole Geometry.");
+    return NULL;
+  }
+
+  Lattice* lattice = static_cast<Lattice*>(cell->getFillUniverse());
+
+  if (fabs(lattice->getMinX() - _geometry->getMinX()) > ON_SURFACE_THRESH ||
+      fabs(lattice->getMaxX() - _geometry->getMaxX()) > ON_SURFACE_THRESH ||
+      fabs(lattice->getMinY() - _geometry->getMinY()) > ON_SURFACE_THRESH ||
+      fabs(lattice->getMaxY() - _geometry->getMaxY()) > ON_SURFACE_THRESH) {
+    log_printf(WARNING, "Unable to use modular ray tracing since the Lattice "
+               "ID = %d does not span the Geometry. Each Track will be ray "
+               "traced across the whole Geometry.", lattice->getId());
+    return NULL;
+  }
+
+  return lattice;
+}
+
+
+/**
+ * @brief Generates the segments for each Track by reusing the segments
+ *        traced across repeated cells of the Lattice filling the root
+ *        Universe.
+ * @details Since the Track spacing is commensurate with the Lattice pitch,
+ *          the chord of a Track across a Lattice cell is identified by the
+ *          edge of the cell it enters through and its offset along that
+ *          edge in units of the Track spacing. For each azimuthal angle, the
+ *          segments along each unique (Universe, chord) pair are traced
+ *          once as a template by Geometry::segmentizeLatticeCell(...). The
+ *          FSRs crossed within each Universe are identified by the FSR key
+ *          components beneath the Lattice level, and the FSR ID of each such
+ *          region is found once for each Lattice cell. The segments of each
+ *          Track are then assembled from the templates for the Lattice cells
+ *          it crosses with the FSR IDs of each cell.
+ */
+void TrackGenerator::segmentizeModular() {
+
+  Lattice* lattice = _modular_lattice;
+  int num_lat_x = lattice->getNumX();
+  int num_lat_y = lattice->getNumY();
+  int num_lat_cells = num_lat_x * num_lat_y;
+  double lat_width_x = lattice->getWidthX();
+  double lat_width_y = lattice->getWidthY();
+  double lat_min_x = lattice->getMinX();
+  double lat_min_y = lattice->getMinY();
+  Universe* root_universe = _geometry->getRootUniverse();
+  int max_nesting_depth = _geometry->getMaxNestingDepth();
+
+  /* Find the Universe filling each Lattice cell */
+  std::vector<Universe*> lat_universes(num_lat_cells);
+  Point center;
+  for (int c=0; c < num_lat_cells; c++) {
+    int lat_x = c % num_lat_x;
+    int lat_y = c / num_lat_x;
+    center.setCoords(lat_min_x + (lat_x + 0.5) * lat_width_x,
+                     lat_min_y + (lat_y + 0.5) * lat_width_y, _z_coord);
+    lat_universes[c] = lattice->getUniverse(lat_x, lat_y,
+                                            lattice->getLatZ(&center));
+  }
+
+  /* The regions crossed in each Universe, each with a point relative to
+   * the lower left corner of the Lattice cell */
+  std::map<Universe*, std::map<std::vector<int>, int> > region_ids;
+  std::map<Universe*, std::vector< std::pair<double, double> > >
+      region_points;
+  std::vector< std::vector< std::pair<double, double> >* >
+      cell_region_points(num_lat_cells);
+  for (int c=0; c < num_lat_cells; c++)
+    cell_region_points[c] = &region_points[lat_universes[c]];
+
+  /* The FSR ID of each region of the Universe filling each Lattice cell */
+  std::vector< std::vector<int> > cell_fsr_ids(num_lat_cells);
+
+  long num_templates = 0;
+  long num_template_segments = 0;
+  long num_crossings = 0;
+
+  for (int a=0; a < _num_azim_2; a++) {
+
+    double phi = _quadrature->getPhi(a);
+    double cos_phi = cos(phi);
+    double sin_phi = sin(phi);
+    double dx = _geometry->getWidthX() / _num_x[a];
+    double dy = _geometry->getWidthY() / _num_y[a];
+
+    /* The template for each (Universe, chord offset) pair, with the
+     * Lattice cell and start point of the first chord found for each */
+    std::map<std::pair<Universe*, int>, int> template_ids;
+    std::vector<int> template_cells;
+    std::vector< std::pair<double, double> > template_starts;
+
+    /* The (Lattice cell, template) pairs crossed by each Track */
+    std::vector< std::vector< std::pair<int, int> > >
+        crossings(_num_tracks[a]);
+
+    for (int i=0; i < _num_tracks[a]; i++) {
+
+      double x0 = _tracks[a][i].getStart()->getX();
+      double y0 = _tracks[a][i].getStart()->getY();
+      double x = x0;
+      double y = y0;
+      int lat_x, lat_y;
+
+      /* The first _num_x Tracks start on the bottom of the Geometry and the
+       * others on the left or right side */
+      bool bottom = (i < _num_x[a]);
+      if (bottom) {
+        lat_x = int(floor((x - lat_min_x) / lat_width_x));
+        lat_y = 0;
+      }
+      else {
+        lat_x = (cos_phi > 0.) ? 0 : num_lat_x - 1;
+        lat_y = int(floor((y - lat_min_y) / lat_width_y));
+      }
+
+      while (lat_x >= 0 && lat_x < num_lat_x && lat_y < num_lat_y) {
+
+        int cell = lat_y * num_lat_x + lat_x;
+        double cell_min_x = lat_min_x + lat_x * lat_width_x;
+        double cell_min_y = lat_min_y + lat_y * lat_width_y;
+
+        /* Identify the chord by the edge it enters through and its offset
+         * along that edge, which lies midway between multiples of the
+         * Track spacing */
+        int offset;
+        if (bottom)
+          offset = 2 * int(floor((x - cell_min_x) / dx));
+        else
+          offset = 2 * int(floor((y - cell_min_y) / dy)) + 1;
+
+        std::pair<Universe*, int> key(lat_universes[cell], offset);
+        std::map<std::pair<Universe*, int>, int>::iterator iter =
+            template_ids.find(key);
+        int template_id;
+
+        if (iter == template_ids.end()) {
+          template_id = template_cells.size();
+          template_ids.insert(std::make_pair(key, template_id));
+          template_cells.push_back(cell);
+          template_starts.push_back(std::make_pair(x, y));
+        }
+        else
+          template_id = iter->second;
+
+        crossings[i].push_back(std::make_pair(cell, template_id));
+
+        /* Find where the Track leaves the Lattice cell through its top or
+         * through its side, computed from the Track's start to avoid
+         * accumulating round off */
+        double side_x = (cos_phi > 0.) ? cell_min_x + lat_width_x : cell_min_x;
+        double top_y = cell_min_y + lat_width_y;
+        double top_x = x0 + (top_y - y0) * cos_phi / sin_phi;
+
+        if ((cos_phi > 0. && top_x < side_x) ||
+            (cos_phi < 0. && top_x > side_x)) {
+          x = top_x;
+          y = top_y;
+          lat_y++;
+          bottom = true;
+        }
+        else {
+          x = side_x;
+          y = y0 + (side_x - x0) * sin_phi / cos_phi;
+          lat_x += (cos_phi > 0.) ? 1 : -1;
+          bottom = false;
+        }
+      }
+    }
+
+    /* Ray trace the chord of each template */
+    int num_angle_templates = template_cells.size();
+    std::vector< std::vector<segment> > templates(num_angle_templates);
+    std::vector< std::vector<fsr_key> > template_keys(num_angle_templates);
+    std::vector< std::vector< std::pair<double, double> > >
+        template_points(num_angle_templates);
+
+#pragma omp parallel for schedule(dynamic)
+    for (int t=0; t < num_angle_templates; t++)
+      _geometry->segmentizeLatticeCell(
+          template_starts[t].first, template_starts[t].second, _z_coord,
+          phi, templates[t], template_keys[t], template_points[t]);
+
+    /* Assign the region of its Universe crossed by each template segment */
+    for (int t=0; t < num_angle_templates; t++) {
+
+      int cell = template_cells[t];
+      Universe* univ = lat_universes[cell];
+      std::map<std::vector<int>, int>& regions = region_ids[univ];
+      double cell_min_x = lat_min_x + (cell % num_lat_x) * lat_width_x;
+      double cell_min_y = lat_min_y + (cell / num_lat_x) * lat_width_y;
+
+      for (size_t s=0; s < templates[t].size(); s++) {
+
+        /* Drop the key levels down to the Lattice to identify the region
+         * of the Universe filling the Lattice cell */
+        fsr_key& key = template_keys[t][s];
+        std::vector<int> local_key(key._components.begin() +
+                                   key.findLevelEnd(KEY_LAT),
+                                   key._components.end());
+        std::map<std::vector<int>, int>::iterator iter =
+            regions.find(local_key);
+
+        if (iter == regions.end()) {
+          int region = regions.size();
+          regions.insert(std::make_pair(local_key, region));
+          region_points[univ].push_back(std::make_pair(
+              template_points[t][s].first - cell_min_x,
+              template_points[t][s].second - cell_min_y));
+          templates[t][s]._region_id = region;
+        }
+        else
+          templates[t][s]._region_id = iter->second;
+      }
+    }
+
+    /* Find the FSR IDs of the new regions in each Lattice cell */
+#pragma omp parallel for schedule(dynamic)
+    for (int c=0; c < num_lat_cells; c++) {
+
+      std::vector< std::pair<double, double> >& points =
+          *cell_region_points[c];
+      double cell_min_x = lat_min_x + (c % num_lat_x) * lat_width_x;
+      double cell_min_y = lat_min_y + (c / num_lat_x) * lat_width_y;
+      LocalCoords coords(0., 0., _z_coord);
+      coords.reserveLevels(max_nesting_depth);
+
+      for (size_t r=cell_fsr_ids[c].size(); r < points.size(); r++) {
+        coords.prune();
+        coords.setX(cell_min_x + points[r].first);
+        coords.setY(cell_min_y + points[r].second);
+        coords.setUniverse(root_universe);
+        _geometry->findCellContainingCoords(&coords);
+        cell_fsr_ids[c].push_back(_geometry->findFSRId(&coords));
+      }
+    }
+
+    /* Assemble the segments of each Track from the templates */
+#pragma omp parallel for
+    for (int i=0; i < _num_tracks[a]; i++) {
+      for (size_t k=0; k < crossings[i].size(); k++) {
+
+        int cell = crossings[i][k].first;
+        std::vector<segment>& segments = templates[crossings[i][k].second];
+
+        for (size_t s=0; s < segments.size(); s++) {
+          segment new_segment = segments[s];
+          new_segment._region_id = cell_fsr_ids[cell][segments[s]._region_id];
+          _tracks[a][i].addSegment(&new_segment);
+        }
+      }
+    }
+
+    num_templates += num_angle_templates;
+    for (int t=0; t < num_angle_templates; t++)
+      num_template_segments += templates[t].size();
+    for (int i=0; i < _num_tracks[a]; i++)
+      num_crossings += crossings[i].size();
+  }
+
+  log_printf(NORMAL, "Ray traced %ld segment templates with %ld segments "
+             "for %ld Lattice cell crossings", num_templates,
+             num_template_segments, num_crossings);
+}
+
+
+/**
+ * @brief Ray traces each Track to find the FSRs and count the segments
+ *        formed on the fly, caching the segments of some Tracks.
+ * @details The segments are not stored. The number of segments of each Track
+ *          is counted to find the total number of segments. If a segment
+ *          cache memory budget was set, the FSR ID and length of each segment
+ *          are cached for as many Tracks as fit in the budget, in order of
+ *          the UIDs assigned by TrackGenerator::initializeTrackUids().
+ */
+void TrackGenerator::segmentizeOTF() {
+
+  /* Find the offset of the first Track for each azimuthal angle in the order
+   * of Track UIDs */
+  std::vector<int> azim_offsets(_num_azim_2+1, 0);
+  for (int a=0; a < _num_azim_2; a++)
+    azim_offsets[a+1] = azim_offsets[a] + _num_tracks[a];
+  int num_tracks = azim_offsets[_num_azim_2];
+
+  /* Ray trace each Track to find the FSRs and count its segments */
+  std::vector<long> track_num_segments(num_tracks);
+  _num_otf_segments = 0;
+
+#pragma omp parallel
+  {
+    CounterKernel kernel(this);
+
+    for (int a=0; a < _num_azim_2; a++) {
+#pragma omp for
+      for (int i=0; i < _num_tracks[a]; i++) {
+        kernel.newTrack(&_tracks[a][i]);
+        _geometry->segmentize(&_tracks[a][i], &kernel);
+        track_num_segments[azim_offsets[a]+i] = kernel.getCount();
+      }
+    }
+  }
+
+  for (int t=0; t < num_tracks; t++)
+    _num_otf_segments += track_num_segments[t];
+
+  if (_segment_cache_memory <= 0.)
+    return;
+
+  if (_geometry->getCmfd() != NULL) {
+    log_printf(WARNING, "Segments formed on the fly are not cached since the "
+               "CMFD surfaces crossed by each segment are not cached");
+    return;
+  }
+
+  /* Find the number of Tracks whose segments fit in the cache */
+  double segment_mem = (sizeof(int) + sizeof(FP_PRECISION)) / 1.E6;
+  long num_cached_segments = 0;
+  while (_num_cached_tracks < num_tracks &&
+         (num_cached_segments + track_num_segments[_num_cached_tracks]) *
+         segment_mem <= _segment_cache_memory) {
+    num_cached_segments += track_num_segments[_num_cached_tracks];
+    _num_cached_tracks++;
+  }
+
+  log_printf(NORMAL, "Caching segments for %d of %d Tracks (%.2f MB)",
+             _num_cached_tracks, num_tracks,
+             num_cached_segments * segment_mem);
+
+  try {
+    _segment_cache_offsets = new long[_num_cached_tracks+1];
+    _segment_cache_fsr_ids = new int[num_cached_segments];
+    _segment_cache_lengths = new FP_PRECISION[num_cached_segments];
+  }
+  catch (std::exception &e) {
+    log_printf(ERROR, "Unable to allocate memory for the segment cache");
+  }
+
+  _segment_cache_offsets[0] = 0;
+  for (int t=0; t < _num_cached_tracks; t++)
+    _segment_cache_offsets[t+1] = _segment_cache_offsets[t] +
+        track_num_segments[t];
+
+  /* Ray trace each cached Track again to store its segments */
+#pragma omp parallel
+  {
+    SegmentationKernel kernel(this);
+
+    for (int a=0; a < _num_azim_2; a++) {
+      int num_cached = std::min(_num_tracks[a],
+                                _num_cached_tracks - azim_offsets[a]);
+#pragma omp for
+      for (int i=0; i < num_cached; i++) {
+        kernel.newTrack(&_tracks[a][i]);
+        _geometry->segmentize(&_tracks[a][i], &kernel);
+
+        segment* segments = kernel.getSegments();
+        long start = _segment_cache_offsets[azim_offsets[a]+i];
+        for (int s=0; s < kernel.getCount(); s++) {
+          _segment_cache_fsr_ids[start+s] = segments[s]._region_id;
+          _segment_cache_lengths[start+s] = segments[s]._length;
+        }
+      }
+    }
+  }
+}
+
+
+/**
+ * @brief Forms the segments of a Track on the fly and applies an MOCKernel
+ *        to each segment.
+ * @details The segments of Tracks in the segment cache are formed from the
+ *          cached FSR IDs and lengths with the current Material in each FSR.
+ *          The segments of all other Tracks are formed by ray tracing the
+ *          Track across the Geometry. This is used with OTF_2D segmentation
+ *          each time the segments of a Track are needed, such as in each
+ *          transport sweep. The segments read from a Track file which are
+ *          not stored in each Track are formed from the flattened segment
+ *          arrays mapped from the file.
+ * @param track the Track whose segments are formed
+ * @param kernel the MOCKernel to apply to each segment
+ */
+void TrackGenerator::formSegments(Track* track, MOCKernel* kernel) {
+
+  int uid = track->getUid();
+
+  /* Form the segments from the flattened segment arrays */
+  if (_segment_formation == EXPLICIT_2D) {
+    for (long s=_segment_offsets[uid]; s < _segment_offsets[uid+1]; s++) {
+      int fsr_id = _segment_fsr_ids[s];
+      kernel->execute(_segment_lengths[s], _FSR_materials[fsr_id], fsr_id,
+                      _segment_cmfd_surfaces_fwd[s],
+                      _segment_cmfd_surfaces_bwd[s]);
+    }
+  }
+
+  /* Form the segments from the segment cache */
+  else if (uid < _num_cached_tracks) {
+    for (long s=_segment_cache_offsets[uid];
+         s < _segment_cache_offsets[uid+1]; s++) {
+      int fsr_id = _segment_cache_fsr_ids[s];
+      kernel->execute(_segment_cache_lengths[s], _FSR_materials[fsr_id],
+                      fsr_id, -1, -1);
+    }
+  }
+
+  /* Form the segments by ray tracing */
+  else
+    _geometry->segmentize(track, kernel);
+}
+
+
+/**
+ * @brief Returns the segments of a Track, forming them on the fly if they
+ *        are not stored.
+ * @param track the Track whose segments are returned
+ * @param kernel a SegmentationKernel used to form the segments on the fly
+ * @param num_segments a pointer to the number of segments to set
+ * @return the segments of the Track
+ */
+segment* TrackGenerator::getTrackSegments(Track* track,
+                                          SegmentationKernel* kernel,
+                                          int* num_segments) {
+
+  if (_segment_formation == OTF_2D || !_contains_track_segments) {
+    kernel->newTrack(track);
+    formSegments(track, kernel);
+    *num_segments = kernel->getCount();
+    return kernel->getSegments();
+  }
+
+  *num_segments = track->getNumSegments();
+  return track->getSegments();
+}
+
+
+/**
+ * @brief Computes a 64-bit FNV-1a hash of a string.
+ * @param str the string to hash
+ * @return the hash of the string
+ */
+static unsigned long long hashString(const std::string& str) {
+
+  unsigned long long hash = 14695981039346656037ULL;
+  for (size_t i=0; i < str.length(); i++) {
+    hash ^= (unsigned char)str[i];
+    hash *= 1099511628211ULL;
+  }
+
+  return hash;
+}
+
+
+/**
+ * @brief Writes a section of a Track file aligned to TRACK_FILE_ALIGNMENT.
+ * @param out the Track file
+ * @param offset a pointer to the section offset to set in the file header
+ * @param data the data for the section
+ * @param size the size of the section in bytes
+ */
+static void writeTrackFileSection(FILE* out, long* offset, const void* data,
+                                  long size) {
+
+  /* Pad the file up to the alignment of the section */
+  long position = ftell(out);
+  long padding = (TRACK_FILE_ALIGNMENT - position % TRACK_FILE_ALIGNMENT) %
+      TRACK_FILE_ALIGNMENT;
+  char zeros[TRACK_FILE_ALIGNMENT] = {0};
+  fwrite(zeros, sizeof(char), padding, out);
+
+  *offset = position + padding;
+  if (size > 0)
+    fwrite(data, sizeof(char), size, out);
+}
+
+
+/**
+ * @brief Writes all Track and segment data to a binary Track file.
  * @details Storing Tracks in a binary file saves time by eliminating ray
  *          tracing for Track segmentation in commonly simulated geometries.
+ *          The file begins with a track_file_header which identifies the
+ *          Geometry by a hash of its string representation and stores the
+ *          offset of each section. Each section is a contiguous array
+ *          aligned to TRACK_FILE_ALIGNMENT bytes. The segments are stored in
+ *          the same flattened structure-of-arrays layout used by the
+ *          transport sweep so that the file may be memory mapped and used
+ *          in place by TrackGenerator::readTracksFromFile(). The file is
+ *          written under a temporary name and renamed so that processes
+ *          reading the Track file never see a partially written file.
  */
 void TrackGenerator::dumpTracksToFile() {
 
@@ -1350,158 +2251,176 @@ void TrackGenerator::dumpTracksToFile() {
       "been generated for %d azimuthal angles and %f azimuthal track spacing",
       2*_num_azim_2, _azim_spacing);
 
-  FILE* out;
-  out = fopen(_tracks_filename.c_str(), "w");
+  /* Flatten the segments into contiguous arrays if needed */
+  if (!_contains_segment_arrays)
+    initializeSegmentArrays();
 
-  /* Get a string representation of the Geometry's attributes. This is used to
-   * check whether or not ray tracing has been performed for this Geometry */
-  std::string geometry_to_string = _geometry->toString();
-  int string_length = geometry_to_string.length() + 1;
-
-  /* Write geometry metadata to the Track file */
-  fwrite(&string_length, sizeof(int), 1, out);
-  fwrite(geometry_to_string.c_str(), sizeof(char)*string_length, 1, out);
+  Cmfd* cmfd = _geometry->getCmfd();
+  int num_tracks = getNumTracks();
+  int num_FSRs = _geometry->getNumFSRs();
+  int num_materials = _segment_materials.size();
+  long num_segments = _num_flat_segments;
+
+  /* Initialize the Track file header */
+  track_file_header header;
+  memset(&header, 0, sizeof(track_file_header));
+  strncpy(header._magic, "OPENMOC", sizeof(header._magic));
+  header._version = TRACK_FILE_VERSION;
+  header._fp_precision = sizeof(FP_PRECISION);
+  header._geometry_hash = hashString(_geometry->toString());
+  header._num_azim = 2 * _num_azim_2;
+  header._num_FSRs = num_FSRs;
+  header._azim_spacing = _azim_spacing;
+  header._num_tracks = num_tracks;
+  header._num_segments = num_segments;
+  header._num_materials = num_materials;
+  header._num_cmfd_cells = (cmfd != NULL) ? cmfd->getNumCells() : -1;
+
+  /* Gather the Track counts for each azimuthal angle */
+  int* track_counts = new int[3*_num_azim_2];
+  for (int i=0; i < _num_azim_2; i++) {
+    track_counts[i] = _num_tracks[i];
+    track_counts[_num_azim_2 + i] = _num_x[i];
+    track_counts[2*_num_azim_2 + i] = _num_y[i];
+  }
 
-  /* Write ray tracing metadata to the Track file */
-  int num_azim = 2 * _num_azim_2;
-  fwrite(&num_azim, sizeof(int), 1, out);
-  fwrite(&_azim_spacing, sizeof(double), 1, out);
-  fwrite(_num_tracks, sizeof(int), _num_azim_2, out);
-  fwrite(_num_x, sizeof(int), _num_azim_2, out);
-  fwrite(_num_y, sizeof(int), _num_azim_2, out);
+  /* Gather the start and end points and azimuthal angle for each Track */
+  double* track_points = new double[7*num_tracks];
+  int* azim_indices = new int[num_tracks];
+  for (int i=0; i < num_tracks; i++) {
+    Track* track = _tracks_array[i];
+    track_points[7*i] = track->getStart()->getX();
+    track_points[7*i+1] = track->getStart()->getY();
+    track_points[7*i+2] = track->getStart()->getZ();
+    track_points[7*i+3] = track->getEnd()->getX();
+    track_points[7*i+4] = track->getEnd()->getY();
+    track_points[7*i+5] = track->getEnd()->getZ();
+    track_points[7*i+6] = track->getPhi();
+    azim_indices[i] = track->getAzimAngleIndex();
+  }
 
-  Track* curr_track;
-  double x0, y0, z0, x1, y1, z1;
-  double phi;
-  int azim_angle_index;
-  int num_segments;
-  std::vector<segment*> _segments;
-  Cmfd* cmfd = _geometry->getCmfd();
+  /* Gather the Material IDs for the compact Material indices */
+  int* material_ids = new int[num_materials];
+  for (int m=0; m < num_materials; m++)
+    material_ids[m] = _segment_materials[m]->getId();
 
-  segment* curr_segment;
-  double length;
-  int material_id;
-  int region_id;
-  int cmfd_surface_fwd;
-  int cmfd_surface_bwd;
+  /* Gather the FSR keys and data by FSR ID */
+  ParallelHashMap<fsr_key, fsr_data*>& FSR_keys_map =
+      _geometry->getFSRKeysMap();
+  std::vector<fsr_key>& FSRs_to_keys = _geometry->getFSRsToKeys();
 
-  /* Loop over all Tracks */
-  for (int i=0; i < _num_azim_2; i++) {
-    for (int j=0; j < _num_tracks[i]; j++) {
+  long* key_offsets = new long[num_FSRs+1];
+  key_offsets[0] = 0;
+  for (int r=0; r < num_FSRs; r++)
+    key_offsets[r+1] = key_offsets[r] + FSRs_to_keys[r]._components.size();
 
-      /* Get data for this Track */
-      curr_track = &_tracks[i][j];
-      x0 = curr_track->getStart()->getX();
-      y0 = curr_track->getStart()->getY();
-      z0 = curr_track->getStart()->getZ();
-      x1 = curr_track->getEnd()->getX();
-      y1 = curr_track->getEnd()->getY();
-      z1 = curr_track->getEnd()->getZ();
-      phi = curr_track->getPhi();
-      azim_angle_index = curr_track->getAzimAngleIndex();
-      num_segments = curr_track->getNumSegments();
-
-      /* Write data for this Track to the Track file */
-      fwrite(&x0, sizeof(double), 1, out);
-      fwrite(&y0, sizeof(double), 1, out);
-      fwrite(&z0, sizeof(double), 1, out);
-      fwrite(&x1, sizeof(double), 1, out);
-      fwrite(&y1, sizeof(double), 1, out);
-      fwrite(&z1, sizeof(double), 1, out);
-      fwrite(&phi, sizeof(double), 1, out);
-      fwrite(&azim_angle_index, sizeof(int), 1, out);
-      fwrite(&num_segments, sizeof(int), 1, out);
-
-      /* Loop over all segments for this Track */
-      for (int s=0; s < num_segments; s++) {
+  int* keys = new int[key_offsets[num_FSRs]];
+  double* FSR_points = new double[3*num_FSRs];
+  int* FSR_material_ids = new int[num_FSRs];
+  int* FSR_cmfd_cells = new int[num_FSRs];
 
-        /* Get data for this segment */
-        curr_segment = curr_track->getSegment(s);
-        length = curr_segment->_length;
-        material_id = curr_segment->_material->getId();
-        region_id = curr_segment->_region_id;
+  for (int r=0; r < num_FSRs; r++) {
+    std::vector<int>& components = FSRs_to_keys[r]._components;
+    std::copy(components.begin(), components.end(), &keys[key_offsets[r]]);
+
+    fsr_data* fsr = FSR_keys_map.at(FSRs_to_keys[r]);
+    FSR_points[3*r] = fsr->_point->getX();
+    FSR_points[3*r+1] = fsr->_point->getY();
+    FSR_points[3*r+2] = fsr->_point->getZ();
+    FSR_material_ids[r] = fsr->_mat_id;
+    FSR_cmfd_cells[r] = (cmfd != NULL) ? fsr->_cmfd_cell : -1;
+  }
 
-        /* Write data for this segment to the Track file */
-        fwrite(&length, sizeof(double), 1, out);
-        fwrite(&material_id, sizeof(int), 1, out);
-        fwrite(&region_id, sizeof(int), 1, out);
+  /* Gather the FSRs in each CMFD cell */
+  int num_cells = std::max(header._num_cmfd_cells, 0);
+  long* cell_offsets = new long[num_cells+1];
+  cell_offsets[0] = 0;
+  std::vector<int> cell_FSRs;
 
-        /* Write CMFD-related data for the Track if needed */
-        if (cmfd != NULL) {
-          cmfd_surface_fwd = curr_segment->_cmfd_surface_fwd;
-          cmfd_surface_bwd = curr_segment->_cmfd_surface_bwd;
-          fwrite(&cmfd_surface_fwd, sizeof(int), 1, out);
-          fwrite(&cmfd_surface_bwd, sizeof(int), 1, out);
-        }
-      }
-    }
+  for (int cell=0; cell < num_cells; cell++) {
+    std::vector<int>& FSRs = cmfd->getCellFSRs()->at(cell);
+    cell_FSRs.insert(cell_FSRs.end(), FSRs.begin(), FSRs.end());
+    cell_offsets[cell+1] = cell_FSRs.size();
   }
 
-  /* Get FSR vector maps */
-  ParallelHashMap<std::string, fsr_data*>& FSR_keys_map =
-      _geometry->getFSRKeysMap();
-  std::vector<std::string>& FSRs_to_keys = _geometry->getFSRsToKeys();
-  std::string fsr_key;
-  int fsr_id;
-  double x, y, z;
+  /* Write the Track file to a temporary file */
+  std::stringstream temp_filename;
+  temp_filename << _tracks_filename << "." << getpid() << ".tmp";
 
-  /* Write number of FSRs */
-  int num_FSRs = _geometry->getNumFSRs();
-  fwrite(&num_FSRs, sizeof(int), 1, out);
+  FILE* out = fopen(temp_filename.str().c_str(), "wb");
 
-  /* Write FSR vector maps to file */
-  std::string* fsr_key_list = FSR_keys_map.keys();
-  fsr_data** fsr_data_list = FSR_keys_map.values();
-  for (int i=0; i < num_FSRs; i++) {
+  if (out == NULL)
+    log_printf(WARNING, "Unable to open Track file %s for writing",
+               temp_filename.str().c_str());
 
-    /* Write key to file from FSR_keys_map */
-    fsr_key = fsr_key_list[i];
-    string_length = fsr_key.length() + 1;
-    fwrite(&string_length, sizeof(int), 1, out);
-    fwrite(fsr_key.c_str(), sizeof(char)*string_length, 1, out);
-
-    /* Write data to file from FSR_keys_map */
-    fsr_id = fsr_data_list[i]->_fsr_id;
-    x = fsr_data_list[i]->_point->getX();
-    y = fsr_data_list[i]->_point->getY();
-    z = fsr_data_list[i]->_point->getZ();
-    fwrite(&fsr_id, sizeof(int), 1, out);
-    fwrite(&x, sizeof(double), 1, out);
-    fwrite(&y, sizeof(double), 1, out);
-    fwrite(&z, sizeof(double), 1, out);
-
-    /* Write data to file from FSRs_to_keys */
-    fsr_key = FSRs_to_keys.at(i);
-    string_length = fsr_key.length() + 1;
-    fwrite(&string_length, sizeof(int), 1, out);
-    fwrite(fsr_key.c_str(), sizeof(char)*string_length, 1, out);
-  }
-
-  /* Write cmfd_fsrs vector of vectors to file */
-  if (cmfd != NULL) {
-    std::vector< std::vector<int> >* cell_fsrs = cmfd->getCellFSRs();
-    std::vector<int>::iterator iter;
-    int num_cells = cmfd->getNumCells();
-    fwrite(&num_cells, sizeof(int), 1, out);
-
-    /* Loop over CMFD cells */
-    for (int cell=0; cell < num_cells; cell++) {
-      num_FSRs = cell_fsrs->at(cell).size();
-      fwrite(&num_FSRs, sizeof(int), 1, out);
-
-      /* Loop over FSRs within cell */
-      for (iter = cell_fsrs->at(cell).begin();
-           iter != cell_fsrs->at(cell).end(); ++iter)
-        fwrite(&(*iter), sizeof(int), 1, out);
+  else {
+
+    long* offsets = header._offsets;
+    fwrite(&header, sizeof(track_file_header), 1, out);
+
+    writeTrackFileSection(out, &offsets[TRACK_COUNTS], track_counts,
+                          3 * _num_azim_2 * sizeof(int));
+    writeTrackFileSection(out, &offsets[TRACK_POINTS], track_points,
+                          7 * (long)num_tracks * sizeof(double));
+    writeTrackFileSection(out, &offsets[TRACK_AZIM_INDICES], azim_indices,
+                          (long)num_tracks * sizeof(int));
+    writeTrackFileSection(out, &offsets[SEGMENT_OFFSETS], _segment_offsets,
+                          (num_tracks+1) * sizeof(long));
+    writeTrackFileSection(out, &offsets[SEGMENT_LENGTHS], _segment_lengths,
+                          num_segments * sizeof(FP_PRECISION));
+    writeTrackFileSection(out, &offsets[SEGMENT_FSR_IDS], _segment_fsr_ids,
+                          num_segments * sizeof(int));
+    writeTrackFileSection(out, &offsets[SEGMENT_MATERIAL_IDS],
+                          _segment_material_ids,
+                          num_segments * sizeof(unsigned short));
+    writeTrackFileSection(out, &offsets[SEGMENT_CMFD_SURFACES_FWD],
+                          _segment_cmfd_surfaces_fwd,
+                          num_segments * sizeof(int));
+    writeTrackFileSection(out, &offsets[SEGMENT_CMFD_SURFACES_BWD],
+                          _segment_cmfd_surfaces_bwd,
+                          num_segments * sizeof(int));
+    writeTrackFileSection(out, &offsets[MATERIAL_IDS], material_ids,
+                          num_materials * sizeof(int));
+    writeTrackFileSection(out, &offsets[FSR_KEY_OFFSETS], key_offsets,
+                          (num_FSRs+1) * sizeof(long));
+    writeTrackFileSection(out, &offsets[FSR_KEYS], keys,
+                          key_offsets[num_FSRs] * sizeof(int));
+    writeTrackFileSection(out, &offsets[FSR_POINTS], FSR_points,
+                          3 * (long)num_FSRs * sizeof(double));
+    writeTrackFileSection(out, &offsets[FSR_MATERIAL_IDS], FSR_material_ids,
+                          num_FSRs * sizeof(int));
+    writeTrackFileSection(out, &offsets[FSR_CMFD_CELLS], FSR_cmfd_cells,
+                          num_FSRs * sizeof(int));
+    writeTrackFileSection(out, &offsets[CMFD_CELL_OFFSETS], cell_offsets,
+                          (num_cells+1) * sizeof(long));
+    writeTrackFileSection(out, &offsets[CMFD_CELL_FSRS],
+                          cell_FSRs.empty() ? NULL : &cell_FSRs[0],
+                          cell_FSRs.size() * sizeof(int));
+
+    /* Rewrite the header with the section offsets */
+    header._file_size = ftell(out);
+    fseek(out, 0, SEEK_SET);
+    fwrite(&header, sizeof(track_file_header), 1, out);
+
+    /* Close the Track file and move it into place */
+    if (fclose(out) != 0 ||
+        rename(temp_filename.str().c_str(), _tracks_filename.c_str()) != 0) {
+      log_printf(WARNING, "Unable to write Track file %s",
+                 _tracks_filename.c_str());
+      remove(temp_filename.str().c_str());
     }
   }
 
-  /* Delete key and value lists */
-  delete [] fsr_key_list;
-  delete [] fsr_data_list;
-
-  /* Close the Track file */
-  fclose(out);
+  delete [] track_counts;
+  delete [] track_points;
+  delete [] azim_indices;
+  delete [] material_ids;
+  delete [] key_offsets;
+  delete [] keys;
+  delete [] FSR_points;
+  delete [] FSR_material_ids;
+  delete [] FSR_cmfd_cells;
+  delete [] cell_offsets;
 
   /* Inform other the TrackGenerator::generateTracks() method that it may
    * import ray tracing data from this file if it is called and the ray
@@ -1513,9 +2432,18 @@ void TrackGenerator::dumpTracksToFile() {
 
 
 /**
- * @brief Reads Tracks in from a "*.tracks" binary file.
- * @details Storing Tracks in a binary file saves time by eliminating ray
- *          tracing for Track segmentation in commonly simulated geometries.
+ * @brief Reads Tracks in from a binary Track file.
+ * @details The Track file is memory mapped read-only. If the file format,
+ *          floating point precision, Geometry hash and ray tracing
+ *          parameters match this TrackGenerator, the Tracks, FSRs and CMFD
+ *          cells are initialized from the file. The flattened segment arrays
+ *          point directly into the shared mapping rather than being copied,
+ *          such that many processes on one node may share a single copy of
+ *          the segments. The segments are not stored in each Track unless
+ *          they are modified, such as by splitting segments, correcting FSR
+ *          volumes or replacing the Material in an FSR, in which case they
+ *          are copied by initializeTrackSegments(). The mapping is released
+ *          when the segment arrays are cleared.
  * @return true if able to read Tracks in from a file; false otherwise
  */
 bool TrackGenerator::readTracksFromFile() {
@@ -1530,32 +2458,134 @@ bool TrackGenerator::readTracksFromFile() {
       delete [] _tracks[i];
 
     delete [] _tracks;
+    _contains_tracks = false;
   }
 
-  int ret;
-  FILE* in;
-  in = fopen(_tracks_filename.c_str(), "r");
-  int string_length;
+  /* Memory map the Track file */
+  int fd = open(_tracks_filename.c_str(), O_RDONLY);
+  if (fd < 0)
+    return false;
+
+  struct stat buffer;
+  if (fstat(fd, &buffer) != 0 ||
+      buffer.st_size < (off_t)sizeof(track_file_header)) {
+    close(fd);
+    return false;
+  }
 
-  /* Import Geometry metadata from the Track file */
-  ret = fread(&string_length, sizeof(int), 1, in);
-  char* geometry_to_string = new char[string_length];
-  ret = fread(geometry_to_string, sizeof(char)*string_length, 1, in);
+  size_t file_size = buffer.st_size;
+  void* map = mmap(NULL, file_size, PROT_READ, MAP_SHARED, fd, 0);
+  close(fd);
 
-  /* Check if our Geometry is exactly the same as the Geometry in the
-   * Track file for this number of azimuthal angles and track spacing */
-  if (_geometry->toString().compare(std::string(geometry_to_string)) != 0)
+  if (map == MAP_FAILED)
     return false;
 
-  delete [] geometry_to_string;
+  char* data = (char*)map;
+  track_file_header* header = (track_file_header*)map;
+  Cmfd* cmfd = _geometry->getCmfd();
+  std::map<int, Material*> materials = _geometry->getAllMaterials();
+
+  /* Check that the Track file matches this Geometry and TrackGenerator */
+  bool valid = (strncmp(header->_magic, "OPENMOC", sizeof(header->_magic))
+                == 0) &&
+      header->_version == TRACK_FILE_VERSION &&
+      header->_fp_precision == sizeof(FP_PRECISION) &&
+      header->_file_size == (long)file_size &&
+      header->_geometry_hash == hashString(_geometry->toString()) &&
+      header->_num_azim == 2 * _num_azim_2 &&
+      header->_num_cmfd_cells == ((cmfd != NULL) ? cmfd->getNumCells() : -1);
+
+  /* Check that each section lies within the file */
+  if (valid) {
+    int num_cells = std::max(header->_num_cmfd_cells, 0);
+    long num_tracks = header->_num_tracks;
+    long num_segments = header->_num_segments;
+    long num_FSRs = header->_num_FSRs;
+    long sizes[NUM_TRACK_FILE_SECTIONS];
+
+    sizes[TRACK_COUNTS] = 3 * _num_azim_2 * sizeof(int);
+    sizes[TRACK_POINTS] = 7 * num_tracks * sizeof(double);
+    sizes[TRACK_AZIM_INDICES] = num_tracks * sizeof(int);
+    sizes[SEGMENT_OFFSETS] = (num_tracks+1) * sizeof(long);
+    sizes[SEGMENT_LENGTHS] = num_segments * sizeof(FP_PRECISION);
+    sizes[SEGMENT_FSR_IDS] = num_segments * sizeof(int);
+    sizes[SEGMENT_MATERIAL_IDS] = num_segments * sizeof(unsigned short);
+    sizes[SEGMENT_CMFD_SURFACES_FWD] = num_segments * sizeof(int);
+    sizes[SEGMENT_CMFD_SURFACES_BWD] = num_segments * sizeof(int);
+    sizes[MATERIAL_IDS] = header->_num_materials * sizeof(int);
+    sizes[FSR_KEY_OFFSETS] = (num_FSRs+1) * sizeof(long);
+    sizes[FSR_KEYS] = 0;
+    sizes[FSR_POINTS] = 3 * num_FSRs * sizeof(double);
+    sizes[FSR_MATERIAL_IDS] = num_FSRs * sizeof(int);
+    sizes[FSR_CMFD_CELLS] = num_FSRs * sizeof(int);
+    sizes[CMFD_CELL_OFFSETS] = (num_cells+1) * sizeof(long);
+    sizes[CMFD_CELL_FSRS] = 0;
+
+    for (int i=0; i < NUM_TRACK_FILE_SECTIONS; i++) {
+      if (header->_offsets[i] < (long)sizeof(track_file_header) ||
+          header->_offsets[i] + sizes[i] > (long)file_size)
+        valid = false;
+    }
+
+    /* Check the sizes of the variable length sections */
+    if (valid) {
+      long* key_offsets = (long*)(data + header->_offsets[FSR_KEY_OFFSETS]);
+      long* cell_offsets = (long*)(data + header->_offsets[CMFD_CELL_OFFSETS]);
+      valid = header->_offsets[FSR_KEYS] + key_offsets[num_FSRs] *
+          (long)sizeof(int) <= (long)file_size &&
+          header->_offsets[CMFD_CELL_FSRS] + cell_offsets[num_cells] *
+          (long)sizeof(int) <= (long)file_size;
+    }
+  }
+
+  /* Check that each Material in the Track file is in the Geometry */
+  if (valid) {
+    int* material_ids = (int*)(data + header->_offsets[MATERIAL_IDS]);
+    for (int m=0; m < header->_num_materials; m++) {
+      if (materials.find(material_ids[m]) == materials.end())
+        valid = false;
+    }
+  }
+
+  if (!valid) {
+    log_printf(INFO, "Ignoring Track file %s which does not match this "
+               "Geometry and TrackGenerator", _tracks_filename.c_str());
+    munmap(map, file_size);
+    return false;
+  }
 
   log_printf(NORMAL, "Importing ray tracing data from file...");
 
+  /* Get pointers to each section in the Track file */
+  int* track_counts = (int*)(data + header->_offsets[TRACK_COUNTS]);
+  double* track_points = (double*)(data + header->_offsets[TRACK_POINTS]);
+  int* azim_indices = (int*)(data + header->_offsets[TRACK_AZIM_INDICES]);
+  long* segment_offsets = (long*)(data + header->_offsets[SEGMENT_OFFSETS]);
+  FP_PRECISION* lengths =
+      (FP_PRECISION*)(data + header->_offsets[SEGMENT_LENGTHS]);
+  int* fsr_ids = (int*)(data + header->_offsets[SEGMENT_FSR_IDS]);
+  unsigned short* segment_material_ids =
+      (unsigned short*)(data + header->_offsets[SEGMENT_MATERIAL_IDS]);
+  int* cmfd_surfaces_fwd =
+      (int*)(data + header->_offsets[SEGMENT_CMFD_SURFACES_FWD]);
+  int* cmfd_surfaces_bwd =
+      (int*)(data + header->_offsets[SEGMENT_CMFD_SURFACES_BWD]);
+  int* material_ids = (int*)(data + header->_offsets[MATERIAL_IDS]);
+  long* key_offsets = (long*)(data + header->_offsets[FSR_KEY_OFFSETS]);
+  int* keys = (int*)(data + header->_offsets[FSR_KEYS]);
+  double* FSR_points = (double*)(data + header->_offsets[FSR_POINTS]);
+  int* FSR_material_ids = (int*)(data + header->_offsets[FSR_MATERIAL_IDS]);
+  int* FSR_cmfd_cells = (int*)(data + header->_offsets[FSR_CMFD_CELLS]);
+  long* cell_offsets = (long*)(data + header->_offsets[CMFD_CELL_OFFSETS]);
+  int* cell_FSRs = (int*)(data + header->_offsets[CMFD_CELL_FSRS]);
+
+  /* Look up the Material for each compact Material index */
+  std::vector<Material*> segment_materials;
+  for (int m=0; m < header->_num_materials; m++)
+    segment_materials.push_back(materials[material_ids[m]]);
+
   /* Import ray tracing metadata from the Track file */
-  int num_azim;
-  ret = fread(&num_azim, sizeof(int), 1, in);
-  _num_azim_2 = num_azim/2;
-  ret = fread(&_azim_spacing, sizeof(double), 1, in);
+  _azim_spacing = header->_azim_spacing;
 
   /* Initialize data structures for Tracks */
   _num_tracks = new int[_num_azim_2];
@@ -1563,150 +2593,89 @@ bool TrackGenerator::readTracksFromFile() {
   _num_y = new int[_num_azim_2];
   _tracks = new Track*[_num_azim_2];
 
-  ret = fread(_num_tracks, sizeof(int), _num_azim_2, in);
-  ret = fread(_num_x, sizeof(int), _num_azim_2, in);
-  ret = fread(_num_y, sizeof(int), _num_azim_2, in);
-
-  Track* curr_track;
-  double x0, y0, z0, x1, y1, z1;
-  double phi;
-  int azim_angle_index;
-  int num_segments;
-  Cmfd* cmfd = _geometry->getCmfd();
-
-  double length;
-  int material_id;
-  int region_id;
-
-  int cmfd_surface_fwd;
-  int cmfd_surface_bwd;
-  segment curr_segment;
-
-  std::map<int, Material*> materials = _geometry->getAllMaterials();
+  for (int i=0; i < _num_azim_2; i++) {
+    _num_tracks[i] = track_counts[i];
+    _num_x[i] = track_counts[_num_azim_2 + i];
+    _num_y[i] = track_counts[2*_num_azim_2 + i];
+  }
 
-  /* Loop over Tracks */
+  /* Loop over Tracks in UID order */
+  long uid = 0;
   for (int i=0; i < _num_azim_2; i++) {
     _tracks[i] = new Track[_num_tracks[i]];
 
     for (int j=0; j < _num_tracks[i]; j++) {
 
-      /* Import data for this Track from Track file */
-      ret = fread(&x0, sizeof(double), 1, in);
-      ret = fread(&y0, sizeof(double), 1, in);
-      ret = fread(&z0, sizeof(double), 1, in);
-      ret = fread(&x1, sizeof(double), 1, in);
-      ret = fread(&y1, sizeof(double), 1, in);
-      ret = fread(&z1, sizeof(double), 1, in);
-      ret = fread(&phi, sizeof(double), 1, in);
-      ret = fread(&azim_angle_index, sizeof(int), 1, in);
-      ret = fread(&num_segments, sizeof(int), 1, in);
-
       /* Initialize a Track with this data */
-      curr_track = &_tracks[i][j];
-      curr_track->setValues(x0, y0, z0, x1, y1, z1, phi);
-      curr_track->setAzimAngleIndex(azim_angle_index);
-      if (azim_angle_index < _num_azim_2 / 2)
-        _quadrature->setPhi(phi, azim_angle_index);
-
-      /* Loop over all segments in this Track */
-      for (int s=0; s < num_segments; s++) {
-
-        /* Import data for this segment from Track file */
-        ret = fread(&length, sizeof(double), 1, in);
-        ret = fread(&material_id, sizeof(int), 1, in);
-        ret = fread(&region_id, sizeof(int), 1, in);
-
-        /* Initialize segment with the data */
-        curr_segment._length = length;
-        curr_segment._material = materials[material_id];
-        curr_segment._region_id = region_id;
-
-        /* Import CMFD-related data if needed */
-        if (cmfd != NULL) {
-          ret = fread(&cmfd_surface_fwd, sizeof(int), 1, in);
-          ret = fread(&cmfd_surface_bwd, sizeof(int), 1, in);
-          curr_segment._cmfd_surface_fwd = cmfd_surface_fwd;
-          curr_segment._cmfd_surface_bwd = cmfd_surface_bwd;
-        }
+      double* points = &track_points[7*uid];
+      Track* curr_track = &_tracks[i][j];
+      curr_track->setValues(points[0], points[1], points[2],
+                            points[3], points[4], points[5], points[6]);
+      curr_track->setAzimAngleIndex(azim_indices[uid]);
+      if (azim_indices[uid] < _num_azim_2 / 2)
+        _quadrature->setPhi(points[6], azim_indices[uid]);
 
-        /* Add this segment to the Track */
-        curr_track->addSegment(&curr_segment);
-      }
+      uid++;
     }
   }
 
   /* Create FSR vector maps */
-  ParallelHashMap<std::string, fsr_data*>& FSR_keys_map =
+  ParallelHashMap<fsr_key, fsr_data*>& FSR_keys_map =
       _geometry->getFSRKeysMap();
-  std::vector<std::string>& FSRs_to_keys =
+  std::vector<fsr_key>& FSRs_to_keys =
       _geometry->getFSRsToKeys();
   FSR_keys_map.clear();
   FSRs_to_keys.clear();
-  int num_FSRs;
-  std::string fsr_key;
-  int fsr_key_id;
-  double x, y, z;
-
-  /* Get number of FSRs */
-  ret = fread(&num_FSRs, sizeof(int), 1, in);
-
-  /* Read FSR vector maps from file */
-  for (int fsr_id=0; fsr_id < num_FSRs; fsr_id++) {
-
-    /* Read key for FSR_keys_map */
-    ret = fread(&string_length, sizeof(int), 1, in);
-    char* char_buffer1 = new char[string_length];
-    ret = fread(char_buffer1, sizeof(char)*string_length, 1, in);
-    fsr_key = std::string(char_buffer1);
-
-    /* Read data from file for FSR_keys_map */
-    ret = fread(&fsr_key_id, sizeof(int), 1, in);
-    ret = fread(&x, sizeof(double), 1, in);
-    ret = fread(&y, sizeof(double), 1, in);
-    ret = fread(&z, sizeof(double), 1, in);
+
+  if (_FSR_materials != NULL)
+    delete [] _FSR_materials;
+  _FSR_materials = new Material*[header->_num_FSRs];
+
+  for (int r=0; r < header->_num_FSRs; r++) {
+    fsr_key key;
+    key._components.assign(&keys[key_offsets[r]], &keys[key_offsets[r+1]]);
+
     fsr_data* fsr = new fsr_data;
-    fsr->_fsr_id = fsr_key_id;
+    fsr->_fsr_id = r;
+    fsr->_mat_id = FSR_material_ids[r];
+    fsr->_cmfd_cell = FSR_cmfd_cells[r];
+    _FSR_materials[r] = materials[FSR_material_ids[r]];
     Point* point = new Point();
-    point->setCoords(x,y,z);
+    point->setCoords(FSR_points[3*r], FSR_points[3*r+1], FSR_points[3*r+2]);
     fsr->_point = point;
-    FSR_keys_map.insert(fsr_key, fsr);
-
-    /* Read data from file for FSR_to_keys */
-    ret = fread(&string_length, sizeof(int), 1, in);
-    char* char_buffer2 = new char[string_length];
-    ret = fread(char_buffer2, sizeof(char)*string_length, 1, in);
-    fsr_key = std::string(char_buffer2);
-    FSRs_to_keys.push_back(fsr_key);
+    FSR_keys_map.insert(key, fsr);
+    FSRs_to_keys.push_back(key);
   }
 
-  /* Read cmfd cell_fsrs vector of vectors from file */
+  /* Set the CMFD cell_fsrs vector of vectors */
   if (cmfd != NULL) {
-    std::vector< std::vector<int> > cell_fsrs;
-    int num_cells, fsr_id;
-    ret = fread(&num_cells, sizeof(int), 1, in);
-
-    /* Loop over CMFD cells */
-    for (int cell=0; cell < num_cells; cell++) {
-      cell_fsrs.push_back(std::vector<int>());
-      ret = fread(&num_FSRs, sizeof(int), 1, in);
-
-      /* Loop over FRSs within cell */
-      for (int fsr = 0; fsr < num_FSRs; fsr++) {
-        ret = fread(&fsr_id, sizeof(int), 1, in);
-        cell_fsrs.at(cell).push_back(fsr_id);
-      }
-    }
-
-    /* Set CMFD cell_fsrs vector of vectors */
-    cmfd->setCellFSRs(&cell_fsrs);
+    std::vector< std::vector<int> > cmfd_cell_FSRs(header->_num_cmfd_cells);
+    for (int cell=0; cell < header->_num_cmfd_cells; cell++)
+      cmfd_cell_FSRs[cell].assign(&cell_FSRs[cell_offsets[cell]],
+                                  &cell_FSRs[cell_offsets[cell+1]]);
+    cmfd->setCellFSRs(&cmfd_cell_FSRs);
   }
 
-  /* Inform the rest of the class methods that Tracks have been initialized */
-  if (ret)
-    _contains_tracks = true;
+  /* Use the flattened segment arrays in place from the mapped file */
+  clearSegmentArrays();
+  _track_file_map = map;
+  _track_file_map_size = file_size;
+  _num_flat_segments = header->_num_segments;
+  _segment_offsets = segment_offsets;
+  _segment_lengths = lengths;
+  _segment_fsr_ids = fsr_ids;
+  _segment_material_ids = segment_material_ids;
+  _segment_cmfd_surfaces_fwd = cmfd_surfaces_fwd;
+  _segment_cmfd_surfaces_bwd = cmfd_surfaces_bwd;
+  _segment_materials = segment_materials;
+  _mapped_segment_material_ids = true;
+  _contains_segment_arrays = true;
+
+  /* The segments are only copied into each Track when they are modified */
+  _contains_track_segments = false;
 
-  /* Close the Track file */
-  fclose(in);
+  /* Inform the rest of the class methods that Tracks have been initialized */
+  _contains_tracks = true;
 
   return true;
 }
@@ -1726,12 +2695,22 @@ void TrackGenerator::correctFSRVolume(int fsr_id, FP_PRECISION fsr_volume) {
     log_printf(ERROR, "Unable to correct FSR volume since "
 	       "tracks have not yet been generated");
 
+  if (_segment_formation == OTF_2D)
+    log_printf(ERROR, "Unable to correct the volume of FSR %d since segments "
+               "are formed on the fly", fsr_id);
+
+  /* The segment lengths in each Track are corrected */
+  initializeTrackSegments();
+
   /* Compute the current volume approximation for the flat source region */
   FP_PRECISION curr_volume = getFSRVolume(fsr_id);
 
   log_printf(INFO, "Correcting FSR %d volume from %f to %f",
              fsr_id, curr_volume, fsr_volume);
 
+  /* The flattened segment arrays must be rebuilt for the new lengths */
+  _contains_segment_arrays = false;
+
   int num_segments, azim_index;
   double dx_eff, d_eff;
   double volume, corr_factor;
@@ -1792,67 +2771,100 @@ void TrackGenerator::correctFSRVolume(int fsr_id, FP_PRECISION fsr_volume) {
  *          by weighting the average x and y values of each segment in the
  *          FSR by the segment's length and azimuthal weight. The numerical
  *          centroid fomula can be found in R. Ferrer et. al. "Linear Source
- *          Approximation in CASMO 5", PHYSOR 2012.
+ *          Approximation in CASMO 5", PHYSOR 2012. Each thread tallies the
+ *          weighted x and y values into its own arrays without locks, and
+ *          the arrays of all threads are summed to find the centroids.
  */
 void TrackGenerator::generateFSRCentroids() {
 
   int num_FSRs = _geometry->getNumFSRs();
   FP_PRECISION* FSR_volumes = getFSRVolumes();
 
-  /* Create array of centroids and initialize to origin */
-  Point** centroids = new Point*[num_FSRs];
-#pragma omp parallel for
-  for (int r=0; r < num_FSRs; r++) {
-    centroids[r] = new Point();
-    centroids[r]->setCoords(0.0, 0.0, 0.0);
-  }
+  /* Create array of (x,y,z) centroid coordinates for each FSR */
+  double* centroids = new double[3*num_FSRs];
+
+  /* Arrays of the weighted x and y values tallied by each thread */
+  int max_threads = omp_get_max_threads();
+  double** thread_x = new double*[max_threads];
+  double** thread_y = new double*[max_threads];
 
   /* Generate the fsr centroids */
-  for (int i=0; i < _num_azim_2; i++) {
-    FP_PRECISION azim_weight = _quadrature->getAzimWeight(i)
-            * _quadrature->getAzimSpacing(i);
+#pragma omp parallel
+  {
+    int tid = omp_get_thread_num();
+    int num_threads = omp_get_num_threads();
 
-#pragma omp parallel for
-    for (int j=0; j < _num_tracks[i]; j++) {
+    /* Buffer for segments formed on the fly */
+    SegmentationKernel kernel(this);
 
-      int num_segments = _tracks[i][j].getNumSegments();
-      segment* segments = _tracks[i][j].getSegments();
-      double x = _tracks[i][j].getStart()->getX();
-      double y = _tracks[i][j].getStart()->getY();
-      double z = _tracks[i][j].getStart()->getZ();
-      double phi = _tracks[i][j].getPhi();
+    /* Initialize the thread's weighted x and y values to zero */
+    thread_x[tid] = new double[num_FSRs];
+    thread_y[tid] = new double[num_FSRs];
+    memset(thread_x[tid], 0, num_FSRs * sizeof(double));
+    memset(thread_y[tid], 0, num_FSRs * sizeof(double));
 
-      for (int s=0; s < num_segments; s++) {
-        segment* curr_segment = &segments[s];
-        int fsr = curr_segment->_region_id;
-        double volume = FSR_volumes[fsr];
-
-        /* Set FSR mutual exclusion lock */
-        omp_set_lock(&_FSR_locks[fsr]);
-
-        centroids[fsr]->setX(centroids[fsr]->getX() + azim_weight *
-                             (x + cos(phi) * curr_segment->_length / 2.0) *
-                             curr_segment->_length / FSR_volumes[fsr]);
-        centroids[fsr]->setY(centroids[fsr]->getY() + azim_weight *
-                             (y + sin(phi) * curr_segment->_length / 2.0) *
-                             curr_segment->_length / FSR_volumes[fsr]);
-        centroids[fsr]->setZ(z);
-
-        /* Release FSR mutual exclusion lock */
-        omp_unset_lock(&_FSR_locks[fsr]);
-
-        x += cos(phi) * curr_segment->_length;
-        y += sin(phi) * curr_segment->_length;
+    for (int i=0; i < _num_azim_2; i++) {
+      double azim_weight = _quadrature->getAzimWeight(i)
+          * _quadrature->getAzimSpacing(i);
+
+#pragma omp for
+      for (int j=0; j < _num_tracks[i]; j++) {
+
+        int num_segments;
+        segment* segments = getTrackSegments(&_tracks[i][j], &kernel,
+                                             &num_segments);
+        double x = _tracks[i][j].getStart()->getX();
+        double y = _tracks[i][j].getStart()->getY();
+        double phi = _tracks[i][j].getPhi();
+        double cos_phi = cos(phi);
+        double sin_phi = sin(phi);
+
+        for (int s=0; s < num_segments; s++) {
+          int fsr = segments[s]._region_id;
+          double length = segments[s]._length;
+
+          thread_x[tid][fsr] += azim_weight * (x + cos_phi * length / 2.0)
+              * length;
+          thread_y[tid][fsr] += azim_weight * (y + sin_phi * length / 2.0)
+              * length;
+
+          x += cos_phi * length;
+          y += sin_phi * length;
+        }
+      }
+    }
+
+    /* Sum the weighted values of all threads and divide by the volumes */
+#pragma omp barrier
+#pragma omp for schedule(static)
+    for (int r=0; r < num_FSRs; r++) {
+      double x = 0.;
+      double y = 0.;
+      for (int t=0; t < num_threads; t++) {
+        x += thread_x[t][r];
+        y += thread_y[t][r];
+      }
+
+      if (FSR_volumes[r] > 0.) {
+        x /= FSR_volumes[r];
+        y /= FSR_volumes[r];
       }
+
+      centroids[3*r] = x;
+      centroids[3*r+1] = y;
+      centroids[3*r+2] = _z_coord;
     }
+
+    delete [] thread_x[tid];
+    delete [] thread_y[tid];
   }
 
-  /* Set the centroid for the FSR */
-#pragma omp parallel for
-  for (int r=0; r < num_FSRs; r++)
-    _geometry->setFSRCentroid(r, centroids[r]);
+  /* Set the centroids for the FSRs */
+  _geometry->setFSRCentroids(centroids, num_FSRs);
 
-  /* Delete temporary array of FSR volumes and centroids */
+  /* Delete temporary arrays of centroids */
+  delete [] thread_x;
+  delete [] thread_y;
   delete [] centroids;
 }
 
@@ -1871,6 +2883,41 @@ void TrackGenerator::splitSegments(FP_PRECISION max_optical_length) {
     log_printf(ERROR, "Unable to split segments since "
 	       "tracks have not yet been generated");
 
+  /* Segments formed on the fly are split as they are formed */
+  if (_segment_formation == OTF_2D) {
+    _max_optical_length = max_optical_length;
+
+    /* Count the split segments formed for all Tracks */
+    long num_segments = 0;
+
+#pragma omp parallel
+    {
+      CounterKernel kernel(this);
+
+      for (int i=0; i < _num_azim_2; i++) {
+#pragma omp for reduction(+:num_segments)
+        for (int j=0; j < _num_tracks[i]; j++) {
+          kernel.newTrack(&_tracks[i][j]);
+          formSegments(&_tracks[i][j], &kernel);
+          num_segments += kernel.getCount();
+        }
+      }
+    }
+
+    _num_otf_segments = num_segments;
+    return;
+  }
+
+  /* Segments read from a Track file are only copied into each Track if
+   * they must be split */
+  if (!_contains_track_segments) {
+    if (getMaxOpticalLength() <= max_optical_length)
+      return;
+    initializeTrackSegments();
+  }
+
+  int num_split = 0;
+
 #pragma omp parallel
   {
 
@@ -1913,6 +2960,9 @@ void TrackGenerator::splitSegments(FP_PRECISION max_optical_length) {
           if (min_num_cuts == 1)
             continue;
 
+#pragma omp atomic
+          num_split++;
+
           /* Split the segment into sub-segments */
           for (int k=0; k < min_num_cuts; k++) {
 
@@ -1939,6 +2989,10 @@ void TrackGenerator::splitSegments(FP_PRECISION max_optical_length) {
       }
     }
   }
+
+  /* The flattened segment arrays must be rebuilt for the split segments */
+  if (num_split > 0)
+    _contains_segment_arrays = false;
 }
 
 
@@ -1948,7 +3002,10 @@ void TrackGenerator::splitSegments(FP_PRECISION max_optical_length) {
  *          initialization is necessary since Materials in each FSR
  *          may be interchanged by the user in between different
  *          simulations. This method links each segment and fsr_data
- *          struct with the current Material found in each FSR.
+ *          struct with the current Material found in each FSR. The Material
+ *          in each FSR is stored to detect Materials which were replaced,
+ *          even by a Material with the same ID, and to form cached segments
+ *          on the fly.
  */
 void TrackGenerator::initializeSegments() {
 
@@ -1956,41 +3013,283 @@ void TrackGenerator::initializeSegments() {
     log_printf(ERROR, "Unable to initialize segments since "
 	       "tracks have not yet been generated");
 
-  /* Get all of the Materials from the Geometry */
-  std::map<int, Material*> materials = _geometry->getAllMaterials();
-
   /* Get the mappings of FSR to keys to fsr_data to update Materials */
-  ParallelHashMap<std::string, fsr_data*>& FSR_keys_map =
+  ParallelHashMap<fsr_key, fsr_data*>& FSR_keys_map =
       _geometry->getFSRKeysMap();
-  std::vector<std::string>& FSRs_to_keys = _geometry->getFSRsToKeys();
+  std::vector<fsr_key>& FSRs_to_keys = _geometry->getFSRsToKeys();
+  int num_FSRs = _geometry->getNumFSRs();
+  int num_changed = 0;
+
+  if (_FSR_materials == NULL) {
+    _FSR_materials = new Material*[num_FSRs];
+    memset(_FSR_materials, 0, num_FSRs * sizeof(Material*));
+  }
 
 #pragma omp parallel
   {
 
-    int region_id, mat_id;
     segment* curr_segment;
     Material* mat;
+    fsr_data* fsr;
 
     /* Set the Material for each FSR */
-#pragma omp for
-    for (int r=0; r < _geometry->getNumFSRs(); r++) {
+#pragma omp for reduction(+:num_changed)
+    for (int r=0; r < num_FSRs; r++) {
       mat = _geometry->findFSRMaterial(r);
-      FSR_keys_map.at(FSRs_to_keys.at(r))->_mat_id = mat->getId();
+      fsr = FSR_keys_map.at(FSRs_to_keys.at(r));
+      if (fsr->_mat_id != mat->getId() || _FSR_materials[r] != mat) {
+        fsr->_mat_id = mat->getId();
+        _FSR_materials[r] = mat;
+        num_changed++;
+      }
     }
 
     /* Set the Material for each segment */
-    for (int i=0; i < _num_azim_2; i++) {
+    for (int i=0; i < _num_azim_2 && _segment_formation == EXPLICIT_2D; i++) {
 #pragma omp for
       for (int j=0; j < _num_tracks[i]; j++) {
         for (int s=0; s < _tracks[i][j].getNumSegments(); s++) {
           curr_segment = _tracks[i][j].getSegment(s);
-          region_id = curr_segment->_region_id;
-          mat_id = FSR_keys_map.at(FSRs_to_keys.at(region_id))->_mat_id;
-          curr_segment->_material = materials[mat_id];
+          curr_segment->_material = _FSR_materials[curr_segment->_region_id];
         }
       }
     }
   }
+
+  /* The flattened segment arrays must be rebuilt for the new Materials */
+  if (num_changed > 0)
+    _contains_segment_arrays = false;
+}
+
+
+/**
+ * @brief Copies the Track segments into contiguous structure-of-arrays
+ *        storage for the transport sweep.
+ * @details The lengths, FSR IDs, Material indices and CMFD surfaces of all
+ *          segments are stored in separate contiguous arrays ordered by
+ *          Track UID, such that the segments for each azimuthal angle form
+ *          one contiguous block. Materials are referenced by a compact 16-bit
+ *          index into the array returned by getSegmentMaterials() rather than
+ *          by a pointer. This is called by the CPUSolver before a transport
+ *          sweep if the segments have changed since the arrays were built.
+ *          If segments are formed on the fly, only the compact Material
+ *          index of each FSR is initialized. If the segments read from a
+ *          Track file are not stored in each Track, the arrays mapped from
+ *          the file are kept and only the compact Material index of each
+ *          segment is recomputed.
+ */
+void TrackGenerator::initializeSegmentArrays() {
+
+  if (!_contains_tracks)
+    log_printf(ERROR, "Unable to initialize the segment arrays since "
+               "tracks have not yet been generated");
+
+  bool mapped = !_contains_track_segments;
+
+  if (!mapped)
+    clearSegmentArrays();
+  else {
+    if (!_mapped_segment_material_ids)
+      delete [] _segment_material_ids;
+    if (_FSR_material_ids != NULL)
+      delete [] _FSR_material_ids;
+    _segment_material_ids = NULL;
+    _FSR_material_ids = NULL;
+    _segment_materials.clear();
+  }
+
+  /* Assign a compact index to each Material in the Geometry */
+  std::map<int, Material*> materials = _geometry->getAllMaterials();
+  std::map<int, Material*>::iterator m_iter;
+  std::map<int, int> material_indices;
+
+  if (materials.size() > std::numeric_limits<unsigned short>::max())
+    log_printf(ERROR, "Unable to initialize the segment arrays since the "
+               "Geometry contains %d Materials", (int) materials.size());
+
+  for (m_iter = materials.begin(); m_iter != materials.end(); ++m_iter) {
+    material_indices[m_iter->first] = _segment_materials.size();
+    _segment_materials.push_back(m_iter->second);
+  }
+
+  /* Find the compact Material index for each FSR */
+  int num_FSRs = _geometry->getNumFSRs();
+  _FSR_material_ids = new unsigned short[num_FSRs];
+  for (int r=0; r < num_FSRs; r++)
+    _FSR_material_ids[r] =
+        material_indices[_geometry->findFSRMaterial(r)->getId()];
+
+  /* Segments formed on the fly are not stored */
+  if (_segment_formation == OTF_2D) {
+    _contains_segment_arrays = true;
+    return;
+  }
+
+  /* Recompute the compact Material index of each segment read from a
+   * Track file, whose other arrays remain in the file mapping */
+  if (mapped) {
+    _segment_material_ids = new unsigned short[_num_flat_segments];
+    _mapped_segment_material_ids = false;
+
+#pragma omp parallel for schedule(static)
+    for (long s=0; s < _num_flat_segments; s++)
+      _segment_material_ids[s] = _FSR_material_ids[_segment_fsr_ids[s]];
+
+    _contains_segment_arrays = true;
+    return;
+  }
+
+  /* Compute the offset of the first segment for each Track */
+  int num_tracks = getNumTracks();
+  _segment_offsets = new long[num_tracks+1];
+  _segment_offsets[0] = 0;
+  for (int i=0; i < num_tracks; i++)
+    _segment_offsets[i+1] = _segment_offsets[i] +
+        _tracks_array[i]->getNumSegments();
+  _num_flat_segments = _segment_offsets[num_tracks];
+
+  /* Allocate the flattened segment arrays */
+  long size = _num_flat_segments;
+  double mem = size * (sizeof(FP_PRECISION) + 3 * sizeof(int) +
+                       sizeof(unsigned short)) / 1.E6;
+  log_printf(INFO, "Flattening %ld segments into contiguous arrays "
+             "(%.2f MB)", size, mem);
+
+  try {
+    _segment_lengths = new FP_PRECISION[size];
+    _segment_fsr_ids = new int[size];
+    _segment_material_ids = new unsigned short[size];
+    _segment_cmfd_surfaces_fwd = new int[size];
+    _segment_cmfd_surfaces_bwd = new int[size];
+  }
+  catch (std::exception &e) {
+    log_printf(ERROR, "Unable to allocate memory for the segment arrays");
+  }
+
+  /* Copy the data for each segment into the flattened arrays */
+#pragma omp parallel for schedule(guided)
+  for (int i=0; i < num_tracks; i++) {
+    segment* segments = _tracks_array[i]->getSegments();
+    int num_segments = _tracks_array[i]->getNumSegments();
+    long start = _segment_offsets[i];
+
+    for (int s=0; s < num_segments; s++) {
+      _segment_lengths[start+s] = segments[s]._length;
+      _segment_fsr_ids[start+s] = segments[s]._region_id;
+      _segment_material_ids[start+s] =
+          _FSR_material_ids[segments[s]._region_id];
+      _segment_cmfd_surfaces_fwd[start+s] = segments[s]._cmfd_surface_fwd;
+      _segment_cmfd_surfaces_bwd[start+s] = segments[s]._cmfd_surface_bwd;
+    }
+  }
+
+  _contains_segment_arrays = true;
+}
+
+
+/**
+ * @brief Copies the segments read from a Track file into each Track.
+ * @details The segments read from a Track file are only stored in the
+ *          flattened segment arrays mapped from the file. This copies them
+ *          into each Track with the current Material in each FSR so that
+ *          they may be modified. This does nothing if the segments are
+ *          already stored in each Track.
+ */
+void TrackGenerator::initializeTrackSegments() {
+
+  if (_contains_track_segments)
+    return;
+
+  log_printf(INFO, "Copying %ld segments from the Track file into each "
+             "Track", _num_flat_segments);
+
+  int num_tracks = getNumTracks();
+
+#pragma omp parallel for schedule(guided)
+  for (int i=0; i < num_tracks; i++) {
+    Track* track = _tracks_array[i];
+
+    for (long s=_segment_offsets[i]; s < _segment_offsets[i+1]; s++) {
+      segment curr_segment;
+      curr_segment._length = _segment_lengths[s];
+      curr_segment._region_id = _segment_fsr_ids[s];
+      curr_segment._material = _FSR_materials[curr_segment._region_id];
+      curr_segment._cmfd_surface_fwd = _segment_cmfd_surfaces_fwd[s];
+      curr_segment._cmfd_surface_bwd = _segment_cmfd_surfaces_bwd[s];
+      track->addSegment(&curr_segment);
+    }
+  }
+
+  _contains_track_segments = true;
+}
+
+
+/**
+ * @brief Deletes the flattened segment arrays.
+ */
+void TrackGenerator::clearSegmentArrays() {
+
+  /* Segment arrays read from a Track file point into the file mapping */
+  if (_track_file_map != NULL) {
+    if (!_mapped_segment_material_ids && _segment_material_ids != NULL)
+      delete [] _segment_material_ids;
+    munmap(_track_file_map, _track_file_map_size);
+    _track_file_map = NULL;
+    _track_file_map_size = 0;
+    _mapped_segment_material_ids = false;
+  }
+  else {
+    if (_segment_offsets != NULL)
+      delete [] _segment_offsets;
+    if (_segment_lengths != NULL)
+      delete [] _segment_lengths;
+    if (_segment_fsr_ids != NULL)
+      delete [] _segment_fsr_ids;
+    if (_segment_material_ids != NULL)
+      delete [] _segment_material_ids;
+    if (_segment_cmfd_surfaces_fwd != NULL)
+      delete [] _segment_cmfd_surfaces_fwd;
+    if (_segment_cmfd_surfaces_bwd != NULL)
+      delete [] _segment_cmfd_surfaces_bwd;
+  }
+
+  if (_FSR_material_ids != NULL)
+    delete [] _FSR_material_ids;
+
+  _segment_offsets = NULL;
+  _segment_lengths = NULL;
+  _segment_fsr_ids = NULL;
+  _segment_material_ids = NULL;
+  _segment_cmfd_surfaces_fwd = NULL;
+  _segment_cmfd_surfaces_bwd = NULL;
+  _FSR_material_ids = NULL;
+  _segment_materials.clear();
+  _num_flat_segments = 0;
+  _contains_segment_arrays = false;
+}
+
+
+/**
+ * @brief Deletes the cache of segments formed on the fly and the Material
+ *        in each FSR found when segments were last initialized.
+ */
+void TrackGenerator::clearSegmentCache() {
+
+  if (_segment_cache_offsets != NULL)
+    delete [] _segment_cache_offsets;
+  if (_segment_cache_fsr_ids != NULL)
+    delete [] _segment_cache_fsr_ids;
+  if (_segment_cache_lengths != NULL)
+    delete [] _segment_cache_lengths;
+  if (_FSR_materials != NULL)
+    delete [] _FSR_materials;
+
+  _segment_cache_offsets = NULL;
+  _segment_cache_fsr_ids = NULL;
+  _segment_cache_lengths = NULL;
+  _FSR_materials = NULL;
+  _num_cached_tracks = 0;
+  _num_otf_segments = 0;
 }
 
 
@@ -2043,6 +3342,37 @@ void TrackGenerator::printTimerReport() {
   msg_string.resize(REPORT_WIDTH, '.');
   log_printf(RESULT, "%s%1.4E sec", msg_string.c_str(), time_per_segment);
 
+  /* Time to subdivide Cells and build Cell search grids */
+  double fsr_time = _timer->getSplit("FSR initialization");
+  msg_string = "FSR initialization";
+  msg_string.resize(REPORT_WIDTH, '.');
+  log_printf(RESULT, "%s%1.4E sec", msg_string.c_str(), fsr_time);
+
+  /* Time to segmentize the Tracks, dominated by Cell searches */
+  double segment_time = _timer->getSplit("Segmentation");
+  msg_string = "Segmentation";
+  msg_string.resize(REPORT_WIDTH, '.');
+  log_printf(RESULT, "%s%1.4E sec", msg_string.c_str(), segment_time);
+
+  /* Number of Cell searches and Cells tested during segmentation */
+  long num_lookups = _num_cell_lookups;
+  long num_tests = _num_cell_tests;
+  msg_string = "Cell lookups";
+  msg_string.resize(REPORT_WIDTH, '.');
+  log_printf(RESULT, "%s%ld", msg_string.c_str(), num_lookups);
+
+  if (num_lookups > 0) {
+    msg_string = "Time per Cell lookup";
+    msg_string.resize(REPORT_WIDTH, '.');
+    log_printf(RESULT, "%s%1.4E sec", msg_string.c_str(),
+               segment_time / num_lookups);
+
+    msg_string = "Cells tested per lookup";
+    msg_string.resize(REPORT_WIDTH, '.');
+    log_printf(RESULT, "%s%1.4f", msg_string.c_str(),
+               double(num_tests) / num_lookups);
+  }
+
   set_separator_character('-');
   log_printf(SEPARATOR, "-");
 }
@@ -19,14 +19,23 @@
 #include "Quadrature.h"
 #include "Timer.h"
 #include "segmentation_type.h"
+#include "track_file.h"
 #include <iostream>
 #include <fstream>
 #include <sstream>
 #include <unistd.h>
+#include <fcntl.h>
+#include <sys/mman.h>
+#include <sys/stat.h>
 #include <omp.h>
 #endif
 
 
+/** Forward declarations of the MOCKernel classes */
+class MOCKernel;
+class SegmentationKernel;
+
+
 /**
  * @class TrackGenerator TrackGenerator.h "src/TrackGenerator.h"
  * @brief The TrackGenerator is dedicated to generating and storing Tracks
@@ -94,15 +103,99 @@ protected:
   /** Determines the type of track segmentation to use */
   segmentationType _segment_formation;
 
+  /** Whether to reuse segments traced across repeated Lattice cells (true)
+   *  or to ray trace each Track across the whole Geometry (false) */
+  bool _modular_ray_tracing;
+
+  /** The Lattice filling the root Universe whose cells are ray traced once
+   *  per unique chord, or NULL if modular ray tracing is not used */
+  Lattice* _modular_lattice;
+
   /** Max optical path length for segments before splitting */
   FP_PRECISION _max_optical_length;
 
   /** A timer to record timing data for ray tracing */
   Timer* _timer;
 
+  /** The number of Cell searches and Cells tested for containment when the
+   *  Tracks were last segmentized */
+  long _num_cell_lookups;
+  long _num_cell_tests;
+
   /** A buffer holding the computed FSR volumes */
   FP_PRECISION* _FSR_volumes;
 
+  /** Boolean whether the flattened segment arrays are up to date with the
+   *  Track segments (true) or not (false) */
+  bool _contains_segment_arrays;
+
+  /** Boolean whether the segments are stored in each Track (true) or only
+   *  in the flattened segment arrays mapped from a Track file (false) */
+  bool _contains_track_segments;
+
+  /** The total number of segments in the flattened segment arrays */
+  long _num_flat_segments;
+
+  /** Offsets into the flattened segment arrays for each Track by UID. The
+   *  segments for Track UID i span [offsets[i], offsets[i+1]). */
+  long* _segment_offsets;
+
+  /** The lengths of all segments ordered by Track UID (cm) */
+  FP_PRECISION* _segment_lengths;
+
+  /** The FSR IDs of all segments ordered by Track UID */
+  int* _segment_fsr_ids;
+
+  /** The indices into the segment Materials array of all segments */
+  unsigned short* _segment_material_ids;
+
+  /** The CMFD surfaces crossed by the end points of all segments */
+  int* _segment_cmfd_surfaces_fwd;
+
+  /** The CMFD surfaces crossed by the start points of all segments */
+  int* _segment_cmfd_surfaces_bwd;
+
+  /** The Materials indexed by the compact segment Material indices */
+  std::vector<Material*> _segment_materials;
+
+  /** A read-only memory mapping of the Track file which holds the flattened
+   *  segment arrays, or NULL if the arrays were allocated on the heap */
+  void* _track_file_map;
+
+  /** The size in bytes of the Track file memory mapping */
+  size_t _track_file_map_size;
+
+  /** Boolean whether the segment Material indices point into the Track file
+   *  memory mapping (true) or were allocated on the heap (false) */
+  bool _mapped_segment_material_ids;
+
+  /** The compact segment Material index of each FSR */
+  unsigned short* _FSR_material_ids;
+
+  /** The total number of segments formed on the fly for all Tracks */
+  long _num_otf_segments;
+
+  /** The Material in each FSR when segments were last initialized, used to
+   *  detect replaced Materials and to form cached segments on the fly */
+  Material** _FSR_materials;
+
+  /** The maximum memory (MB) allowed for the cache of segments formed on
+   *  the fly (0 disables the cache) */
+  double _segment_cache_memory;
+
+  /** The number of Tracks, in order of UID, whose segments are cached */
+  int _num_cached_tracks;
+
+  /** Offsets into the segment cache for each cached Track by UID. The
+   *  segments for Track UID i span [offsets[i], offsets[i+1]). */
+  long* _segment_cache_offsets;
+
+  /** The FSR IDs of all cached segments */
+  int* _segment_cache_fsr_ids;
+
+  /** The lengths of all cached segments (cm) */
+  FP_PRECISION* _segment_cache_lengths;
+
   void computeEndPoint(Point* start, Point* end,  const double phi,
                        const double width_x, const double width_y);
 
@@ -115,11 +208,18 @@ protected:
   void initializeVolumes();
   void initializeFSRLocks();
   void segmentize();
+  Lattice* findModularLattice();
+  void segmentizeModular();
+  void segmentizeOTF();
+  segment* getTrackSegments(Track* track, SegmentationKernel* kernel,
+                            int* num_segments);
   void dumpTracksToFile();
   bool readTracksFromFile();
   void clearTimerSplits();
   void calculateFSRVolumes();
   void resetStatus();
+  void clearSegmentArrays();
+  void clearSegmentCache();
 
 public:
 
@@ -146,6 +246,20 @@ public:
   double getZCoord();
   omp_lock_t* getFSRLocks();
   segmentationType getSegmentFormation();
+  bool getModularRayTracing();
+  long getNumFlatSegments();
+  long* getSegmentOffsets();
+  FP_PRECISION* getSegmentLengths();
+  int* getSegmentFSRIds();
+  unsigned short* getSegmentMaterialIds();
+  int* getSegmentCmfdSurfacesFwd();
+  int* getSegmentCmfdSurfacesBwd();
+  int getNumSegmentMaterials();
+  Material** getSegmentMaterials();
+  unsigned short* getFSRMaterialIds();
+  double getSegmentCacheMemory();
+  int getNumCachedTracks();
+  long getNumCachedSegments();
 
   /* Set parameters */
   void setNumAzim(int num_azim);
@@ -154,17 +268,25 @@ public:
   void setQuadrature(Quadrature* quadrature);
   void setNumThreads(int num_threads);
   void setZCoord(double z_coord);
+  void setModularRayTracing(bool modular);
+  void setSegmentFormation(segmentationType segmentation_type);
+  void setSegmentCacheMemory(double mem);
   void setTracksFilenameSuffix(char* suffix);
 
   /* Worker functions */
   bool containsTracks();
+  bool containsSegmentArrays();
+  bool containsTrackSegments();
   void retrieveTrackCoords(double* coords, int num_tracks);
   void retrieveSegmentCoords(double* coords, int num_segments);
   void generateTracks(bool store=true, bool neighbor_cells=false);
+  void formSegments(Track* track, MOCKernel* kernel);
   void correctFSRVolume(int fsr_id, FP_PRECISION fsr_volume);
   void generateFSRCentroids();
   void splitSegments(FP_PRECISION max_optical_length);
   void initializeSegments();
+  void initializeSegmentArrays();
+  void initializeTrackSegments();
   void printTimerReport();
   void resetFSRVolumes();
 };
@@ -16,27 +16,62 @@ VolumeCalculator::VolumeCalculator(TrackGenerator* track_generator)
 /**
  * @brief FSR volumes are calculated and saved in the TrackGenerator's FSR
  *        volumes buffer
- * @details VolumeKernels are created and used to loop over all segments and
- *          tally each segments contribution to FSR volumes.
+ * @details A VolumeKernel is created for each thread and used to loop over
+ *          all segments and tally each segments contribution to the FSR
+ *          volumes without locks. The volumes tallied by each thread are then
+ *          summed into the TrackGenerator's FSR volumes.
  */
 void VolumeCalculator::execute() {
+
+  FP_PRECISION* FSR_volumes = _track_generator->getFSRVolumes();
+  int num_FSRs = _track_generator->getGeometry()->getNumFSRs();
+  double** thread_volumes = new double*[omp_get_max_threads()];
+
 #pragma omp parallel
   {
     VolumeKernel kernel(_track_generator);
+    thread_volumes[omp_get_thread_num()] = kernel.getFSRVolumes();
     loopOverTracks(&kernel);
+
+    /* Sum the volumes once all threads have tallied their segments */
+    int num_threads = omp_get_num_threads();
+#pragma omp barrier
+#pragma omp for schedule(static)
+    for (int r=0; r < num_FSRs; r++) {
+      double volume = 0.;
+      for (int t=0; t < num_threads; t++)
+        volume += thread_volumes[t][r];
+      FSR_volumes[r] = volume;
+    }
   }
+
+  delete [] thread_volumes;
 }
 
 
 /**
  * @brief Constructor for TransportSweep calls the TraverseTracks
- *        constructor and allocates temporary memory for local scalar fluxes
+ *        constructor, retrieves the contiguous segment arrays and allocates
+ *        temporary memory for local scalar fluxes
  * @param track_generator The TrackGenerator to pull tracking information from
  */
 TransportSweep::TransportSweep(TrackGenerator* track_generator)
                               : TraverseTracks(track_generator) {
   _cpu_solver = NULL;
 
+  /* Get the contiguous segment arrays from the TrackGenerator */
+  _segment_offsets = track_generator->getSegmentOffsets();
+  _segment_lengths = track_generator->getSegmentLengths();
+  _segment_fsr_ids = track_generator->getSegmentFSRIds();
+  _segment_material_ids = track_generator->getSegmentMaterialIds();
+  _segment_cmfd_surfaces_fwd = track_generator->getSegmentCmfdSurfacesFwd();
+  _segment_cmfd_surfaces_bwd = track_generator->getSegmentCmfdSurfacesBwd();
+
+  /* Get the compact Material indices if segments are formed on the fly */
+  _FSR_material_ids = NULL;
+  if (_segment_formation == OTF_2D)
+    _FSR_material_ids = track_generator->getFSRMaterialIds();
+
   /* Allocate temporary storage of FSR fluxes */
   int num_threads = omp_get_max_threads();
   int num_groups = track_generator->getGeometry()->getNumEnergyGroups();
@@ -89,13 +124,20 @@ void TransportSweep::setCPUSolver(CPUSolver* cpu_solver) {
  * @brief Applies the MOC equations the Track and segments
  * @details The MOC equations are applied to each segment, attenuating the
  *          Track's angular flux and tallying FSR contributions. Finally,
- *          Track boundary fluxes are transferred.
+ *          Track boundary fluxes are transferred. The segment data is read
+ *          from the TrackGenerator's contiguous segment arrays rather than
+ *          from the provided segments.
  * @param track The Track for which the angular flux is attenuated and
  *        transferred
  * @param segments The segments over which the MOC equations are applied
  */
 void TransportSweep::onTrack(Track* track, segment* segments) {
 
+  if (_segment_formation == OTF_2D) {
+    onTrackOTF(track, segments);
+    return;
+  }
+
   /* Get array for temporary scalar flux storage */
   int tid = omp_get_thread_num();
   FP_PRECISION* thread_fsr_flux = _thread_fsr_fluxes[tid];
@@ -103,21 +145,26 @@ void TransportSweep::onTrack(Track* track, segment* segments) {
   /* Extract Track information */
   int track_id = track->getUid();
   int azim_index = track->getAzimAngleIndex();
-  int num_segments = track->getNumSegments();
   FP_PRECISION* track_flux;
 
-  /* Correct azimuthal index to first octant */
-  Quadrature* quad = _track_generator->getQuadrature();
+  /* Extract the contiguous segment arrays for this Track */
+  long start = _segment_offsets[track_id];
+  int num_segments = _segment_offsets[track_id+1] - start;
+  FP_PRECISION* lengths = &_segment_lengths[start];
+  int* fsr_ids = &_segment_fsr_ids[start];
+  unsigned short* material_ids = &_segment_material_ids[start];
+  int* cmfd_surfaces_fwd = &_segment_cmfd_surfaces_fwd[start];
+  int* cmfd_surfaces_bwd = &_segment_cmfd_surfaces_bwd[start];
 
   /* Get the forward track flux */
   track_flux = _cpu_solver->getBoundaryFlux(track_id, true);
 
   /* Loop over each Track segment in forward direction */
   for (int s=0; s < num_segments; s++) {
-    segment* curr_segment = &segments[s];
-    _cpu_solver->tallyScalarFlux(curr_segment, azim_index, track_flux,
+    _cpu_solver->tallyScalarFlux(start+s, lengths[s], material_ids[s],
+                                 fsr_ids[s], azim_index, track_flux,
                                  thread_fsr_flux);
-    _cpu_solver->tallyCurrent(curr_segment, azim_index, track_flux, true);
+    _cpu_solver->tallyCurrent(cmfd_surfaces_fwd[s], azim_index, track_flux);
   }
 
   /* Transfer boundary angular flux to outgoing Track */
@@ -128,10 +175,70 @@ void TransportSweep::onTrack(Track* track, segment* segments) {
 
   /* Loop over each Track segment in reverse direction */
   for (int s=num_segments-1; s >= 0; s--) {
-    segment* curr_segment = &segments[s];
-    _cpu_solver->tallyScalarFlux(curr_segment, azim_index, track_flux,
+    _cpu_solver->tallyScalarFlux(start+s, lengths[s], material_ids[s],
+                                 fsr_ids[s], azim_index, track_flux,
                                  thread_fsr_flux);
-    _cpu_solver->tallyCurrent(curr_segment, azim_index, track_flux, false);
+    _cpu_solver->tallyCurrent(cmfd_surfaces_bwd[s], azim_index, track_flux);
+  }
+
+  /* Transfer boundary angular flux to outgoing Track */
+  _cpu_solver->transferBoundaryFlux(track_id, azim_index, false, track_flux);
+}
+
+
+/**
+ * @brief Applies the MOC equations to a Track and its segments formed on
+ *        the fly
+ * @details The segment data is read from the segments formed by the calling
+ *          thread's SegmentationKernel, and the compact Material index of each
+ *          segment is looked up from its FSR. Exponentials are always
+ *          evaluated since segments formed on the fly are not cached by the
+ *          CPUSolver.
+ * @param track The Track for which the angular flux is attenuated and
+ *        transferred
+ * @param segments The segments over which the MOC equations are applied
+ */
+void TransportSweep::onTrackOTF(Track* track, segment* segments) {
+
+  /* Get array for temporary scalar flux storage */
+  int tid = omp_get_thread_num();
+  FP_PRECISION* thread_fsr_flux = _thread_fsr_fluxes[tid];
+  int num_segments = _segmentation_kernels[tid]->getCount();
+
+  /* Extract Track information */
+  int track_id = track->getUid();
+  int azim_index = track->getAzimAngleIndex();
+  FP_PRECISION* track_flux;
+
+  /* Get the forward track flux */
+  track_flux = _cpu_solver->getBoundaryFlux(track_id, true);
+
+  /* Loop over each Track segment in forward direction */
+  for (int s=0; s < num_segments; s++) {
+    segment* curr_segment = &segments[s];
+    int fsr_id = curr_segment->_region_id;
+    _cpu_solver->tallyScalarFlux(-1, curr_segment->_length,
+                                 _FSR_material_ids[fsr_id], fsr_id,
+                                 azim_index, track_flux, thread_fsr_flux);
+    _cpu_solver->tallyCurrent(curr_segment->_cmfd_surface_fwd, azim_index,
+                              track_flux);
+  }
+
+  /* Transfer boundary angular flux to outgoing Track */
+  _cpu_solver->transferBoundaryFlux(track_id, azim_index, true, track_flux);
+
+  /* Get the backward track flux */
+  track_flux = _cpu_solver->getBoundaryFlux(track_id, false);
+
+  /* Loop over each Track segment in reverse direction */
+  for (int s=num_segments-1; s >= 0; s--) {
+    segment* curr_segment = &segments[s];
+    int fsr_id = curr_segment->_region_id;
+    _cpu_solver->tallyScalarFlux(-1, curr_segment->_length,
+                                 _FSR_material_ids[fsr_id], fsr_id,
+                                 azim_index, track_flux, thread_fsr_flux);
+    _cpu_solver->tallyCurrent(curr_segment->_cmfd_surface_bwd, azim_index,
+                              track_flux);
   }
 
   /* Transfer boundary angular flux to outgoing Track */
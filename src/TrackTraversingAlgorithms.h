@@ -31,9 +31,9 @@ class CPUSolver;
  *        "src/TrackTraversingAlgorithms.h"
  * @brief A class used to calculate FSR volumes
  * @details A VolumeCalculator imports a buffer to store FSR volumes from the
- *          provided TrackGenerator and the allocates VolumeKernels to
- *          calculate and update the volumes in each FSR, implicitly writing
- *          the calculated volumes back to the TrackGenerator.
+ *          provided TrackGenerator and the allocates a VolumeKernel for each
+ *          thread to calculate the volumes in each FSR, summing the volumes
+ *          of all threads back into the TrackGenerator's buffer.
  */
 class VolumeCalculator: public TraverseTracks {
 
@@ -60,6 +60,19 @@ private:
   CPUSolver* _cpu_solver;
   FP_PRECISION** _thread_fsr_fluxes;
 
+  /* Contiguous segment arrays from the TrackGenerator */
+  long* _segment_offsets;
+  FP_PRECISION* _segment_lengths;
+  int* _segment_fsr_ids;
+  unsigned short* _segment_material_ids;
+  int* _segment_cmfd_surfaces_fwd;
+  int* _segment_cmfd_surfaces_bwd;
+
+  /** The compact Material index in each FSR for segments formed on the fly */
+  unsigned short* _FSR_material_ids;
+
+  void onTrackOTF(Track* track, segment* segments);
+
 public:
 
   TransportSweep(TrackGenerator* track_generator);
@@ -11,6 +11,15 @@ TraverseTracks::TraverseTracks(TrackGenerator* track_generator) {
 
   /* Determine the type of segment formation used */
   _segment_formation = track_generator->getSegmentFormation();
+
+  /* Allocate a buffer for each thread to form segments on the fly */
+  _segmentation_kernels = NULL;
+  if (_segment_formation == OTF_2D) {
+    int num_threads = omp_get_max_threads();
+    _segmentation_kernels = new SegmentationKernel*[num_threads];
+    for (int t=0; t < num_threads; t++)
+      _segmentation_kernels[t] = new SegmentationKernel(track_generator);
+  }
 }
 
 
@@ -18,6 +27,13 @@ TraverseTracks::TraverseTracks(TrackGenerator* track_generator) {
  * @brief Destructor for TraverseTracks
  */
 TraverseTracks::~TraverseTracks() {
+
+  if (_segmentation_kernels != NULL) {
+    int num_threads = omp_get_max_threads();
+    for (int t=0; t < num_threads; t++)
+      delete _segmentation_kernels[t];
+    delete [] _segmentation_kernels;
+  }
 }
 
 
@@ -34,6 +50,9 @@ void TraverseTracks::loopOverTracks(MOCKernel* kernel) {
     case EXPLICIT_2D:
       loopOverTracks2D(kernel);
       break;
+    case OTF_2D:
+      loopOverTracks2DOTF(kernel);
+      break;
     default:
       log_printf(ERROR, "Segment formation type not currently supported");
   }
@@ -73,14 +92,57 @@ void TraverseTracks::loopOverTracks2D(MOCKernel* kernel) {
 }
 
 
+/**
+ * @brief Loops over all 2D Tracks, forming their segments on the fly
+ * @details The segments of each Track are formed by the calling thread's
+ *          SegmentationKernel before the specified kernel is applied to them
+ *          and the onTrack(...) function is applied to the Track. The segments
+ *          passed to onTrack(...) are only valid until the thread forms the
+ *          segments of its next Track.
+ * @param kernel The MOCKernel to apply to all segments
+ */
+void TraverseTracks::loopOverTracks2DOTF(MOCKernel* kernel) {
+
+  /* Loop over all parallel tracks for each azimuthal angle */
+  Track** tracks_2D = _track_generator->getTracks();
+  int num_azim = _track_generator->getNumAzim();
+  for (int a=0; a < num_azim/2; a++) {
+    int num_xy = _track_generator->getNumX(a) + _track_generator->getNumY(a);
+#pragma omp for
+    for (int i=0; i < num_xy; i++) {
+
+      Track* track_2D = &tracks_2D[a][i];
+
+      /* Form the segments and apply the kernel to them if necessary */
+      if (kernel != NULL)
+        kernel->newTrack(track_2D);
+      traceSegmentsOTF(track_2D, kernel);
+
+      /* Operate on the Track */
+      int tid = omp_get_thread_num();
+      segment* segments = _segmentation_kernels[tid]->getSegments();
+      onTrack(track_2D, segments);
+    }
+  }
+}
+
+
 /**
  * @brief Loops over segments in a Track when segments are explicitly generated
  * @details All segments in the provided Track are looped over and the provided
- *          MOCKernel is applied to them.
+ *          MOCKernel is applied to them. Segments read from a Track file
+ *          which are not stored in the Track are formed from the
+ *          TrackGenerator's flattened segment arrays.
  * @param track The Track whose segments will be traversed
  * @param kernel The kernel to apply to all segments
  */
 void TraverseTracks::traceSegmentsExplicit(Track* track, MOCKernel* kernel) {
+
+  if (!_track_generator->containsTrackSegments()) {
+    _track_generator->formSegments(track, kernel);
+    return;
+  }
+
   for (int s=0; s < track->getNumSegments(); s++) {
     segment* seg = track->getSegment(s);
     kernel->execute(seg->_length, seg->_material, seg->_region_id,
@@ -89,6 +151,33 @@ void TraverseTracks::traceSegmentsExplicit(Track* track, MOCKernel* kernel) {
 }
 
 
+/**
+ * @brief Forms the segments of a Track on the fly and loops over them
+ * @details The segments of the provided Track are formed in the calling
+ *          thread's SegmentationKernel, either by ray tracing the Track or
+ *          from the TrackGenerator's segment cache, and the provided MOCKernel
+ *          is applied to them if it is not NULL.
+ * @param track The Track whose segments will be traversed
+ * @param kernel The kernel to apply to all segments
+ */
+void TraverseTracks::traceSegmentsOTF(Track* track, MOCKernel* kernel) {
+
+  SegmentationKernel* segmenter = _segmentation_kernels[omp_get_thread_num()];
+  segmenter->newTrack(track);
+  _track_generator->formSegments(track, segmenter);
+
+  if (kernel == NULL)
+    return;
+
+  segment* segments = segmenter->getSegments();
+  for (int s=0; s < segmenter->getCount(); s++) {
+    segment* seg = &segments[s];
+    kernel->execute(seg->_length, seg->_material, seg->_region_id,
+                    seg->_cmfd_surface_fwd, seg->_cmfd_surface_bwd);
+  }
+}
+
+
 /**
  * @brief Dummy function for default onTrack implementation
  */
@@ -38,9 +38,11 @@ private:
 
   /* Functions defining how to loop over Tracks */
   void loopOverTracks2D(MOCKernel* kernel);
+  void loopOverTracks2DOTF(MOCKernel* kernel);
 
   /* Functions defining how to traverse segments */
   void traceSegmentsExplicit(Track* track, MOCKernel* kernel);
+  void traceSegmentsOTF(Track* track, MOCKernel* kernel);
 
 protected:
 
@@ -50,6 +52,9 @@ protected:
   /** The type of segmentation used for segment formation */
   segmentationType _segment_formation;
 
+  /** The SegmentationKernel used by each thread to form segments on the fly */
+  SegmentationKernel** _segmentation_kernels;
+
   TraverseTracks(TrackGenerator* track_generator);
   virtual ~TraverseTracks();
 
@@ -2,6 +2,11 @@
 
 
 int Universe::_n = 0;
+std::vector<long> Universe::_cell_lookup_counts;
+
+/** The stride between each thread's Cell search counts, in longs, such that
+ *  the counts of different threads lie on different cache lines */
+static const int CELL_COUNTS_STRIDE = 8;
 
 static int auto_id = DEFAULT_INIT_ID;
 
@@ -69,6 +74,14 @@ Universe::Universe(const int id, const char* name) {
 
   /* By default, the Universe's fissionability is unknown */
   _fissionable = false;
+
+  /* The Cell search grid is built once all Cells have been added */
+  _cell_grid_num_x = 0;
+  _cell_grid_num_y = 0;
+  _cell_grid_min_x = 0.;
+  _cell_grid_min_y = 0.;
+  _cell_grid_width_x = 0.;
+  _cell_grid_width_y = 0.;
 }
 
 
@@ -526,6 +539,32 @@ std::map<int, Universe*> Universe::getAllUniverses() {
 }
 
 
+/**
+ * @brief Returns the maximum number of nested Universe levels beneath and
+ *        including this Universe.
+ * @return the maximum nesting depth of this Universe
+ */
+int Universe::getMaxNestingDepth() {
+
+  int max_depth = 0;
+  std::map<int, Cell*>::iterator iter;
+
+  for (iter = _cells.begin(); iter != _cells.end(); ++iter) {
+    if (iter->second->getType() != FILL)
+      continue;
+
+    Universe* fill = iter->second->getFillUniverse();
+    if (fill->getType() == SIMPLE)
+      max_depth = std::max(max_depth, fill->getMaxNestingDepth());
+    else
+      max_depth = std::max(max_depth,
+                           static_cast<Lattice*>(fill)->getMaxNestingDepth());
+  }
+
+  return max_depth + 1;
+}
+
+
 /**
  * @brief Returns true if the Universe contains a Cell filled by a fissionable
  *        Material and false otherwise.
@@ -591,6 +630,7 @@ void Universe::addCell(Cell* cell) {
     _cells.insert(std::pair<int, Cell*>(cell->getId(), cell));
     log_printf(DEBUG, "Added Cell with ID = %d to Universe with ID = %d",
                cell->getId(), _id);
+    clearCellGrid();
   }
   catch (std::exception &e) {
     log_printf(ERROR, "Unable to add Cell with ID = %d to Universe with"
@@ -604,16 +644,43 @@ void Universe::addCell(Cell* cell) {
  * @param cell a pointer to the Cell to remove
  */
 void Universe::removeCell(Cell* cell) {
-  if (_cells.find(cell->getId()) != _cells.end())
+  if (_cells.find(cell->getId()) != _cells.end()) {
     _cells.erase(cell->getId());
+    clearCellGrid();
+  }
+}
+
+
+/**
+ * @brief Returns the Cells in the Cell search grid bin containing a
+ *        LocalCoords object.
+ * @details Returns NULL if the Cell search grid has not been built or if the
+ *          LocalCoords is outside of the grid.
+ * @param coords a pointer to the LocalCoords of interest
+ * @return a pointer to the vector of Cells overlapping the grid bin
+ */
+std::vector<Cell*>* Universe::getCellGridBin(LocalCoords* coords) {
+
+  if (_cell_grid.empty())
+    return NULL;
+
+  double x = (coords->getX() - _cell_grid_min_x) / _cell_grid_width_x;
+  double y = (coords->getY() - _cell_grid_min_y) / _cell_grid_width_y;
+
+  if (x < 0. || x >= _cell_grid_num_x || y < 0. || y >= _cell_grid_num_y)
+    return NULL;
+
+  return &_cell_grid[int(y) * _cell_grid_num_x + int(x)];
 }
 
 
 /**
  * @brief Finds the Cell for which a LocalCoords object resides.
  * @details Finds the Cell that a LocalCoords object is located inside by
- *          checking each of this Universe's Cells. Returns NULL if the
- *          LocalCoords is not in any of the Cells.
+ *          checking each of this Universe's neighbor Cells followed by the
+ *          Cells overlapping the LocalCoords' Cell search grid bin, or all
+ *          of the Universe's Cells if the LocalCoords is not in the grid.
+ *          Returns NULL if the LocalCoords is not in any of the Cells.
  * @param coords a pointer to the LocalCoords of interest
  * @return a pointer the Cell where the LocalCoords is located
  */
@@ -631,14 +698,30 @@ Cell* Universe::findCell(LocalCoords* coords) {
   if (coords->getCell() != NULL)
     cells = coords->getCell()->getNeighbors();
 
-  /* Add all of Universe's Cells to the back of neighbor Cells vector */
-  std::transform(_cells.begin(), _cells.end(),
-                 std::back_inserter(cells), pair_second(_cells));
+  /* Add the Cells in the LocalCoords' grid bin, or all of the Universe's
+   * Cells, to the back of neighbor Cells vector */
+  std::vector<Cell*>* grid_cells = getCellGridBin(coords);
+  if (grid_cells != NULL)
+    cells.insert(cells.end(), grid_cells->begin(), grid_cells->end());
+  else
+    std::transform(_cells.begin(), _cells.end(),
+                   std::back_inserter(cells), pair_second(_cells));
+
+  /* Count the search with this thread's counts, if it keeps them */
+  long* counts = NULL;
+  size_t offset = size_t(omp_get_thread_num()) * CELL_COUNTS_STRIDE;
+  if (offset < _cell_lookup_counts.size()) {
+    counts = &_cell_lookup_counts[offset];
+    counts[0]++;
+  }
 
   /* Loop over all Cells */
   for (iter = cells.begin(); iter != cells.end(); ++iter) {
     cell = (*iter);
 
+    if (counts != NULL)
+      counts[1]++;
+
     if (cell->containsCoords(coords)) {
 
       /* Set the Cell on this level */
@@ -652,8 +735,8 @@ Cell* Universe::findCell(LocalCoords* coords) {
        * Update coords to next level and continue search */
       else if (cell->getType() == FILL) {
 
-        LocalCoords* next_coords =
-            new LocalCoords(coords->getX(), coords->getY(), coords->getZ());
+        LocalCoords* next_coords = coords->getNextCreate(
+            coords->getX(), coords->getY(), coords->getZ());
         next_coords->setPhi(coords->getPhi());
 
         /* Apply translation to position in the next coords */
@@ -685,8 +768,6 @@ Cell* Universe::findCell(LocalCoords* coords) {
         Universe* univ = cell->getFillUniverse();
         next_coords->setUniverse(univ);
 
-        coords->setNext(next_coords);
-        next_coords->setPrev(coords);
         if (univ->getType() == SIMPLE)
           return univ->findCell(next_coords);
         else
@@ -746,6 +827,151 @@ void Universe::buildNeighbors() {
 }
 
 
+/**
+ * @brief Builds a uniform grid of the Cells overlapping each grid bin to
+ *        reduce the number of Cells tested by Universe::findCell(...).
+ * @details The grid spans the union of the finite bounding boxes of the
+ *          Universe's Cells, with roughly one bin per Cell. The Cells in each
+ *          bin are stored in the same order as in the Universe such that
+ *          Cell searches find the same Cells with and without the grid. No
+ *          grid is built for Universes with fewer than MIN_CELL_GRID_CELLS
+ *          Cells. This method must be called after the Universe's Cells have
+ *          been subdivided and is not thread safe.
+ */
+void Universe::buildCellGrid() {
+
+  clearCellGrid();
+
+  int num_cells = _cells.size();
+  if (num_cells < MIN_CELL_GRID_CELLS)
+    return;
+
+  /* Find the bounding box of each Cell and the union of the finite boxes */
+  std::vector<double> min_x, max_x, min_y, max_y;
+  double grid_min_x = INFINITY;
+  double grid_max_x = -INFINITY;
+  double grid_min_y = INFINITY;
+  double grid_max_y = -INFINITY;
+  std::map<int, Cell*>::iterator iter;
+
+  for (iter = _cells.begin(); iter != _cells.end(); ++iter) {
+    Cell* cell = iter->second;
+    min_x.push_back(cell->getMinX() - CELL_GRID_TOLERANCE);
+    max_x.push_back(cell->getMaxX() + CELL_GRID_TOLERANCE);
+    min_y.push_back(cell->getMinY() - CELL_GRID_TOLERANCE);
+    max_y.push_back(cell->getMaxY() + CELL_GRID_TOLERANCE);
+
+    if (min_x.back() > -INFINITY)
+      grid_min_x = std::min(grid_min_x, min_x.back());
+    if (max_x.back() < INFINITY)
+      grid_max_x = std::max(grid_max_x, max_x.back());
+    if (min_y.back() > -INFINITY)
+      grid_min_y = std::min(grid_min_y, min_y.back());
+    if (max_y.back() < INFINITY)
+      grid_max_y = std::max(grid_max_y, max_y.back());
+  }
+
+  /* A grid cannot be built if none of the Cells are bounded */
+  if (grid_min_x >= grid_max_x || grid_min_y >= grid_max_y)
+    return;
+
+  int num_bins = std::min(int(ceil(sqrt(double(num_cells)))),
+                          MAX_CELL_GRID_BINS);
+  _cell_grid_num_x = num_bins;
+  _cell_grid_num_y = num_bins;
+  _cell_grid_min_x = grid_min_x;
+  _cell_grid_min_y = grid_min_y;
+  _cell_grid_width_x = (grid_max_x - grid_min_x) / num_bins;
+  _cell_grid_width_y = (grid_max_y - grid_min_y) / num_bins;
+  _cell_grid.resize(num_bins * num_bins);
+
+  /* Add each Cell to all of the bins overlapped by its bounding box */
+  int c = 0;
+  for (iter = _cells.begin(); iter != _cells.end(); ++iter, ++c) {
+
+    double x0 = (min_x[c] - _cell_grid_min_x) / _cell_grid_width_x;
+    double x1 = (max_x[c] - _cell_grid_min_x) / _cell_grid_width_x;
+    double y0 = (min_y[c] - _cell_grid_min_y) / _cell_grid_width_y;
+    double y1 = (max_y[c] - _cell_grid_min_y) / _cell_grid_width_y;
+
+    /* Clamp the bin indices to the grid for unbounded Cells */
+    int first_x = int(std::min(std::max(x0, 0.), num_bins - 1.));
+    int last_x = int(std::min(std::max(x1, 0.), num_bins - 1.));
+    int first_y = int(std::min(std::max(y0, 0.), num_bins - 1.));
+    int last_y = int(std::min(std::max(y1, 0.), num_bins - 1.));
+
+    for (int j=first_y; j <= last_y; j++) {
+      for (int i=first_x; i <= last_x; i++)
+        _cell_grid[j * num_bins + i].push_back(iter->second);
+    }
+  }
+
+  log_printf(DEBUG, "Built a %d x %d Cell search grid for Universe ID = %d "
+             "with %d Cells", num_bins, num_bins, _id, num_cells);
+}
+
+
+/**
+ * @brief Deletes the Cell search grid built by Universe::buildCellGrid().
+ */
+void Universe::clearCellGrid() {
+  _cell_grid.clear();
+  _cell_grid_num_x = 0;
+  _cell_grid_num_y = 0;
+}
+
+
+/**
+ * @brief Returns the number of bins in the Universe's Cell search grid.
+ * @return the number of grid bins (0 if no grid has been built)
+ */
+int Universe::getNumCellGridBins() {
+  return _cell_grid.size();
+}
+
+
+/**
+ * @brief Returns the number of Cell searches performed by all Universes
+ *        since the counts were last reset.
+ * @return the number of Cell searches
+ */
+long Universe::getNumCellLookups() {
+
+  long num_lookups = 0;
+  for (size_t i=0; i < _cell_lookup_counts.size(); i += CELL_COUNTS_STRIDE)
+    num_lookups += _cell_lookup_counts[i];
+
+  return num_lookups;
+}
+
+
+/**
+ * @brief Returns the number of Cells tested for containment of a
+ *        LocalCoords by all Cell searches since the counts were last reset.
+ * @return the number of Cells tested
+ */
+long Universe::getNumCellTests() {
+
+  long num_tests = 0;
+  for (size_t i=0; i < _cell_lookup_counts.size(); i += CELL_COUNTS_STRIDE)
+    num_tests += _cell_lookup_counts[i+1];
+
+  return num_tests;
+}
+
+
+/**
+ * @brief Resets the counts of Cell searches and Cells tested to zero.
+ * @details Each thread counts its Cell searches separately without
+ *          synchronization, and the counts are only summed when queried.
+ *          Counts are kept for as many threads as OpenMP may use when this
+ *          method is called. It must not be called during a Cell search.
+ */
+void Universe::resetCellLookupCounts() {
+  _cell_lookup_counts.assign(omp_get_max_threads() * CELL_COUNTS_STRIDE, 0);
+}
+
+
 /**
  * @brief Convert the member attributes of this Universe to a character array.
  * @return a character array representing the Universe's attributes
@@ -1098,6 +1324,31 @@ std::map<int, Universe*> Lattice::getAllUniverses() {
 }
 
 
+/**
+ * @brief Returns the maximum number of nested Universe levels beneath and
+ *        including this Lattice.
+ * @return the maximum nesting depth of this Lattice
+ */
+int Lattice::getMaxNestingDepth() {
+
+  int max_depth = 0;
+  std::map<int, Universe*> unique_universes = getUniqueUniverses();
+  std::map<int, Universe*>::iterator iter;
+
+  for (iter = unique_universes.begin(); iter != unique_universes.end();
+       ++iter) {
+    Universe* univ = iter->second;
+    if (univ->getType() == SIMPLE)
+      max_depth = std::max(max_depth, univ->getMaxNestingDepth());
+    else
+      max_depth = std::max(max_depth,
+                           static_cast<Lattice*>(univ)->getMaxNestingDepth());
+  }
+
+  return max_depth + 1;
+}
+
+
 /**
  * @brief Set the number of Lattice cells along the x-axis.
  * @param num_x the number of Lattice cells along x
@@ -1390,13 +1641,8 @@ Cell* Lattice::findCell(LocalCoords* coords) {
       (-_width_z*_num_z/2.0 + _offset.getZ() + (lat_z + 0.5) * _width_z) +
       getOffset()->getZ();
 
-  /* Create a new LocalCoords object for the next level Universe */
-  LocalCoords* next_coords;
-
-  if (coords->getNext() == NULL)
-    next_coords = new LocalCoords(next_x, next_y, next_z);
-  else
-    next_coords = coords->getNext();
+  /* Get the LocalCoords object for the next level Universe */
+  LocalCoords* next_coords = coords->getNextCreate(next_x, next_y, next_z);
 
   Universe* univ = getUniverse(lat_x, lat_y, lat_z);
   next_coords->setUniverse(univ);
@@ -1408,9 +1654,6 @@ Cell* Lattice::findCell(LocalCoords* coords) {
   coords->setLatticeY(lat_y);
   coords->setLatticeZ(lat_z);
 
-  coords->setNext(next_coords);
-  next_coords->setPrev(coords);
-
   /* Search the next lowest level Universe for the Cell */
   return univ->findCell(next_coords);
 }
@@ -17,6 +17,7 @@
 #include <limits>
 #include <map>
 #include <vector>
+#include <omp.h>
 #endif
 
 
@@ -33,6 +34,18 @@ void reset_universe_id();
 void maximize_universe_id(int universe_id);
 
 
+/** The minimum number of Cells in a Universe for which a uniform grid of
+ *  the Cells overlapping each grid bin is built to accelerate Cell searches */
+#define MIN_CELL_GRID_CELLS 8
+
+/** The maximum number of grid bins along each axis of a Cell search grid */
+#define MAX_CELL_GRID_BINS 64
+
+/** The distance by which Cell bounding boxes are expanded when binned in a
+ *  Cell search grid such that points on a Cell's boundary are found */
+#define CELL_GRID_TOLERANCE 1E-6
+
+
 /**
  * @enum universeType
  * @brief The type of universe
@@ -81,6 +94,29 @@ protected:
    *  with a non-zero fission cross-section and is fissionable */
   bool _fissionable;
 
+  /** A uniform grid of the Cells whose bounding boxes overlap each grid bin,
+   *  in the order of the Cells in the Universe, indexed by x-y bin */
+  std::vector< std::vector<Cell*> > _cell_grid;
+
+  /** The number of Cell search grid bins along the x and y axes */
+  int _cell_grid_num_x;
+  int _cell_grid_num_y;
+
+  /** The minimum x and y coordinates of the Cell search grid */
+  double _cell_grid_min_x;
+  double _cell_grid_min_y;
+
+  /** The width of the Cell search grid bins along the x and y axes */
+  double _cell_grid_width_x;
+  double _cell_grid_width_y;
+
+  /** The number of Cell searches and Cells tested for containment over all
+   *  Universes by each thread, one cache line apart to avoid false sharing.
+   *  Counts are only kept by the threads present when last reset. */
+  static std::vector<long> _cell_lookup_counts;
+
+  std::vector<Cell*>* getCellGridBin(LocalCoords* coords);
+
 public:
 
   Universe(const int id=-1, const char* name="");
@@ -106,6 +142,7 @@ public:
   std::map<int, Cell*> getAllCells();
   std::map<int, Material*> getAllMaterials();
   std::map<int, Universe*> getAllUniverses();
+  int getMaxNestingDepth();
   bool isFissionable();
 
   void setName(const char* name);
@@ -117,6 +154,13 @@ public:
   void setFissionability(bool fissionable);
   void subdivideCells(double max_radius=INFINITY);
   void buildNeighbors();
+  void buildCellGrid();
+  void clearCellGrid();
+  int getNumCellGridBins();
+
+  static long getNumCellLookups();
+  static long getNumCellTests();
+  static void resetCellLookupCounts();
 
   virtual std::string toString();
   void printString();
@@ -184,6 +228,7 @@ public:
   std::map<int, Universe*> getUniqueUniverses();
   std::map<int, Cell*> getAllCells();
   std::map<int, Universe*> getAllUniverses();
+  int getMaxNestingDepth();
 
   void setNumX(int num_x);
   void setNumY(int num_y);
@@ -8,12 +8,16 @@
 VectorizedSolver::VectorizedSolver(TrackGenerator* track_generator) :
   CPUSolver(track_generator) {
 
-  if (_cmfd != NULL)
-    log_printf(ERROR, "The VectorizedSolver is not yet configured for CMFD");
-
   _delta_psi = NULL;
   _thread_taus = NULL;
   _thread_exponentials = NULL;
+  _thread_batch_fluxes = NULL;
+  _thread_batch_exponentials = NULL;
+  _thread_batch_sources = NULL;
+  _thread_batch_fsr_fluxes = NULL;
+  _num_unpadded_groups = 0;
+  _vectorization_type = GROUP_VECTORIZED;
+  _auto_vectorization = true;
 
   if (track_generator != NULL)
     setTrackGenerator(track_generator);
@@ -33,6 +37,11 @@ VectorizedSolver::~VectorizedSolver() {
     _boundary_flux = NULL;
   }
 
+  if (_start_flux != NULL) {
+    MM_FREE(_start_flux);
+    _start_flux = NULL;
+  }
+
   if (_scalar_flux != NULL && !_user_fluxes) {
     MM_FREE(_scalar_flux);
     _scalar_flux = NULL;
@@ -67,6 +76,26 @@ VectorizedSolver::~VectorizedSolver() {
     MM_FREE(_thread_exponentials);
     _thread_exponentials = NULL;
   }
+
+  if (_thread_batch_fluxes != NULL) {
+    MM_FREE(_thread_batch_fluxes);
+    _thread_batch_fluxes = NULL;
+  }
+
+  if (_thread_batch_exponentials != NULL) {
+    MM_FREE(_thread_batch_exponentials);
+    _thread_batch_exponentials = NULL;
+  }
+
+  if (_thread_batch_sources != NULL) {
+    MM_FREE(_thread_batch_sources);
+    _thread_batch_sources = NULL;
+  }
+
+  if (_thread_batch_fsr_fluxes != NULL) {
+    MM_FREE(_thread_batch_fsr_fluxes);
+    _thread_batch_fsr_fluxes = NULL;
+  }
 }
 
 
@@ -83,6 +112,18 @@ int VectorizedSolver::getNumVectorWidths() {
 }
 
 
+/**
+ * @brief Returns the loop vectorized in the transport sweep.
+ * @details Unless set by the user, the transport sweep is vectorized across
+ *          Tracks for problems with at most MAX_TRACK_VECTORIZED_GROUPS
+ *          energy groups and across energy groups otherwise.
+ * @return the vectorization type (GROUP_VECTORIZED or TRACK_VECTORIZED)
+ */
+vectorizationType VectorizedSolver::getVectorizationType() {
+  return _vectorization_type;
+}
+
+
 /**
  * @brief Sets the Geometry for the Solver.
  * @param geometry a pointer to the Geometry
@@ -90,6 +131,7 @@ int VectorizedSolver::getNumVectorWidths() {
 void VectorizedSolver::setGeometry(Geometry* geometry) {
 
   CPUSolver::setGeometry(geometry);
+  _num_unpadded_groups = _num_groups;
 
   /* Compute the number of SIMD vector widths needed to fit energy groups */
   _num_vector_lengths = (_num_groups / VEC_LENGTH) + 1;
@@ -97,7 +139,25 @@ void VectorizedSolver::setGeometry(Geometry* geometry) {
   /* Reset the number of energy groups by rounding up for the number
    * of vector widths needed to accomodate the energy groups */
   _num_groups = _num_vector_lengths * VEC_LENGTH;
-  _polar_times_groups = _num_groups * _num_polar;
+  _polar_times_groups = _num_groups * _num_polar_2;
+}
+
+
+/**
+ * @brief Sets the loop vectorized in the transport sweep.
+ * @details The default (GROUP_VECTORIZED) sweeps one Track at a time and
+ *          vectorizes the loops over energy groups, which are padded to a
+ *          multiple of the vector width. For few-group problems most of the
+ *          vector lanes are padding, so TRACK_VECTORIZED instead sweeps
+ *          VEC_LENGTH Tracks with the same azimuthal angle together with one
+ *          vector lane per Track. Setting the vectorization type overrides
+ *          the choice made from the number of energy groups.
+ * @param vectorization_type the vectorization type
+ */
+void VectorizedSolver::setVectorizationType(vectorizationType
+                                            vectorization_type) {
+  _vectorization_type = vectorization_type;
+  _auto_vectorization = false;
 }
 
 
@@ -151,6 +211,9 @@ void VectorizedSolver::initializeFluxArrays() {
   if (_boundary_flux != NULL)
     MM_FREE(_boundary_flux);
 
+  if (_start_flux != NULL)
+    MM_FREE(_start_flux);
+
   if (_scalar_flux != NULL && !_user_fluxes)
     MM_FREE(_scalar_flux);
 
@@ -168,9 +231,10 @@ void VectorizedSolver::initializeFluxArrays() {
   /* Allocate aligned memory for all flux arrays */
   try{
 
-    size = 2 * _tot_num_tracks * _num_groups * _num_polar;
+    size = 2 * _tot_num_tracks * _num_groups * _num_polar_2;
     size *= sizeof(FP_PRECISION);
     _boundary_flux = (FP_PRECISION*)MM_MALLOC(size, VEC_ALIGNMENT);
+    _start_flux = (FP_PRECISION*)MM_MALLOC(size, VEC_ALIGNMENT);
 
     size = _num_FSRs * _num_groups * sizeof(FP_PRECISION);
     _scalar_flux = (FP_PRECISION*)MM_MALLOC(size, VEC_ALIGNMENT);
@@ -185,6 +249,53 @@ void VectorizedSolver::initializeFluxArrays() {
   catch(std::exception &e) {
     log_printf(ERROR, "Could not allocate memory for the fluxes");
   }
+
+  _array_generation++;
+
+  /* Allocate thread-private scalar fluxes if requested by the user */
+  if (_flux_tally_type == THREAD_PRIVATE)
+    initializeThreadFluxes();
+
+  /* Allocate the thread-private arrays for batches of Tracks */
+  if (_vectorization_type == TRACK_VECTORIZED)
+    initializeBatchArrays();
+}
+
+
+/**
+ * @brief Allocates memory for the angular fluxes, exponentials, sources and
+ *        scalar flux contributions of a batch of Tracks for each thread.
+ * @details These arrays are used by the TRACK_VECTORIZED transport sweep and
+ *          store VEC_LENGTH values (one per Track in the batch) contiguously
+ *          for each polar angle and energy group.
+ */
+void VectorizedSolver::initializeBatchArrays() {
+
+  if (_thread_batch_fluxes != NULL)
+    MM_FREE(_thread_batch_fluxes);
+  if (_thread_batch_exponentials != NULL)
+    MM_FREE(_thread_batch_exponentials);
+  if (_thread_batch_sources != NULL)
+    MM_FREE(_thread_batch_sources);
+  if (_thread_batch_fsr_fluxes != NULL)
+    MM_FREE(_thread_batch_fsr_fluxes);
+
+  int size;
+
+  try{
+    size = _num_threads * _num_polar_2 * _num_unpadded_groups * VEC_LENGTH;
+    size *= sizeof(FP_PRECISION);
+    _thread_batch_fluxes = (FP_PRECISION*)MM_MALLOC(size, VEC_ALIGNMENT);
+    _thread_batch_exponentials = (FP_PRECISION*)MM_MALLOC(size, VEC_ALIGNMENT);
+
+    size = _num_threads * _num_unpadded_groups * VEC_LENGTH;
+    size *= sizeof(FP_PRECISION);
+    _thread_batch_sources = (FP_PRECISION*)MM_MALLOC(size, VEC_ALIGNMENT);
+    _thread_batch_fsr_fluxes = (FP_PRECISION*)MM_MALLOC(size, VEC_ALIGNMENT);
+  }
+  catch(std::exception &e) {
+    log_printf(ERROR, "Could not allocate memory for the Track batches");
+  }
 }
 
 
@@ -212,6 +323,8 @@ void VectorizedSolver::initializeSourceArrays() {
     log_printf(ERROR, "Could not allocate memory for FSR sources");
   }
 
+  _array_generation++;
+
   /* Initialize fixed sources to zero */
   memset(_fixed_sources, 0.0, size);
 
@@ -259,6 +372,7 @@ void VectorizedSolver::initializeFixedSources() {
 void VectorizedSolver::initializeFSRs() {
 
   CPUSolver::initializeFSRs();
+  _num_unpadded_groups = _geometry->getNumEnergyGroups();
 
   /* Compute the number of SIMD vector widths needed to fit energy groups */
   _num_vector_lengths = (_num_groups / VEC_LENGTH) + 1;
@@ -266,11 +380,40 @@ void VectorizedSolver::initializeFSRs() {
   /* Reset the number of energy groups by rounding up for the number
    * of vector widths needed to accomodate the energy groups */
   _num_groups = _num_vector_lengths * VEC_LENGTH;
-  _polar_times_groups = _num_groups * _num_polar;
+  _polar_times_groups = _num_groups * _num_polar_2;
+
+  /* Vectorize across Tracks if the groups would mostly be padding */
+  if (_auto_vectorization) {
+    if (_num_unpadded_groups <= MAX_TRACK_VECTORIZED_GROUPS)
+      _vectorization_type = TRACK_VECTORIZED;
+    else
+      _vectorization_type = GROUP_VECTORIZED;
+  }
+
+  log_printf(INFO, "Vectorizing the transport sweep across %s",
+             (_vectorization_type == TRACK_VECTORIZED) ?
+             "Tracks" : "energy groups");
 }
 
 
 
+/**
+ * @brief Initializes CMFD acceleration if it is attached to the Geometry.
+ * @details CMFD is not yet supported since its energy groups are mapped
+ *          from the unpadded MOC energy groups, and since the
+ *          TRACK_VECTORIZED sweep does not tally the CMFD surface currents.
+ */
+void VectorizedSolver::initializeCmfd() {
+
+  Cmfd* cmfd = _geometry->getCmfd();
+
+  if (cmfd != NULL && cmfd->isFluxUpdateOn())
+    log_printf(ERROR, "The VectorizedSolver is not yet configured for CMFD");
+
+  CPUSolver::initializeCmfd();
+}
+
+
 /**
  * @brief Normalizes all FSR scalar fluxes and Track boundary angular
  *        fluxes to the total fission source (times \f$ \nu \f$).
@@ -335,12 +478,14 @@ void VectorizedSolver::normalizeFluxes() {
 #endif
 
   /* Normalize the Track angular boundary fluxes */
-  size = 2 * _tot_num_tracks * _num_polar * _num_groups;
+  size = 2 * _tot_num_tracks * _num_polar_2 * _num_groups;
 
 #ifdef SINGLE
   cblas_sscal(size, norm_factor, _boundary_flux, 1);
+  cblas_sscal(size, norm_factor, _start_flux, 1);
 #else
   cblas_dscal(size, norm_factor, _boundary_flux, 1);
+  cblas_dscal(size, norm_factor, _start_flux, 1);
 #endif
 
   return;
@@ -413,6 +558,319 @@ void VectorizedSolver::computeFSRSources() {
 }
 
 
+/**
+ * @brief This method performs one transport sweep of all azimuthal angles,
+ *        Tracks, Track segments, polar angles and energy groups.
+ * @details With the GROUP_VECTORIZED type, each Track is swept in turn by
+ *          the CPUSolver's TransportSweep with the loops over energy groups
+ *          vectorized. With the TRACK_VECTORIZED type, the Tracks for each
+ *          azimuthal angle are divided into batches of VEC_LENGTH Tracks
+ *          which are swept together, one vector lane per Track.
+ */
+void VectorizedSolver::transportSweep() {
+
+  /* Segments formed on the fly are only swept with the group kernel */
+  if (_vectorization_type == GROUP_VECTORIZED ||
+      _track_generator->getSegmentFormation() == OTF_2D) {
+    CPUSolver::transportSweep();
+    return;
+  }
+
+  log_printf(DEBUG, "Track-vectorized transport sweep with %d OpenMP "
+             "threads", _num_threads);
+
+  /* Initialize flux in each FSR to zero */
+  flattenFSRFluxes(0.0);
+
+  /* Copy starting flux to current flux */
+  copyBoundaryFluxes();
+
+  /* Allocate thread-private fluxes if none exist for each thread */
+  if (_flux_tally_type == THREAD_PRIVATE &&
+      (_thread_scalar_flux == NULL ||
+       _num_thread_fluxes < omp_get_max_threads()))
+    initializeThreadFluxes();
+
+  /* Allocate the Track batch arrays if the sweep type was changed */
+  if (_thread_batch_fluxes == NULL)
+    initializeBatchArrays();
+
+  /* Load the flattened segment arrays and segment cross-sections */
+  initializeSegmentArrays();
+
+  Track** tracks = _track_generator->getTracks();
+  int num_azim_2 = _track_generator->getNumAzim() / 2;
+
+#pragma omp parallel
+  {
+    /* Loop over batches of parallel Tracks for each azimuthal angle */
+    for (int a=0; a < num_azim_2; a++) {
+
+      int num_xy = _track_generator->getNumX(a) + _track_generator->getNumY(a);
+      int num_batches = (num_xy + VEC_LENGTH - 1) / VEC_LENGTH;
+      int first_uid = tracks[a][0].getUid();
+
+#pragma omp for schedule(guided)
+      for (int b=0; b < num_batches; b++)
+        sweepTrackBatch(first_uid + b*VEC_LENGTH,
+                        std::min(VEC_LENGTH, num_xy - b*VEC_LENGTH));
+    }
+  }
+
+  /* Sum the thread-private fluxes into the FSR scalar fluxes */
+  if (_flux_tally_type == THREAD_PRIVATE)
+    reduceThreadFluxes();
+}
+
+
+/**
+ * @brief Sweeps a batch of Tracks with the same azimuthal angle in both
+ *        directions with one vector lane per Track.
+ * @details The angular fluxes of the Tracks are transposed such that the
+ *          fluxes of all Tracks in the batch for each polar angle and energy
+ *          group are contiguous. The s-th segments of all Tracks are then
+ *          attenuated together, with lanes masked off for Tracks with fewer
+ *          than s segments. The scalar flux contribution of each lane is
+ *          tallied into the FSR of its segment.
+ * @param first_uid the UID of the first Track in the batch
+ * @param num_batch_tracks the number of Tracks in the batch (at most
+ *        VEC_LENGTH)
+ */
+void VectorizedSolver::sweepTrackBatch(int first_uid, int num_batch_tracks) {
+
+  int tid = omp_get_thread_num();
+  int flux_size = _num_polar_2 * _num_unpadded_groups * VEC_LENGTH;
+  int source_size = _num_unpadded_groups * VEC_LENGTH;
+  FP_PRECISION* batch_flux = &_thread_batch_fluxes[tid*flux_size];
+  FP_PRECISION* batch_exponentials =
+      &_thread_batch_exponentials[tid*flux_size];
+  FP_PRECISION* batch_sources = &_thread_batch_sources[tid*source_size];
+  FP_PRECISION* batch_fsr_flux = &_thread_batch_fsr_fluxes[tid*source_size];
+  FP_PRECISION* track_flux;
+  FP_PRECISION weight, delta_psi;
+
+  /* Get the flattened segment arrays */
+  long* segment_offsets = _track_generator->getSegmentOffsets();
+  FP_PRECISION* segment_lengths = _track_generator->getSegmentLengths();
+  int* segment_fsr_ids = _track_generator->getSegmentFSRIds();
+  unsigned short* segment_material_ids =
+      _track_generator->getSegmentMaterialIds();
+
+  /* All Tracks in the batch share the same azimuthal angle */
+  int azim_index = _tracks[first_uid]->getAzimAngleIndex();
+
+  /* Find the segments of each Track in the batch */
+  long starts[VEC_LENGTH];
+  int num_segments[VEC_LENGTH];
+  int max_num_segments = 0;
+
+  for (int l=0; l < VEC_LENGTH; l++) {
+    if (l < num_batch_tracks) {
+      starts[l] = segment_offsets[first_uid+l];
+      num_segments[l] = segment_offsets[first_uid+l+1] - starts[l];
+      max_num_segments = std::max(max_num_segments, num_segments[l]);
+    }
+    else {
+      starts[l] = 0;
+      num_segments[l] = 0;
+    }
+  }
+
+  /* The segment data for each lane */
+  long segment_ids[VEC_LENGTH];
+  FP_PRECISION lengths[VEC_LENGTH];
+  int material_ids[VEC_LENGTH];
+  int fsr_ids[VEC_LENGTH];
+  bool active[VEC_LENGTH];
+
+  /* Sweep the batch in the forward and then the reverse direction */
+  for (int d=0; d < 2; d++) {
+
+    bool forward = (d == 0);
+
+    /* Transpose the Track angular fluxes into the batch */
+    memset(batch_flux, 0.0, flux_size * sizeof(FP_PRECISION));
+    for (int l=0; l < num_batch_tracks; l++) {
+      track_flux = getBoundaryFlux(first_uid+l, forward);
+      for (int p=0; p < _num_polar_2; p++) {
+        for (int e=0; e < _num_unpadded_groups; e++)
+          batch_flux(p,e,l) = track_flux(p,e);
+      }
+    }
+
+    /* Loop over the s-th segment of each Track in the batch */
+    for (int s=0; s < max_num_segments; s++) {
+
+      /* Gather the segment data for each lane */
+      for (int l=0; l < VEC_LENGTH; l++) {
+        active[l] = (s < num_segments[l]);
+        if (active[l]) {
+          segment_ids[l] = starts[l] + (forward ? s : num_segments[l]-1-s);
+          lengths[l] = segment_lengths[segment_ids[l]];
+          material_ids[l] = segment_material_ids[segment_ids[l]];
+          fsr_ids[l] = segment_fsr_ids[segment_ids[l]];
+        }
+        else {
+          segment_ids[l] = 0;
+          lengths[l] = 0.;
+          material_ids[l] = 0;
+          fsr_ids[l] = -1;
+        }
+      }
+
+      computeBatchExponentials(segment_ids, lengths, material_ids, active,
+                               batch_exponentials);
+
+      /* Gather the reduced sources for each lane */
+      for (int e=0; e < _num_unpadded_groups; e++) {
+        for (int l=0; l < VEC_LENGTH; l++)
+          batch_sources(e,l) = active[l] ? _reduced_sources(fsr_ids[l],e) : 0.;
+      }
+
+      /* Attenuate the angular fluxes of all Tracks in the batch */
+      memset(batch_fsr_flux, 0.0, source_size * sizeof(FP_PRECISION));
+      for (int p=0; p < _num_polar_2; p++) {
+        weight = _quadrature->getWeightInline(azim_index, p);
+        for (int e=0; e < _num_unpadded_groups; e++) {
+
+          /* Loop over the Tracks in the batch */
+#pragma simd vectorlength(VEC_LENGTH) private(delta_psi)
+          for (int l=0; l < VEC_LENGTH; l++) {
+            delta_psi = (batch_flux(p,e,l) - batch_sources(e,l)) *
+                batch_exponentials(p,e,l);
+            batch_fsr_flux(e,l) += delta_psi * weight;
+            batch_flux(p,e,l) -= delta_psi;
+          }
+        }
+      }
+
+      /* Tally the scalar flux contribution of each lane into its FSR */
+      for (int l=0; l < num_batch_tracks; l++) {
+
+        if (!active[l])
+          continue;
+
+        /* Increment this thread's private FSR scalar flux without locking */
+        if (_flux_tally_type == THREAD_PRIVATE) {
+          for (int e=0; e < _num_unpadded_groups; e++)
+            _thread_scalar_flux(tid,fsr_ids[l],e) += batch_fsr_flux(e,l);
+        }
+
+        /* Atomically increment the FSR scalar flux */
+        else {
+          omp_set_lock(&_FSR_locks[fsr_ids[l]]);
+          for (int e=0; e < _num_unpadded_groups; e++)
+            _scalar_flux(fsr_ids[l],e) += batch_fsr_flux(e,l);
+          omp_unset_lock(&_FSR_locks[fsr_ids[l]]);
+        }
+      }
+    }
+
+    /* Transpose the angular fluxes back and transfer them at the boundary */
+    for (int l=0; l < num_batch_tracks; l++) {
+      track_flux = getBoundaryFlux(first_uid+l, forward);
+      for (int p=0; p < _num_polar_2; p++) {
+        for (int e=0; e < _num_unpadded_groups; e++)
+          track_flux(p,e) = batch_flux(p,e,l);
+      }
+      transferBoundaryFlux(first_uid+l, azim_index, forward, track_flux);
+    }
+  }
+}
+
+
+/**
+ * @brief Computes the exponentials in the transport equation for the
+ *        current segment of each Track in a batch.
+ * @details The exponentials \f$ 1 - exp(-\frac{\Sigma_t * l}{sin(\theta)})
+ *          \f$ are stored for each polar angle and energy group with the
+ *          values for all lanes contiguous. The exponentials for inactive
+ *          lanes are set to zero such that their angular fluxes are left
+ *          unchanged.
+ * @param segment_ids the index of each lane's segment in the flattened
+ *        segment arrays
+ * @param lengths the length of each lane's segment (cm)
+ * @param material_ids the compact Material index of each lane's segment
+ * @param active whether each lane has a segment
+ * @param batch_exponentials the array to store the exponentials
+ */
+void VectorizedSolver::computeBatchExponentials(long* segment_ids,
+                                                FP_PRECISION* lengths,
+                                                int* material_ids,
+                                                bool* active,
+                                                FP_PRECISION*
+                                                batch_exponentials) {
+
+  FP_PRECISION* sigma_t;
+
+  /* Copy the precomputed exponentials from the exponential cache */
+  if (_exp_cache != NULL) {
+    for (int l=0; l < VEC_LENGTH; l++) {
+      if (!active[l])
+        continue;
+      for (int e=0; e < _num_unpadded_groups; e++) {
+        for (int p=0; p < _num_polar_2; p++)
+          batch_exponentials(p,e,l) = _exp_cache(segment_ids[l],e,p);
+      }
+    }
+  }
+
+  /* Evaluate the exponentials using the linear interpolation table */
+  else if (_exp_evaluator->isUsingInterpolation()) {
+    FP_PRECISION tau;
+
+    for (int l=0; l < VEC_LENGTH; l++) {
+      sigma_t = &_segment_sigma_t[material_ids[l] * _num_groups];
+      for (int e=0; e < _num_unpadded_groups; e++) {
+        tau = lengths[l] * sigma_t[e];
+        for (int p=0; p < _num_polar_2; p++)
+          batch_exponentials(p,e,l) =
+              _exp_evaluator->computeExponential(tau, p);
+      }
+    }
+  }
+
+  /* Evalute the exponentials using the intrinsic exp(...) function */
+  else {
+
+    FP_PRECISION sin_theta;
+    int size = _num_polar_2 * _num_unpadded_groups * VEC_LENGTH;
+
+    /* Initialize the tau argument for the exponentials */
+    for (int p=0; p < _num_polar_2; p++) {
+      sin_theta = _quadrature->getSinTheta(0, p);
+      for (int l=0; l < VEC_LENGTH; l++) {
+        sigma_t = &_segment_sigma_t[material_ids[l] * _num_groups];
+        for (int e=0; e < _num_unpadded_groups; e++)
+          batch_exponentials(p,e,l) = -sigma_t[e] * lengths[l] / sin_theta;
+      }
+    }
+
+    /* Evaluate the negative of the exponentials using Intel's MKL */
+#ifdef SINGLE
+    vsExp(size, batch_exponentials, batch_exponentials);
+#else
+    vdExp(size, batch_exponentials, batch_exponentials);
+#endif
+
+    /* Compute one minus the exponentials */
+#pragma simd vectorlength(VEC_LENGTH)
+    for (int i=0; i < size; i++)
+      batch_exponentials[i] = 1.0 - batch_exponentials[i];
+  }
+
+  /* Leave the angular fluxes unchanged in lanes without a segment */
+  for (int l=0; l < VEC_LENGTH; l++) {
+    if (active[l])
+      continue;
+    for (int e=0; e < _num_unpadded_groups; e++) {
+      for (int p=0; p < _num_polar_2; p++)
+        batch_exponentials(p,e,l) = 0.;
+    }
+  }
+}
+
+
 /**
  * @brief Add the source term contribution in the transport equation to
  *        the FSR scalar flux
@@ -433,11 +891,6 @@ void VectorizedSolver::addSourceToScalarFlux() {
     /* Loop over each energy group vector length */
     for (int v=0; v < _num_vector_lengths; v++) {
 
-      /* Loop over energy groups within this vector */
-#pragma simd vectorlength(VEC_LENGTH)
-      for (int e=v*VEC_LENGTH; e < (v+1)*VEC_LENGTH; e++)
-        _scalar_flux(r,e) *= 0.5;
-
       /* Loop over energy groups within this vector */
 #pragma simd vectorlength(VEC_LENGTH)
       for (int e=v*VEC_LENGTH; e < (v+1)*VEC_LENGTH; e++)
@@ -520,29 +973,32 @@ void VectorizedSolver::computeKeff() {
  * @details This method integrates the angular flux for a Track segment across
  *        energy groups and polar angles, and tallies it into the FSR scalar
  *        flux, and updates the Track's angular flux.
- * @param curr_segment a pointer to the Track segment of interest
+ * @param segment_id the index of the segment in the flattened segment arrays
+ * @param length the length of the segment (cm)
+ * @param material_id the compact Material index of the segment
+ * @param fsr_id the ID of the FSR in which the segment resides
  * @param azim_index a pointer to the azimuthal angle index for this segment
  * @param track_flux a pointer to the Track's angular flux
  * @param fsr_flux a pointer to the temporary FSR flux buffer
  */
-void VectorizedSolver::tallyScalarFlux(segment* curr_segment,
+void VectorizedSolver::tallyScalarFlux(long segment_id, FP_PRECISION length,
+                                       int material_id, int fsr_id,
                                        int azim_index,
                                        FP_PRECISION* track_flux,
                                        FP_PRECISION* fsr_flux) {
 
   int tid = omp_get_thread_num();
-  int fsr_id = curr_segment->_region_id;
   FP_PRECISION* delta_psi = &_delta_psi[tid*_num_groups];
   FP_PRECISION* exponentials = &_thread_exponentials[tid*_polar_times_groups];
 
-  computeExponentials(curr_segment, exponentials);
+  computeExponentials(segment_id, length, material_id, exponentials);
 
   /* Set the FSR scalar flux buffer to zero */
   memset(fsr_flux, 0.0, _num_groups * sizeof(FP_PRECISION));
 
   /* Tally the flux contribution from segment to FSR's scalar flux */
   /* Loop over polar angles */
-  for (int p=0; p < _num_polar; p++) {
+  for (int p=0; p < _num_polar_2; p++) {
 
     /* Loop over each energy group vector length */
     for (int v=0; v < _num_vector_lengths; v++) {
@@ -560,7 +1016,7 @@ void VectorizedSolver::tallyScalarFlux(segment* curr_segment,
       /* Loop over energy groups within this vector */
 #pragma simd vectorlength(VEC_LENGTH)
       for (int e=v*VEC_LENGTH; e < (v+1)*VEC_LENGTH; e++)
-        fsr_flux[e] += delta_psi[e] * _polar_weights(azim_index,p);
+        fsr_flux[e] += delta_psi[e] * _quadrature->getWeightInline(azim_index,p);
 
       /* Loop over energy groups within this vector */
 #pragma simd vectorlength(VEC_LENGTH)
@@ -569,18 +1025,31 @@ void VectorizedSolver::tallyScalarFlux(segment* curr_segment,
     }
   }
 
+  /* Increment this thread's private FSR scalar flux without locking */
+  if (_flux_tally_type == THREAD_PRIVATE) {
+#ifdef SINGLE
+    vsAdd(_num_groups, &_thread_scalar_flux(tid,fsr_id,0), fsr_flux,
+          &_thread_scalar_flux(tid,fsr_id,0));
+#else
+    vdAdd(_num_groups, &_thread_scalar_flux(tid,fsr_id,0), fsr_flux,
+          &_thread_scalar_flux(tid,fsr_id,0));
+#endif
+  }
+
   /* Atomically increment the FSR scalar flux from the temporary array */
-  omp_set_lock(&_FSR_locks[fsr_id]);
-  {
+  else {
+    omp_set_lock(&_FSR_locks[fsr_id]);
+    {
 #ifdef SINGLE
-    vsAdd(_num_groups, &_scalar_flux(fsr_id,0), fsr_flux,
-          &_scalar_flux(fsr_id,0));
+      vsAdd(_num_groups, &_scalar_flux(fsr_id,0), fsr_flux,
+            &_scalar_flux(fsr_id,0));
 #else
-    vdAdd(_num_groups, &_scalar_flux(fsr_id,0), fsr_flux,
-          &_scalar_flux(fsr_id,0));
+      vdAdd(_num_groups, &_scalar_flux(fsr_id,0), fsr_flux,
+            &_scalar_flux(fsr_id,0));
 #endif
+    }
+    omp_unset_lock(&_FSR_locks[fsr_id]);
   }
-  omp_unset_lock(&_FSR_locks[fsr_id]);
 }
 
 
@@ -588,22 +1057,35 @@ void VectorizedSolver::tallyScalarFlux(segment* curr_segment,
  * @brief Computes an array of the exponentials in the transport equation,
  *        \f$ exp(-\frac{\Sigma_t * l}{sin(\theta)}) \f$, for each energy group
  *        and polar angle for a given Track segment.
- * @param curr_segment pointer to the Track segment of interest
+ * @details If the exponential cache is in use, the precomputed exponentials
+ *          for the segment are copied from the cache.
+ * @param segment_id the index of the segment in the flattened segment arrays
+ * @param length the length of the segment (cm)
+ * @param material_id the compact Material index of the segment
  * @param exponentials the array to store the exponential values
  */
-void VectorizedSolver::computeExponentials(segment* curr_segment,
+void VectorizedSolver::computeExponentials(long segment_id,
+                                           FP_PRECISION length,
+                                           int material_id,
                                            FP_PRECISION* exponentials) {
 
-  FP_PRECISION length = curr_segment->_length;
-  FP_PRECISION* sigma_t = curr_segment->_material->getSigmaT();
+  FP_PRECISION* sigma_t = &_segment_sigma_t[material_id * _num_groups];
+
+  /* Copy the precomputed exponentials from the exponential cache */
+  if (_exp_cache != NULL) {
+    for (int e=0; e < _num_groups; e++) {
+      for (int p=0; p < _num_polar_2; p++)
+        exponentials(p,e) = _exp_cache(segment_id,e,p);
+    }
+  }
 
   /* Evaluate the exponentials using the linear interpolation table */
-  if (_exp_evaluator->isUsingInterpolation()) {
+  else if (_exp_evaluator->isUsingInterpolation()) {
     FP_PRECISION tau;
 
     for (int e=0; e < _num_groups; e++) {
       tau = length * sigma_t[e];
-      for (int p=0; p < _num_polar; p++)
+      for (int p=0; p < _num_polar_2; p++)
         exponentials(p,e) = _exp_evaluator->computeExponential(tau, p);
     }
   }
@@ -612,11 +1094,10 @@ void VectorizedSolver::computeExponentials(segment* curr_segment,
   else {
 
     int tid = omp_get_thread_num();
-    FP_PRECISION* sin_thetas = _polar_quad->getSinThetas();
     FP_PRECISION* taus = &_thread_taus[tid*_polar_times_groups];
 
     /* Initialize the tau argument for the exponentials */
-    for (int p=0; p < _num_polar; p++) {
+    for (int p=0; p < _num_polar_2; p++) {
 
       for (int v=0; v < _num_vector_lengths; v++) {
 
@@ -626,7 +1107,7 @@ void VectorizedSolver::computeExponentials(segment* curr_segment,
 
 #pragma simd vectorlength(VEC_LENGTH)
         for (int e=v*VEC_LENGTH; e < (v+1)*VEC_LENGTH; e++)
-          taus(p,e) /= sin_thetas[p];
+          taus(p,e) /= _quadrature->getSinTheta(0, p);
       }
     }
 
@@ -638,7 +1119,7 @@ void VectorizedSolver::computeExponentials(segment* curr_segment,
 #endif
 
     /* Compute one minus the exponentials */
-    for (int p=0; p < _num_polar; p++) {
+    for (int p=0; p < _num_polar_2; p++) {
 
       for (int v=0; v < _num_vector_lengths; v++) {
 
@@ -683,10 +1164,10 @@ void VectorizedSolver::transferBoundaryFlux(int track_id, int azim_index,
     track_out_id = _tracks[track_id]->getTrackIn()->getUid();
   }
 
-  FP_PRECISION* track_out_flux = &_boundary_flux(track_out_id,0,0,start);
+  FP_PRECISION* track_out_flux = &_start_flux(track_out_id,0,0,start);
 
   /* Loop over polar angles and energy groups */
-  for (int p=0; p < _num_polar; p++) {
+  for (int p=0; p < _num_polar_2; p++) {
 
     /* Loop over each energy group vector length */
     for (int v=0; v < _num_vector_lengths; v++) {
@@ -27,6 +27,41 @@
  *  Track segment for each polar angle and energy group */
 #define exponentials(p,e) (exponentials[(p)*_num_groups + (e)])
 
+/** Indexing scheme for the angular fluxes of a batch of Tracks for each
+ *  polar angle, energy group and Track (SIMD lane) in the batch */
+#define batch_flux(p,e,l) \
+  (batch_flux[((p)*_num_unpadded_groups + (e))*VEC_LENGTH + (l)])
+
+/** Indexing scheme for the exponentials for the current segment of each
+ *  Track (SIMD lane) in a batch for each polar angle and energy group */
+#define batch_exponentials(p,e,l) \
+  (batch_exponentials[((p)*_num_unpadded_groups + (e))*VEC_LENGTH + (l)])
+
+/** Indexing scheme for the reduced sources and scalar flux contributions of
+ *  the current segment of each Track (SIMD lane) in a batch */
+#define batch_sources(e,l) (batch_sources[(e)*VEC_LENGTH + (l)])
+#define batch_fsr_flux(e,l) (batch_fsr_flux[(e)*VEC_LENGTH + (l)])
+
+/** The largest number of energy groups for which the VectorizedSolver
+ *  vectorizes the transport sweep across Tracks rather than energy groups
+ *  by default */
+#define MAX_TRACK_VECTORIZED_GROUPS (VEC_LENGTH / 2)
+
+
+/**
+ * @enum vectorizationType
+ * @brief The loop vectorized with SIMD instructions in the transport sweep.
+ */
+enum vectorizationType {
+
+  /** Sweep one Track at a time, with one SIMD lane per energy group */
+  GROUP_VECTORIZED,
+
+  /** Sweep a batch of VEC_LENGTH Tracks with the same azimuthal angle at a
+   *  time, with one SIMD lane per Track */
+  TRACK_VECTORIZED
+};
+
 /**
  * @class VectorizedSolver VectorizedSolver.h "src/VectorizedSolver.h"
  * @brief This is a subclass of the CPUSolver class which uses memory-aligned
@@ -43,6 +78,27 @@ protected:
   /** Number of energy groups divided by vector widths (VEC_LENGTH) */
   int _num_vector_lengths;
 
+  /** The number of energy groups before padding to the vector width */
+  int _num_unpadded_groups;
+
+  /** The loop vectorized in the transport sweep */
+  vectorizationType _vectorization_type;
+
+  /** Whether the vectorization type is chosen from the number of groups */
+  bool _auto_vectorization;
+
+  /** The angular fluxes for a batch of Tracks for each thread */
+  FP_PRECISION* _thread_batch_fluxes;
+
+  /** The exponentials for a batch of segments for each thread */
+  FP_PRECISION* _thread_batch_exponentials;
+
+  /** The reduced sources for a batch of segments for each thread */
+  FP_PRECISION* _thread_batch_sources;
+
+  /** The scalar flux contributions of a batch of segments for each thread */
+  FP_PRECISION* _thread_batch_fsr_fluxes;
+
   /** The change in angular flux along a track segment for each energy group */
   FP_PRECISION* _delta_psi;
 
@@ -53,19 +109,28 @@ protected:
    *  each thread in each energy group and polar angle */
   FP_PRECISION* _thread_exponentials;
 
-  void tallyScalarFlux(segment* curr_segment, int azim_index,
+  void tallyScalarFlux(long segment_id, FP_PRECISION length,
+                       int material_id, int fsr_id, int azim_index,
                        FP_PRECISION* track_flux, FP_PRECISION* fsr_flux);
   void transferBoundaryFlux(int track_id, int azim_index, bool direction,
                             FP_PRECISION* track_flux);
-  void computeExponentials(segment* curr_segment, FP_PRECISION* exponentials);
+  void computeExponentials(long segment_id, FP_PRECISION length,
+                           int material_id, FP_PRECISION* exponentials);
+  void computeBatchExponentials(long* segment_ids, FP_PRECISION* lengths,
+                                int* material_ids, bool* active,
+                                FP_PRECISION* batch_exponentials);
+  void sweepTrackBatch(int first_uid, int num_batch_tracks);
+  void initializeBatchArrays();
 
 public:
   VectorizedSolver(TrackGenerator* track_generator=NULL);
   virtual ~VectorizedSolver();
 
   int getNumVectorWidths();
+  vectorizationType getVectorizationType();
 
   void setGeometry(Geometry* geometry);
+  void setVectorizationType(vectorizationType vectorization_type);
 
   void initializeExpEvaluator();
   void initializeMaterials(solverMode mode=ADJOINT);
@@ -73,9 +138,11 @@ public:
   void initializeSourceArrays();
   void initializeFixedSources();
   void initializeFSRs();
+  void initializeCmfd();
 
   void normalizeFluxes();
   void computeFSRSources();
+  void transportSweep();
   void addSourceToScalarFlux();
   void computeKeff();
 };
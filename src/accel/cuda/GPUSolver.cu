@@ -1209,6 +1209,13 @@ void GPUSolver::initializeTracks() {
 
   log_printf(INFO, "Initializing tracks on the GPU...");
 
+  if (_track_generator->getSegmentFormation() != EXPLICIT_2D)
+    log_printf(ERROR, "Unable to initialize Tracks on the GPU since the "
+               "GPUSolver only supports explicit 2D segments");
+
+  /* The segments of each Track are copied to the device */
+  _track_generator->initializeTrackSegments();
+
   /* Delete old Tracks array if it exists */
   if (_dev_tracks != NULL)
     cudaFree(_dev_tracks);
@@ -1860,3 +1867,13 @@ void GPUSolver::computeFSRFissionRates(double* fission_rates, int num_FSRs) {
   cudaFree(dev_fission_rates);
   delete [] host_fission_rates;
 }
+
+
+/**
+ * @brief Anderson acceleration is not supported by the GPUSolver.
+ * @param k_ratio the ratio of the previous to the current eigenvalue
+ */
+void GPUSolver::accelerateFluxes(FP_PRECISION k_ratio) {
+  log_printf(ERROR, "Anderson acceleration is not supported by the "
+             "GPUSolver");
+}
@@ -149,6 +149,7 @@ public:
   void addSourceToScalarFlux();
   void computeKeff();
   double computeResidual(residualType res_type);
+  void accelerateFluxes(FP_PRECISION k_ratio);
 
   void computeFSRFissionRates(double* fission_rates, int num_FSRs);
 };
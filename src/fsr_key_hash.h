@@ -0,0 +1,35 @@
+/**
+ * @file fsr_key_hash.h
+ * @brief The std::hash specialization for fsr_key structs.
+ * @details The specialization is kept out of Geometry.h so that it is seen
+ *          by the C++ compiler but not parsed by SWIG, which does not follow
+ *          #include directives. This header must be included after the
+ *          fsr_key struct is defined.
+ */
+
+#ifndef FSR_KEY_HASH_H_
+#define FSR_KEY_HASH_H_
+
+#include <functional>
+#include <vector>
+
+namespace std {
+
+/**
+ * @brief Hash function for fsr_key structs used by the ParallelHashMap.
+ * @details The integer components are combined in order with the same
+ *          mixing step as boost::hash_combine.
+ */
+template<>
+struct hash<fsr_key> {
+  size_t operator()(const fsr_key& key) const {
+    size_t seed = key._components.size();
+    std::vector<int>::const_iterator iter;
+    for (iter = key._components.begin(); iter != key._components.end(); ++iter)
+      seed ^= size_t(*iter) + 0x9e3779b9 + (seed << 6) + (seed >> 2);
+    return seed;
+  }
+};
+}
+
+#endif /* FSR_KEY_HASH_H_ */
@@ -9,15 +9,32 @@
  *          dominant eigenvalue and eigenvector using the Power method. The
  *          eigenvalue is returned and the input X Vector is modified in
  *          place to be the corresponding eigenvector.
+ *
+ *          If a positive Wielandt shift \f$ \delta \f$ is given, each
+ *          power iteration after the first instead solves the shifted
+ *          system \f$ (A - M / k_s) X = M X_{old} \f$ with
+ *          \f$ k_s = k + \delta \f$ for the current eigenvalue estimate
+ *          \f$ k \f$. This reduces the dominance ratio of the iteration,
+ *          and hence the number of power iterations, at the cost of linear
+ *          systems which are more expensive to solve. Small shifts
+ *          converge in fewer power iterations.
  * @param A the loss + streaming Matrix object
  * @param M the fission gain Matrix object
  * @param X the flux Vector object
  * @param tol the power method and linear solve source convergence threshold
  * @param SOR_factor the successive over-relaxation factor
+ * @param solver_type the method used to solve each linear system
+ * @param wielandt_shift the shift of the eigenvalue (0 for no shift)
+ * @param num_iterations the number of power iterations (output, optional)
+ * @param num_linear_iterations the total number of linear solver iterations
+ *        (output, optional)
  * @return k_eff the dominant eigenvalue
  */
 FP_PRECISION eigenvalueSolve(Matrix* A, Matrix* M, Vector* X, FP_PRECISION tol,
-                             FP_PRECISION SOR_factor) {
+                             FP_PRECISION SOR_factor,
+                             linearSolverType solver_type,
+                             FP_PRECISION wielandt_shift, int* num_iterations,
+                             int* num_linear_iterations) {
 
   log_printf(DEBUG, "Computing the Matrix-Vector eigenvalue...");
 
@@ -46,7 +63,9 @@ FP_PRECISION eigenvalueSolve(Matrix* A, Matrix* M, Vector* X, FP_PRECISION tol,
   Vector old_source(cell_locks, num_x, num_y, num_groups);
   Vector new_source(cell_locks, num_x, num_y, num_groups);
   FP_PRECISION residual, _k_eff;
+  FP_PRECISION k_ratio, shift = 0.;
   int iter;
+  int linear_iters = 0;
 
   /* Compute and normalize the initial source */
   matrixMultiplication(M, X, &old_source);
@@ -56,17 +75,27 @@ FP_PRECISION eigenvalueSolve(Matrix* A, Matrix* M, Vector* X, FP_PRECISION tol,
   /* Power iteration Matrix-Vector solver */
   for (iter = 0; iter < MAX_LINALG_POWER_ITERATIONS; iter++) {
 
-    /* Solve X = A^-1 * old_source */
-    linearSolve(A, M, X, &old_source, tol*1e1, SOR_factor);
+    /* Solve X = (A - shift * M)^-1 * old_source */
+    if (solver_type == BICGSTAB)
+      linear_iters += linearSolveBiCGSTAB(A, M, X, &old_source, tol*1e-1,
+                                          shift);
+    else
+      linear_iters += linearSolve(A, M, X, &old_source, tol*1e1, SOR_factor,
+                                  shift);
 
     /* Compute the new source */
     matrixMultiplication(M, X, &new_source);
 
-    /* Compute and set keff */
-    _k_eff = new_source.getSum() / num_rows;
+    /* Compute the ratio of the new to old source and set keff */
+    k_ratio = new_source.getSum() / num_rows;
+    _k_eff = 1.0 / (1.0 / k_ratio + shift);
 
-    /* Scale the new source by 1 / k_eff */
-    new_source.scaleByValue(1.0 / _k_eff);
+    /* Scale the new source by the ratio of the new to old source */
+    new_source.scaleByValue(1.0 / k_ratio);
+
+    /* Shift the eigenvalue for the next iteration */
+    if (wielandt_shift > 0.)
+      shift = 1.0 / (_k_eff + wielandt_shift);
 
     /* Compute the residual */
     residual = computeRMSE(&new_source, &old_source, true);
@@ -84,6 +113,11 @@ FP_PRECISION eigenvalueSolve(Matrix* A, Matrix* M, Vector* X, FP_PRECISION tol,
 
   log_printf(DEBUG, "Matrix-Vector eigenvalue solve iterations: %d", iter);
 
+  if (num_iterations != NULL)
+    *num_iterations = std::min(iter + 1, MAX_LINALG_POWER_ITERATIONS);
+  if (num_linear_iterations != NULL)
+    *num_linear_iterations = linear_iters;
+
   return _k_eff;
 }
 
@@ -103,9 +137,11 @@ FP_PRECISION eigenvalueSolve(Matrix* A, Matrix* M, Vector* X, FP_PRECISION tol,
  * @param B the source Vector object
  * @param tol the power method and linear solve source convergence threshold
  * @param SOR_factor the successive over-relaxation factor
+ * @param shift the multiple of the M Matrix subtracted from the A Matrix
+ * @return the number of iterations
  */
-void linearSolve(Matrix* A, Matrix* M, Vector* X, Vector* B, FP_PRECISION tol,
-                 FP_PRECISION SOR_factor) {
+int linearSolve(Matrix* A, Matrix* M, Vector* X, Vector* B, FP_PRECISION tol,
+                FP_PRECISION SOR_factor, FP_PRECISION shift) {
 
   /* Check for consistency of matrix and vector dimensions */
   if (A->getNumX() != B->getNumX() || A->getNumX() != X->getNumX() ||
@@ -142,6 +178,9 @@ void linearSolve(Matrix* A, Matrix* M, Vector* X, Vector* B, FP_PRECISION tol,
   int* JLU = A->getJLU();
   FP_PRECISION* DIAG = A->getDiag();
   FP_PRECISION* lu = A->getLU();
+  int* IM = M->getIA();
+  int* JM = M->getJA();
+  FP_PRECISION* m = M->getA();
   FP_PRECISION* x = X->getArray();
   FP_PRECISION* b = B->getArray();
   int row;
@@ -173,7 +212,20 @@ void linearSolve(Matrix* A, Matrix* M, Vector* X, Vector* B, FP_PRECISION tol,
               val += lu[i] * x[JLU[i]];
 
             /* Update the flux for this row */
-            x[row] += SOR_factor * ((b[row] - val) / DIAG[row] - x[row]);
+            if (shift == 0.)
+              x[row] += SOR_factor * ((b[row] - val) / DIAG[row] - x[row]);
+
+            /* Subtract the shifted fission terms from the matrix */
+            else {
+              FP_PRECISION diag = DIAG[row];
+              for (int i = IM[row]; i < IM[row+1]; i++) {
+                if (JM[i] == row)
+                  diag -= shift * m[i];
+                else
+                  val -= shift * m[i] * x[JM[i]];
+              }
+              x[row] += SOR_factor * ((b[row] - val) / diag - x[row]);
+            }
           }
         }
       }
@@ -198,6 +250,269 @@ void linearSolve(Matrix* A, Matrix* M, Vector* X, Vector* B, FP_PRECISION tol,
   }
 
   log_printf(DEBUG, "Linear solve iterations: %d", iter);
+
+  return iter;
+}
+
+
+/**
+ * @brief Applies a block Jacobi preconditioner to an array.
+ * @details Each block is the LU factorization, with row pivots, of the
+ *          coupling between the groups in a cell.
+ * @param blocks the factorized blocks for each cell
+ * @param pivots the row pivots of the factorization of each block
+ * @param num_cells the number of cells
+ * @param num_groups the number of groups in each cell
+ * @param x the array to precondition
+ * @param y the array for the preconditioned result
+ */
+static void applyBlockJacobi(FP_PRECISION* blocks, int* pivots, int num_cells,
+                             int num_groups, FP_PRECISION* x,
+                             FP_PRECISION* y) {
+
+#pragma omp parallel for
+  for (int cell = 0; cell < num_cells; cell++) {
+
+    FP_PRECISION* block = &blocks[cell * num_groups * num_groups];
+    int* pivot = &pivots[cell * num_groups];
+    FP_PRECISION* cell_y = &y[cell * num_groups];
+
+    for (int g = 0; g < num_groups; g++)
+      cell_y[g] = x[cell * num_groups + g];
+
+    /* Forward substitution with the row pivots */
+    for (int g = 0; g < num_groups; g++) {
+      std::swap(cell_y[g], cell_y[pivot[g]]);
+      for (int h = 0; h < g; h++)
+        cell_y[g] -= block[g * num_groups + h] * cell_y[h];
+    }
+
+    /* Back substitution */
+    for (int g = num_groups-1; g >= 0; g--) {
+      for (int h = g+1; h < num_groups; h++)
+        cell_y[g] -= block[g * num_groups + h] * cell_y[h];
+      cell_y[g] /= block[g * num_groups + g];
+    }
+  }
+}
+
+
+/**
+ * @brief Computes the product of a shifted Matrix and an array.
+ * @details This computes \f$ y = (A - shift M) x \f$ using the CSR form of
+ *          each Matrix.
+ * @param A the loss + streaming Matrix object
+ * @param M the fission gain Matrix object
+ * @param shift the multiple of the M Matrix subtracted from the A Matrix
+ * @param x the array to multiply
+ * @param y the array for the product
+ */
+static void shiftedMultiplication(Matrix* A, Matrix* M, FP_PRECISION shift,
+                                  FP_PRECISION* x, FP_PRECISION* y) {
+
+  int* IA = A->getIA();
+  int* JA = A->getJA();
+  FP_PRECISION* a = A->getA();
+  int* IM = M->getIA();
+  int* JM = M->getJA();
+  FP_PRECISION* m = M->getA();
+  int num_rows = A->getNumRows();
+
+#pragma omp parallel for
+  for (int row = 0; row < num_rows; row++) {
+    FP_PRECISION val = 0.;
+    for (int i = IA[row]; i < IA[row+1]; i++)
+      val += a[i] * x[JA[i]];
+    if (shift != 0.) {
+      for (int i = IM[row]; i < IM[row+1]; i++)
+        val -= shift * m[i] * x[JM[i]];
+    }
+    y[row] = val;
+  }
+}
+
+
+/**
+ * @brief Computes the dot product of two arrays.
+ * @param x the first array
+ * @param y the second array
+ * @param size the length of each array
+ * @return the dot product
+ */
+static double dotProduct(FP_PRECISION* x, FP_PRECISION* y, int size) {
+
+  double dot = 0.;
+
+#pragma omp parallel for reduction(+:dot)
+  for (int i = 0; i < size; i++)
+    dot += x[i] * y[i];
+
+  return dot;
+}
+
+
+/**
+ * @brief Solves a linear system using BiCGSTAB with a block Jacobi
+ *        preconditioner.
+ * @details This function takes in a loss + streaming Matrix (A), a fission
+ *          gain Matrix (M), a flux Vector (X), a source Vector (B), a
+ *          relative residual tolerance (tol) and a shift and computes the
+ *          solution to the linear system \f$ (A - shift M) X = B \f$. The
+ *          input X Vector is used as the initial guess and is modified in
+ *          place to be the solution vector. The preconditioner is the
+ *          inverse of the block diagonal of the shifted matrix, with one
+ *          dense block coupling the groups in each cell. Unlike red-black
+ *          SOR, the iteration does not require the shifted matrix to be
+ *          diagonally dominant, as for large Wielandt shifts.
+ * @param A the loss + streaming Matrix object
+ * @param M the fission gain Matrix object
+ * @param X the flux Vector object
+ * @param B the source Vector object
+ * @param tol the relative residual convergence threshold
+ * @param shift the multiple of the M Matrix subtracted from the A Matrix
+ * @return the number of iterations
+ */
+int linearSolveBiCGSTAB(Matrix* A, Matrix* M, Vector* X, Vector* B,
+                        FP_PRECISION tol, FP_PRECISION shift) {
+
+  /* Check for consistency of matrix and vector dimensions */
+  if (A->getNumRows() != B->getNumRows() ||
+      A->getNumRows() != X->getNumRows() ||
+      A->getNumRows() != M->getNumRows())
+    log_printf(ERROR, "Cannot perform linear solve with different sizes for "
+               "the A matrix, M matrix, B vector, and X vector: "
+               "(%d, %d, %d, %d)", A->getNumRows(), M->getNumRows(),
+               B->getNumRows(), X->getNumRows());
+
+  int num_cells = X->getNumX() * X->getNumY();
+  int num_groups = X->getNumGroups();
+  int num_rows = X->getNumRows();
+  FP_PRECISION* x = X->getArray();
+  FP_PRECISION* b = B->getArray();
+
+  /* Factorize the diagonal block of the shifted matrix for each cell */
+  int ng2 = num_groups * num_groups;
+  std::vector<FP_PRECISION> blocks(num_cells * ng2, 0.);
+  std::vector<int> pivots(num_rows);
+  int* IA = A->getIA();
+  int* JA = A->getJA();
+  FP_PRECISION* a = A->getA();
+  int* IM = M->getIA();
+  int* JM = M->getJA();
+  FP_PRECISION* m = M->getA();
+
+#pragma omp parallel for
+  for (int cell = 0; cell < num_cells; cell++) {
+
+    FP_PRECISION* block = &blocks[cell * ng2];
+    int* pivot = &pivots[cell * num_groups];
+
+    for (int g = 0; g < num_groups; g++) {
+      int row = cell * num_groups + g;
+      for (int i = IA[row]; i < IA[row+1]; i++) {
+        if (JA[i] / num_groups == cell)
+          block[g * num_groups + JA[i] % num_groups] += a[i];
+      }
+      for (int i = IM[row]; i < IM[row+1]; i++) {
+        if (JM[i] / num_groups == cell)
+          block[g * num_groups + JM[i] % num_groups] -= shift * m[i];
+      }
+    }
+
+    /* LU factorization with partial pivoting */
+    for (int g = 0; g < num_groups; g++) {
+      int p = g;
+      for (int h = g+1; h < num_groups; h++) {
+        if (fabs(block[h * num_groups + g]) > fabs(block[p * num_groups + g]))
+          p = h;
+      }
+      pivot[g] = p;
+      if (p != g) {
+        for (int h = 0; h < num_groups; h++)
+          std::swap(block[g * num_groups + h], block[p * num_groups + h]);
+      }
+      for (int h = g+1; h < num_groups; h++) {
+        block[h * num_groups + g] /= block[g * num_groups + g];
+        for (int l = g+1; l < num_groups; l++)
+          block[h * num_groups + l] -= block[h * num_groups + g]
+              * block[g * num_groups + l];
+      }
+    }
+  }
+
+  /* Allocate the BiCGSTAB work arrays */
+  std::vector<FP_PRECISION> r(num_rows), r_hat(num_rows), p(num_rows, 0.),
+      v(num_rows, 0.), y(num_rows), s(num_rows), z(num_rows), t(num_rows);
+
+  /* Compute the initial residual */
+  shiftedMultiplication(A, M, shift, x, &r[0]);
+#pragma omp parallel for
+  for (int i = 0; i < num_rows; i++) {
+    r[i] = b[i] - r[i];
+    r_hat[i] = r[i];
+  }
+
+  double b_norm = sqrt(dotProduct(b, b, num_rows));
+  if (b_norm == 0.)
+    b_norm = 1.;
+
+  double rho = 1., alpha = 1., omega = 1.;
+  double residual = sqrt(dotProduct(&r[0], &r[0], num_rows)) / b_norm;
+  int iter = 0;
+
+  while (iter < MAX_LINEAR_SOLVE_ITERATIONS && residual > tol) {
+
+    double rho_new = dotProduct(&r_hat[0], &r[0], num_rows);
+    if (rho_new == 0.)
+      break;
+
+    double beta = (rho_new / rho) * (alpha / omega);
+    rho = rho_new;
+
+#pragma omp parallel for
+    for (int i = 0; i < num_rows; i++)
+      p[i] = r[i] + beta * (p[i] - omega * v[i]);
+
+    /* Apply the preconditioner and the shifted matrix */
+    applyBlockJacobi(&blocks[0], &pivots[0], num_cells, num_groups, &p[0],
+                     &y[0]);
+    shiftedMultiplication(A, M, shift, &y[0], &v[0]);
+    alpha = rho / dotProduct(&r_hat[0], &v[0], num_rows);
+
+#pragma omp parallel for
+    for (int i = 0; i < num_rows; i++) {
+      x[i] += alpha * y[i];
+      s[i] = r[i] - alpha * v[i];
+    }
+
+    iter++;
+    residual = sqrt(dotProduct(&s[0], &s[0], num_rows)) / b_norm;
+    if (residual < tol)
+      break;
+
+    applyBlockJacobi(&blocks[0], &pivots[0], num_cells, num_groups, &s[0],
+                     &z[0]);
+    shiftedMultiplication(A, M, shift, &z[0], &t[0]);
+    double t_norm = dotProduct(&t[0], &t[0], num_rows);
+    omega = (t_norm == 0.) ? 0. : dotProduct(&t[0], &s[0], num_rows) / t_norm;
+
+#pragma omp parallel for
+    for (int i = 0; i < num_rows; i++) {
+      x[i] += omega * z[i];
+      r[i] = s[i] - omega * t[i];
+    }
+
+    residual = sqrt(dotProduct(&r[0], &r[0], num_rows)) / b_norm;
+
+    log_printf(DEBUG, "BiCGSTAB iter: %d, residual: %f", iter, residual);
+
+    if (omega == 0.)
+      break;
+  }
+
+  log_printf(DEBUG, "Linear solve iterations: %d", iter);
+
+  return iter;
 }
 
 
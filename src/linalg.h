@@ -23,10 +23,31 @@
 #include <omp.h>
 #endif
 
+/**
+ * @enum linearSolverType
+ * @brief The iterative methods used to solve the CMFD linear systems.
+ */
+enum linearSolverType {
+
+  /** Red-black Gauss-Seidel with successive over-relaxation */
+  RED_BLACK_SOR,
+
+  /** BiCGSTAB preconditioned with the inverse of the block diagonal of the
+   *  matrix for the groups in each cell */
+  BICGSTAB
+};
+
+
 FP_PRECISION eigenvalueSolve(Matrix* A, Matrix* M, Vector* X, FP_PRECISION tol,
-                             FP_PRECISION SOR_factor=1.5);
-void linearSolve(Matrix* A, Matrix* M, Vector* X, Vector* B, FP_PRECISION tol,
-                 FP_PRECISION SOR_factor=1.5);
+                             FP_PRECISION SOR_factor=1.5,
+                             linearSolverType solver_type=RED_BLACK_SOR,
+                             FP_PRECISION wielandt_shift=0.,
+                             int* num_iterations=NULL,
+                             int* num_linear_iterations=NULL);
+int linearSolve(Matrix* A, Matrix* M, Vector* X, Vector* B, FP_PRECISION tol,
+                FP_PRECISION SOR_factor=1.5, FP_PRECISION shift=0.);
+int linearSolveBiCGSTAB(Matrix* A, Matrix* M, Vector* X, Vector* B,
+                        FP_PRECISION tol, FP_PRECISION shift=0.);
 void matrixMultiplication(Matrix* A, Vector* X, Vector* B);
 FP_PRECISION computeRMSE(Vector* x, Vector* y, bool integrated);
 
@@ -24,7 +24,11 @@ enum segmentationType {
   OTF_TRACKS,
 
   /** Axial on-the-fly 3D segment formation by z-stack */
-  OTF_STACKS
+  OTF_STACKS,
+
+  /** On-the-fly 2D segment formation by ray tracing each Track in every
+   *  transport sweep */
+  OTF_2D
 
 };
 
@@ -0,0 +1,136 @@
+/**
+ * @file track_file.h
+ * @brief The layout of the binary Track files of the TrackGenerator.
+ * @details The layout is kept out of TrackGenerator.h so that it is seen by
+ *          the C++ compiler but not parsed by SWIG, which does not follow
+ *          #include directives.
+ */
+
+#ifndef TRACK_FILE_H_
+#define TRACK_FILE_H_
+
+
+/** The version of the binary Track file format */
+#define TRACK_FILE_VERSION 2
+
+/** The byte alignment of each section in a Track file */
+#define TRACK_FILE_ALIGNMENT 64
+
+
+/**
+ * @enum trackFileSection
+ * @brief The sections of a binary Track file.
+ * @details Each section is a contiguous array aligned to TRACK_FILE_ALIGNMENT
+ *          bytes. The byte offset of each section from the start of the file
+ *          is stored in the track_file_header.
+ */
+enum trackFileSection {
+
+  /** The number of Tracks, x-intercepts and y-intercepts for each azimuthal
+   *  angle (int) */
+  TRACK_COUNTS,
+
+  /** The start and end coordinates and azimuthal angle of each Track by UID
+   *  (7 doubles per Track) */
+  TRACK_POINTS,
+
+  /** The azimuthal angle index of each Track by UID (int) */
+  TRACK_AZIM_INDICES,
+
+  /** The offset of the first segment of each Track by UID (long) */
+  SEGMENT_OFFSETS,
+
+  /** The length of each segment (FP_PRECISION) */
+  SEGMENT_LENGTHS,
+
+  /** The FSR ID of each segment (int) */
+  SEGMENT_FSR_IDS,
+
+  /** The compact Material index of each segment (unsigned short) */
+  SEGMENT_MATERIAL_IDS,
+
+  /** The forward CMFD surface of each segment (int) */
+  SEGMENT_CMFD_SURFACES_FWD,
+
+  /** The backward CMFD surface of each segment (int) */
+  SEGMENT_CMFD_SURFACES_BWD,
+
+  /** The Material ID for each compact Material index (int) */
+  MATERIAL_IDS,
+
+  /** The offset of the first key component of each FSR (long) */
+  FSR_KEY_OFFSETS,
+
+  /** The key components of all FSRs (int) */
+  FSR_KEYS,
+
+  /** The characteristic point of each FSR (3 doubles per FSR) */
+  FSR_POINTS,
+
+  /** The Material ID of each FSR (int) */
+  FSR_MATERIAL_IDS,
+
+  /** The CMFD cell of each FSR (int) */
+  FSR_CMFD_CELLS,
+
+  /** The offset of the first FSR of each CMFD cell (long) */
+  CMFD_CELL_OFFSETS,
+
+  /** The FSRs in all CMFD cells (int) */
+  CMFD_CELL_FSRS,
+
+  /** The number of sections in a Track file */
+  NUM_TRACK_FILE_SECTIONS
+};
+
+
+/**
+ * @struct track_file_header
+ * @brief The fixed-size header at the start of a binary Track file.
+ * @details The header identifies the file format and the Geometry for which
+ *          the Tracks were generated, and stores the counts needed to size
+ *          each section along with the offset of each section in the file.
+ */
+struct track_file_header {
+
+  /** The string "OPENMOC" identifying the file format */
+  char _magic[8];
+
+  /** The version of the Track file format */
+  int _version;
+
+  /** The size in bytes of the floating point type used for segment lengths */
+  int _fp_precision;
+
+  /** A hash of the Geometry's string representation */
+  unsigned long long _geometry_hash;
+
+  /** The number of azimuthal angles in \f$ [0, 2\pi] \f$ */
+  int _num_azim;
+
+  /** The number of FSRs */
+  int _num_FSRs;
+
+  /** The requested track azimuthal spacing (cm) */
+  double _azim_spacing;
+
+  /** The total number of Tracks */
+  long _num_tracks;
+
+  /** The total number of segments */
+  long _num_segments;
+
+  /** The number of Materials in the compact Material index table */
+  int _num_materials;
+
+  /** The number of CMFD cells, or -1 if CMFD is not used */
+  int _num_cmfd_cells;
+
+  /** The total size of the file in bytes */
+  long _file_size;
+
+  /** The byte offset of each section from the start of the file */
+  long _offsets[NUM_TRACK_FILE_SECTIONS];
+};
+
+#endif /* TRACK_FILE_H_ */
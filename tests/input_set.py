@@ -93,6 +93,10 @@ class HomInfMedInput(InputSet):
 class PinCellInput(InputSet):
     """A pin cell problem from sample-input/pin-cell."""
 
+    def __init__(self, boundary_type=openmoc.REFLECTIVE):
+        super(PinCellInput, self).__init__()
+        self.boundary_type = boundary_type
+
     def create_materials(self):
         """Instantiate C5G7 Materials."""
         self.materials = \
@@ -108,10 +112,10 @@ class PinCellInput(InputSet):
         ymin = openmoc.YPlane(y=-2.0, name='ymin')
         ymax = openmoc.YPlane(y=+2.0, name='ymax')
 
-        xmin.setBoundaryType(openmoc.REFLECTIVE)
-        xmax.setBoundaryType(openmoc.REFLECTIVE)
-        ymin.setBoundaryType(openmoc.REFLECTIVE)
-        ymax.setBoundaryType(openmoc.REFLECTIVE)
+        xmin.setBoundaryType(self.boundary_type)
+        xmax.setBoundaryType(self.boundary_type)
+        ymin.setBoundaryType(self.boundary_type)
+        ymax.setBoundaryType(self.boundary_type)
 
         fuel = openmoc.Cell(name='fuel')
         fuel.setFill(self.materials['UO2'])
@@ -0,0 +1,378 @@
+import sys
+import multiprocessing
+from numbers import Integral, Real
+
+import numpy as np
+
+import openmoc
+
+# For Python 2.X.X
+if sys.version_info[0] == 2:
+    from log import py_printf
+    import checkvalue as cv
+# For Python 3.X.X
+else:
+    from openmoc.log import py_printf
+    import openmoc.checkvalue as cv
+
+
+# The BatchSolver whose states are solved by the worker processes. This is
+# inherited by the workers when they are forked such that the Geometry and
+# TrackGenerator need not be pickled.
+_batch_solver = None
+
+
+def _compute_state(index):
+    """Solve a single state of the global BatchSolver in a worker process.
+
+    Parameters
+    ----------
+    index : Integral
+        The index of the state to solve
+
+    Returns
+    -------
+    results : tuple
+        The eigenvalue, number of iterations and scalar fluxes for the state
+
+    """
+
+    return _batch_solver._compute_state(index)
+
+
+class BatchSolver(object):
+    """A driver which solves many states sharing one Geometry and
+    TrackGenerator, such as branch cases or material perturbations.
+
+    Each state may replace some of the Materials in the Geometry and/or
+    assign fixed sources. The states are solved concurrently by forked worker
+    processes, each with its own Solver instance. Since the workers are
+    forked from the current process, the ray tracing data is generated only
+    once and is shared between the workers. Segments read from a Track file
+    are memory mapped read-only and shared by all workers on a node, unless
+    they are copied into each Track to split them, to correct FSR volumes or
+    to update the boundary fluxes with CMFD.
+
+    NOTE: Worker processes are forked and therefore require a POSIX platform.
+    Since OpenMP may not be used with more than one thread by a process
+    forked after OpenMP threads were started, each worker uses one thread.
+    Multithreaded Solvers may only be used if the states are solved in turn
+    by a single process.
+
+    """
+
+    def __init__(self, track_generator, solver_type=openmoc.CPUSolver,
+                 num_workers=None, num_threads=1):
+        """Initialize a BatchSolver.
+
+        Parameters
+        ----------
+        track_generator : openmoc.TrackGenerator
+            The TrackGenerator shared by all states. Tracks are generated and
+            stored to a Track file if they have not yet been generated.
+        solver_type : type
+            The Solver class instantiated for each state
+            (default is openmoc.CPUSolver)
+        num_workers : Integral or None
+            The number of worker processes. If None (default), one worker is
+            used for each processor if num_threads is 1. If 1 or if
+            num_threads is greater than 1, the states are solved in turn in
+            this process.
+        num_threads : Integral
+            The number of OpenMP threads used by each Solver (default is 1).
+            More than one thread may only be used with a single worker.
+
+        """
+
+        cv.check_type('track_generator', track_generator,
+                      openmoc.TrackGenerator)
+        cv.check_type('num_threads', num_threads, Integral)
+        cv.check_greater_than('num_threads', num_threads, 0)
+
+        if num_workers is None:
+            num_workers = 1
+            if num_threads == 1:
+                num_workers = multiprocessing.cpu_count()
+        else:
+            cv.check_type('num_workers', num_workers, Integral)
+            cv.check_greater_than('num_workers', num_workers, 0)
+
+        # Forked workers deadlock if they start OpenMP threads after this
+        # process has started OpenMP threads
+        if num_workers > 1 and num_threads > 1:
+            py_printf('ERROR', 'Unable to solve states with %d threads in ' +
+                      'each of %d worker processes since forked workers ' +
+                      'may only use one OpenMP thread', num_threads,
+                      num_workers)
+
+        self._track_generator = track_generator
+        self._solver_type = solver_type
+        self._num_workers = num_workers
+        self._num_threads = num_threads
+
+        # Generate the Tracks and store them to a Track file to share them
+        if not self._track_generator.containsTracks():
+            self._track_generator.generateTracks(True)
+
+        # Initialize solution-dependent class attributes to None
+        self._method = None
+        self._args = None
+        self._materials = None
+        self._sources = None
+        self._convergence_threshold = None
+        self._k_effs = None
+        self._num_iterations = None
+        self._fluxes = None
+
+    @property
+    def k_effs(self):
+        return self._k_effs
+
+    @property
+    def num_iterations(self):
+        return self._num_iterations
+
+    @property
+    def fluxes(self):
+        return self._fluxes
+
+    def computeEigenvalues(self, materials=None, sources=None,
+                           max_iters=1000, solver_mode=openmoc.FORWARD,
+                           res_type=openmoc.FISSION_SOURCE,
+                           convergence_threshold=None):
+        """Solve an eigenvalue problem for each state.
+
+        Parameters
+        ----------
+        materials : Iterable of dict or None
+            For each state, a dictionary mapping the IDs of the Materials to
+            replace to the openmoc.Material to use in their place
+        sources : Iterable of dict or None
+            For each state, a dictionary mapping an openmoc.Cell,
+            openmoc.Material or integer FSR ID to an array of the fixed
+            source in each energy group
+        max_iters : Integral
+            The maximum number of source iterations (default is 1000)
+        solver_mode : {openmoc.FORWARD, openmoc.ADJOINT}
+            The type of solution (default is openmoc.FORWARD)
+        res_type : {openmoc.SCALAR_FLUX, openmoc.FISSION_SOURCE,
+                    openmoc.TOTAL_SOURCE}
+            The type of residual used for convergence
+            (default is openmoc.FISSION_SOURCE)
+        convergence_threshold : Real or None
+            The convergence threshold for each Solver (default is None for
+            the Solver's default threshold)
+
+        """
+
+        self._compute('computeEigenvalue', materials, sources,
+                      convergence_threshold, max_iters, solver_mode, res_type)
+
+    def computeFluxes(self, materials=None, sources=None, max_iters=1000,
+                      solver_mode=openmoc.FORWARD, only_fixed_source=True,
+                      convergence_threshold=None):
+        """Solve a fixed source problem for the flux of each state.
+
+        Parameters
+        ----------
+        materials : Iterable of dict or None
+            For each state, a dictionary mapping the IDs of the Materials to
+            replace to the openmoc.Material to use in their place
+        sources : Iterable of dict or None
+            For each state, a dictionary mapping an openmoc.Cell,
+            openmoc.Material or integer FSR ID to an array of the fixed
+            source in each energy group
+        max_iters : Integral
+            The maximum number of source iterations (default is 1000)
+        solver_mode : {openmoc.FORWARD, openmoc.ADJOINT}
+            The type of solution (default is openmoc.FORWARD)
+        only_fixed_source : bool
+            Whether to use only the fixed sources (default is True)
+        convergence_threshold : Real or None
+            The convergence threshold for each Solver (default is None for
+            the Solver's default threshold)
+
+        """
+
+        self._compute('computeFlux', materials, sources, convergence_threshold,
+                      max_iters, solver_mode, only_fixed_source)
+
+    def computeSources(self, materials=None, sources=None, max_iters=1000,
+                       solver_mode=openmoc.FORWARD, k_eff=1.,
+                       res_type=openmoc.TOTAL_SOURCE,
+                       convergence_threshold=None):
+        """Solve a fixed source problem for the total source of each state.
+
+        Parameters
+        ----------
+        materials : Iterable of dict or None
+            For each state, a dictionary mapping the IDs of the Materials to
+            replace to the openmoc.Material to use in their place
+        sources : Iterable of dict or None
+            For each state, a dictionary mapping an openmoc.Cell,
+            openmoc.Material or integer FSR ID to an array of the fixed
+            source in each energy group
+        max_iters : Integral
+            The maximum number of source iterations (default is 1000)
+        solver_mode : {openmoc.FORWARD, openmoc.ADJOINT}
+            The type of solution (default is openmoc.FORWARD)
+        k_eff : Real
+            The eigenvalue used to scale the fission source (default is 1)
+        res_type : {openmoc.SCALAR_FLUX, openmoc.FISSION_SOURCE,
+                    openmoc.TOTAL_SOURCE}
+            The type of residual used for convergence
+            (default is openmoc.TOTAL_SOURCE)
+        convergence_threshold : Real or None
+            The convergence threshold for each Solver (default is None for
+            the Solver's default threshold)
+
+        """
+
+        self._compute('computeSource', materials, sources,
+                      convergence_threshold, max_iters, solver_mode, k_eff,
+                      res_type)
+
+    def _compute(self, method, materials, sources, convergence_threshold,
+                 *args):
+        """Private routine to solve each state with a Solver method.
+
+        Parameters
+        ----------
+        method : str
+            The name of the Solver method used to solve each state
+        materials : Iterable of dict or None
+            For each state, the Materials to replace
+        sources : Iterable of dict or None
+            For each state, the fixed sources
+        convergence_threshold : Real or None
+            The convergence threshold for each Solver
+        *args
+            The arguments passed to the Solver method
+
+        """
+
+        global _batch_solver
+
+        if materials is None and sources is None:
+            py_printf('ERROR', 'Unable to solve a batch of states without ' +
+                      'any materials or sources')
+
+        if materials is not None:
+            materials = list(materials)
+            cv.check_iterable_type('materials', materials, dict)
+        if sources is not None:
+            sources = list(sources)
+            cv.check_iterable_type('sources', sources, dict)
+
+        if materials is not None and sources is not None and \
+           len(materials) != len(sources):
+            py_printf('ERROR', 'Unable to solve a batch of states with %d ' +
+                      'sets of materials and %d sets of sources',
+                      len(materials), len(sources))
+
+        if convergence_threshold is not None:
+            cv.check_type('convergence_threshold', convergence_threshold, Real)
+            cv.check_greater_than('convergence_threshold',
+                                  convergence_threshold, 0.)
+
+        num_states = len(materials) if materials is not None else len(sources)
+        self._method = method
+        self._args = args
+        self._materials = materials
+        self._sources = sources
+        self._convergence_threshold = convergence_threshold
+
+        num_workers = min(self._num_workers, num_states)
+        py_printf('NORMAL', 'Solving %d states with %d worker(s)...',
+                  num_states, num_workers)
+
+        # Solve the states in this process or in forked worker processes
+        if num_workers == 1:
+            results = [self._compute_state(i) for i in range(num_states)]
+        else:
+            # The workers must be forked to inherit the TrackGenerator, which
+            # cannot be pickled, even where processes are spawned by default
+            if sys.version_info[0] == 2:
+                context = multiprocessing
+            elif 'fork' in multiprocessing.get_all_start_methods():
+                context = multiprocessing.get_context('fork')
+            else:
+                py_printf('ERROR', 'Unable to solve states in %d worker ' +
+                          'processes since processes cannot be forked on ' +
+                          'this platform', num_workers)
+
+            _batch_solver = self
+            pool = context.Pool(num_workers)
+            try:
+                results = pool.map(_compute_state, range(num_states))
+            finally:
+                pool.close()
+                pool.join()
+                _batch_solver = None
+
+        # Gather the results for all states into arrays
+        self._k_effs = np.array([result[0] for result in results])
+        self._num_iterations = np.array([result[1] for result in results])
+        self._fluxes = np.array([result[2] for result in results])
+
+    def _compute_state(self, index):
+        """Private routine to solve a single state.
+
+        Parameters
+        ----------
+        index : Integral
+            The index of the state to solve
+
+        Returns
+        -------
+        results : tuple
+            The eigenvalue, number of iterations and scalar fluxes (indexed
+            by FSR and energy group) for the state
+
+        """
+
+        geometry = self._track_generator.getGeometry()
+
+        # Replace the Materials in all Material-filled Cells for this state
+        cells = geometry.getAllMaterialCells()
+        replaced = {}
+        if self._materials is not None:
+            for cell_id in cells:
+                material_id = cells[cell_id].getFillMaterial().getId()
+                if material_id in self._materials[index]:
+                    replaced[cell_id] = cells[cell_id].getFillMaterial()
+                    cells[cell_id].setFill(self._materials[index][material_id])
+
+        try:
+            solver = self._solver_type(self._track_generator)
+            solver.setNumThreads(self._num_threads)
+            if self._convergence_threshold is not None:
+                solver.setConvergenceThreshold(self._convergence_threshold)
+
+            # Assign the fixed sources for this state
+            if self._sources is not None:
+                for domain, source in self._sources[index].items():
+                    for group, value in enumerate(np.ravel(source)):
+                        if isinstance(domain, openmoc.Cell):
+                            solver.setFixedSourceByCell(domain, group+1, value)
+                        elif isinstance(domain, openmoc.Material):
+                            solver.setFixedSourceByMaterial(
+                                domain, group+1, value)
+                        else:
+                            solver.setFixedSourceByFSR(
+                                int(domain), group+1, value)
+
+            getattr(solver, self._method)(*self._args)
+
+            num_fsrs = geometry.getNumFSRs()
+            num_groups = geometry.getNumEnergyGroups()
+            fluxes = solver.getFluxes(num_fsrs * num_groups)
+            fluxes = np.reshape(fluxes, (num_fsrs, num_groups))
+            results = (solver.getKeff(), solver.getNumIterations(), fluxes)
+
+        # Restore the original Materials
+        finally:
+            for cell_id in replaced:
+                cells[cell_id].setFill(replaced[cell_id])
+
+        return results
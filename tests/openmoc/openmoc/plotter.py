@@ -0,0 +1,2272 @@
+import os
+import sys
+import time
+import multiprocessing
+from numbers import Integral, Real
+from collections import Iterable, OrderedDict
+
+import numpy as np
+import numpy.random
+import matplotlib
+from mpl_toolkits.mplot3d import Axes3D
+
+# Force headless backend for plotting on clusters
+matplotlib.use('Agg')
+
+import matplotlib.pyplot as plt
+import matplotlib.colors as colors
+import matplotlib.cm as cmx
+
+import openmoc
+
+# For Python 2.X.X
+if (sys.version_info[0] == 2):
+    from log import *
+    from process import get_scalar_fluxes
+    import checkvalue as cv
+# For Python 3.X.X
+else:
+    from openmoc.log import *
+    from openmoc.process import get_scalar_fluxes
+    import openmoc.checkvalue as cv
+
+# Store viable OpenMOC solver types for type checking
+solver_types = (openmoc.Solver,)
+try:
+    # Try to import OpenMOC's CUDA module
+    if (sys.version_info[0] == 2):
+        from cuda import GPUSolver
+    else:
+        from openmoc.cuda import GPUSolver
+    solver_types += (GPUSolver,)
+except ImportError:
+    pass
+
+# Force non-interactive mode for plotting on clusters
+plt.ioff()
+
+# Default matplotlib parameters to use in all plots
+matplotlib_rcparams = matplotlib.rcParamsDefault
+matplotlib_rcparams['font.family'] = 'sans-serif'
+matplotlib_rcparams['font.weight'] = 'normal'
+matplotlib_rcparams['font.size'] = 15
+matplotlib_rcparams['savefig.dpi'] = 500
+matplotlib_rcparams['figure.dpi'] = 500
+
+# A static variable for the output directory in which to save plots
+subdirectory = "/plots/"
+
+TINY_MOVE = openmoc.TINY_MOVE
+
+# The maximum number of rasterized domain ID grids to cache for reuse
+raster_cache_size = 16
+
+# A cache of the domain IDs on the plotting grids of the most recent plots,
+# keyed by the geometry, plotting window, gridsize, z-coordinate and domain
+_raster_cache = OrderedDict()
+
+# The plots and rendering settings exported by the worker processes. These
+# are inherited by the workers when they are forked such that the surfaces
+# need not be pickled.
+_export_plots = None
+_export_settings = None
+
+# The data, grid and settings of the tiled plot rendered by the worker
+# processes, which are inherited by the workers when they are forked. The
+# Geometry is only queried by the parent process, since OpenMP may not be
+# used by a process forked after OpenMP threads were started.
+_tiled_plot = None
+
+if sys.version_info[0] >= 3:
+    basestring = str
+
+
+def plot_tracks(track_generator, get_figure=False):
+    """Plot the characteristic tracks from an OpenMOC simulation.
+
+    This method requires that tracks have been generated by a TrackGenerator.
+
+    Parameters
+    ----------
+    track_generator : openmoc.TrackGenerator
+        A TrackGenerator with the tracks to plot
+    get_figure : bool
+        Whether or not to return the Matplotlib figure
+
+    Returns
+    -------
+    fig : matplotlib.Figure or None
+        The Matplotlib figure is returned if get_figure is True
+
+    Examples
+    --------
+    A user may invoke this function from an OpenMOC Python file as follows:
+
+        >>> openmoc.plotter.plot_tracks(track_generator)
+
+    """
+
+    cv.check_type('track_generator', track_generator, openmoc.TrackGenerator)
+    if not track_generator.containsTracks():
+        py_printf('ERROR', 'Unable to plot Tracks since the track ' +
+                  'generator has not yet generated tracks')
+
+    global subdirectory, matplotlib_rcparams
+    directory = openmoc.get_output_directory() + subdirectory
+
+    # Ensure that normal settings are used even if called from ipython
+    curr_rc = dict(matplotlib.rcParams)
+    matplotlib.rcParams.update(matplotlib_rcparams)
+
+    # Make directory if it does not exist
+    try:
+        os.makedirs(directory)
+    except OSError:
+        pass
+
+    py_printf('NORMAL', 'Plotting the tracks...')
+
+    # Retrieve data from TrackGenerator
+    vals_per_track = openmoc.NUM_VALUES_PER_RETRIEVED_TRACK
+    num_azim = track_generator.getNumAzim()
+    spacing = track_generator.getDesiredAzimSpacing()
+    num_tracks = track_generator.getNumTracks()
+    coords = track_generator.retrieveTrackCoords(num_tracks*vals_per_track)
+
+    # Convert data to NumPy arrays
+    coords = np.array(coords)
+    x = coords[0::vals_per_track/2]
+    y = coords[1::vals_per_track/2]
+
+    # Make figure of line segments for each Track
+    fig = plt.figure()
+    fig.patch.set_facecolor('none')
+    for i in range(num_tracks):
+        plt.plot([x[i*2], x[i*2+1]], [y[i*2], y[i*2+1]], 'b-')
+
+    plt.xlim([x.min(), x.max()])
+    plt.ylim([y.min(), y.max()])
+
+    title = 'Tracks for {0} angles and {1} cm spacing'.format(num_azim, spacing)
+    plt.title(title)
+
+    # Restore settings if called from ipython
+    matplotlib.rcParams.update(curr_rc)
+
+    # Save the figure to a file or return to user
+    if get_figure:
+        return fig
+    else:
+        filename = \
+            'tracks-{1}-angles-{2}.png'.format(directory, num_azim, spacing)
+        fig.savefig(directory+filename, bbox_inches='tight')
+        plt.close(fig)
+
+
+def plot_segments(track_generator, get_figure=False):
+    """Plot the characteristic track segments from an OpenMOC simulation.
+
+    This method requires that tracks have been generated by a TrackGenerator.
+    Each segment is colored by the ID of the unique FSR it is within.
+
+    Parameters
+    ----------
+    track_generator : openmoc.TrackGenerator
+        A TrackGenerator with the track segments to plot
+    get_figure : bool
+        Whether or not to return the Matplotlib figure
+
+    Returns
+    -------
+    fig : matplotlib.Figure or None
+        The Matplotlib figure is returned if get_figure is True
+
+    Examples
+    --------
+    A user may invoke this function from an OpenMOC Python file as follows:
+
+        >>> openmoc.plotter.plot_segments(track_generator)
+
+    """
+
+    cv.check_type('track_generator', track_generator, openmoc.TrackGenerator)
+    if not track_generator.containsTracks():
+        py_printf('ERROR', 'Unable to plot Track segments since the ' +
+                  'TrackGenerator has not yet generated Tracks.')
+
+    global subdirectory, matplotlib_rcparams
+    directory = openmoc.get_output_directory() + subdirectory
+
+    # Ensure that normal settings are used even if called from ipython
+    curr_rc = dict(matplotlib.rcParams)
+    matplotlib.rcParams.update(matplotlib_rcparams)
+
+    # Make directory if it does not exist
+    try:
+        os.makedirs(directory)
+    except OSError:
+        pass
+
+    py_printf('NORMAL', 'Plotting the track segments...')
+
+    # Retrieve data from TrackGenerator
+    vals_per_segment = openmoc.NUM_VALUES_PER_RETRIEVED_SEGMENT
+    num_azim = track_generator.getNumAzim()
+    spacing = track_generator.getDesiredAzimSpacing()
+    num_segments = track_generator.getNumSegments()
+    num_fsrs = track_generator.getGeometry().getNumFSRs()
+    coords = \
+        track_generator.retrieveSegmentCoords(num_segments*vals_per_segment)
+
+    # Convert data to NumPy arrays
+    coords = np.array(coords)
+    x = np.zeros(num_segments*2)
+    y = np.zeros(num_segments*2)
+    z = np.zeros(num_segments*2)
+    fsrs = np.zeros(num_segments)
+
+    for i in range(num_segments):
+        fsrs[i] = coords[i*vals_per_segment]
+        x[i*2] = coords[i*vals_per_segment+1]
+        y[i*2] = coords[i*vals_per_segment+2]
+        z[i*2] = coords[i*vals_per_segment+3]
+        x[i*2+1] = coords[i*vals_per_segment+4]
+        y[i*2+1] = coords[i*vals_per_segment+5]
+        z[i*2+1] = coords[i*vals_per_segment+6]
+
+    # Create array of equally spaced randomized floats as a color map for plots
+    # Seed the NumPy random number generator to ensure reproducible color maps
+    numpy.random.seed(1)
+    color_map = np.linspace(0., 1., num_fsrs, endpoint=False)
+    numpy.random.shuffle(color_map)
+
+    # Make figure of line segments for each track
+    fig = plt.figure()
+    fig.patch.set_facecolor('none')
+
+    # Create a color map corresponding to FSR IDs
+    for i in range(num_segments):
+        cNorm  = colors.Normalize(vmin=0, vmax=max(color_map))
+        scalarMap = cmx.ScalarMappable(norm=cNorm)
+        color = scalarMap.to_rgba(color_map[fsrs[i] % num_fsrs])
+        plt.plot([x[i*2], x[i*2+1]], [y[i*2], y[i*2+1]], c=color)
+
+    plt.xlim([x.min(), x.max()])
+    plt.ylim([y.min(), y.max()])
+
+    suptitle = 'Segments ({0} angles, {1} cm spacing)'.format(num_azim, spacing)
+    title = 'z = {0}'.format(z[0])
+    plt.suptitle(suptitle)
+    plt.title(title)
+
+    # Restore settings if called from ipython
+    matplotlib.rcParams.update(curr_rc)
+
+    if get_figure:
+        return fig
+    else:
+        filename = 'segments-{0}-angles-{1}-spacing'.format(num_azim, spacing)
+        filename = '{0}-z-{1}.png'.format(filename, z[0])
+        fig.savefig(directory+filename, bbox_inches='tight')
+        plt.close(fig)
+
+
+def plot_materials(geometry, gridsize=250, xlim=None, ylim=None, zcoord=None,
+                   get_figure=False, library='matplotlib'):
+    """Plot a color-coded 2D surface plot of the materials in the geometry.
+
+    The geometry must be initialized with materials, cells, universes and
+    lattices before being passed into this routine.
+
+    Parameters
+    ----------
+    geometry : openmoc.Geometry
+        An OpenMOC geometry
+    gridsize : Integral, optional
+        The number of grid cells for the plot (250 by default)
+    xlim : 2-tuple of Real, optional
+        The minimim/maximum x-coordinates
+    ylim : 2-tuple of Real, optional
+        The minimim/maximum y-coordinates
+    zcoord : Real, optional
+        The z coordinate (default is 0.0)
+    get_figure : bool
+        Whether to return the Matplotlib figure (only if library='matplotlib')
+    library : {'matplotlib', 'pil'}
+        The plotting library to use
+
+    Returns
+    -------
+    fig : matplotlib.Figure or None
+        The Matplotlib figure is returned if get_figure is True
+
+    Examples
+    --------
+    A user may invoke this function from an OpenMOC Python file as follows:
+
+        >>> openmoc.plotter.plot_materials(geometry)
+
+    """
+
+    cv.check_type('geometry', geometry, openmoc.Geometry)
+
+    py_printf('NORMAL', 'Plotting the materials...')
+
+    # Create an array of random integer colors for each Material
+    materials = geometry.getAllMaterials()
+    num_materials = len(materials)
+    colors = np.arange(num_materials)
+    numpy.random.seed(1)
+    numpy.random.shuffle(colors)
+    for i, material_id in enumerate(materials):
+        materials[material_id] = colors[i]
+
+    # Initialize plotting parameters
+    plot_params = PlotParams()
+    plot_params.geometry = geometry
+    plot_params.domain_type = 'material'
+    plot_params.gridsize = gridsize
+    plot_params.library = library
+    plot_params.xlim = xlim
+    plot_params.ylim = ylim
+    plot_params.zcoord = zcoord
+    plot_params.suptitle = 'Materials'
+    plot_params.title = 'z = {0}'.format(plot_params.zcoord)
+    plot_params.filename = 'materials-z-{0}'.format(plot_params.zcoord)
+    plot_params.interpolation = 'nearest'
+    plot_params.vmin = 0
+    plot_params.vmax = num_materials
+
+    # Plot a 2D color map of the Materials
+    figures = plot_spatial_data(materials, plot_params, get_figure)
+
+    # Return the figure to the user if requested
+    if get_figure:
+        return figures[0]
+
+
+def plot_cells(geometry, gridsize=250, xlim=None, ylim=None,
+               zcoord=None, get_figure=False, library='matplotlib'):
+    """Plots a color-coded 2D surface plot of the cells in the geometry.
+
+    The geometry must be initialized with materials, cells, universes and
+    lattices before being passed into this routine.
+
+    Parameters
+    ----------
+    geometry : openmoc.Geometry
+        An OpenMOC geometry
+    gridsize : Integral, optional
+        The number of grid cells for the plot (250 by default)
+    xlim : 2-tuple of Real, optional
+        The minimim/maximum x-coordinates
+    ylim : 2-tuple of Real, optional
+        The minimim/maximum y-coordinates
+    zcoord : Real, optional
+        The z coordinate (default is 0.0)
+    get_figure : bool
+        Whether to return the Matplotlib figure (only if library='matplotlib')
+    library : {'matplotlib', 'pil'}
+        The plotting library to use
+
+    Returns
+    -------
+    fig : matplotlib.Figure or None
+        The Matplotlib figure is returned if get_figure is True
+
+    Examples
+    --------
+    A user may invoke this function from an OpenMOC Python file as follows:
+
+        >>> openmoc.plotter.plot_cells(geometry)
+
+    """
+
+    cv.check_type('geometry', geometry, openmoc.Geometry)
+
+    py_printf('NORMAL', 'Plotting the cells...')
+
+    # Create an array of random integer colors for each Cell
+    cells = geometry.getAllMaterialCells()
+    num_cells = len(cells)
+    colors = np.arange(num_cells)
+    numpy.random.seed(1)
+    numpy.random.shuffle(colors)
+    for i, cell_id in enumerate(cells):
+        cells[cell_id] = colors[i]
+
+    # Initialize plotting parameters
+    plot_params = PlotParams()
+    plot_params.geometry = geometry
+    plot_params.domain_type = 'cell'
+    plot_params.gridsize = gridsize
+    plot_params.library = library
+    plot_params.xlim = xlim
+    plot_params.ylim = ylim
+    plot_params.zcoord = zcoord
+    plot_params.suptitle = 'Cells'
+    plot_params.title = 'z = {0}'.format(plot_params.zcoord)
+    plot_params.filename = 'cells-z-{0}'.format(plot_params.zcoord)
+    plot_params.interpolation = 'nearest'
+    plot_params.vmin = 0
+    plot_params.vmax = num_cells
+
+    # Plot a 2D color map of the Cells
+    figures = plot_spatial_data(cells, plot_params, get_figure)
+
+    # Return the figure to the user if requested
+    if get_figure:
+        return figures[0]
+
+
+def plot_flat_source_regions(geometry, gridsize=250, xlim=None, ylim=None,
+                             centroids=False, marker_type='o', marker_size=2,
+                             get_figure=False, library='matplotlib'):
+    """Plots a color-coded 2D surface plot of the FSRs in the geometry.
+
+    The geometry must be initialized with materials, cells, universes and
+    lattices before being passed into this routine.
+
+    Parameters
+    ----------
+    geometry : openmoc.Geometry
+        An OpenMOC geometry
+    gridsize : Integral, optional
+        The number of grid cells for the plot (250 by default)
+    xlim : 2-tuple of Real, optional
+        The minimim/maximum x-coordinates
+    ylim : 2-tuple of Real, optional
+        The minimim/maximum y-coordinates
+    centroids : bool
+        Whether to plot the FSR centroids (False by default)
+    marker_type : str
+        The marker type to use for FSR centroids ('o' by default)
+    marker_size : Integral
+        The marker size to use for FSR centroids (2 by default)
+    get_figure : bool
+        Whether to return the Matplotlib figure (only if library='matplotlib')
+    library : {'matplotlib', 'pil'}
+        The plotting library to use
+
+    Returns
+    -------
+    fig : matplotlib.Figure or None
+        The Matplotlib figure is returned if get_figure is True
+
+    Examples
+    --------
+    A user may invoke this function from an OpenMOC Python file as follows:
+
+        >>> openmoc.plotter.plot_flat_source_regions(geometry)
+
+    """
+
+    cv.check_type('geometry', geometry, openmoc.Geometry)
+    cv.check_type('centroids', centroids, bool)
+    cv.check_type('marker_type', marker_type, basestring)
+    cv.check_value('marker_type', marker_type,
+                   tuple(matplotlib.markers.MarkerStyle().markers.keys()))
+    cv.check_type('marker_size', marker_size, Real)
+    cv.check_greater_than('marker_size', marker_size, 0)
+
+    if geometry.getNumFSRs() == 0:
+        py_printf('ERROR', 'Unable to plot the flat source regions ' +
+                  'since no tracks have been generated.')
+
+    py_printf('NORMAL', 'Plotting the flat source regions...')
+
+    global subdirectory, matplotlib_rcparams
+    directory = openmoc.get_output_directory() + subdirectory
+
+    num_fsrs = geometry.getNumFSRs()
+    fsrs_to_fsrs = np.arange(num_fsrs, dtype=np.int64)
+    fsrs_to_fsrs = _colorize(fsrs_to_fsrs, num_fsrs)
+
+    # Initialize plotting parameters
+    zcoord = geometry.getFSRPoint(0).getZ()
+    plot_params = PlotParams()
+    plot_params.geometry = geometry
+    plot_params.zcoord = zcoord
+    plot_params.gridsize = gridsize
+    plot_params.library = library
+    plot_params.xlim = xlim
+    plot_params.ylim = ylim
+    plot_params.suptitle = 'Flat Source Regions'
+    plot_params.title = 'z = {0}'.format(zcoord)
+    plot_params.filename = 'flat-source-regions-z-{0}'.format(zcoord)
+    plot_params.interpolation = 'nearest'
+    plot_params.vmin = 0
+    plot_params.vmax = num_fsrs
+
+    # Plot a 2D color map of the flat source regions
+    figures = plot_spatial_data(fsrs_to_fsrs, plot_params, get_figure=True)
+    fig = figures[0]
+
+    # Plot centroids on top of 2D flat source region color map
+    if centroids:
+
+        # Populate a NumPy array with the FSR centroid coordinates
+        centroids = geometry.getFSRCentroids(num_fsrs * 3)
+        centroids = centroids.reshape(num_fsrs, 3)[:, :2]
+
+        # Plot centroids on figure using matplotlib
+        if library == 'pil':
+
+            # Retrieve the plot bounds
+            coords = _get_pixel_coords(plot_params)
+            r = marker_size
+
+            # Open a PIL ImageDraw portal on the Image object
+            from PIL import ImageDraw
+            draw = ImageDraw.Draw(fig)
+
+            for fsr_id in range(num_fsrs):
+                # Retrieve the pixel coordinates for this centroid
+                x, y = centroids[fsr_id,:]
+
+                # Only plot centroid if it is within the plot bounds
+                if x < coords['bounds'][0] or x > coords['bounds'][1]:
+                    continue
+                elif y < coords['bounds'][2] or y > coords['bounds'][3]:
+                    continue
+
+                # Transform the centroid into pixel coordinates
+                x = int((x-coords['x'][1]) / (coords['x'][1]-coords['x'][0]))
+                y = int((y-coords['y'][1]) / (coords['y'][1]-coords['y'][0]))
+
+                # Draw circle for this centroid on the image
+                draw.ellipse((x-r, y-r, x+r, y+r), fill=(0, 0, 0))
+
+        # Plot centroids on figure using PIL
+        else:
+            plt.scatter(centroids[:,0], centroids[:,1], color='k',
+                        marker=marker_type, s=marker_size)
+
+    # Return the figure to the user if requested
+    if get_figure:
+        return figures[0]
+    # Set the plot title and save the figure
+    else:
+        plot_filename = directory + plot_params.filename + plot_params.extension
+
+        if library == 'pil':
+            fig.save(plot_filename)
+        else:
+            fig.savefig(plot_filename, bbox_inches='tight')
+            plt.close(fig)
+
+
+def plot_cmfd_cells(geometry, cmfd, gridsize=250, xlim=None, ylim=None,
+                    get_figure=False, library='matplotlib'):
+    """Plots a color-coded 2D surface plot of the CMFD cells in a geometry.
+
+    The geometry must be initialized with materials, cells, universes and
+    lattices before being passed into this method. Plotting the CMFD cells
+    requires that segments must have been created for the geometry and FSR IDs
+    assigned to regions.
+
+    Parameters
+    ----------
+    geometry : openmoc.Geometry
+        An OpenMOC geometry
+    cmfd : openmoc.Cmfd
+        An OpenMOC cmfd
+    gridsize : Integral, optional
+        The number of grid cells for the plot (250 by default)
+    xlim : 2-tuple of Real, optional
+        The minimim/maximum x-coordinates
+    ylim : 2-tuple of Real, optional
+        The minimim/maximum y-coordinates
+    get_figure : bool
+        Whether to return the Matplotlib figure (only if library='matplotlib')
+    library : {'matplotlib', 'pil'}
+        The plotting library to use
+
+    Returns
+    -------
+    fig : matplotlib.Figure or None
+        The Matplotlib figure is returned if get_figure is True
+
+    Examples
+    --------
+    A user may invoke this function from an OpenMOC Python file as follows:
+
+        >>> openmoc.plotter.plot_cmfd_cells(geometry, cmfd)
+
+    """
+
+    cv.check_type('geometry', geometry, openmoc.Geometry)
+    cv.check_type('cmfd', cmfd, openmoc.Cmfd)
+
+    py_printf('NORMAL', 'Plotting the CMFD cells...')
+
+    # Create a NumPy array to map FSRs to CMFD cells
+    num_fsrs = geometry.getNumFSRs()
+    fsrs_to_cmfd_cells = cmfd.getFSRCmfdCells(num_fsrs).astype(np.int64)
+
+    # Assign random color scheme to CMFD cells
+    num_cmfd_cells = cmfd.getNumCells()
+    fsrs_to_cmfd_cells = _colorize(fsrs_to_cmfd_cells, num_cmfd_cells)
+
+    # Initialize plotting parameters
+    zcoord = geometry.getFSRPoint(0).getZ()
+    plot_params = PlotParams()
+    plot_params.geometry = geometry
+    plot_params.zcoord = zcoord
+    plot_params.gridsize = gridsize
+    plot_params.library = library
+    plot_params.xlim = xlim
+    plot_params.ylim = ylim
+    plot_params.suptitle = 'CMFD Cells'
+    plot_params.title = 'z = {0}'.format(zcoord)
+    plot_params.filename = 'cmfd-cells-{0}'.format(zcoord)
+    plot_params.interpolation = 'nearest'
+    plot_params.vmin = 0
+    plot_params.vmax = num_cmfd_cells
+
+    # Plot the CMFD cells
+    figures = plot_spatial_data(fsrs_to_cmfd_cells, plot_params, get_figure)
+
+    # Return the figure to the user if requested
+    if get_figure:
+        return figures[0]
+
+
+def plot_spatial_fluxes(solver, energy_groups=[1], norm=False, gridsize=250,
+                        xlim=None, ylim=None, get_figure=False,
+                        library='matplotlib', num_workers=1):
+    """Plot a color-coded 2D surface plot of the FSR scalar fluxes for one or
+    more energy groups.
+
+    The solver must have converged the FSR sources before calling this routine.
+
+    Parameters
+    ----------
+    solver : openmoc.Solver
+        An OpenMOC solver used to compute the flux
+    energy_groups : Iterable of Integral
+        The energy groups to plot (starting at 1 for the highest energy)
+    norm : bool, optional
+        Whether to normalize the fluxes to the mean (False by default)
+    gridsize : Integral, optional
+        The number of grid cells for the plot (250 by default)
+    xlim : 2-tuple of Real, optional
+        The minimim/maximum x-coordinates
+    ylim : 2-tuple of Real, optional
+        The minimim/maximum y-coordinates
+    get_figure : bool
+        Whether to return the Matplotlib figure (only if library='matplotlib')
+    library : {'matplotlib', 'pil'}
+        The plotting library to use
+    num_workers : Integral, optional
+        The number of processes used to render and save the plots (1 by
+        default). This is ignored if get_figure is True.
+
+    Returns
+    -------
+    fig : list of matplotlib.Figure or None
+        The Matplotlib figures are returned if get_figure is True
+
+    Examples
+    --------
+    A user may invoke this function from an OpenMOC Python file as follows:
+
+        >>> openmoc.plotter.plot_spatial_fluxes(solver, energy_groups=[1,7])
+
+    The PIL library and a pool of processes may be used to quickly export
+    the plots for many energy groups:
+
+        >>> openmoc.plotter.plot_spatial_fluxes(solver, range(1, 71),
+        ...                                     library='pil', num_workers=8)
+
+    """
+
+    global solver_types
+    cv.check_type('solver', solver, solver_types)
+    cv.check_type('energy_groups', energy_groups, Iterable, Integral)
+
+    py_printf('NORMAL', 'Plotting the FSR scalar fluxes...')
+
+    # Initialize plotting parameters
+    geometry = solver.getGeometry()
+    zcoord = geometry.getFSRPoint(0).getZ()
+    plot_params = PlotParams()
+    plot_params.geometry = geometry
+    plot_params.zcoord = zcoord
+    plot_params.gridsize = gridsize
+    plot_params.library = library
+    plot_params.xlim = xlim
+    plot_params.ylim = ylim
+    plot_params.colorbar = True
+    plot_params.cmap = plt.get_cmap('jet')
+    plot_params.norm = norm
+
+    plot_params.title = 'z = {0}'.format(zcoord)
+
+    # Get array of FSR energy-dependent fluxes
+    fluxes = get_scalar_fluxes(solver)
+
+    # Plot the fluxes in each energy group on the same spatial grid
+    global subdirectory
+    directory = openmoc.get_output_directory() + subdirectory
+    plots = _get_flux_plots(fluxes, energy_groups, plot_params, directory)
+    coords = _get_pixel_coords(plot_params)
+
+    # Return figures if requested by the user
+    return _export_spatial_plots(plots, plot_params, coords['bounds'],
+                                 get_figure, num_workers)
+
+
+def plot_energy_fluxes(solver, fsrs, group_bounds=None, norm=True,
+                       loglog=True, get_figure=False):
+    """Plot the scalar flux vs. energy for one or more FSRs.
+
+    The Solver must have converged the FSR sources before calling this routine.
+    The routine will generate a step plot of the flux across each energy group.
+
+    An optional parameter for the energy group bounds may be input. The group
+    bounds should be input in increasing order of energy. If group bounds are
+    not specified, the routine will use equal width steps for each energy group.
+
+    Parameters
+    ----------
+    solver : openmoc.Solver
+        An OpenMOC solver used to compute the flux
+    fsrs : Iterable of Integral
+        The FSRs for which to plot the flux
+    group_bounds : Iterable of Real or None, optional
+        The bounds of the energy groups
+    norm : bool, optional
+        Whether to normalize the fluxes (True by default)
+    loglog : bool
+        Whether to use a log scale on the x- and y-axes (True by default)
+    get_figure : bool
+        Whether to return the Matplotlib figure
+
+    Returns
+    -------
+    fig : list of matplotlib.Figure or None
+        The Matplotlib figures are returned if get_figure is True
+
+    Examples
+    --------
+    A user may invoke this function from an OpenMOC Python file as follows:
+
+        >>> openmoc.plotter.plot_energy_fluxes(solver, fsrs=[1,5,20], \
+                                               group_bounds=[0., 0.625, 2e7])
+
+    """
+
+    global solver_types
+    cv.check_type('solver', solver, solver_types)
+    cv.check_type('fsrs', fsrs, Iterable, Integral)
+    cv.check_type('norm', norm, bool)
+    cv.check_type('loglog', loglog, bool)
+    cv.check_type('get_figure', get_figure, bool)
+
+    geometry = solver.getGeometry()
+    num_groups = geometry.getNumEnergyGroups()
+
+    if group_bounds is not None:
+        cv.check_type('group_bounds', group_bounds, Iterable, Real)
+        if not all(low < up for low, up in zip(group_bounds, group_bounds[1:])):
+            py_printf('ERROR', 'Unable to plot the flux vs. energy since ' +
+                      'the group bounds are not monotonically increasing')
+    else:
+        group_bounds = np.arange(num_groups+1, dtype=np.int)
+        loglog = False
+
+    py_printf('NORMAL', 'Plotting the scalar fluxes vs. energy...')
+
+    global subdirectory, matplotlib_rcparams
+    directory = openmoc.get_output_directory() + subdirectory
+
+    # Ensure that normal settings are used even if called from ipython
+    curr_rc = dict(matplotlib.rcParams)
+    matplotlib.rcParams.update(matplotlib_rcparams)
+
+    # Make directory if it does not exist
+    try:
+        os.makedirs(directory)
+    except OSError:
+        pass
+
+    # Compute difference in energy bounds for each group
+    group_deltas = np.ediff1d(group_bounds)
+    group_bounds = np.flipud(group_bounds)
+    group_deltas = np.flipud(group_deltas)
+
+    # Initialize an empty list of Matplotlib figures if requestd by the user
+    figures = []
+
+    # Iterate over all flat source regions
+    for fsr in fsrs:
+
+        # Allocate memory for an array of this FSR's fluxes
+        fluxes = np.zeros(num_groups, dtype=np.float)
+
+        # Extract the flux in each energy group
+        for group in range(num_groups):
+            fluxes[group] = solver.getFlux(fsr, group+1)
+
+        # Normalize fluxes to the total integrated flux
+        if norm:
+            fluxes /= np.sum(group_deltas * fluxes)
+
+        # Initialize a separate plot for this FSR's fluxes
+        fig = plt.figure()
+        fig.patch.set_facecolor('none')
+
+        # Draw horizontal/vertical lines on the plot for each energy group
+        for group in range(num_groups):
+
+            # Horizontal line
+            if loglog:
+                plt.loglog(group_bounds[group:group+2], [fluxes[group]]*2,
+                           linewidth=3, c='b', label='openmoc', linestyle='-')
+            else:
+                plt.plot(group_bounds[group:group+2], [fluxes[group]]*2,
+                         linewidth=3, c='b', label='openmoc', linestyle='-')
+
+            # Vertical lines
+            if group < num_groups - 1:
+                if loglog:
+                    plt.loglog([group_bounds[group+1]]*2, fluxes[group:group+2],
+                               c='b', linestyle='--')
+                else:
+                    plt.plot([group_bounds[group+1]]*2, fluxes[group:group+2],
+                             c='b', linestyle='--')
+
+        plt.xlabel('Energy')
+        plt.ylabel('Flux')
+        plt.xlim((min(group_bounds), max(group_bounds)))
+        plt.grid()
+        plt.title('FSR {0} Flux ({1} groups)'.format(fsr, num_groups))
+
+        # Save the figure to a file or return to user if requested
+        if get_figure:
+            figures.append(fig)
+        else:
+            filename = 'flux-fsr-{0}.png'.format(fsr)
+            plt.savefig(directory+filename, bbox_inches='tight')
+            plt.close(fig)
+
+    # Restore settings if called from ipython
+    matplotlib.rcParams.update(curr_rc)
+
+    # Return the figures if requested by user
+    if get_figure:
+        return figures
+
+
+def plot_fission_rates(solver, norm=False, transparent_zeros=True, gridsize=250,
+                       xlim=None, ylim=None, get_figure=False,
+                       library='matplotlib'):
+    """Plot a color-coded 2D surface plot representing the FSR fission rates.
+
+    The Solver must have converged the FSR sources before calling this routine.
+    The fission rates are computed as the volume-averaged and energy-integrated
+    fission rates in each FSR.
+
+    Parameters
+    ----------
+    solver : openmoc.Solver
+        An OpenMOC solver used to compute the flux
+    norm : bool
+        Whether to normalize the fission rates (False by default)
+    transparent_zeros : bool
+        Whether to make all non-fissionable FSRs transparent (True by default)
+    gridsize : Integral, optional
+        The number of grid cells for the plot (250 by default)
+    xlim : 2-tuple of Real, optional
+        The minimim/maximum x-coordinates
+    ylim : 2-tuple of Real, optional
+        The minimim/maximum y-coordinates
+    get_figure : bool
+        Whether to return the Matplotlib figure (only if library='matplotlib')
+    library : {'matplotlib', 'pil'}
+        The plotting library to use
+
+    Returns
+    -------
+    fig : matplotlib.Figure or None
+        The Matplotlib figure is returned if get_figure is True
+
+    Examples
+    --------
+    A user may invoke this function from an OpenMOC Python file as follows:
+
+         >>> openmoc.plotter.plot_fission_rates(solver)
+
+    """
+
+    global solver_types
+    cv.check_type('solver', solver, solver_types)
+
+    py_printf('NORMAL', 'Plotting the flat source region fission rates...')
+
+    # Compute the volume-weighted fission rates for each FSR
+    geometry = solver.getGeometry()
+    fission_rates = solver.computeFSRFissionRates(geometry.getNumFSRs())
+
+    # Initialize plotting parameters
+    zcoord = geometry.getFSRPoint(0).getZ()
+    plot_params = PlotParams()
+    plot_params.geometry = geometry
+    plot_params.zcoord = zcoord
+    plot_params.gridsize = gridsize
+    plot_params.library = library
+    plot_params.xlim = xlim
+    plot_params.ylim = ylim
+    plot_params.suptitle = 'Flat Source Region Fission Rates'
+    plot_params.title = 'z = {0}'.format(zcoord)
+    plot_params.filename = 'fission-rates-z-{0}.png'.format(zcoord)
+    plot_params.transparent_zeros = True
+    plot_params.colorbar = True
+    plot_params.cmap = plt.get_cmap('jet')
+    plot_params.norm = norm
+
+    # Plot the fission rates
+    figures = plot_spatial_data(fission_rates, plot_params, get_figure)
+
+    # Return the figure if requested by user
+    if get_figure:
+        return figures[0]
+
+
+def plot_eigenmode_fluxes(iramsolver, eigenmodes=[], energy_groups=[1],
+                          norm=False, gridsize=250, xlim=None, ylim=None,
+                          get_figure=False, library='matplotlib',
+                          num_workers=1):
+    """Plot the color-coded 2D surface plot of FSR scalar fluxes for one or
+    more eigenmodes from an IRAMSolver.
+
+    The IRAMSolver must have computed the eigenmodes before calling this routine.
+
+    Parameters
+    ----------
+    iramsolver : openmoc.krylov.IRAMSolver
+        An OpenMOC IRAM solver used to compute the flux eigenmodes
+    energy_groups : Iterable of Integral
+        The energy groups to plot (starting at 1 for the highest energy)
+    norm : bool
+        Whether to normalize the fission rates (False by default)
+    gridsize : Integral, optional
+        The number of grid cells for the plot (250 by default)
+    xlim : 2-tuple of Real, optional
+        The minimim/maximum x-coordinates
+    ylim : 2-tuple of Real, optional
+        The minimim/maximum y-coordinates
+    get_figure : bool
+        Whether to return the Matplotlib figure (only if library='matplotlib')
+    library : {'matplotlib', 'pil'}
+        The plotting library to use
+    num_workers : Integral, optional
+        The number of processes used to render and save the plots for all
+        eigenmodes and energy groups (1 by default). This is ignored if
+        get_figure is True.
+
+    Returns
+    -------
+    fig : list of matplotlib.Figure or None
+        The Matplotlib figures for each eigenmode and energy group are
+        returned if get_figure is True
+
+    Examples
+    --------
+    A user may invoke this function from an OpenMOC Python file as follows:
+
+        >>> openmoc.plotter.plot_eigenmode_fluxes(iramsolver, energy_groups=[3])
+
+    """
+
+    cv.check_type('iramsolver', iramsolver, openmoc.krylov.IRAMSolver)
+    cv.check_type('eigenmodes', eigenmodes, Iterable, Integral)
+
+    py_printf('NORMAL', 'Plotting the eigenmode fluxes...')
+
+    cv.check_type('energy_groups', energy_groups, Iterable, Integral)
+
+    # Initialize plotting parameters
+    geometry = iramsolver._moc_solver.getGeometry()
+    num_fsrs = geometry.getNumFSRs()
+    num_groups = geometry.getNumEnergyGroups()
+    zcoord = geometry.getFSRPoint(0).getZ()
+    plot_params = PlotParams()
+    plot_params.geometry = geometry
+    plot_params.zcoord = zcoord
+    plot_params.gridsize = gridsize
+    plot_params.library = library
+    plot_params.xlim = xlim
+    plot_params.ylim = ylim
+    plot_params.colorbar = True
+    plot_params.cmap = plt.get_cmap('jet')
+    plot_params.norm = norm
+    plot_params.title = 'z = {0}'.format(zcoord)
+
+    # Gather the plots for all eigenmodes to render them together
+    plots = []
+
+    # Loop over each eigenmode
+    for mode in eigenmodes:
+
+        # Extract the eigenvector for this eigenmode from the IRAMSolver
+        fluxes = np.real(iramsolver._eigenvectors[:,mode-1])
+        fluxes = np.reshape(fluxes, (num_fsrs, num_groups))
+
+        # Ensure the primary eigenvector is positive
+        if mode == 1:
+            fluxes = np.abs(fluxes)
+
+        # Set subdirectory folder for this eigenmode
+        num_digits = len(str(max(eigenmodes)))
+        directory = openmoc.get_output_directory() + \
+            '/plots/eig-{0}-flux/'.format(str(mode).zfill(num_digits))
+
+        # Plot this eigenmode's spatial fluxes
+        plots.extend(_get_flux_plots(fluxes, energy_groups, plot_params,
+                                     directory))
+
+    # Return Matplotlib figures if requested by user
+    coords = _get_pixel_coords(plot_params)
+    return _export_spatial_plots(plots, plot_params, coords['bounds'],
+                                 get_figure, num_workers)
+
+
+def plot_spatial_data(domains_to_data, plot_params, get_figure=False,
+                      num_workers=1):
+    """Plots a color-coded 2D surface plot of arbitrary data mapped to each
+    spatial domain in the geometry.
+
+    The plot_params must include the domain type encoded in domains_to_data.
+
+    Parameters
+    ----------
+    domains_to_data : dict or numpy.ndarray or pandas.DataFrame
+        A mapping between spatial domain IDs and numerical data to plot.
+        In the case of 'material' and 'cell' domain types, domains_to_data must
+        be a Python dictionary with keys representing material/cell IDs and
+        values of the data to plot. In the case of the 'fsr' domain type,
+        domains_to_data may be a dictionary, NumPy array or a Pandas DataFrame
+        indexed by FSR ID and values of the data to plot.
+    plot_params : openmoc.plotter.PlotParams
+        The plotting parameters
+    get_figure : bool, optional
+        Whether to return the Matplotlib figures (False by default)
+    num_workers : Integral, optional
+        The number of processes used to render and save the plots (1 by
+        default). This is ignored if get_figure is True.
+
+    Returns
+    -------
+    fig : list of matplotlib.Figure or None
+        The Matplotlib figures are returned if get_figure is True
+
+    Examples
+    --------
+    A user may invoke this function from an Python file as follows:
+        >>> fsrs_to_data = numpy.random.rand(geometry.getNumFSRS())
+        >>> plot_params = PlotParams()
+        >>> plot_params.domain_type = 'fsr'
+        >>> openmoc.plotter.plot_spatial_data(fsrs_to_data, plot_params)
+
+    """
+
+    cv.check_type('plot_params', plot_params, PlotParams)
+    cv.check_type('num_workers', num_workers, Integral)
+    cv.check_greater_than('num_workers', num_workers, 0)
+
+    # Determine the number of domains
+    if plot_params.domain_type == 'material':
+        num_domains = len(plot_params.geometry.getAllMaterials())
+    elif plot_params.domain_type == 'cell':
+        num_domains = len(plot_params.geometry.getAllMaterialCells())
+    else:
+        num_domains = plot_params.geometry.getNumFSRs()
+
+    if isinstance(domains_to_data, (np.ndarray, dict)):
+        pandas_df = False
+        if len(domains_to_data) != num_domains:
+            py_printf('ERROR', 'The domains_to_data array is length %d but ' +
+                      'there are %d domains', len(domains_to_data), num_domains)
+    elif 'DataFrame' in str(type(domains_to_data)):
+        pandas_df = True
+        if len(domains_to_data) != plot_params.geometry.getNumFSRs():
+            py_printf('ERROR', 'The domains_to_data DataFrame is length %d ' +
+                      'but there are %d domains in the Geometry',
+                      len(domains_to_data), num_domains)
+    else:
+        py_printf('ERROR', 'Unable to plot spatial data since ' +
+                  'domains_to_data is not a dict, array or DataFrame')
+
+    global subdirectory
+    directory = openmoc.get_output_directory() + subdirectory
+
+    # Retrieve the pixel coordinates and the domain IDs on the spatial grid
+    coords, domains = _get_domains_on_grid(plot_params)
+
+    # Make domains-to-data array 2D to mirror a Pandas DataFrame
+    if isinstance(domains_to_data, np.ndarray) and domains_to_data.ndim == 1:
+        domains_to_data = domains_to_data.reshape(-1, 1)
+
+    # Determine the number of plots to generate
+    if pandas_df or isinstance(domains_to_data, np.ndarray):
+        num_plots = domains_to_data.shape[1]
+    else:
+        num_plots = int(len(domains_to_data) / num_domains)
+
+    # Build the surface, filename and suptitle of each plot
+    plots = []
+
+    # Loop over all columns in NumPy array or Pandas DataFrame input
+    for i in range(num_plots):
+
+        # Use domain IDs to appropriately index into FSR data
+        # If domains-to-data was input as a Pandas DataFrame
+        if pandas_df:
+            surface = _get_surface(domains_to_data.ix[:,i].values, domains,
+                                   plot_params)
+        # If domains-to-data was input as a NumPy array
+        elif isinstance(domains_to_data, np.ndarray):
+            surface = _get_surface(domains_to_data[:,i], domains, plot_params)
+        # If domains-to-data was input as a Python dictionary
+        else:
+            surface = np.zeros(domains.shape, dtype=np.float)
+            for domain_id in domains_to_data:
+                indices = np.where(domains == domain_id)
+                surface[indices] = domains_to_data[domain_id]
+            surface = _get_surface(surface, None, plot_params)
+
+        # Create plot filename
+        plot_filename = directory + plot_params.filename
+
+        # If input was Pandas DataFrame, append column name to filename
+        if pandas_df:
+            plot_filename += '-{0}'.format(domains_to_data.columns[i])
+
+        # Append file extension (e.g., '.png', '.ppm') to filename
+        plot_filename += plot_params.extension
+
+        # If input was Pandas DataFrame, append column name to suptitle
+        suptitle = plot_params.suptitle
+        if suptitle and pandas_df:
+            suptitle += ' ({0})'.format(domains_to_data.columns[i])
+
+        plots.append((surface, plot_filename, suptitle))
+
+    # Render and save the plots or return them to the user
+    return _export_spatial_plots(plots, plot_params, coords['bounds'],
+                                 get_figure, num_workers)
+
+
+def plot_tiled_spatial_data(domains_to_data, plot_params, tile_size=1024,
+                            pyramid=False, num_workers=1):
+    """Plots a color-coded 2D surface plot of arbitrary data mapped to each
+    spatial domain in the geometry as a grid of image tiles.
+
+    This routine renders very large plots, such as full-core FSR layouts at
+    pin resolution, without holding the whole image in memory. The plotting
+    window of plot_params.gridsize pixels along each axis is split into
+    square tiles which are queried, colored with the Python Imaging Library
+    (PIL) and saved to disk as they finish. The tiles of each zoom level are
+    saved as '<row>-<column><extension>' in a '<level>' subdirectory of a
+    directory named by plot_params.filename, with the full resolution tiles
+    at level 0.
+
+    If a zoom pyramid is requested, each tile at level n+1 is downsampled
+    from the 2x2 tiles beneath it at level n until the whole window fits in
+    a single tile.
+
+    NOTE: Worker processes are forked and therefore require a POSIX platform.
+    The Geometry is queried with OpenMP by the calling process for a batch of
+    tiles at a time, while the workers color and save the previous batch.
+
+    Parameters
+    ----------
+    domains_to_data : dict or numpy.ndarray
+        A mapping between spatial domain IDs and numerical data to plot. In
+        the case of 'material' and 'cell' domain types, domains_to_data must
+        be a Python dictionary with keys representing material/cell IDs and
+        values of the data to plot. In the case of the 'fsr' domain type,
+        domains_to_data may be a dictionary or NumPy array indexed by FSR ID.
+    plot_params : openmoc.plotter.PlotParams
+        The plotting parameters
+    tile_size : Integral, optional
+        The number of pixels along each axis of a tile (1024 by default)
+    pyramid : bool, optional
+        Whether to build a zoom pyramid of downsampled tiles (False by default)
+    num_workers : Integral, optional
+        The number of worker processes used to color and save the tiles (1
+        by default)
+
+    Returns
+    -------
+    directory : str
+        The directory with the subdirectory of tiles for each zoom level
+
+    Examples
+    --------
+    A user may invoke this function from an Python file as follows:
+        >>> plot_params = PlotParams()
+        >>> plot_params.geometry = geometry
+        >>> plot_params.domain_type = 'fsr'
+        >>> plot_params.filename = 'fsr-tiles'
+        >>> plot_params.gridsize = 20000
+        >>> openmoc.plotter.plot_tiled_spatial_data(
+        ...     fission_rates, plot_params, pyramid=True, num_workers=4)
+
+    """
+
+    global subdirectory, _tiled_plot
+
+    cv.check_type('plot_params', plot_params, PlotParams)
+    cv.check_type('domains_to_data', domains_to_data, (np.ndarray, dict))
+    cv.check_type('tile_size', tile_size, Integral)
+    cv.check_greater_than('tile_size', tile_size, 0)
+    cv.check_type('pyramid', pyramid, bool)
+    cv.check_type('num_workers', num_workers, Integral)
+    cv.check_greater_than('num_workers', num_workers, 0)
+
+    if plot_params.filename is None:
+        py_printf('ERROR', 'Unable to plot tiled spatial data without a ' +
+                  'filename for the directory of tiles')
+
+    # Map the data to an array if it is indexed by FSR ID
+    if isinstance(domains_to_data, np.ndarray):
+        data = np.asarray(np.ravel(domains_to_data), dtype=np.float)
+        values = data
+    else:
+        data = domains_to_data
+        values = np.asarray(list(domains_to_data.values()), dtype=np.float)
+
+    # Normalize the data to the maximum over all domains rather than tiles
+    if plot_params.vmax is not None:
+        vmax = plot_params.vmax
+    elif plot_params.norm:
+        vmax = 1.
+    else:
+        vmax = np.nanmax(values)
+    scale = 1. / np.nanmax(values) if plot_params.norm else 1.
+
+    # Color "bad" numbers (ie, NaN, INF) with transparent pixels
+    if plot_params.cmap:
+        plot_params.cmap.set_bad(alpha=0.0)
+
+    directory = openmoc.get_output_directory() + subdirectory + \
+        plot_params.filename + '/'
+
+    # Split the pixels of the plotting window into tiles, with the rows of
+    # pixels ordered from the top to the bottom of the window
+    coords = _get_pixel_coords(plot_params)
+    num_tiles = -(-plot_params.gridsize // tile_size)
+
+    _tiled_plot = {'data': data,
+                   'x': coords['x'],
+                   'y': coords['y'][::-1],
+                   'geometry': plot_params.geometry,
+                   'zcoord': plot_params.zcoord,
+                   'domain_type': plot_params.domain_type,
+                   'scale': scale,
+                   'vmax': vmax,
+                   'transparent_zeros': plot_params.transparent_zeros,
+                   'cmap': plot_params.cmap,
+                   'tile_size': tile_size,
+                   'num_tiles': num_tiles,
+                   'directory': directory,
+                   'extension': plot_params.extension}
+
+    py_printf('NORMAL', 'Plotting %d x %d tiles of %d x %d pixels...',
+              num_tiles, num_tiles, tile_size, tile_size)
+
+    timer = time.time()
+    level = 0
+    tiles = [(row, col) for row in range(num_tiles)
+             for col in range(num_tiles)]
+
+    # The worker processes only color and save the tiles
+    num_workers = min(num_workers, len(tiles))
+    pool = _fork_pool(num_workers) if num_workers > 1 else None
+
+    try:
+        # Render the full resolution tiles, then downsample the tiles of
+        # each zoom level from those beneath it
+        while True:
+            try:
+                os.makedirs(directory + str(level))
+            except OSError:
+                pass
+
+            if pool is None:
+                for tile in tiles:
+                    _render_tile(level, tile)
+
+            # Query a batch of tiles in this process while the workers color
+            # and save the previous batch
+            else:
+                pending = None
+                for i in range(0, len(tiles), num_workers):
+                    batch = [(level, tile, _query_tile(tile) if level == 0
+                              else None)
+                             for tile in tiles[i:i+num_workers]]
+                    if pending is not None:
+                        pending.get()
+                    pending = pool.map_async(_render_tile_star, batch)
+                pending.get()
+
+            if not pyramid or num_tiles == 1:
+                break
+
+            level += 1
+            num_tiles = -(-num_tiles // 2)
+            _tiled_plot['num_tiles'] = num_tiles
+            tiles = [(row, col) for row in range(num_tiles)
+                     for col in range(num_tiles)]
+
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+        _tiled_plot = None
+
+    timer = time.time() - timer
+    py_printf('INFO', 'Rendered %d zoom level(s) with %d process(es) in ' +
+              '%.3f sec (%.2E pixels/sec)', level + 1, num_workers, timer,
+              plot_params.gridsize ** 2 / max(timer, 1e-12))
+
+    return directory
+
+
+def plot_quadrature(solver, get_figure=False):
+    """Plots the quadrature set used for an OpenMOC simulation.
+
+    This method requires that tracks have been generated by a TrackGenerator
+    owned by the solver.
+
+    Paramters
+    ---------
+    solver : openmoc.Solver
+        An OpenMOC solver with a trackgenerator
+    get_figure : bool
+        Whether to return the Matplotlib figure
+
+    Returns
+    -------
+    fig : matplotlib.Figure or None
+        The Matplotlib figure is returned if get_figure is True
+
+    Examples
+    --------
+    A user may invoke this routine from an OpenMOC Python file as follows:
+
+        >>> openmoc.plotter.plot_quadrature(solver)
+
+    """
+
+    global solver_types
+    cv.check_type('solver', solver, solver_types)
+
+    py_printf('NORMAL', 'Plotting the quadrature...')
+
+    global subdirectory, matplotlib_rcparams
+    directory = openmoc.get_output_directory() + subdirectory
+
+    # Ensure that normal settings are used even if called from ipython
+    curr_rc = dict(matplotlib.rcParams)
+    matplotlib.rcParams.update(matplotlib_rcparams)
+
+    # Make directory if it does not exist
+    try:
+        os.makedirs(directory)
+    except OSError:
+        pass
+
+    # Retrieve data from TrackGenerator
+    track_generator = solver.getTrackGenerator()
+    quad = track_generator.getQuadrature()
+    num_azim = track_generator.getNumAzim()
+    azim_spacing = track_generator.getDesiredAzimSpacing()
+    num_polar_2 = int(quad.getNumPolarAngles() / 2)
+    phis = np.zeros(num_azim/4)
+    thetas = np.zeros(num_polar_2)
+
+    # Get the polar angles
+    for p in range(num_polar_2):
+        thetas[p] = np.arcsin(quad.getSinTheta(0,p))
+
+    # Get the azimuthal angles
+    for a in range(int(num_azim / 4)):
+        phis[a] = track_generator.getPhi(a)
+
+    # Make a 3D figure
+    fig = plt.figure()
+    fig.patch.set_facecolor('none')
+    ax = fig.gca(projection ='3d')
+
+    # Plot a wire mesh on one octant of the unit sphere
+    u = np.linspace(0, np.pi/2.0, 100)
+    v = np.linspace(0, np.pi/2.0, 100)
+    x = np.outer(np.cos(u), np.sin(v))
+    y = np.outer(np.sin(u), np.sin(v))
+    z = np.outer(np.ones(np.size(u)), np.cos(v))
+    ax.plot_wireframe(x, y, z, rstride=5, cstride=5, color='k', linewidth=0.1)
+
+    # Plot the quadrature points on the octant unit sphere
+    for a in range(int(num_azim / 4)):
+        for p in range(num_polar_2):
+            ax.scatter(np.cos(phis[a]) * np.sin(thetas[p]), np.sin(phis[a]) *
+                       np.sin(thetas[p]), np.cos(thetas[p]), s=50, color='b')
+
+    # Get the quadrature type
+    quad_type = ''
+    if quad.getQuadratureType() is openmoc.TABUCHI_YAMAMOTO:
+        quad_type = 'TABUCHI_YAMAMOTO'
+        title = 'TABUCHI YAMAMOTO'
+    elif quad.getQuadratureType() is openmoc.LEONARD:
+        quad_type = 'LEONARD'
+        title = 'LEONARD'
+    elif quad.getQuadratureType() is openmoc.GAUSS_LEGENDRE:
+        quad_type = 'GAUSS_LEGENDRE'
+        title = 'GAUSS LEGENDRE'
+    elif quad.getQuadratureType() is openmoc.EQUAL_WEIGHTS:
+        quad_type = 'EQUAL_WEIGHTS'
+        title = 'EQUAL WEIGHTS'
+    elif quad.getQuadratureType() is openmoc.EQUAL_ANGLES:
+        quad_type = 'EQUAL_ANGLES'
+        title = 'EQUAL ANGLES'
+    elif quad.getQuadratureType() is openmoc.CUSTOM:
+        quad_type = 'CUSTOM'
+        title = 'CUSTOM'
+    else:
+        py_printf('ERROR', 'Unable to plot the quadrature since the ' +
+                  'quadrature type could not be recognized')
+
+    title += ' with ' + str(num_azim) + ' azim, ' + \
+             '{:5.3f}'.format(azim_spacing) + ' spacing and ' \
+             + str(2*num_polar_2) + ' polar'
+
+    filename = directory + 'quad_' + quad_type + '_' + \
+               str(num_azim) + '_azim_' + '{:5.3f}'.format(azim_spacing) + \
+               '_cm_spacing_' + str(2*num_polar_2) + '_polar.png'
+
+    ax.view_init(elev=30, azim=45)
+    ax.set_xlim([0,1])
+    ax.set_ylim([0,1])
+    ax.set_zlim([0,1])
+    plt.title(title)
+
+    # Restore settings if called from ipython
+    matplotlib.rcParams.update(curr_rc)
+
+    # Save the figure or return to user
+    if get_figure:
+        return fig
+    else:
+        fig.savefig(filename, bbox_inches='tight')
+        plt.close(fig)
+
+
+class PlotParams(object):
+    """A container for plotting parameters for spatially-varying plots.
+
+    Attributes
+    ----------
+    geometry : openomc.Geometry
+        The Geometry to query when generating the spatial map
+    domain_type : str
+        The domain type used to map spatial data to the geometry
+    filename : str
+        The filename string
+    extension : str
+        The image file extension (e.g., '.png')
+    library : {'matplotlib', 'pil'}
+        The image processing library to use to generate the plot
+    zcoord : Real
+        The z-coordinate at which to slice the Geometry
+    gridsize : Integral
+        The number of points along the x- and y-axes
+    xlim : 2-tuple of Real
+        A 2-tuple of (maximum, minimum) x-coordinates to display
+    ylim : 2-tuple of Real
+        A 2-tuple of (maximum, minimum) y-coordinates to display
+    title : str
+        The minor title string
+    suptitle : str
+        The major title string
+    norm : bool
+        Normalize the plotted data to unity
+    transparent_zeros : bool
+        Make zeros in the data appear transparent
+    interpolation : str
+        Interpolation used between points (e.g., 'nearest')
+    colorbar : bool
+        Include a colorbar to the right of the plot
+    cmap : matplotlib.colormap
+        A Matplotlib colormap for the plot
+    vmin : Real
+        The minimum value used in colormapping the data
+    vmax : Real
+        The maximum value used in colormapping the data
+
+    """
+
+    def __init__(self):
+
+        self._geometry = None
+        self._domain_type = 'fsr'
+        self._filename = None
+        self._extension = '.png'
+        self._library = 'matplotlib'
+        self._zcoord = 0
+        self._gridsize = 250
+        self._xlim = None
+        self._ylim = None
+        self._title = None
+        self._suptitle = None
+        self._norm = False
+        self._transparent_zeros = False
+        self._interpolation = None
+        self._colorbar = False
+        self._cmap = plt.get_cmap('spectral')
+        self._vmin = None
+        self._vmax = None
+
+    @property
+    def geometry(self):
+        return self._geometry
+
+    @property
+    def domain_type(self):
+        return self._domain_type
+
+    @property
+    def filename(self):
+        return self._filename
+
+    @property
+    def extension(self):
+        return self._extension
+
+    @property
+    def library(self):
+        return self._library
+
+    @property
+    def zcoord(self):
+        return self._zcoord
+
+    @property
+    def gridsize(self):
+        return self._gridsize
+
+    @property
+    def xlim(self):
+        return self._xlim
+
+    @property
+    def ylim(self):
+        return self._ylim
+
+    @property
+    def colorbar(self):
+        return self._colorbar
+
+    @property
+    def title(self):
+        return self._title
+
+    @property
+    def suptitle(self):
+        return self._suptitle
+
+    @property
+    def norm(self):
+        return self._norm
+
+    @property
+    def transparent_zeros(self):
+        return self._transparent_zeros
+
+    @property
+    def interpolation(self):
+        return self._interpolation
+
+    @property
+    def cmap(self):
+        return self._cmap
+
+    @property
+    def vmin(self):
+        return self._vmin
+
+    @property
+    def vmax(self):
+        return self._vmax
+
+    @geometry.setter
+    def geometry(self, geometry):
+        cv.check_type('geometry', geometry, openmoc.Geometry)
+        self._geometry = geometry
+        self._check_zcoord()
+
+    @domain_type.setter
+    def domain_type(self, domain_type):
+        cv.check_value('domain_type', domain_type, ('material', 'cell', 'fsr'))
+        self._domain_type = domain_type
+
+    @filename.setter
+    def filename(self, filename):
+        cv.check_type('filename', filename, basestring)
+        self._filename = filename
+
+    @extension.setter
+    def extension(self, extension):
+        cv.check_type('extension', extension, basestring)
+        self._extension = extension
+
+    @library.setter
+    def library(self, library):
+        cv.check_value('library', library, ('matplotlib', 'pil'))
+        self._library = library
+
+    @zcoord.setter
+    def zcoord(self, zcoord):
+        if zcoord:
+            self._zcoord = zcoord
+        self._check_zcoord()
+
+    @gridsize.setter
+    def gridsize(self, gridsize):
+        cv.check_type('gridsize', gridsize, Integral)
+        cv.check_greater_than('gridsize', gridsize, 0)
+        self._gridsize = gridsize
+
+    @xlim.setter
+    def xlim(self, xlim):
+        if xlim:
+            cv.check_type('xlim', xlim, tuple)
+            cv.check_length('xlim', xlim, 2, 2)
+        self._xlim = xlim
+
+    @ylim.setter
+    def ylim(self, ylim):
+        if ylim:
+            cv.check_type('ylim', ylim, tuple)
+            cv.check_length('ylim', ylim, 2, 2)
+        self._ylim = ylim
+
+    @colorbar.setter
+    def colorbar(self, colorbar):
+        cv.check_type('colorbar', colorbar, bool)
+        self._colorbar = colorbar
+
+    @title.setter
+    def title(self, title):
+        cv.check_type('title', title, basestring)
+        self._title = title
+
+    @suptitle.setter
+    def suptitle(self, suptitle):
+        cv.check_type('suptitle', suptitle, basestring)
+        self._suptitle = suptitle
+
+    @norm.setter
+    def norm(self, norm):
+        cv.check_type('norm', norm, bool)
+        self._norm = norm
+
+    @transparent_zeros.setter
+    def transparent_zeros(self, transparent_zeros):
+        cv.check_type('transparent_zeros', transparent_zeros, bool)
+        self._transparent_zeros = transparent_zeros
+
+    @interpolation.setter
+    def interpolation(self, interpolation):
+        cv.check_type('interpolation', interpolation, basestring)
+        self._interpolation = interpolation
+
+    @cmap.setter
+    def cmap(self, cmap):
+        cv.check_type('cmap', cmap, (matplotlib.colors.Colormap, type(None)))
+        self._cmap = cmap
+
+    @vmin.setter
+    def vmin(self, vmin):
+        cv.check_type('vmin', vmin, Real)
+        self._vmin = vmin
+
+    @vmax.setter
+    def vmax(self, vmax):
+        cv.check_type('vmax', vmax, Real)
+        self._vmax = vmax
+
+    def _check_zcoord(self):
+        if self.zcoord and self.geometry:
+            cv.check_type('zcoord', self.zcoord, Real)
+            cv.check_greater_than('zcoord', self.zcoord,
+                                  self.geometry.getMinZ(), equality=True)
+            cv.check_less_than('zcoord', self.zcoord,
+                               self.geometry.getMaxZ(), equality=True)
+
+
+def _get_pixel_coords(plot_params):
+    """A helper method to define coordinates for a plotting window.
+
+    This routine builds a coordinate surface map for the plotting window defined
+    for by the user. If no window was defined, then this routine uses the outer
+    bounding box around the geometry as the plotting window.
+
+    Parameters
+    ----------
+    plot_params : openmoc.plotter.PlotParams
+        A PlotParams object initialized with a geometry
+
+    Returns
+    -------
+    coords : dict
+        A dictionary with the plotting window map and bounding box
+
+    """
+
+    # initialize variables to be returned
+    geometry = plot_params.geometry
+    bounds = [geometry.getMinX() + TINY_MOVE, geometry.getMaxX() - TINY_MOVE,
+              geometry.getMinY() + TINY_MOVE, geometry.getMaxY() - TINY_MOVE]
+    coords = dict()
+
+    if not plot_params.xlim is None:
+        bounds[0] = plot_params.xlim[0]
+        bounds[1] = plot_params.xlim[1]
+
+    if not plot_params.ylim is None:
+        bounds[2] = plot_params.ylim[0]
+        bounds[3] = plot_params.ylim[1]
+
+    xcoords = np.linspace(bounds[0], bounds[1], plot_params.gridsize)
+    ycoords = np.linspace(bounds[2], bounds[3], plot_params.gridsize)
+
+    # add attributes to coords dictionary
+    coords['x'] = xcoords
+    coords['y'] = ycoords
+    coords['bounds'] = bounds
+
+    return coords
+
+
+def clear_raster_cache():
+    """Clear the cache of domain IDs rasterized on plotting grids.
+
+    The domain IDs on the plotting grid of each plot are cached such that
+    later plots of the same Geometry, window and domain type need not query
+    the Geometry again. The cache must be cleared if the Geometry is modified
+    after plotting without changing its number of FSRs.
+
+    """
+
+    _raster_cache.clear()
+
+
+def _get_domains_on_grid(plot_params):
+    """A helper method to rasterize the domain IDs on a plotting window.
+
+    This routine queries the Geometry for the material, cell or FSR ID at
+    each pixel in the plotting window. The domain IDs are cached such that
+    later plots with the same Geometry, window, gridsize, z-coordinate and
+    domain type reuse them.
+
+    Parameters
+    ----------
+    plot_params : openmoc.plotter.PlotParams
+        A PlotParams object initialized with a geometry
+
+    Returns
+    -------
+    coords : dict
+        A dictionary with the plotting window map and bounding box
+    domains : numpy.ndarray
+        A read-only 2D array of the domain IDs at each pixel
+
+    """
+
+    global raster_cache_size
+
+    coords = _get_pixel_coords(plot_params)
+    geometry = plot_params.geometry
+    key = (int(geometry.this), geometry.getNumFSRs(), tuple(coords['bounds']),
+           plot_params.gridsize, plot_params.zcoord, plot_params.domain_type)
+
+    if key in _raster_cache:
+        _raster_cache[key] = _raster_cache.pop(key)
+        return coords, _raster_cache[key][1]
+
+    # Query the geometry for the data on the spatial grid
+    domains = geometry.getSpatialDataOnGrid(
+        coords['x'], coords['y'], zcoord=plot_params.zcoord,
+        domain_type=plot_params.domain_type)
+    domains = np.reshape(np.asarray(domains, dtype=np.int64),
+                         tuple(([plot_params.gridsize]*2)))
+    domains.flags.writeable = False
+
+    # Store a reference to the Geometry with its domain IDs such that its
+    # address is not reused by another Geometry while it is in the cache
+    _raster_cache[key] = (geometry, domains)
+    while len(_raster_cache) > raster_cache_size:
+        _raster_cache.popitem(last=False)
+
+    return coords, domains
+
+
+def _get_surface(data, domains, plot_params):
+    """A helper method to map data for each domain onto the plotting grid.
+
+    Parameters
+    ----------
+    data : numpy.ndarray
+        The data for each domain, or the data on the plotting grid if
+        domains is None
+    domains : numpy.ndarray or None
+        The 2D array of domain IDs on the plotting grid
+    plot_params : openmoc.plotter.PlotParams
+        The plotting parameters
+
+    Returns
+    -------
+    surface : numpy.ndarray
+        The 2D array of data on the plotting grid
+
+    """
+
+    if domains is None:
+        surface = np.array(data, dtype=np.float)
+    else:
+        surface = np.asarray(data, dtype=np.float).take(domains)
+
+    # Reshape data to 2D array for Matplotlib image plot
+    surface.shape = (plot_params.gridsize, plot_params.gridsize)
+
+    # Normalize data to maximum if requested
+    if plot_params.norm:
+        surface /= np.max(surface)
+
+    # Set zero data entries to NaN so Matplotlib will make them transparent
+    if plot_params.transparent_zeros:
+        indices = np.where(surface == 0.0)
+        surface[indices] = np.nan
+
+    return surface
+
+
+def _get_flux_plots(fluxes, energy_groups, plot_params, directory):
+    """A helper method to build the plots of the fluxes in energy groups.
+
+    Parameters
+    ----------
+    fluxes : numpy.ndarray
+        The scalar fluxes indexed by FSR and energy group
+    energy_groups : Iterable of Integral
+        The energy groups to plot (starting at 1 for the highest energy)
+    plot_params : openmoc.plotter.PlotParams
+        The plotting parameters
+    directory : str
+        The directory to save the plots in
+
+    Returns
+    -------
+    plots : list of tuple
+        The 2D surface, filename and suptitle of each plot
+
+    """
+
+    coords, domains = _get_domains_on_grid(plot_params)
+    zcoord = plot_params.zcoord
+
+    plots = []
+    for group in energy_groups:
+        surface = _get_surface(fluxes[:,group-1], domains, plot_params)
+        filename = directory + 'fsr-flux-group-{0}-z-{1}'.format(group, zcoord)
+        suptitle = 'FSR Scalar Flux (Group {0})'.format(group)
+        plots.append((surface, filename + plot_params.extension, suptitle))
+
+    return plots
+
+
+def _export_spatial_plots(plots, plot_params, bounds, get_figure=False,
+                          num_workers=1):
+    """A helper method to render and save or return 2D surface plots.
+
+    The plots are rendered and saved in turn by this process unless a pool
+    of worker processes is requested. The worker processes are forked and
+    therefore require a POSIX platform.
+
+    Parameters
+    ----------
+    plots : list of tuple
+        The 2D surface, filename and suptitle of each plot
+    plot_params : openmoc.plotter.PlotParams
+        The plotting parameters shared by all plots
+    bounds : list of Real
+        The bounding box of the plotting window
+    get_figure : bool
+        Whether to return the Matplotlib figures / PIL Images rather than
+        saving them (False by default)
+    num_workers : Integral
+        The number of processes used to render and save the plots
+
+    Returns
+    -------
+    figures : list of matplotlib.Figure or PIL.Image or None
+        The figures are returned if get_figure is True
+
+    """
+
+    global _export_plots, _export_settings
+
+    # Color "bad" numbers (ie, NaN, INF) with transparent pixels
+    if plot_params.cmap:
+        plot_params.cmap.set_bad(alpha=0.0)
+
+    settings = {'library': plot_params.library,
+                'bounds': bounds,
+                'interpolation': plot_params.interpolation,
+                'vmin': plot_params.vmin,
+                'vmax': plot_params.vmax,
+                'cmap': plot_params.cmap,
+                'colorbar': plot_params.colorbar,
+                'title': plot_params.title}
+
+    if get_figure:
+        return [_render_spatial_plot(surface, None, suptitle, settings)
+                for surface, filename, suptitle in plots]
+
+    # Make the directories if they do not exist
+    for directory in set(os.path.dirname(plot[1]) for plot in plots):
+        try:
+            os.makedirs(directory)
+        except OSError:
+            pass
+
+    timer = time.time()
+    num_workers = min(num_workers, len(plots))
+
+    # Render and save the plots in this process or in forked worker processes
+    if num_workers <= 1:
+        for surface, filename, suptitle in plots:
+            _render_spatial_plot(surface, filename, suptitle, settings)
+    else:
+        _export_plots = plots
+        _export_settings = settings
+        pool = _fork_pool(num_workers)
+        try:
+            pool.map(_export_spatial_plot, range(len(plots)))
+        finally:
+            pool.close()
+            pool.join()
+            _export_plots = None
+            _export_settings = None
+
+    timer = time.time() - timer
+    py_printf('INFO', 'Exported %d plots with %d process(es) in %.3f sec ' +
+              '(%.2f plots/sec)', len(plots), max(num_workers, 1), timer,
+              len(plots) / max(timer, 1e-12))
+
+
+def _fork_pool(num_workers):
+    """Return a pool of worker processes forked from this process.
+
+    The workers find the plots they render in module globals, which are only
+    inherited by forked workers, so processes are forked even where they are
+    spawned by default.
+
+    Parameters
+    ----------
+    num_workers : Integral
+        The number of worker processes
+
+    Returns
+    -------
+    pool : multiprocessing.Pool
+        The pool of forked worker processes
+
+    """
+
+    if sys.version_info[0] == 2:
+        return multiprocessing.Pool(num_workers)
+
+    if 'fork' not in multiprocessing.get_all_start_methods():
+        py_printf('ERROR', 'Unable to plot with %d worker processes since ' +
+                  'processes cannot be forked on this platform', num_workers)
+
+    return multiprocessing.get_context('fork').Pool(num_workers)
+
+
+def _export_spatial_plot(index):
+    """Render and save a single plot of the global export in a worker.
+
+    Parameters
+    ----------
+    index : Integral
+        The index of the plot to render and save
+
+    """
+
+    surface, filename, suptitle = _export_plots[index]
+    _render_spatial_plot(surface, filename, suptitle, _export_settings)
+
+
+def _render_spatial_plot(surface, filename, suptitle, settings):
+    """A helper method to render a 2D surface plot and save it to a file.
+
+    Parameters
+    ----------
+    surface : numpy.ndarray
+        The 2D array of data on the plotting grid
+    filename : str or None
+        The file to save the plot to, or None to return the figure
+    suptitle : str or None
+        The major title string
+    settings : dict
+        The library, bounding box, interpolation, colormap, colorbar and
+        minor title used to render the plot
+
+    Returns
+    -------
+    fig : matplotlib.Figure or PIL.Image or None
+        The figure is returned if no filename is given
+
+    """
+
+    global matplotlib_rcparams
+
+    # Use Python Imaging Library (PIL) to plot 2D color map of domain data
+    if settings['library'] == 'pil':
+        img = _get_pil_image(np.flipud(surface), settings['cmap'])
+
+        if filename is None:
+            return img
+        else:
+            img.save(filename)
+            return
+
+    # Use Matplotlib to plot 2D color map of domain data
+    # Ensure that normal settings are used even if called from ipython
+    curr_rc = dict(matplotlib.rcParams)
+    matplotlib.rcParams.update(matplotlib_rcparams)
+
+    fig = plt.figure()
+    fig.patch.set_facecolor('none')
+    plt.imshow(np.flipud(surface), extent=settings['bounds'],
+               interpolation=settings['interpolation'],
+               vmin=settings['vmin'], vmax=settings['vmax'],
+               cmap=settings['cmap'])
+
+    if settings['colorbar']:
+        plt.colorbar()
+    if settings['title']:
+        plt.title(settings['title'])
+    if suptitle:
+        plt.suptitle(suptitle)
+
+    # Save this Matplotlib figure unless the figure handle was requested for
+    # further specialization
+    if filename is not None:
+        fig.savefig(filename, bbox_inches='tight')
+        plt.close(fig)
+        fig = None
+
+    # Restore settings if called from ipython
+    matplotlib.rcParams.update(curr_rc)
+
+    return fig
+
+
+def _query_tile(tile):
+    """Query the Geometry for the domain IDs on the pixels of a single tile of
+    the global tiled plot.
+
+    Parameters
+    ----------
+    tile : 2-tuple of Integral
+        The row and column of the tile
+
+    Returns
+    -------
+    domains : numpy.ndarray of Integral
+        The domain IDs on the rows and columns of pixels of the tile
+
+    """
+
+    plot = _tiled_plot
+    row, col = tile
+    size = plot['tile_size']
+
+    xcoords = plot['x'][col*size:(col+1)*size]
+    ycoords = plot['y'][row*size:(row+1)*size]
+    domains = plot['geometry'].getSpatialDataOnGrid(
+        xcoords, ycoords, zcoord=plot['zcoord'],
+        domain_type=plot['domain_type'])
+    return np.reshape(np.asarray(domains, dtype=np.int64),
+                      (len(ycoords), len(xcoords)))
+
+
+def _render_tile(level, tile, domains=None):
+    """Render a single tile of the global tiled plot and save it to disk.
+
+    The full resolution tiles at level 0 are colored from the domain IDs on
+    their pixels, which are queried from the Geometry unless they are given.
+    The tiles at higher zoom levels are downsampled from the 2x2 tiles
+    beneath them, which are read back from disk.
+
+    Parameters
+    ----------
+    level : Integral
+        The zoom level of the tile
+    tile : 2-tuple of Integral
+        The row and column of the tile
+    domains : numpy.ndarray of Integral, optional
+        The domain IDs on the pixels of a tile at level 0
+
+    """
+
+    from PIL import Image
+
+    plot = _tiled_plot
+    row, col = tile
+    size = plot['tile_size']
+    directory = plot['directory']
+    extension = plot['extension']
+
+    # Downsample the 2x2 tiles beneath this one at the previous zoom level
+    if level > 0:
+        subtiles = []
+        for i in range(2):
+            for j in range(2):
+                filename = directory + '{0}/{1}-{2}{3}'.format(
+                    level - 1, 2*row + i, 2*col + j, extension)
+                if os.path.exists(filename):
+                    subtiles.append((i, j, Image.open(filename)))
+
+        width = max(j * size + img.size[0] for i, j, img in subtiles)
+        height = max(i * size + img.size[1] for i, j, img in subtiles)
+        img = Image.new('RGBA', (width, height))
+        for i, j, subtile in subtiles:
+            img.paste(subtile, (j * size, i * size))
+        img = img.resize((max(width // 2, 1), max(height // 2, 1)),
+                         Image.LANCZOS)
+
+    # Map the data onto the domain IDs on this tile's pixels
+    else:
+        if domains is None:
+            domains = _query_tile(tile)
+
+        if isinstance(plot['data'], np.ndarray):
+            surface = plot['data'].take(domains)
+        else:
+            surface = np.zeros(domains.shape, dtype=np.float)
+            for domain_id in plot['data']:
+                surface[domains == domain_id] = plot['data'][domain_id]
+
+        surface *= plot['scale']
+        if plot['transparent_zeros']:
+            surface[surface == 0.0] = np.nan
+
+        img = _get_pil_image(surface, plot['cmap'], plot['vmax'])
+
+    img.save(directory + '{0}/{1}-{2}{3}'.format(level, row, col, extension))
+
+
+def _render_tile_star(args):
+    """Unpack the arguments to render a tile of the global tiled plot in a
+    worker process."""
+
+    return _render_tile(*args)
+
+
+def _colorize(data, num_colors, seed=1):
+    """Replace unique data values with a random but reproducible color IDs.
+
+    This routine randomly assigns a random integer to each unique value in the
+    input array. This is a helper routine for the plotting routine.
+
+    Parameters
+    ----------
+    data : numpy.ndarray
+        A NumPy array of data to colorize
+    num_colors : Integral
+        The number of random colors to generate
+    seed : Integral
+        The random number seed used to generate colors
+
+    Returns
+    -------
+    ids_to_colors : numpy.ndarray
+        A NumPy array with the random integer colors
+
+    """
+
+    # Generate linearly-spaced array of color indices
+    all_ids = np.arange(num_colors, dtype=np.int64)
+
+    # Generate linearly-spaced integer color IDs
+    id_colors = np.arange(num_colors, dtype=np.int64)
+
+    # Randomly shuffle the linearly-spaced integer color IDs
+    numpy.random.seed(seed)
+    np.random.shuffle(id_colors)
+
+    # Insert random colors into appropriate locations in data array
+    ids_to_colors = np.arange(num_colors, dtype=np.int64)
+    ids_to_colors[all_ids] = id_colors
+
+    return ids_to_colors.take(data)
+
+
+def _get_pil_image(array, cmap, vmax=None):
+    """Plot 2D NumPy array data using Python Imaging Library (PIL).
+
+    This is a good alternative to matplotlib for high-resolution images. The
+    colormap is applied with a lookup table of its colors, which is much
+    faster than calling the colormap on the array for large images.
+
+    Parameters
+    ----------
+    array : numpy.ndarray
+        A NumPy array of data
+    cmap : matplotlib.colormap
+        The matplotlib colormap to use
+    vmax : Real or None
+        The value mapped to the top of the colormap (default is None for the
+        maximum of the array)
+
+    Returns
+    -------
+    float_array : PIL.Image
+        A Python Imaging Library (PIL) Image object
+
+    """
+
+    from PIL import Image
+
+    # Convert array to a normalized array of floating point values
+    float_array = np.zeros(array.shape, dtype=np.float)
+    float_array[:,:] = array[:,:]
+    if vmax is None:
+        vmax = np.nanmax(float_array)
+    float_array[:,:] /= vmax
+
+    # Build a lookup table of the colormap's colors followed by its colors
+    # for values under and over its range and for "bad" numbers
+    num_colors = cmap.N
+    lut = np.vstack((cmap(np.arange(num_colors)), cmap([-1., 2., np.nan])))
+    lut = np.uint8(lut * 255)
+
+    # Map the normalized values to the colormap's indices as Matplotlib does
+    float_array *= num_colors
+    float_array[float_array == num_colors] = num_colors - 1
+    bad = np.isnan(float_array)
+    float_array[bad] = 0.
+    indices = np.floor(float_array).astype(np.intp)
+    indices[float_array < 0.] = num_colors
+    indices[float_array >= num_colors] = num_colors + 1
+    indices[bad] = num_colors + 2
+
+    # Use Python Imaging Library (PIL) to create an image from the array
+    return Image.fromarray(lut.take(indices, axis=0))
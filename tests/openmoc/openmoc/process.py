@@ -0,0 +1,1657 @@
+import os
+import re
+import mmap
+import sys
+import math
+import datetime
+import operator
+from numbers import Integral, Real
+from collections import Iterable
+import pickle
+
+import numpy as np
+import h5py
+
+import openmoc
+
+# For Python 2.X.X
+if (sys.version_info[0] == 2):
+    from log import *
+    import checkvalue as cv
+# For Python 3.X.X
+else:
+    from openmoc.log import *
+    import openmoc.checkvalue as cv
+
+# Store viable OpenMOC solver types for type checking
+solver_types = (openmoc.Solver,)
+try:
+    # Try to import OpenMOC's CUDA module
+    if (sys.version_info[0] == 2):
+        from cuda import GPUSolver
+    else:
+        from openmoc.cuda import GPUSolver
+    solver_types += (GPUSolver,)
+except ImportError:
+    pass
+
+if sys.version_info[0] >= 3:
+    basestring = str
+
+
+def get_scalar_fluxes(solver, fsrs='all', groups='all'):
+    """Return an array of scalar fluxes in one or more FSRs and groups.
+
+    This routine builds a 2D NumPy array indexed by FSR and energy group for
+    the corresponding scalar fluxes. The fluxes are organized in the array in
+    order of increasing FSR and enery group if 'all' FSRs or energy groups are
+    requested (the default). If the user requests fluxes for specific FSRs or
+    energy groups, then the fluxes are returned in the order in which the FSRs
+    and groups are enumerated in the associated paramters.
+
+    Parameters
+    ----------
+    solver : openmoc.Solver
+        The solver used to compute the flux
+    fsrs : Iterable of Integral or 'all'
+        A collection of integer FSR IDs or 'all' (default)
+    groups : Iterable of Integral or 'all'
+        A collection of integer energy groups or 'all' (default)
+
+    Returns
+    -------
+    fluxes : ndarray
+        The scalar fluxes indexed by FSR ID and energy group. Note that the
+        energy group index starts at 0 rather than 1 for the highest energy
+        in accordance with Python's 0-based indexing.
+
+    """
+
+    global solver_types
+    cv.check_type('solver', solver, solver_types)
+
+    if isinstance('fsrs', basestring):
+        cv.check_value('fsrs', fsrs, 'all')
+    else:
+        cv.check_type('fsrs', Iterable, Integral)
+
+    if isinstance('groups', basestring):
+        cv.check_value('groups', fsrs, 'all')
+    else:
+        cv.check_type('groups', Iterable, Integral)
+
+    num_fsrs = solver.getGeometry().getNumFSRs()
+    num_groups = solver.getGeometry().getNumEnergyGroups()
+
+    # Read the fluxes from a view of the Solver's scalar flux array, which
+    # may be padded in energy, rather than copying them out of the Solver.
+    # The GPUSolver stores its fluxes on the device and must copy them.
+    if 'GPUSolver' in type(solver).__name__:
+        fluxes = solver.getFluxes(num_fsrs * num_groups)
+        fluxes = np.reshape(fluxes, (num_fsrs, num_groups))
+    else:
+        fluxes = solver.getScalarFluxView()[:, :num_groups]
+
+    # Extract all of the FSR scalar fluxes
+    if groups == 'all' and fsrs == 'all':
+        return np.array(fluxes)
+
+    # Build a list of FSRs to extract
+    if fsrs == 'all':
+        fsrs = np.arange(num_fsrs)
+
+    # Build a list of enery groups to extract
+    if groups == 'all':
+        groups = np.arange(num_groups) + 1
+
+    # Extract some of the FSR scalar fluxes
+    fsrs = np.asarray(fsrs, dtype=int)
+    groups = np.asarray(groups, dtype=int) - 1
+    return np.array(fluxes[np.ix_(fsrs, groups)], dtype=np.float64)
+
+
+def compute_fission_rates(solver, use_hdf5=False):
+    """Computes the fission rate in each FSR.
+
+    This method combines the rates based on their hierarchical universe/lattice
+    structure. The fission rates are then exported to a binary HDF5 or Python
+    pickle file.
+
+    This routine is intended to be called by the user in Python to compute
+    fission rates. Typically, the fission rates will represent pin powers. The
+    routine either exports fission rates to an HDF5 binary file or pickle file
+    with each fission rate being indexed by a string representing the
+    universe/lattice hierarchy.
+
+    Parameters
+    ----------
+    solver : openmoc.Solver
+        The solver used to compute the flux
+    use_hdf5 : bool
+        Whether or not to export fission rates to an HDF5 file
+
+    Examples
+    --------
+    This routine may be called from a Python script as follows:
+
+        >>> compute_fission_rates(solver, use_hdf5=True)
+
+    """
+
+    global solver_types
+    cv.check_type('solver', solver, solver_types)
+    cv.check_type('use_hdf5', use_hdf5, bool)
+
+    # Make directory if it does not exist
+    directory = openmoc.get_output_directory() + '/fission-rates/'
+    filename = 'fission-rates'
+    if not os.path.exists(directory):
+        os.makedirs(directory)
+
+    # Get geometry
+    geometry = solver.getGeometry()
+
+    # Compute the volume-weighted fission rates for each FSR
+    num_fsrs = geometry.getNumFSRs()
+    fsr_fission_rates = solver.computeFSRFissionRates(num_fsrs)
+
+    # Find the FSRs filled by fissionable materials
+    materials = geometry.getAllMaterials()
+    fissionable_ids = [material_id for material_id in materials
+                       if materials[material_id].isFissionable()]
+    fsr_material_ids = geometry.getFSRMaterialIds(num_fsrs)
+    fsr_points = geometry.getFSRPoints(num_fsrs * 3).reshape(num_fsrs, 3)
+
+    # Initialize fission rates dictionary
+    fission_rates_sum = {}
+
+    # Reuse the same LocalCoords linked list for each FSR
+    root_coords = openmoc.LocalCoords(0., 0., 0.)
+    root_coords.reserveLevels(geometry.getMaxNestingDepth())
+
+    # Loop over FSRs and populate fission rates dictionary
+    for fsr in range(num_fsrs):
+
+        if fsr_material_ids[fsr] in fissionable_ids:
+
+            # Get the linked list of LocalCoords
+            x, y, z = fsr_points[fsr]
+            root_coords.prune()
+            root_coords.setX(x)
+            root_coords.setY(y)
+            root_coords.setZ(z)
+            root_coords.setUniverse(geometry.getRootUniverse())
+            geometry.findCellContainingCoords(root_coords)
+            coords = root_coords.getNext()
+
+            # initialize dictionary key
+            key = 'UNIV = 0 : '
+
+            # Parse through the linked list and create fsr key.
+            # If lowest level sub dictionary already exists, then increment
+            # fission rate; otherwise, set the fission rate.
+            while True:
+                if coords.getType() is openmoc.LAT:
+                    key += 'LAT = ' + str(coords.getLattice().getId()) + ' (' + \
+                           str(coords.getLatticeX()) + ', ' + \
+                           str(coords.getLatticeY()) + ', ' + \
+                           str(coords.getLatticeZ()) + ') : '
+                else:
+                    key += 'UNIV = ' + str(coords.getUniverse().getId()) + ' : '
+
+                # Remove trailing ' : ' on end of key if at last univ/lat
+                if coords.getNext() is None:
+                    key = key[:-3]
+                    break
+                else:
+                    coords = coords.getNext()
+
+            # Increment or set fission rate
+            if key in fission_rates_sum:
+                fission_rates_sum[key] += fsr_fission_rates[fsr]
+            else:
+                fission_rates_sum[key] = fsr_fission_rates[fsr]
+
+    # Write the fission rates to the HDF5 file
+    if use_hdf5:
+        f = h5py.File(directory + filename + '.h5', 'w')
+        fission_rates_group = f.create_group('fission-rates')
+        for key, value in fission_rates_sum.items():
+            fission_rates_group.attrs[key] = value
+        f.close()
+
+    # Pickle the fission rates to a file
+    else:
+        pickle.dump(fission_rates_sum, open(directory + filename + '.pkl', 'wb'))
+
+
+def store_simulation_state(solver, fluxes=False, sources=False,
+                           fission_rates=False, use_hdf5=False,
+                           filename='simulation-state',
+                           directory = 'simulation-states',
+                           append=True, note='', compression='gzip',
+                           indexed=False):
+    """Store all of the data for an OpenMOC simulation to a binary file for
+    downstream data processing.
+
+    This routine may be used to store the following:
+
+        * type of Solver used
+        * floating point precision
+        * exponential evaluation method
+        * number of FSRs
+        * number of materials
+        * number of energy groups
+        * number of azimuthal angles
+        * number of polar angles
+        * track spacing
+        * number of tracks
+        * number of track segments
+        * number of source iterations
+        * source convergence tolerance
+        * converged $k_{eff}$
+        * total runtime [seconds]
+        * number of OpenMP or CUDA threads
+
+    In addition, the routine can optionally store the FSR scalar fluxes, FSR
+    sources, and pin and assembly fission rates.
+
+    The routine may export the simulation data to either an HDF5 or a Python
+    pickle binary file. Users may tell the routine to either create a new binary
+    output file, or append to an existing file using a timestamp to record
+    multiple simulation states to the same file.
+
+    The FSR scalar fluxes and sources are streamed from the Solver into
+    chunked and compressed HDF5 datasets a chunk of FSRs at a time. If an
+    indexed HDF5 file is requested, each simulation state is appended to a
+    'states' group as a numbered group and a row is appended to an 'index'
+    dataset with the timestamp, Solver type, note, eigenvalue, number of
+    iterations and runtime of each state. Thousands of states may then be
+    listed and read selectively, e.g., with SimulationStates(...).
+
+    Parameters
+    ----------
+    solver : openmoc.Solver
+        The solver used to compute the flux
+    fluxes : bool
+        Whether to store FSR scalar fluxes (False by default)
+    sources : bool
+        Whether to store FSR sources (False by default)
+    fission_rates : bool
+        Whether to store fission rates (False by default)
+    use_hdf5 : bool
+        Whether to export to HDF5 (True by default) or Python pickle file
+    filename : str
+        The filename to use (default is 'simulation-state.h5')
+    directory : str
+        The directory to use (default is 'simulation-states')
+    append : bool
+        Append to existing file or create new one (False by default)
+    note : str, optional
+        An optional string note to include in state file
+    compression : {'gzip', 'lzf', None}
+        The compression filter for the HDF5 FSR datasets (default is 'gzip')
+    indexed : bool
+        Whether to store the state in an indexed HDF5 file rather than in
+        groups for each day and time (False by default)
+
+    Examples
+    --------
+    This routine may be called from Python as follows:
+
+        >>> store_simulation_state(solver, fluxes=True, source=True, \
+                                   fission_rates=True, use_hdf5=True)
+
+    See Also
+    --------
+    restore_simulation_state(...)
+
+    """
+
+    global solver_types
+    cv.check_type('solver', solver, solver_types)
+    cv.check_type('fluxes', fluxes, bool)
+    cv.check_type('sources', sources, bool)
+    cv.check_type('fission_rates', fission_rates, bool)
+    cv.check_type('use_hdf5', use_hdf5, bool)
+    cv.check_type('filename', filename, basestring)
+    cv.check_type('directory', directory, basestring)
+    cv.check_type('append', append, bool)
+    cv.check_type('note', note, basestring)
+    cv.check_value('compression', compression, ('gzip', 'lzf', None))
+    cv.check_type('indexed', indexed, bool)
+
+    # Make directory if it does not exist
+    if not os.path.exists(directory):
+        os.makedirs(directory)
+
+    # Get the day and time to construct the appropriate groups in the file
+    time = datetime.datetime.now()
+    year = time.year
+    month = time.month
+    day = time.day
+    hr = time.hour
+    mins = time.minute
+    sec = time.second
+
+    # Determine the Solver type
+    solver_type = ''
+
+    if 'CPUSolver' in str(solver.__class__):
+        solver_type = 'CPUSolver'
+    elif 'VectorizedSolver' in str(solver.__class__):
+        solver_type = 'VectorizedSolver'
+    elif 'GPUSolver' in str(solver.__class__):
+        solver_type = 'GPUSolver'
+
+    # Determine the floating point precision level
+    if solver.isUsingDoublePrecision():
+        precision = 'double'
+    else:
+        precision = 'single'
+
+    # Determine whether we are using the exponential
+    # linear interpolation for exponential evaluations
+    if solver.isUsingExponentialInterpolation():
+        method = 'linear interpolation'
+    else:
+        method = 'exp intrinsic'
+
+    # Determine whether the Solver has initialized Coarse Mesh Finite
+    # Difference Acceleration (CMFD)
+    if solver.getGeometry().getCmfd() is not None:
+        cmfd = True
+    else:
+        cmfd = False
+
+    # Get the Geometry and TrackGenerator from the solver
+    geometry = solver.getGeometry()
+    track_generator = solver.getTrackGenerator()
+
+    # Retrieve useful data from the Solver, Geometry and TrackGenerator
+    num_FSRs = geometry.getNumFSRs()
+    num_materials = geometry.getNumMaterials()
+    num_groups = geometry.getNumEnergyGroups()
+    zcoord = track_generator.getZCoord()
+    num_tracks = track_generator.getNumTracks()
+    num_segments = track_generator.getNumSegments()
+    spacing = track_generator.getDesiredAzimSpacing()
+    num_azim = track_generator.getNumAzim()
+    num_polar = solver.getNumPolarAngles()
+    num_iters = solver.getNumIterations()
+    thresh = solver.getConvergenceThreshold()
+    tot_time = solver.getTotalTime()
+    keff = solver.getKeff()
+
+    # Store the simulation data in a Python dictionary
+    state = {}
+    state['solver type'] = solver_type
+    state['# FSRs'] = num_FSRs
+    state['# materials'] = num_materials
+    state['# energy groups'] = num_groups
+    state['z coord'] = zcoord
+    state['# tracks'] = num_tracks
+    state['# segments'] = num_segments
+    state['track spacing [cm]'] = spacing
+    state['# azimuthal angles'] = num_azim
+    state['# polar angles'] = num_polar
+    state['# iterations'] = num_iters
+    state['convergence threshold'] = thresh
+    state['exponential'] = method
+    state['floating point'] = precision
+    state['CMFD'] = cmfd
+    state['time [sec]'] = tot_time
+    state['keff'] = keff
+
+    if solver_type == 'GPUSolver':
+        state['# threads per block'] = solver.getNumThreadsPerBlock()
+        state['# thread blocks'] = solver.getNumThreadBlocks()
+    else:
+        state['# threads'] = solver.getNumThreads()
+
+    # The FSR data requested by the user, indexed by FSR and energy group
+    fsr_data = []
+    if fluxes:
+        fsr_data.append('FSR scalar fluxes')
+    if sources:
+        fsr_data.append('FSR sources')
+
+    # Create strings for the day and time
+    day_key = '{0:02}-{1:02}-{2:02}'.format(month, day, year)
+    time_key = '{0:02}:{1:02}:{2:02}'.format(hr, mins, sec)
+
+    # If using HDF5
+    if use_hdf5:
+        if append:
+            f = h5py.File(directory + '/' + filename + '.h5', 'a')
+        else:
+            f = h5py.File(directory + '/' + filename + '.h5', 'w')
+
+        # Append a numbered group for this state and a row to the index
+        if indexed:
+            time_group = _append_indexed_state(f, state, day_key, time_key,
+                                               note)
+
+        # Create groups for the day and time in the HDF5 file
+        else:
+            day_group = f.require_group(day_key)
+
+            # Use counter in case two simulations write simulation state at
+            # the exact same hour, minute, and second
+            key = time_key
+            counter = 0
+            while key in day_group.keys():
+                key = '{0}-{1}'.format(time_key, counter)
+                counter += 1
+
+            time_group = day_group.require_group(key)
+
+        # Store a note for this simulation state
+        if note != '':
+            time_group.attrs['note'] = note
+
+        # Store simulation data to the HDF5 file
+        for key in state:
+            time_group.create_dataset(key, data=state[key])
+
+        # Stream the FSR data into chunked, compressed datasets
+        chunk_FSRs = _get_chunk_num_fsrs(num_FSRs, num_groups)
+        for name in fsr_data:
+            dataset = time_group.create_dataset(
+                name, shape=(num_FSRs, num_groups), dtype=np.float64,
+                chunks=(chunk_FSRs, num_groups), compression=compression)
+            for first, last, data in \
+                _iter_fsr_data(solver, name, num_FSRs, num_groups, chunk_FSRs):
+                dataset[first:last] = data
+
+        if fission_rates:
+            compute_fission_rates(solver, use_hdf5=True)
+            fission_rates_file = h5py.File('fission-rates/fission-rates.h5', 'r')
+            f.copy(fission_rates_file, time_group, name='fission-rates')
+            fission_rates_file.close()
+
+        # Close the HDF5 file
+        f.close()
+
+    # If not using HDF5, we are pickling all of the data
+    else:
+        filename = directory + '/' + filename + '.pkl'
+        if os.path.exists(filename) and append:
+            sim_states = pickle.load(open(filename, 'rb'))
+        else:
+            sim_states = {}
+
+        # Create dictionaries for this day and time within the pickled file
+        if not day_key in sim_states.keys():
+            sim_states[day_key] = {}
+
+        sim_states[day_key][time_key] = state
+
+        # Store a note for this simulation state
+        if note != '':
+            state['note'] = note
+
+        for name in fsr_data:
+            state[name] = np.concatenate(
+                [data for first, last, data in
+                 _iter_fsr_data(solver, name, num_FSRs, num_groups)])
+
+        if fission_rates:
+            compute_fission_rates(solver, False)
+            state['fission-rates'] = \
+                pickle.load(open('fission-rates/fission-rates.pkl', 'rb'))
+
+        # Pickle the simulation states to a file
+        pickle.dump(sim_states, open(filename, 'wb'))
+
+
+def _get_chunk_num_fsrs(num_FSRs, num_groups):
+    """Return the number of FSRs in each chunk of streamed FSR data.
+
+    The chunks are sized to about one megabyte of double precision values.
+
+    Parameters
+    ----------
+    num_FSRs : Integral
+        The number of FSRs
+    num_groups : Integral
+        The number of energy groups
+
+    Returns
+    -------
+    chunk_FSRs : Integral
+        The number of FSRs in each chunk
+
+    """
+
+    return max(min(num_FSRs, 2**17 // num_groups), 1)
+
+
+def _iter_fsr_data(solver, name, num_FSRs, num_groups, chunk_FSRs=None):
+    """Iterate over the FSR scalar fluxes or sources in chunks of FSRs.
+
+    The scalar fluxes are read from a view of the Solver's flux array and the
+    sources are computed a chunk at a time, such that no more than one chunk
+    is copied from the Solver at a time. The GPUSolver stores its fluxes on
+    the device and copies all of them at once.
+
+    Parameters
+    ----------
+    solver : openmoc.Solver
+        The solver used to compute the flux
+    name : {'FSR scalar fluxes', 'FSR sources'}
+        The FSR data to iterate over
+    num_FSRs : Integral
+        The number of FSRs
+    num_groups : Integral
+        The number of energy groups
+    chunk_FSRs : Integral or None
+        The number of FSRs in each chunk (default is None for about one
+        megabyte of values)
+
+    Yields
+    ------
+    first : Integral
+        The ID of the first FSR in the chunk
+    last : Integral
+        One past the ID of the last FSR in the chunk
+    data : numpy.ndarray
+        The data in the chunk indexed by FSR and energy group
+
+    """
+
+    if chunk_FSRs is None:
+        chunk_FSRs = _get_chunk_num_fsrs(num_FSRs, num_groups)
+
+    with_cuda = 'GPUSolver' in type(solver).__name__
+
+    if name == 'FSR scalar fluxes':
+        if with_cuda:
+            fluxes = np.reshape(solver.getFluxes(num_FSRs * num_groups),
+                                (num_FSRs, num_groups))
+        else:
+            fluxes = solver.getScalarFluxView()[:, :num_groups]
+
+    for first in range(0, num_FSRs, chunk_FSRs):
+        last = min(first + chunk_FSRs, num_FSRs)
+
+        if name == 'FSR scalar fluxes':
+            data = np.array(fluxes[first:last], dtype=np.float64)
+        elif with_cuda:
+            data = np.zeros((last - first, num_groups))
+            for i in range(first, last):
+                for j in range(num_groups):
+                    data[i-first,j] = solver.getFSRSource(i,j+1)
+        else:
+            data = solver.getFSRSources(first, (last - first) * num_groups)
+            data = np.reshape(data, (last - first, num_groups))
+
+        yield first, last, data
+
+
+# The fields of each row of the index of an indexed simulation state file
+_index_fields = ('state', 'date', 'time', 'solver type', 'note', 'keff',
+                 '# iterations', 'time [sec]', '# FSRs', '# energy groups')
+
+
+def _get_index_dtype():
+    """Return the NumPy compound data type of a simulation state index row.
+
+    Returns
+    -------
+    dtype : numpy.dtype
+        The data type of the fields in each row of the index
+
+    """
+
+    string = h5py.special_dtype(vlen=str)
+    return np.dtype([('state', string), ('date', string), ('time', string),
+                     ('solver type', string), ('note', string),
+                     ('keff', np.float64), ('# iterations', np.int64),
+                     ('time [sec]', np.float64), ('# FSRs', np.int64),
+                     ('# energy groups', np.int64)])
+
+
+def _append_indexed_state(f, state, day_key, time_key, note):
+    """Append a group for a simulation state to an indexed HDF5 file.
+
+    Parameters
+    ----------
+    f : h5py.File
+        The HDF5 file opened for writing
+    state : dict
+        The scalar simulation state data
+    day_key : str
+        The date the state was stored
+    time_key : str
+        The time of day the state was stored
+    note : str
+        The note for the state
+
+    Returns
+    -------
+    group : h5py.Group
+        The new group for the simulation state
+
+    """
+
+    states = f.require_group('states')
+
+    if 'index' in f:
+        index = f['index']
+    else:
+        index = f.create_dataset('index', shape=(0,), maxshape=(None,),
+                                 chunks=(256,), dtype=_get_index_dtype())
+
+    # Name the state's group by its position in the index
+    num_states = index.shape[0]
+    state_key = '{0:08}'.format(num_states)
+
+    row = np.zeros(1, dtype=index.dtype)
+    row['state'] = state_key
+    row['date'] = day_key
+    row['time'] = time_key
+    row['note'] = note
+    for field in _index_fields[3:]:
+        if field != 'note':
+            row[field] = state[field]
+
+    index.resize((num_states + 1,))
+    index[num_states] = row[0]
+
+    return states.create_group(state_key)
+
+
+def restore_simulation_state(filename='simulation-state.h5',
+                             directory='simulation-states'):
+    """Restore all of the data for an OpenMOC simulation from a binary file for
+    downstream data processing to a Python dictionary.
+
+    This routine may import the simulation state from either an HDF5 or a Python
+    pickle binary file created by the store_simulation_state(...) method. The
+    method may be used to restore the following information:
+
+        * type of Solver used
+        * floating point precision
+        * exponential evaluation method
+        * number of FSRs
+        * number of materials
+        * number of energy groups
+        * number of azimuthal angles
+        * number of polar angles
+        * track spacing
+        * number of tracks
+        * number of track segments
+        * number of source iterations
+        * source convergence tolerance
+        * converged $k_{eff}$
+        * total runtime [seconds]
+        * number of OpenMP or CUDA threads
+
+          Note: If the fission rates were stored in a hdf5 binary file,
+          they are not restored and returned in this method.
+
+    Paramters
+    ---------
+    filename : str
+        The simulation state filename string
+    directory : str
+        The directory where to find the simulation state file
+
+    Returns
+    -------
+    states : dict
+        The dictionary of key/value pairs for simulation state data
+
+    Examples
+    --------
+    This method may be called from Python as follows:
+
+        >>> restore_simulation_state(filename='simulation-state-v1.3.h5')
+
+    See Also
+    --------
+    store_simulation_state(...)
+    SimulationStates : A lazy reader which loads only the data accessed
+
+    """
+
+    cv.check_type('filename', filename, basestring)
+    cv.check_type('directory', directory, basestring)
+
+    filename = directory + '/' + filename
+    if not os.path.isfile(filename):
+        py_printf('ERROR', 'Unable restore simulation state since "{0}" ' + \
+                  'is not an existing simulation state file'.format(filename))
+
+    # If using HDF5
+    if '.h5' in filename or '.hdf5' in filename:
+
+        import h5py
+
+        # Create a file handle
+        f = h5py.File(filename, 'r')
+
+        states = {}
+
+        # Loop over all simulation state timestamps by day
+        for day in f.keys():
+
+            # Skip the states of an indexed file, which are restored below
+            if day in ('index', 'states'):
+                continue
+
+            # Create sub-dictionary for this day
+            states[day] = {}
+
+            # Loop over all simulation state timestamps by time of day
+            for time in f[day]:
+                states[day][time] = _read_hdf5_state(f[day][time])
+
+        # Restore the states of an indexed file by their timestamps
+        if 'index' in f:
+            for row in f['index'][...]:
+                day = _to_str(row['date'])
+                time = _to_str(row['time'])
+                if day not in states:
+                    states[day] = {}
+
+                # Use counter in case two states have the same timestamp
+                key = time
+                counter = 0
+                while key in states[day]:
+                    key = '{0}-{1}'.format(time, counter)
+                    counter += 1
+
+                group = f['states'][_to_str(row['state'])]
+                states[day][key] = _read_hdf5_state(group)
+
+        f.close()
+
+        return states
+
+    # If using a Python pickled file
+    elif '.pkl' in filename:
+        states = pickle.load(open(filename, 'rb'))
+        return states
+
+    # If file does not have a recognizable extension
+    else:
+        py_printf('WARNING', 'Unable to restore the simulation states file %s' +
+                  ' since it does not have a supported file extension. Only ' +
+                  '*.h5, *.hdf5, and *.pkl files are supported', filename)
+        return {}
+
+
+def _to_str(value):
+    """Convert a string read from an HDF5 file to a native string.
+
+    Parameters
+    ----------
+    value : str or bytes or numpy.ndarray
+        The string value read from the HDF5 file
+
+    Returns
+    -------
+    value : str
+        The native string
+
+    """
+
+    if isinstance(value, np.ndarray):
+        value = value[()]
+    if isinstance(value, bytes) and not isinstance(value, str):
+        value = value.decode()
+    return str(value)
+
+
+def _read_hdf5_state(group):
+    """Read a simulation state from an HDF5 group into a Python dictionary.
+
+    Parameters
+    ----------
+    group : h5py.Group
+        The HDF5 group of the simulation state
+
+    Returns
+    -------
+    state : dict
+        The dictionary of key/value pairs for simulation state data
+
+    """
+
+    state = {}
+
+    # Extract simulation state data
+    solver_type = str(group['solver type'])
+    num_FSRs = int(group['# FSRs'][...])
+    num_materials = int(group['# materials'][...])
+    num_tracks = int(group['# tracks'][...])
+    num_segments = int(group['# segments'][...])
+    spacing = int(group['track spacing [cm]'][...])
+    num_azim = int(group['# azimuthal angles'][...])
+    num_polar = int(group['# polar angles'][...])
+    num_iters = int(group['# iterations'][...])
+    thresh = float(group['convergence threshold'][...])
+    method = str(group['exponential'][...])
+    precision = str(group['floating point'][...])
+    cmfd = str(group['CMFD'][...])
+    time = float(group['time [sec]'][...])
+    keff =  float(group['keff'][...])
+
+    # Store simulation state data in sub-dictionary
+    state['solver type'] = solver_type
+    state['# FSRs'] = num_FSRs
+    state['# materials'] = num_materials
+    state['# tracks'] = num_tracks
+    state['# segments'] = num_segments
+    state['track spacing [cm]'] = spacing
+    state['# azimuthal angles'] = num_azim
+    state['# polar angles'] = num_polar
+    state['# iterations'] = num_iters
+    state['convergence threshold'] = thresh
+    state['exponential'] = method
+    state['floating point'] = precision
+    state['CMFD'] = cmfd
+    state['time [sec]'] = time
+    state['keff'] = keff
+
+    if solver_type is 'GPUSolver':
+        state['# threads per block'] = \
+            int(group['# threads per block'])
+        state['# thread blocks'] = int(group['# thread blocks'])
+    else:
+        state['# threads'] = int(group['# threads'][...])
+    if 'FSR scalar fluxes' in group:
+        state['FSR scalar fluxes'] = \
+            group['FSR scalar fluxes'][...]
+    if 'FSR sources' in group:
+        state['FSR sources'] = group['FSR sources'][...]
+    if 'note' in group.attrs:
+        state['note'] = _to_str(group.attrs['note'])
+    if 'fission-rates' in group:
+        py_printf('WARNING', 'The restore_simulation_state(...)' +
+                  'method does not yet support fission rates')
+
+    return state
+
+
+class SimulationState(object):
+    """A single simulation state stored by store_simulation_state(...).
+
+    The state's scalar data are read from the file only when they are
+    accessed. The FSR scalar fluxes, FSR sources and fission rates of a
+    state stored in an HDF5 file are returned as h5py datasets which read
+    their values from the file only when sliced, e.g., state['FSR scalar
+    fluxes'][:, 0] reads only the fluxes in the first energy group.
+
+    Attributes
+    ----------
+    date : str
+        The date the state was stored as 'MM-DD-YYYY'
+    time : str
+        The time of day the state was stored as 'HH:MM:SS'
+    timestamp : datetime.datetime
+        The date and time the state was stored
+    solver_type : str
+        The type of Solver used
+    note : str
+        The note stored with the state, or '' if there is none
+    keff : Real
+        The converged eigenvalue
+    num_iterations : Integral
+        The number of source iterations
+    runtime : Real
+        The total runtime [seconds]
+
+    """
+
+    def __init__(self, date, time, source, index_row=None):
+
+        self._date = date
+        self._time = time
+        self._source = source
+        self._index_row = index_row
+
+    def __repr__(self):
+        return 'SimulationState({0} {1}, {2}, keff={3:.6f})'.format(
+            self.date, self.time, self.solver_type, self.keff)
+
+    def __contains__(self, key):
+        return key in self._source
+
+    def __getitem__(self, key):
+        """Return the value of a field of this state.
+
+        Parameters
+        ----------
+        key : str
+            The name of the field, e.g., 'keff' or 'FSR scalar fluxes'
+
+        Returns
+        -------
+        value : object
+            The scalar value of the field, or an h5py dataset for array
+            fields stored in an HDF5 file
+
+        """
+
+        if key == 'note':
+            return self.note
+
+        value = self._source[key]
+
+        # Return HDF5 array datasets unread and read HDF5 scalar datasets
+        if isinstance(value, h5py.Group):
+            return value
+        elif isinstance(value, h5py.Dataset):
+            if value.shape != ():
+                return value
+            value = value[()]
+            if isinstance(value, (bytes, str)):
+                return _to_str(value)
+            return value.item() if hasattr(value, 'item') else value
+        else:
+            return value
+
+    def keys(self):
+        """Return the names of the fields of this state.
+
+        Returns
+        -------
+        keys : list of str
+            The names of the fields of this state
+
+        """
+
+        keys = list(self._source.keys())
+        if self.note != '' and 'note' not in keys:
+            keys.append('note')
+        return keys
+
+    def _get_field(self, key):
+        """Private routine to return a scalar field from the index if the
+        state is in an indexed file or from the state otherwise."""
+
+        if self._index_row is not None:
+            value = self._index_row[key]
+            return _to_str(value) if key in ('solver type', 'note') \
+                else value.item()
+        return self[key]
+
+    @property
+    def date(self):
+        return self._date
+
+    @property
+    def time(self):
+        return self._time
+
+    @property
+    def timestamp(self):
+        return datetime.datetime.strptime(
+            self.date + ' ' + self.time.split('-')[0], '%m-%d-%Y %H:%M:%S')
+
+    @property
+    def solver_type(self):
+        return self._get_field('solver type')
+
+    @property
+    def note(self):
+        if self._index_row is not None:
+            return self._get_field('note')
+        elif isinstance(self._source, h5py.Group):
+            if 'note' in self._source.attrs:
+                return _to_str(self._source.attrs['note'])
+            return ''
+        return self._source.get('note', '')
+
+    @property
+    def keff(self):
+        return self._get_field('keff')
+
+    @property
+    def num_iterations(self):
+        return self._get_field('# iterations')
+
+    @property
+    def runtime(self):
+        return self._get_field('time [sec]')
+
+
+class SimulationStates(object):
+    """A lazy reader of the simulation states stored in a file by
+    store_simulation_state(...).
+
+    Unlike restore_simulation_state(...), this reader does not load the
+    stored arrays. It lists the stored states, from the index of an indexed
+    HDF5 file if there is one, and reads each field of a state only when it
+    is accessed. The states may be filtered by date, Solver type or note. A
+    pickled file cannot be read lazily and is loaded in whole.
+
+    The HDF5 file is kept open while the reader is in use and should be
+    closed with close(...) or by using the reader as a context manager.
+
+    Examples
+    --------
+    The eigenvalues of all states stored with a CPUSolver in June 2016 may be
+    read from a file without reading any fluxes as follows:
+
+        >>> with SimulationStates('simulation-state.h5') as states:
+        ...     june = states.filter(start=datetime.date(2016, 6, 1),
+        ...                          end=datetime.date(2016, 7, 1),
+        ...                          solver_type='CPUSolver')
+        ...     keffs = [state.keff for state in june]
+
+    See Also
+    --------
+    store_simulation_state(...)
+
+    """
+
+    def __init__(self, filename='simulation-state.h5',
+                 directory='simulation-states'):
+        """Open a simulation state file and list the states in it.
+
+        Parameters
+        ----------
+        filename : str
+            The simulation state filename string
+        directory : str
+            The directory where to find the simulation state file
+
+        """
+
+        cv.check_type('filename', filename, basestring)
+        cv.check_type('directory', directory, basestring)
+
+        filename = directory + '/' + filename
+        if not os.path.isfile(filename):
+            py_printf('ERROR', 'Unable to read simulation states since ' +
+                      '"%s" is not an existing simulation state file', filename)
+
+        self._file = None
+        self._states = []
+
+        # If using HDF5
+        if '.h5' in filename or '.hdf5' in filename:
+            self._file = h5py.File(filename, 'r')
+
+            # List the states stored for each day and time
+            for day in sorted(self._file.keys()):
+                if day in ('index', 'states'):
+                    continue
+                for time in sorted(self._file[day]):
+                    self._states.append(
+                        SimulationState(day, time, self._file[day][time]))
+
+            # List the states of an indexed file from its index
+            if 'index' in self._file:
+                groups = self._file['states']
+                for row in self._file['index'][...]:
+                    group = groups[_to_str(row['state'])]
+                    self._states.append(SimulationState(
+                        _to_str(row['date']), _to_str(row['time']), group, row))
+
+        # If using a Python pickled file
+        elif '.pkl' in filename:
+            sim_states = pickle.load(open(filename, 'rb'))
+            for day in sorted(sim_states):
+                for time in sorted(sim_states[day]):
+                    self._states.append(
+                        SimulationState(day, time, sim_states[day][time]))
+
+        # If file does not have a recognizable extension
+        else:
+            py_printf('ERROR', 'Unable to read the simulation states file ' +
+                      '%s since it does not have a supported file extension. ' +
+                      'Only *.h5, *.hdf5, and *.pkl files are supported',
+                      filename)
+
+        # Order the states by the time they were stored
+        self._states.sort(key=lambda state: state.timestamp)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __len__(self):
+        return len(self._states)
+
+    def __iter__(self):
+        return iter(self._states)
+
+    def __getitem__(self, index):
+        return self._states[index]
+
+    def close(self):
+        """Close the simulation state file."""
+
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def filter(self, start=None, end=None, solver_type=None, note=None):
+        """Return the states stored in a time window, with a Solver type
+        and/or with a note.
+
+        Parameters
+        ----------
+        start : datetime.date or datetime.datetime or None
+            The earliest time a state was stored (default is None)
+        end : datetime.date or datetime.datetime or None
+            The time before which a state was stored (default is None)
+        solver_type : str or None
+            The type of Solver used, e.g., 'CPUSolver' (default is None)
+        note : str or None
+            A string which the state's note must contain (default is None)
+
+        Returns
+        -------
+        states : list of SimulationState
+            The states matching all of the given filters
+
+        """
+
+        if start is not None:
+            cv.check_type('start', start, datetime.date)
+            if not isinstance(start, datetime.datetime):
+                start = datetime.datetime.combine(start, datetime.time())
+        if end is not None:
+            cv.check_type('end', end, datetime.date)
+            if not isinstance(end, datetime.datetime):
+                end = datetime.datetime.combine(end, datetime.time())
+        if solver_type is not None:
+            cv.check_type('solver_type', solver_type, basestring)
+        if note is not None:
+            cv.check_type('note', note, basestring)
+
+        states = []
+        for state in self._states:
+            if start is not None and state.timestamp < start:
+                continue
+            if end is not None and state.timestamp >= end:
+                continue
+            if solver_type is not None and state.solver_type != solver_type:
+                continue
+            if note is not None and note not in state.note:
+                continue
+            states.append(state)
+
+        return states
+
+    def get_field(self, key, states=None):
+        """Return an array of a scalar field of each state.
+
+        Parameters
+        ----------
+        key : str
+            The name of the scalar field, e.g., 'keff' or '# iterations'
+        states : Iterable of SimulationState or None
+            The states to read the field from (default is None for all states)
+
+        Returns
+        -------
+        values : numpy.ndarray
+            The value of the field for each state
+
+        """
+
+        cv.check_type('key', key, basestring)
+
+        if states is None:
+            states = self._states
+
+        fields = {'keff': 'keff', '# iterations': 'num_iterations',
+                  'time [sec]': 'runtime', 'solver type': 'solver_type',
+                  'note': 'note'}
+
+        if key in fields:
+            return np.array([getattr(state, fields[key]) for state in states])
+        else:
+            return np.array([state[key] for state in states])
+
+
+def parse_convergence_data(filename, directory=''):
+    """Parse an OpenMOC log file to obtain a simulation's convergence data.
+
+    This method compiles the eigenvalue and source residuals from each iteration
+    of an OpenMOC simulation. This data is inserted into a Python dictionary
+    under the key names 'eigenvalues' and 'residuals', along with an integer
+    '# iters', and returned to the user.
+
+    Parameters
+    ----------
+    filename : str
+        The OpenMOC log filename string
+    directory : str
+        The directory where to find the log file
+
+    Returns
+    -------
+    convergence_data : dict
+        A Python dictionary of key/value pairs for convergence data
+
+    Examples
+    --------
+    This method may be called from Python as follows:
+
+        >>> parse_convergence_data(filename='openmoc-XX-XX-XXXX--XX:XX:XX.log')
+
+    """
+
+    cv.check_type('filename', filename, basestring)
+    cv.check_type('directory', directory, basestring)
+
+    # If the user specified a directory
+    if len(directory) > 0:
+        filename = directory + '/' + filename
+
+    if not os.path.isfile(filename):
+        py_printf('ERROR', 'Unable to parse convergence data since "{0}" is ' +
+                  'not an existing OpenMOC log file'.format(filename))
+
+    # Compile regular expressions to find the residual and eigenvalue data
+    res = re.compile(b'res = ([0-9].[0-9]+E[+|-][0-9]+)')
+    keff = re.compile(b'k_eff = ([0-9]+.[0-9]+)')
+
+    # Parse the eigenvalues
+    with open(filename, 'r+') as f:
+        data = mmap.mmap(f.fileno(), 0)
+        eigenvalues = keff.findall(data)
+
+    # Parse the source residuals
+    with open(filename, 'r+') as f:
+        data = mmap.mmap(f.fileno(), 0)
+        residuals = res.findall(data)
+
+    # Create NumPy arrays of the data
+    eigenvalues = np.array([float(eigenvalue) for eigenvalue in eigenvalues])
+    residuals = np.array([float(residual) for residual in residuals])
+
+    # Find the total number of source iterations
+    num_iters = len(residuals)
+
+    # Store the data in a dictionary to return to the user
+    convergence_data = dict()
+    convergence_data['# iters'] = num_iters
+    convergence_data['eigenvalues'] = eigenvalues
+    convergence_data['residuals'] = residuals
+    return convergence_data
+
+
+class Mesh(object):
+    """A structured Cartesian mesh in two or three dimensions
+
+    Attributes
+    ----------
+    dimension : Iterable of int
+        The number of mesh cells in each direction.
+    lower_left : Iterable of float
+        The lower-left corner of the structured mesh. If only two coordinate are
+        given, it is assumed that the mesh is an x-y mesh.
+    upper_right : Iterable of float
+        The upper-right corner of the structrued mesh. If only two coordinate
+        are given, it is assumed that the mesh is an x-y mesh.
+    width : Iterable of float
+        The width of mesh cells in each direction.
+    num_mesh_cells : Integral
+        The total number of mesh cells in all dimensions
+    mesh_cell_volume : Real
+        The volume or area of a mesh cell in 2D or 3D in units of cm^3 or cm^2
+
+    """
+
+    def __init__(self):
+        self._dimension = None
+        self._lower_left = None
+        self._upper_right = None
+        self._width = None
+
+        # Cached FSR-to-mesh-cell mapping and FSR cell IDs for a layout of
+        # the FSRs in a geometry
+        self._fsr_layout_id = None
+        self._fsr_mesh_cells = None
+        self._fsr_cell_ids = None
+
+    @property
+    def dimension(self):
+        return self._dimension
+
+    @property
+    def lower_left(self):
+        return self._lower_left
+
+    @property
+    def upper_right(self):
+        return self._upper_right
+
+    @property
+    def width(self):
+        return self._width
+
+    @property
+    def num_mesh_cells(self):
+        return np.prod(self._dimension)
+
+    @property
+    def mesh_cell_volume(self):
+        return reduce(operator.mul, self.dimension, 1)
+
+    @dimension.setter
+    def dimension(self, dimension):
+        cv.check_type('mesh dimension', dimension, Iterable, Integral)
+        cv.check_length('mesh dimension', dimension, 2, 3)
+        self._dimension = dimension
+        self._fsr_mesh_cells = None
+
+    @lower_left.setter
+    def lower_left(self, lower_left):
+        cv.check_type('mesh lower_left', lower_left, Iterable, Real)
+        cv.check_length('mesh lower_left', lower_left, 2, 3)
+        self._lower_left = lower_left
+        self._fsr_mesh_cells = None
+
+    @upper_right.setter
+    def upper_right(self, upper_right):
+        cv.check_type('mesh upper_right', upper_right, Iterable, Real)
+        cv.check_length('mesh upper_right', upper_right, 2, 3)
+        self._upper_right = upper_right
+        self._fsr_mesh_cells = None
+
+    @width.setter
+    def width(self, width):
+        cv.check_type('mesh width', width, Iterable, Real)
+        cv.check_length('mesh width', width, 2, 3)
+        self._width = width
+        self._fsr_mesh_cells = None
+
+    def get_mesh_cell_indices(self, point):
+        """Get the mesh cell indices for a point within the geometry.
+
+        Parameters
+        ----------
+        point : openmoc.Point
+            A point within the geometry
+
+        Returns
+        -------
+        indices : 2- or 3-tuple of Integral
+            The mesh cell indices for the point. If the mesh is 2D then indices
+            for x and y are returned; if the mesh is 3d indices for x, y, and z
+            are returned.
+
+        """
+
+        cv.check_type('point', point, openmoc.Point)
+
+        # Extract the x,y,z coordinates from the OpenMOC Point
+        x, y, z = point.getX(), point.getY(), point.getZ()
+
+        # Translate the point with respect to the center of the mesh
+        x -= (self.upper_right[0] + self.lower_left[0]) / 2.
+        y -= (self.upper_right[1] + self.lower_left[1]) / 2.
+        if len(self.dimension) != 2:
+            z -= (self.upper_right[2] + self.lower_left[2]) / 2.
+
+        # Compute the mesh cell indices
+        mesh_x = (x + self.dimension[0] * self.width[0] * 0.5) / self.width[0]
+        mesh_y = (y + self.dimension[1] * self.width[1] * 0.5) / self.width[1]
+        if len(self.dimension) == 2:
+            mesh_z = 0
+        else:
+            mesh_z = (z + self.dimension[2] * self.width[2] * 0.5) / self.width[2]
+
+        # Round the mesh cell indices down
+        mesh_x = int(math.floor(mesh_x))
+        mesh_y = int(math.floor(mesh_y))
+        mesh_z = int(math.floor(mesh_z))
+
+        # Throw error if indices are outside of the Mesh
+        if len(self.dimension) == 2:
+            if (mesh_x < 0 or mesh_x >= self.dimension[0]) or \
+               (mesh_y < 0 or mesh_y >= self.dimension[1]):
+                return np.nan, np.nan, np.nan
+        else:
+            if (mesh_x < 0 or mesh_x >= self.dimension[0]) or \
+               (mesh_y < 0 or mesh_y >= self.dimension[1]) or \
+               (mesh_z < 0 or mesh_z >= self.dimension[2]):
+                return np.nan, np.nan, np.nan
+
+        # Return mesh cell indices
+        if len(self.dimension) == 2:
+            return mesh_x, mesh_y
+        else:
+            return mesh_x, mesh_y, mesh_z
+
+    def get_fsr_mesh_cells(self, geometry):
+        """Get the flat mesh cell index containing each FSR.
+
+        The mesh cell indices for the characteristic points of all FSRs are
+        computed with array arithmetic and cached on the mesh, such that
+        subsequent calls for the same FSRs return the cached mapping. The
+        cache is reset if the mesh parameters are changed or if Tracks are
+        generated again for the geometry.
+
+        Parameters
+        ----------
+        geometry : openmoc.Geometry
+            The geometry with FSRs to map to mesh cells
+
+        Returns
+        -------
+        mesh_cells : numpy.ndarray of Integral
+            The index of the mesh cell in the flattened (C-ordered) mesh
+            containing each FSR, indexed by FSR ID. FSRs outside the mesh are
+            assigned an index of -1.
+
+        """
+
+        cv.check_type('geometry', geometry, openmoc.Geometry)
+
+        self._check_fsr_cache(geometry)
+        if self._fsr_mesh_cells is not None:
+            return self._fsr_mesh_cells
+
+        # Retrieve the characteristic points of all FSRs in one call
+        num_fsrs = geometry.getNumFSRs()
+        points = geometry.getFSRPoints(num_fsrs * 3).reshape(num_fsrs, 3)
+        num_dims = len(self.dimension)
+
+        # Translate the points with respect to the center of the mesh
+        lower_left = np.asarray(self.lower_left[:num_dims], dtype=float)
+        upper_right = np.asarray(self.upper_right[:num_dims], dtype=float)
+        dimension = np.asarray(self.dimension, dtype=np.int64)
+        width = np.asarray(self.width[:num_dims], dtype=float)
+        points = points[:, :num_dims] - (upper_right + lower_left) / 2.
+
+        # Compute the mesh cell indices and round them down
+        indices = (points + dimension * width * 0.5) / width
+        indices = np.floor(indices).astype(np.int64)
+
+        # Flatten the indices and flag FSRs outside of the mesh
+        inside = np.all((indices >= 0) & (indices < dimension), axis=1)
+        mesh_cells = np.full(num_fsrs, -1, dtype=np.int64)
+        mesh_cells[inside] = \
+            np.ravel_multi_index(tuple(indices[inside].T), tuple(dimension))
+
+        self._fsr_mesh_cells = mesh_cells
+        return mesh_cells
+
+    def _check_fsr_cache(self, geometry):
+        """Reset the cached FSR data if it was built for other FSRs."""
+
+        layout_id = geometry.getFSRLayoutId()
+        if layout_id != self._fsr_layout_id:
+            self._fsr_layout_id = layout_id
+            self._fsr_mesh_cells = None
+            self._fsr_cell_ids = None
+
+    def _get_fsr_domain_ids(self, geometry, domain_type):
+        """Get the cell or material ID for each FSR.
+
+        The cell IDs are fixed for a layout of the FSRs and are cached. The
+        material IDs are retrieved on each call since the materials filling
+        the cells may be replaced between tallies.
+
+        """
+
+        num_fsrs = geometry.getNumFSRs()
+        if domain_type == 'material':
+            return geometry.getFSRMaterialIds(num_fsrs)
+
+        self._check_fsr_cache(geometry)
+        if self._fsr_cell_ids is None:
+            self._fsr_cell_ids = geometry.getFSRCellIds(num_fsrs)
+
+        return self._fsr_cell_ids
+
+    def tally_fission_rates(self, solver, volume='integrated'):
+        """Compute the fission rates in each mesh cell.
+
+        NOTE: This method assumes that the mesh perfectly aligns with the
+        flat source region mesh used in the OpenMOC calculation.
+
+        NOTE: The user must supply 'fission' as well as 'nu-fission' multi-group
+        cross sections to each material in the geometry. Although 'nu-fission'
+        is all that is required for an MOC calculation, 'fission' is what is
+        used to compute the fission rates.
+
+        Parameters
+        ----------
+        solver : {openmoc.CPUSolver, openmoc.GPUSolver, openmoc.VectorizedSolver}
+            The solver used to compute the flux
+        volume : {'averaged' ,'integrated'}
+            Compute volume-averaged or volume-integrated fission rates
+
+        Returns
+        -------
+        tally : numpy.ndarray of Real
+            A NumPy array of the fission rates tallied in each mesh cell
+
+        """
+
+        global solver_types
+        cv.check_type('solver', solver, solver_types)
+        cv.check_value('volume', volume, ('averaged', 'integrated'))
+
+        geometry = solver.getGeometry()
+        num_fsrs = geometry.getNumFSRs()
+
+        # Compute the volume- and energy-integrated fission rates for each FSR
+        fission_rates = solver.computeFSRFissionRates(num_fsrs)
+
+        # Find the mesh cell containing each FSR
+        mesh_cells = self.get_fsr_mesh_cells(geometry)
+        inside = mesh_cells >= 0
+
+        # Tally the fission rates in each FSR to the corresponding mesh cell
+        tally = np.bincount(mesh_cells[inside], weights=fission_rates[inside],
+                            minlength=self.num_mesh_cells)
+        tally = tally.reshape(tuple(self.dimension))
+
+        # Average the fission rates by mesh cell volume if needed
+        if volume == 'averaged':
+            tally /= self.mesh_cell_volume
+
+        return tally
+
+    def tally_on_mesh(self, solver, domains_to_coeffs, domain_type='fsr',
+                      volume='integrated', energy='integrated'):
+        """Compute arbitrary reaction rates in each mesh cell.
+
+        NOTE: This method assumes that the mesh perfectly aligns with the
+        flat source region mesh used in the OpenMOC calculation.
+
+        Parameters
+        ----------
+        solver : {openmoc.CPUSolver, openmoc.GPUSolver, openmoc.VectorizedSolver}
+            The solver used to compute the flux
+        domains_to_coeffs : dict or numpy.ndarray of Real
+            A mapping of spatial domains and energy groups to the coefficients
+            to multiply the flux in each domain. If domain_type is 'material'
+            or 'cell' then the coefficients must be a Python dictionary indexed
+            by material/cell ID mapped to NumPy arrays indexed by energy group.
+            If domain_type is 'fsr' then the coefficients may be a dictionary
+            or NumPy array indexed by FSR ID and energy group. Note that the
+            energy group indexing should start at 0 rather than 1 for the
+            highest energy in accordance with Python's 0-based indexing.
+        domain_type : {'fsr', 'cell', 'material'}
+            The type of domain for which the coefficients are defined
+        volume : {'averaged', 'integrated'}
+            Compute volume-averaged or volume-integrated tallies
+        energy : {'by_group', 'integrated'}
+            Compute tallies by energy group or integrate across groups
+
+        Returns
+        -------
+        tally : numpy.ndarray of Real
+            A NumPy array of the fission rates tallied in each mesh cell indexed
+            by FSR ID and energy group (if energy is 'by_group')
+
+        """
+
+        global solver_types
+        cv.check_type('solver', solver, solver_types)
+        cv.check_value('domain_type', domain_type, ('fsr', 'cell', 'material'))
+        cv.check_value('volume', volume, ('averaged', 'integrated'))
+        cv.check_value('energy', energy, ('by_group', 'integrated'))
+
+        # Extract parameters from the Geometry
+        geometry = solver.getGeometry()
+        num_groups = geometry.getNumEnergyGroups()
+        num_fsrs = geometry.getNumFSRs()
+
+        # Coefficients must be specified as a dict, ndarray or DataFrame
+        if domain_type in ['material', 'cell']:
+            cv.check_type('domains_to_coeffs', domains_to_coeffs, dict)
+        else:
+            cv.check_type('domains_to_coeffs',
+                          domains_to_coeffs, (dict, np.ndarray))
+
+        # Extract the FSR fluxes and volumes from the Solver
+        fluxes = get_scalar_fluxes(solver)
+        volumes = solver.getFSRVolumes(num_fsrs)
+
+        # Find the mesh cell containing each FSR
+        mesh_cells = self.get_fsr_mesh_cells(geometry)
+        inside = np.nonzero(mesh_cells >= 0)[0]
+
+        # Determine domain ID (material, cell or FSR) for each FSR
+        if domain_type == 'fsr':
+            domain_ids = inside
+        else:
+            domain_ids = self._get_fsr_domain_ids(geometry, domain_type)
+            domain_ids = domain_ids[inside]
+
+        # Gather the coefficients for each FSR by energy group
+        if isinstance(domains_to_coeffs, np.ndarray):
+            coeffs = domains_to_coeffs[domain_ids, :num_groups]
+        else:
+            unique_ids, inverse = np.unique(domain_ids, return_inverse=True)
+            coeffs = np.array([np.asarray(domains_to_coeffs[domain_id])
+                               [:num_groups] for domain_id in unique_ids])
+            coeffs = coeffs.reshape(len(unique_ids), num_groups)[inverse]
+
+        # Compute volume-integrated product of fluxes with coefficients
+        fsr_tallies = fluxes[inside, :] * coeffs * volumes[inside, np.newaxis]
+
+        # Scatter the FSR tallies to the mesh cells by energy group
+        tally = np.zeros((self.num_mesh_cells, num_groups), dtype=float)
+        for group in range(num_groups):
+            tally[:, group] = np.bincount(mesh_cells[inside],
+                                          weights=fsr_tallies[:, group],
+                                          minlength=self.num_mesh_cells)
+        tally = tally.reshape(tuple(self.dimension) + (num_groups,))
+
+        # Integrate the energy groups if needed
+        if energy == 'integrated':
+            tally = np.sum(tally, axis=len(self.dimension))
+
+        # Average the fission rates by mesh cell volume if needed
+        if volume == 'averaged':
+            tally /= self.mesh_cell_volume
+
+        return tally
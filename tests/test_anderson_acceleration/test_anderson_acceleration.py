@@ -0,0 +1,58 @@
+#!/usr/bin/env python
+
+import os
+import sys
+sys.path.insert(0, os.pardir)
+sys.path.insert(0, os.path.join(os.pardir, 'openmoc'))
+from testing_harness import MultiSimTestHarness
+from input_set import SimpleLatticeInput
+import openmoc
+
+
+class AndersonAccelerationTestHarness(MultiSimTestHarness):
+    """Eigenvalue calculations for a 4x4 lattice with 7-group C5G7 data
+    with unaccelerated and Anderson accelerated source iteration."""
+
+    def __init__(self):
+        super(AndersonAccelerationTestHarness, self).__init__()
+        self.input_set = SimpleLatticeInput()
+        self.num_simulations = 1
+        self.tolerance = 1E-7
+        self.acceleration_types = []
+        self.num_sweeps_saved = []
+
+    def _run_openmoc(self):
+        """Run an unaccelerated and then an Anderson accelerated eigenvalue
+        calculation."""
+
+        self.acceleration_types.append('NONE')
+        super(AndersonAccelerationTestHarness, self)._run_openmoc()
+        self.num_sweeps_saved.append(self.solver.getNumSweepsSaved())
+
+        # Report the sweeps saved against the unaccelerated calculation
+        self.solver.setReferenceNumIterations(self.solver.getNumIterations())
+        self.solver.setAccelerationType(openmoc.ANDERSON)
+        self.acceleration_types.append('ANDERSON')
+        super(AndersonAccelerationTestHarness, self)._run_openmoc()
+        self.num_sweeps_saved.append(self.solver.getNumSweepsSaved())
+
+    def _get_results(self, num_iterations=True, keff=True, fluxes=False,
+                     num_fsrs=False, num_tracks=False, num_segments=False,
+                     hash_output=False):
+        """Return eigenvalues and sweeps saved from each simulation into a
+        string."""
+
+        outstr = ''
+        for acceleration_type, num_iters, keff, num_sweeps_saved in \
+                zip(self.acceleration_types, self.num_iters, self.keffs,
+                    self.num_sweeps_saved):
+            outstr += '{0}\tIters: {1}\tkeff: {2:12.5E}\t' \
+                'Sweeps saved: {3}\n'.format(
+                    acceleration_type, num_iters, keff, num_sweeps_saved)
+
+        return outstr
+
+
+if __name__ == '__main__':
+    harness = AndersonAccelerationTestHarness()
+    harness.main()
@@ -0,0 +1,63 @@
+#!/usr/bin/env python
+
+import os
+import sys
+import multiprocessing
+sys.path.insert(0, os.pardir)
+sys.path.insert(0, os.path.join(os.pardir, 'openmoc'))
+from testing_harness import TestHarness
+from input_set import PinCellInput
+import openmoc.batch
+
+
+class BatchSolverTestHarness(TestHarness):
+    """Eigenvalue calculations for a pin cell with different fuel materials
+    with 7-group C5G7 data, solved in turn and by forked worker processes."""
+
+    def __init__(self):
+        super(BatchSolverTestHarness, self).__init__()
+        self.input_set = PinCellInput()
+        self.batches = []
+
+    def _run_openmoc(self):
+        """Solve each state in this process with OpenMP threads and then in
+        two forked worker processes."""
+
+        # Replace the UO2 fuel with each MOX fuel
+        uo2_id = self.input_set.materials['UO2'].getId()
+        materials = [{}]
+        for name in ['MOX-4.3%', 'MOX-7%', 'MOX-8.7%']:
+            materials.append({uo2_id: self.input_set.materials[name]})
+
+        # The states are first solved in this process such that OpenMP
+        # threads are started before the workers are forked
+        for name, num_workers, num_threads in \
+                [('Serial', 1, self.num_threads), ('Forked', 2, 1)]:
+            batch = openmoc.batch.BatchSolver(
+                self.track_generator, num_workers=num_workers,
+                num_threads=num_threads)
+            batch.computeEigenvalues(materials=materials,
+                                     convergence_threshold=self.tolerance)
+            self.batches.append((name, batch))
+
+    def _get_results(self, num_iters=True, keff=True, fluxes=False,
+                     num_fsrs=False, num_tracks=False, num_segments=False,
+                     hash_output=False):
+        """Return the eigenvalue of each state into a string."""
+
+        outstr = ''
+        for name, batch in self.batches:
+            for i, (num_iters, keff) in \
+                    enumerate(zip(batch.num_iterations, batch.k_effs)):
+                outstr += '{0}\tState: {1}\tIters: {2}\tkeff: {3:12.5E}\n'\
+                    .format(name, i, num_iters, keff)
+
+        return outstr
+
+
+if __name__ == '__main__':
+    # The workers must be forked even where processes are spawned by default
+    if sys.version_info[0] > 2:
+        multiprocessing.set_start_method('spawn')
+    harness = BatchSolverTestHarness()
+    harness.main()
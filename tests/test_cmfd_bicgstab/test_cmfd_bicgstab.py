@@ -0,0 +1,75 @@
+#!/usr/bin/env python
+
+import os
+import sys
+sys.path.insert(0, os.pardir)
+sys.path.insert(0, os.path.join(os.pardir, 'openmoc'))
+from testing_harness import TestHarness
+from input_set import PwrAssemblyInput
+import openmoc
+
+
+class CmfdBicgstabTestHarness(TestHarness):
+    """An eigenvalue calculation for a 17x17 lattice with 7-group C5G7
+    cross section data with CMFD, whose linear systems are solved with
+    red-black SOR and then with BiCGSTAB and a Wielandt shift."""
+
+    def __init__(self):
+        super(CmfdBicgstabTestHarness, self).__init__()
+        self.input_set = PwrAssemblyInput()
+        self.cmfd = None
+        self.wielandt_shift = 0.05
+        self.names = ['RED_BLACK_SOR', 'BICGSTAB']
+        self.num_iters = []
+        self.keffs = []
+
+    def _create_geometry(self):
+        """Initialize CMFD and add it to the Geometry."""
+
+        super(CmfdBicgstabTestHarness, self)._create_geometry()
+
+        # Initialize CMFD
+        self.cmfd = openmoc.Cmfd()
+        self.cmfd.setSORRelaxationFactor(1.5)
+        self.cmfd.setLatticeStructure(17,17)
+        self.cmfd.setGroupStructure([[1,2,3], [4,5,6,7]])
+        self.cmfd.setKNearest(3)
+
+        # Add CMFD to the Geometry
+        self.input_set.geometry.setCmfd(self.cmfd)
+
+    def _run_openmoc(self):
+        """Run an eigenvalue calculation with each CMFD linear solver."""
+
+        super(CmfdBicgstabTestHarness, self)._run_openmoc()
+        self.num_iters.append(self.solver.getNumIterations())
+        self.keffs.append(self.solver.getKeff())
+
+        self.cmfd.setLinearSolverType(openmoc.BICGSTAB)
+        self.cmfd.setWielandtShift(self.wielandt_shift)
+
+        super(CmfdBicgstabTestHarness, self)._run_openmoc()
+        self.num_iters.append(self.solver.getNumIterations())
+        self.keffs.append(self.solver.getKeff())
+
+    def _get_results(self, num_iters=True, keff=True, fluxes=False,
+                     num_fsrs=False, num_tracks=False, num_segments=False,
+                     hash_output=False):
+        """Return the eigenvalues into a string after checking that the
+        BiCGSTAB eigenvalue matches the red-black SOR eigenvalue."""
+
+        assert abs(self.keffs[1] - self.keffs[0]) < self.tolerance, \
+            'The BICGSTAB eigenvalue {0} does not match the RED_BLACK_SOR ' \
+            'eigenvalue {1}'.format(self.keffs[1], self.keffs[0])
+
+        outstr = ''
+        for name, num_iters, keff in zip(self.names, self.num_iters,
+                                         self.keffs):
+            outstr += '{0}\tIters: {1}\tkeff: {2:12.5E}\n'.format(
+                name, num_iters, keff)
+        return outstr
+
+
+if __name__ == '__main__':
+    harness = CmfdBicgstabTestHarness()
+    harness.main()
@@ -0,0 +1,108 @@
+#!/usr/bin/env python
+
+import os
+import sys
+sys.path.insert(0, os.pardir)
+sys.path.insert(0, os.path.join(os.pardir, 'openmoc'))
+from testing_harness import TestHarness
+from input_set import PinCellInput
+import openmoc
+import openmoc.krylov as krylov
+import numpy as np
+
+
+class InterruptedSolve(Exception):
+    """Raised to stop an IRAMSolver as if its job had been killed."""
+    pass
+
+
+class InterruptedIRAMSolver(krylov.IRAMSolver):
+    """An IRAMSolver which stops after a number of outer iterations."""
+
+    def __init__(self, moc_solver, num_outer_iters):
+        super(InterruptedIRAMSolver, self).__init__(moc_solver)
+        self._num_outer_iters = num_outer_iters
+
+    def _F(self, flux):
+        if self._f_count == self._num_outer_iters:
+            raise InterruptedSolve()
+        return super(InterruptedIRAMSolver, self)._F(flux)
+
+
+class KrylovCheckpointTestHarness(TestHarness):
+    """The fundamental eigenmode of a pin cell with vacuum boundaries and
+    7-group C5G7 data computed with the IRAMSolver from a cold start, after
+    resuming from a checkpoint and from a warm start."""
+
+    def __init__(self):
+        super(KrylovCheckpointTestHarness, self).__init__()
+        self.input_set = PinCellInput(boundary_type=openmoc.VACUUM)
+        self.tolerance = 1E-6
+        self.checkpoint_file = 'iram-checkpoint.h5'
+        self.names = ['Cold start', 'Resumed from checkpoint', 'Warm start']
+        self.iram_solvers = []
+        self.checkpointed = None
+
+    def _compute_eigenmodes(self, iram_solver, **kwargs):
+        """Compute the fundamental eigenmode with an IRAMSolver."""
+        iram_solver.computeEigenmodes(num_modes=1, outer_tol=self.tolerance,
+                                      inner_tol=self.tolerance, **kwargs)
+        self.iram_solvers.append(iram_solver)
+
+    def _run_openmoc(self):
+        """Compute the fundamental eigenmode from a cold start, from the
+        checkpoint of an interrupted solve and from the cold start's
+        eigenvector."""
+
+        self._compute_eigenmodes(krylov.IRAMSolver(self.solver))
+
+        # Stop a solve after it has checkpointed three outer iterations
+        iram_solver = InterruptedIRAMSolver(self.solver, 3)
+        try:
+            self._compute_eigenmodes(iram_solver,
+                                     checkpoint_file=self.checkpoint_file,
+                                     checkpoint_interval=1)
+        except InterruptedSolve:
+            self.checkpointed = os.path.exists(self.checkpoint_file)
+
+        self._compute_eigenmodes(krylov.IRAMSolver(self.solver),
+                                 checkpoint_file=self.checkpoint_file,
+                                 checkpoint_interval=1)
+
+        v0 = self.iram_solvers[0]._eigenvectors[:, 0]
+        self._compute_eigenmodes(krylov.IRAMSolver(self.solver), v0=v0)
+
+    def _get_results(self, num_iters=False, keff=True, fluxes=False,
+                     num_fsrs=False, num_tracks=False, num_segments=False,
+                     hash_output=False):
+        """Return the eigenvalues into a string after checking that they
+        match the cold start's eigenvalue."""
+
+        assert self.checkpointed, 'The interrupted IRAMSolver did not ' \
+            'write a checkpoint'
+        assert not os.path.exists(self.checkpoint_file), 'The checkpoint ' \
+            'was not removed after the resumed IRAMSolver converged'
+
+        eigenvalues = [np.real(iram_solver._eigenvalues[0])
+                       for iram_solver in self.iram_solvers]
+
+        outstr = ''
+        for name, eigenvalue in zip(self.names, eigenvalues):
+            assert abs(eigenvalue - eigenvalues[0]) < \
+                self.tolerance * eigenvalues[0], '{0} eigenvalue {1} does ' \
+                'not match the cold start eigenvalue {2}'.format(
+                    name, eigenvalue, eigenvalues[0])
+            outstr += '{0}\teigenvalue: {1:12.5E}\n'.format(name, eigenvalue)
+
+        return outstr
+
+    def _cleanup(self):
+        """Delete the checkpoint of a failed solve with the other outputs."""
+        super(KrylovCheckpointTestHarness, self)._cleanup()
+        if os.path.exists(self.checkpoint_file):
+            os.remove(self.checkpoint_file)
+
+
+if __name__ == '__main__':
+    harness = KrylovCheckpointTestHarness()
+    harness.main()
@@ -0,0 +1,65 @@
+#!/usr/bin/env python
+
+import os
+import sys
+sys.path.insert(0, os.pardir)
+sys.path.insert(0, os.path.join(os.pardir, 'openmoc'))
+from testing_harness import TestHarness
+from input_set import PinCellInput
+import openmoc
+import openmoc.krylov as krylov
+import numpy as np
+
+
+class KrylovEigenmodesTestHarness(TestHarness):
+    """The fundamental eigenmode of a pin cell with vacuum boundaries and
+    7-group C5G7 data computed with the IRAMSolver and by power iteration."""
+
+    def __init__(self):
+        super(KrylovEigenmodesTestHarness, self).__init__()
+        self.input_set = PinCellInput(boundary_type=openmoc.VACUUM)
+        self.tolerance = 1E-6
+        self.iram_solver = None
+
+    def _run_openmoc(self):
+        """Compute the fundamental eigenmode with the IRAMSolver, which
+        applies its operators on a view of the Solver's scalar fluxes, and
+        then with an eigenvalue calculation."""
+
+        self.iram_solver = krylov.IRAMSolver(self.solver)
+        self.iram_solver.computeEigenmodes(num_modes=1,
+                                           outer_tol=self.tolerance,
+                                           inner_tol=self.tolerance)
+
+        super(KrylovEigenmodesTestHarness, self)._run_openmoc()
+
+    def _get_results(self, num_iters=False, keff=True, fluxes=False,
+                     num_fsrs=False, num_tracks=False, num_segments=False,
+                     hash_output=False):
+        """Return the eigenvalues into a string after checking that the
+        eigenvector matches the converged scalar fluxes."""
+
+        geometry = self.input_set.geometry
+        shape = (geometry.getNumFSRs(), geometry.getNumEnergyGroups())
+
+        # Normalize the eigenvector and the scalar fluxes to unity
+        eigenvector = np.abs(np.real(self.iram_solver._eigenvectors[:, 0]))
+        eigenvector = eigenvector.reshape(shape) / np.sum(eigenvector)
+        fluxes = self.solver.getFluxes(shape[0] * shape[1]).reshape(shape)
+        fluxes /= np.sum(fluxes)
+
+        error = np.max(np.abs(eigenvector - fluxes)) / np.max(fluxes)
+        assert error < 1E-4, \
+            'The IRAMSolver eigenvector differs from the scalar fluxes ' \
+            'by {0}'.format(error)
+
+        outstr = 'IRAMSolver eigenvalue: {0:12.5E}\n'.format(
+            np.real(self.iram_solver._eigenvalues[0]))
+        outstr += 'CPUSolver eigenvalue: {0:12.5E}\n'.format(
+            self.solver.getKeff())
+        return outstr
+
+
+if __name__ == '__main__':
+    harness = KrylovEigenmodesTestHarness()
+    harness.main()
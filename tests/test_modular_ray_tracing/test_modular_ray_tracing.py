@@ -0,0 +1,67 @@
+#!/usr/bin/env python
+
+import os
+import sys
+sys.path.insert(0, os.pardir)
+sys.path.insert(0, os.path.join(os.pardir, 'openmoc'))
+from testing_harness import MultiSimTestHarness
+from input_set import SimpleLatticeInput
+import openmoc
+
+
+class ModularRayTracingTestHarness(MultiSimTestHarness):
+    """Eigenvalue calculations for a 4x4 lattice with 7-group C5G7 data with
+    Tracks ray traced across the Geometry and across each Lattice cell."""
+
+    def __init__(self):
+        super(ModularRayTracingTestHarness, self).__init__()
+        self.input_set = SimpleLatticeInput()
+        self.num_simulations = 1
+
+        # The Track spacing is commensurate with the Lattice pitch such that
+        # both modes generate the same Tracks and thus the same segments
+        self.num_azim = 8
+        self.spacing = 0.11
+        self.modes = [('Geometry', False), ('Modular', True)]
+        self.num_fsrs = []
+        self.num_tracks = []
+        self.num_segments = []
+
+    def _setup(self):
+        """Build the materials and geometry."""
+        self._create_geometry()
+
+    def _run_openmoc(self):
+        """Generate Tracks with and without modular ray tracing and run an
+        eigenvalue calculation."""
+
+        for name, modular in self.modes:
+            self._create_trackgenerator()
+            self.track_generator.setModularRayTracing(modular)
+            self._generate_tracks()
+            self._create_solver()
+            super(ModularRayTracingTestHarness, self)._run_openmoc()
+
+            self.num_fsrs.append(self.input_set.geometry.getNumFSRs())
+            self.num_tracks.append(self.track_generator.getNumTracks())
+            self.num_segments.append(self.track_generator.getNumSegments())
+
+    def _get_results(self, num_iterations=True, keff=True, fluxes=False,
+                     num_fsrs=True, num_tracks=True, num_segments=True,
+                     hash_output=False):
+        """Return the ray tracing data and eigenvalue from each simulation
+        into a string."""
+
+        outstr = ''
+        for i, mode in enumerate(self.modes):
+            outstr += '{0}\t# FSRs: {1}\t# tracks: {2}\t# segments: {3}\t' \
+                'Iters: {4}\tkeff: {5:12.5E}\n'.format(
+                    mode[0], self.num_fsrs[i], self.num_tracks[i],
+                    self.num_segments[i], self.num_iters[i], self.keffs[i])
+
+        return outstr
+
+
+if __name__ == '__main__':
+    harness = ModularRayTracingTestHarness()
+    harness.main()
@@ -0,0 +1,60 @@
+#!/usr/bin/env python
+
+import os
+import sys
+sys.path.insert(0, os.pardir)
+sys.path.insert(0, os.path.join(os.pardir, 'openmoc'))
+from testing_harness import MultiSimTestHarness
+from input_set import SimpleLatticeInput
+import openmoc
+
+
+class OTFSegmentationTestHarness(MultiSimTestHarness):
+    """Eigenvalue calculations for a 4x4 lattice with 7-group C5G7 data with
+    explicit segments and with segments formed on the fly, with and without
+    a segment cache."""
+
+    def __init__(self):
+        super(OTFSegmentationTestHarness, self).__init__()
+        self.input_set = SimpleLatticeInput()
+        self.num_simulations = 1
+
+        # The segment formation type and segment cache memory [MB]
+        self.formations = [('EXPLICIT_2D', openmoc.EXPLICIT_2D, 0.),
+                           ('OTF_2D', openmoc.OTF_2D, 0.),
+                           ('OTF_2D partial cache', openmoc.OTF_2D, 0.01),
+                           ('OTF_2D full cache', openmoc.OTF_2D, 100.)]
+
+    def _setup(self):
+        """Build the materials and geometry."""
+        self._create_geometry()
+
+    def _run_openmoc(self):
+        """Generate Tracks and run an eigenvalue calculation with each
+        segment formation type."""
+
+        for name, formation, memory in self.formations:
+            self._create_trackgenerator()
+            self.track_generator.setSegmentFormation(formation)
+            self.track_generator.setSegmentCacheMemory(memory)
+            self._generate_tracks()
+            self._create_solver()
+            super(OTFSegmentationTestHarness, self)._run_openmoc()
+
+    def _get_results(self, num_iterations=True, keff=True, fluxes=False,
+                     num_fsrs=False, num_tracks=False, num_segments=False,
+                     hash_output=False):
+        """Return eigenvalues from each simulation into a string."""
+
+        outstr = ''
+        for formation, num_iters, keff in \
+                zip(self.formations, self.num_iters, self.keffs):
+            outstr += '{0}\tIters: {1}\tkeff: {2:12.5E}\n'.format(
+                formation[0], num_iters, keff)
+
+        return outstr
+
+
+if __name__ == '__main__':
+    harness = OTFSegmentationTestHarness()
+    harness.main()
@@ -0,0 +1,54 @@
+#!/usr/bin/env python
+
+import os
+import sys
+
+import numpy as np
+from PIL import Image
+
+sys.path.insert(0, os.pardir)
+sys.path.insert(0, os.path.join(os.pardir, 'openmoc'))
+from testing_harness import PlottingTestHarness
+from input_set import SimpleLatticeInput
+from openmoc.plotter import plot_tiled_spatial_data, PlotParams
+
+
+class PlotTiledSpatialDataTestHarness(PlottingTestHarness):
+    """Test tiled spatial data plotting with a 4x4 lattice in this process
+    and in forked worker processes."""
+
+    def __init__(self):
+        super(PlotTiledSpatialDataTestHarness, self).__init__()
+        self.input_set = SimpleLatticeInput()
+
+    def _run_openmoc(self):
+        """Plot the FSR IDs as tiles with a zoom pyramid."""
+
+        # Run an eigenvalue calculation such that OpenMP threads are started
+        # before the worker processes are forked
+        super(PlotTiledSpatialDataTestHarness, self)._run_openmoc()
+
+        num_fsrs = self.input_set.geometry.getNumFSRs()
+
+        # Initialize a PlotParams object
+        plot_params = PlotParams()
+        plot_params.geometry = self.input_set.geometry
+        plot_params.domain_type = 'fsr'
+        plot_params.gridsize = 200
+
+        # Plot the tiles with one and two processes
+        for num_workers in [1, 2]:
+            plot_params.filename = 'tiles-{0}'.format(num_workers)
+            directory = plot_tiled_spatial_data(
+                np.arange(num_fsrs), plot_params, tile_size=100,
+                pyramid=True, num_workers=num_workers)
+
+            # Append the 2x2 full resolution tiles and the downsampled tile
+            for tile in ['0/0-0', '0/0-1', '0/1-0', '0/1-1', '1/0-0']:
+                filename = directory + tile + plot_params.extension
+                self.figures.append(Image.open(filename))
+
+
+if __name__ == '__main__':
+    harness = PlotTiledSpatialDataTestHarness()
+    harness.main()
@@ -0,0 +1,65 @@
+#!/usr/bin/env python
+
+import os
+import sys
+import shutil
+sys.path.insert(0, os.pardir)
+sys.path.insert(0, os.path.join(os.pardir, 'openmoc'))
+from testing_harness import TestHarness
+from input_set import SimpleLatticeInput
+import openmoc.process as process
+
+
+class SimulationStateIndexTestHarness(TestHarness):
+    """An eigenvalue calculation with storage of the simulation state in an
+    indexed HDF5 file and retrieval with the lazy simulation state reader."""
+
+    def __init__(self):
+        super(SimulationStateIndexTestHarness, self).__init__()
+        self.input_set = SimpleLatticeInput()
+        self.notes = ['first state', 'second state']
+
+    def _run_openmoc(self):
+        """Run an eigenvalue calculation and store the simulation state twice
+        in an indexed HDF5 file."""
+        super(SimulationStateIndexTestHarness, self)._run_openmoc()
+
+        # Start from an empty indexed file to only read the states stored here
+        if os.path.exists('simulation-states'):
+            shutil.rmtree('simulation-states')
+
+        for note in self.notes:
+            process.store_simulation_state(self.solver, fluxes=True,
+                                           sources=True, use_hdf5=True,
+                                           note=note, indexed=True)
+
+    def _get_results(self, num_iters=True, keff=True, fluxes=True,
+                     num_fsrs=True, num_tracks=True, num_segments=True,
+                     hash_output=False):
+        """Read the indexed simulation states lazily and return them as a
+        string."""
+
+        with process.SimulationStates('simulation-state.h5') as states:
+            outstr = '# states: {0}\n'.format(len(states))
+
+            # Read the eigenvalues from the index
+            keffs = states.get_field('keff')
+            outstr += 'keffs: ' + \
+                ' '.join(['{0:12.6E}'.format(keff) for keff in keffs]) + '\n'
+
+            # Read the fluxes in the first energy group of each state
+            for note in self.notes:
+                state, = states.filter(note=note)
+                fluxes = state['FSR scalar fluxes'][:, 0]
+                outstr += '{0}\t# iterations: {1}\tkeff: {2:12.6E}\n'.format(
+                    state.note, state.num_iterations, state.keff)
+                outstr += 'group 1 fluxes: ' + \
+                    ' '.join(['{0:12.6E}'.format(flux) for flux in fluxes[:8]])
+                outstr += '\n'
+
+        return outstr
+
+
+if __name__ == '__main__':
+    harness = SimulationStateIndexTestHarness()
+    harness.main()
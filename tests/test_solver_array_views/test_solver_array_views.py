@@ -0,0 +1,87 @@
+#!/usr/bin/env python
+
+import os
+import sys
+sys.path.insert(0, os.pardir)
+sys.path.insert(0, os.path.join(os.pardir, 'openmoc'))
+from testing_harness import TestHarness
+from input_set import PinCellInput
+import numpy as np
+
+
+class SolverArrayViewsTestHarness(TestHarness):
+    """Views of the scalar fluxes and sources of a pin cell eigenvalue
+    calculation which are invalidated by a second calculation."""
+
+    def __init__(self):
+        super(SolverArrayViewsTestHarness, self).__init__()
+        self.input_set = PinCellInput()
+        self.views = []
+        self.view_sums = []
+        self.stale_views = []
+
+    def _get_views(self):
+        """Return views of each of the Solver's flux and source arrays."""
+        return [self.solver.getScalarFluxView(),
+                self.solver.getOldScalarFluxView(),
+                self.solver.getReducedSourceView(),
+                self.solver.getFixedSourceView()]
+
+    def _run_openmoc(self):
+        """Run an eigenvalue calculation, take views of the Solver's arrays,
+        and run a second calculation which reallocates the arrays."""
+
+        super(SolverArrayViewsTestHarness, self)._run_openmoc()
+        self.views = self._get_views()
+        self.view_sums = [np.sum(view) for view in self.views]
+
+        # Views of a slice of an array must also be invalidated
+        self.views.append(self.views[0][:, 0])
+
+        super(SolverArrayViewsTestHarness, self)._run_openmoc()
+
+        # Use each old view in the ways that read or write its memory
+        uses = [lambda view: view[0],
+                lambda view: view.__setitem__(0, 0.),
+                lambda view: view + 1.,
+                lambda view: np.sum(view),
+                lambda view: repr(view)]
+
+        for view in self.views:
+            stale = []
+            for use in uses:
+                try:
+                    use(view)
+                    stale.append(False)
+                except RuntimeError:
+                    stale.append(True)
+            self.stale_views.append(stale)
+
+    def _get_results(self, num_iters=True, keff=True, fluxes=False,
+                     num_fsrs=False, num_tracks=False, num_segments=False,
+                     hash_output=False):
+        """Return the eigenvalue and the sums of the views after checking
+        that the views match the Solver's arrays and were invalidated."""
+
+        num_fluxes = self.views[0].shape[0] * self.views[0].shape[1]
+        scalar_fluxes = self.solver.getFluxes(num_fluxes)
+        assert np.allclose(np.ravel(self.solver.getScalarFluxView()),
+                           scalar_fluxes), \
+            'The scalar flux view does not match the scalar fluxes'
+
+        for i, stale in enumerate(self.stale_views):
+            assert all(stale), 'View {0} was used after the Solver ' \
+                'reallocated its arrays'.format(i)
+
+        outstr = super(SolverArrayViewsTestHarness, self)._get_results(
+            num_iters=num_iters, keff=keff, fluxes=fluxes,
+            num_fsrs=num_fsrs, num_tracks=num_tracks,
+            num_segments=num_segments, hash_output=hash_output)
+        outstr += 'View sums: ' + ' '.join(
+            ['{0:12.6E}'.format(view_sum) for view_sum in self.view_sums])
+        return outstr + '\n'
+
+
+if __name__ == '__main__':
+    harness = SolverArrayViewsTestHarness()
+    harness.main()
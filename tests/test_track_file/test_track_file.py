@@ -0,0 +1,71 @@
+#!/usr/bin/env python
+
+import os
+import sys
+sys.path.insert(0, os.pardir)
+sys.path.insert(0, os.path.join(os.pardir, 'openmoc'))
+from testing_harness import TestHarness
+from input_set import PinCellInput
+import openmoc
+
+
+class TrackFileTestHarness(TestHarness):
+    """Eigenvalue calculations in a pin cell with 7-group C5G7 data using
+    Tracks and segments read from a Track file, before and after the
+    Materials are replaced."""
+
+    def __init__(self):
+        super(TrackFileTestHarness, self).__init__()
+        self.input_set = PinCellInput()
+        self._result = ''
+
+    def _generate_tracks(self):
+        """Store the Tracks to a Track file and read them with a new
+        TrackGenerator."""
+
+        # Generate Tracks and store them to a Track file
+        super(TrackFileTestHarness, self)._generate_tracks()
+
+        # Read the Tracks from the Track file
+        self._create_trackgenerator()
+        super(TrackFileTestHarness, self)._generate_tracks()
+
+    def _run_openmoc(self):
+        """Run eigenvalue calculations before and after exchanging the
+        Materials for their clones."""
+
+        super(TrackFileTestHarness, self)._run_openmoc()
+        self._record_results()
+
+        # Exchange all of the Materials for their clones
+        cells = self.input_set.geometry.getAllMaterialCells()
+        materials = self.input_set.geometry.getAllMaterials()
+        for cell_id in cells:
+            cells[cell_id].setFill(cells[cell_id].getFillMaterial().clone())
+
+        # Turn on SWIG flag to register old Materials
+        # with Python garbage collector
+        for material_id in materials:
+            materials[material_id].thisown = 1
+
+        super(TrackFileTestHarness, self)._run_openmoc()
+        self._record_results()
+
+    def _record_results(self):
+        """Record the solution and whether the segments are stored in each
+        Track rather than only in the mapped Track file."""
+        self._result += super(TrackFileTestHarness, self)._get_results(
+            num_segments=True)
+        self._result += 'segments in each Track: {0}\n'.format(
+            self.track_generator.containsTrackSegments())
+
+    def _get_results(self, num_iters=False, keff=False, fluxes=False,
+                     num_fsrs=False, num_tracks=False, num_segments=False,
+                     hash_output=False):
+        """Return the result string"""
+        return self._result
+
+
+if __name__ == '__main__':
+    harness = TrackFileTestHarness()
+    harness.main()
@@ -0,0 +1,75 @@
+#!/usr/bin/env python
+
+import os
+import sys
+sys.path.insert(0, os.pardir)
+sys.path.insert(0, os.path.join(os.pardir, 'openmoc'))
+from testing_harness import MultiSimTestHarness
+from input_set import PinCellInput
+import openmoc
+
+
+class VectorizedSolverTestHarness(MultiSimTestHarness):
+    """Repeated eigenvalue calculations in a pin cell with 7-group C5G7 data
+    using the CPUSolver and, if OpenMOC was built with it, the
+    VectorizedSolver vectorized across energy groups and across Tracks."""
+
+    def __init__(self):
+        super(VectorizedSolverTestHarness, self).__init__()
+        self.input_set = PinCellInput()
+        self.num_simulations = 2
+        self.solver_types = []
+
+    def _run_openmoc(self):
+        """Run eigenvalue calculations with the CPUSolver and then with each
+        vectorization type of the VectorizedSolver if it was built."""
+
+        # The CPUSolver is run first since the VectorizedSolver pads the
+        # cross-sections of each Material
+        self.solver_types += ['CPUSolver'] * self.num_simulations
+        super(VectorizedSolverTestHarness, self)._run_openmoc()
+
+        if not hasattr(openmoc, 'VectorizedSolver'):
+            return
+
+        vectorization_types = [('GROUP_VECTORIZED', openmoc.GROUP_VECTORIZED),
+                               ('TRACK_VECTORIZED', openmoc.TRACK_VECTORIZED)]
+
+        for name, vectorization_type in vectorization_types:
+            self.solver = openmoc.VectorizedSolver(self.track_generator)
+            self.solver.setNumThreads(self.num_threads)
+            self.solver.setConvergenceThreshold(self.tolerance)
+            self.solver.setVectorizationType(vectorization_type)
+
+            self.solver_types += [name] * self.num_simulations
+            super(VectorizedSolverTestHarness, self)._run_openmoc()
+
+    def _get_results(self, num_iterations=True, keff=True, fluxes=False,
+                     num_fsrs=False, num_tracks=False, num_segments=False,
+                     hash_output=False):
+        """Return the CPUSolver eigenvalues into a string after checking that
+        each VectorizedSolver simulation matches its CPUSolver simulation."""
+
+        outstr = ''
+        for i, solver_type in enumerate(self.solver_types):
+            num_iters = self.num_iters[i]
+            keff = self.keffs[i]
+
+            # The results of the VectorizedSolver are only written if it was
+            # built, so they are compared to those of the CPUSolver instead
+            if solver_type != 'CPUSolver':
+                cpu_keff = self.keffs[i % self.num_simulations]
+                assert abs(keff - cpu_keff) < self.tolerance, \
+                    '{0} keff {1} does not match the CPUSolver keff {2}'.format(
+                        solver_type, keff, cpu_keff)
+                continue
+
+            outstr += '{0}\tIters: {1}\tkeff: {2:12.5E}\n'.format(
+                solver_type, num_iters, keff)
+
+        return outstr
+
+
+if __name__ == '__main__':
+    harness = VectorizedSolverTestHarness()
+    harness.main()